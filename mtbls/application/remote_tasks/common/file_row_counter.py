@@ -0,0 +1,67 @@
+import asyncio
+import logging
+import pathlib
+
+from cachetools import LRUCache
+
+from mtbls.application.services.interfaces.repositories.file_object.file_object_read_repository import (  # noqa: E501
+    FileObjectReadRepository,
+)
+from mtbls.domain.entities.study_file import StudyDataFileOutput
+
+logger = logging.getLogger(__name__)
+
+READ_BUFFER_SIZE = 1024 * 1024
+
+# row counts are valid while file size and modification time are not changed.
+file_row_counts: LRUCache = LRUCache(maxsize=10000)
+
+
+def count_lines(file_path: pathlib.Path) -> int:
+    lines = 0
+    last_byte = b"\n"
+    with file_path.open("rb") as f:
+        while chunk := f.read(READ_BUFFER_SIZE):
+            lines += chunk.count(b"\n")
+            last_byte = chunk[-1:]
+    if last_byte != b"\n":
+        lines += 1
+    return lines
+
+
+def count_content_lines(content: bytes) -> int:
+    lines = content.count(b"\n")
+    if content and not content.endswith(b"\n"):
+        lines += 1
+    return lines
+
+
+async def get_file_row_count(
+    repository: FileObjectReadRepository,
+    resource_id: str,
+    file: StudyDataFileOutput,
+) -> int:
+    """Return number of data rows (without header row) in a tabular file.
+
+    Local files are read in place. Other files are read from repository.
+    """
+    key = (
+        resource_id,
+        repository.get_bucket().value,
+        file.object_key,
+        file.size_in_bytes,
+        str(file.updated_at),
+    )
+    if key in file_row_counts:
+        return file_row_counts[key]
+    uri = await repository.get_uri(resource_id, file.object_key)
+    if uri and uri.startswith("file://"):
+        file_path = pathlib.Path(uri.removeprefix("file://"))
+        lines = await asyncio.to_thread(count_lines, file_path)
+    else:
+        content = await repository.get_content(resource_id, file.object_key)
+        lines = count_content_lines(content)
+    row_count = max(0, lines - 1)
+    file_row_counts[key] = row_count
+    logger.debug("%s %s has %s rows.", resource_id, file.object_key, row_count)
+    return row_count
@@ -0,0 +1,204 @@
+import hashlib
+import logging
+
+from metabolights_utils.models.metabolights.model import MetabolightsStudyModel
+
+from mtbls.application.services.interfaces.validation_override_service import (
+    ValidationOverrideService,
+)
+from mtbls.application.services.interfaces.validation_report_service import (
+    ValidationReportService,
+)
+from mtbls.domain.shared.validator.policy import (
+    PolicyMessage,
+    PolicyResult,
+    PolicySummaryResult,
+)
+from mtbls.domain.shared.validator.types import ValidationPhase
+
+logger = logging.getLogger(__name__)
+
+DB_METADATA_KEY = "study_db_metadata"
+FOLDER_METADATA_KEY = "study_folder_metadata"
+VALIDATION_VERSION_KEY = "validation_version"
+VALIDATION_PHASES_KEY = "validation_phases"
+MHD_RULE_PREFIX = "rule___500_"
+
+
+def _sha256(value: str) -> str:
+    return hashlib.sha256(value.encode()).hexdigest()
+
+
+def create_validation_input_hashes(
+    model: MetabolightsStudyModel,
+    phases: list[ValidationPhase],
+    validation_version: None | str = None,
+) -> dict[str, str]:
+    """Create hashes of validation inputs.
+
+    Keys are ISA metadata file names and study level inputs (database metadata,
+    folder metadata, validation version and validation phases).
+    """
+    hashes: dict[str, str] = {}
+    if model.investigation_file_path:
+        hashes[model.investigation_file_path] = _sha256(
+            model.investigation.model_dump_json()
+        )
+    for tables in (model.samples, model.assays, model.metabolite_assignments):
+        for file_name, table in tables.items():
+            hashes[file_name] = table.sha256_hash or _sha256(
+                table.table.model_dump_json()
+            )
+    hashes[DB_METADATA_KEY] = _sha256(model.study_db_metadata.model_dump_json())
+    hashes[FOLDER_METADATA_KEY] = _sha256(model.study_folder_metadata.model_dump_json())
+    hashes[VALIDATION_VERSION_KEY] = validation_version or ""
+    hashes[VALIDATION_PHASES_KEY] = ",".join(sorted(str(x.value) for x in phases))
+    return hashes
+
+
+def find_incremental_validation_files(
+    model: MetabolightsStudyModel,
+    previous_hashes: dict[str, str],
+    current_hashes: dict[str, str],
+) -> None | tuple[set[str], set[str]]:
+    """Find ISA files to validate again and files required to validate them.
+
+    Returns None if a full validation is required. Otherwise it returns
+    files whose violations are replaced (validated files) and files loaded
+    in the validation input (validated files and their cross-file dependencies).
+    """
+    if not previous_hashes or previous_hashes.keys() != current_hashes.keys():
+        return None
+    changed_keys = {
+        key for key, value in current_hashes.items() if previous_hashes[key] != value
+    }
+    if not changed_keys:
+        return None
+    study_level_keys = {
+        model.investigation_file_path,
+        DB_METADATA_KEY,
+        FOLDER_METADATA_KEY,
+        VALIDATION_VERSION_KEY,
+        VALIDATION_PHASES_KEY,
+    }
+    if changed_keys.intersection(study_level_keys):
+        return None
+
+    maf_assays: dict[str, set[str]] = {}
+    for assay_file, assay in model.assays.items():
+        for maf_file in assay.referenced_assignment_files:
+            maf_assays.setdefault(maf_file, set()).add(assay_file)
+
+    validated_files: set[str] = set()
+    for file_name in changed_keys:
+        validated_files.add(file_name)
+        if file_name in model.samples:
+            validated_files.update(model.assays.keys())
+        elif file_name in model.assays:
+            validated_files.update(
+                x
+                for x in model.assays[file_name].referenced_assignment_files
+                if x in model.metabolite_assignments
+            )
+        elif file_name in model.metabolite_assignments:
+            validated_files.update(maf_assays.get(file_name, set()))
+
+    # sample file rules check sample names referenced in assay files.
+    if validated_files.intersection(model.assays.keys()):
+        validated_files.update(model.samples.keys())
+    input_files = set(validated_files)
+    if validated_files.intersection(model.samples.keys()):
+        input_files.update(model.assays.keys())
+    return validated_files, input_files
+
+
+def create_partial_study_model(
+    model: MetabolightsStudyModel, input_files: set[str]
+) -> MetabolightsStudyModel:
+    return model.model_copy(
+        update={
+            "samples": {k: v for k, v in model.samples.items() if k in input_files},
+            "assays": {k: v for k, v in model.assays.items() if k in input_files},
+            "metabolite_assignments": {
+                k: v
+                for k, v in model.metabolite_assignments.items()
+                if k in input_files
+            },
+        }
+    )
+
+
+def _merge_messages(
+    previous_messages: list[PolicyMessage],
+    current_messages: list[PolicyMessage],
+    validated_files: set[str],
+) -> list[PolicyMessage]:
+    messages = [
+        x
+        for x in previous_messages
+        if x.source_file not in validated_files
+        and not x.identifier.startswith(MHD_RULE_PREFIX)
+    ]
+    messages.extend(x for x in current_messages if x.source_file in validated_files)
+    return messages
+
+
+def merge_policy_results(
+    previous_result: PolicySummaryResult,
+    current_result: PolicyResult,
+    validated_files: set[str],
+) -> PolicyResult:
+    """Merge messages of validated files into the previous validation result.
+
+    Messages of the validated files are replaced with the current ones and
+    messages of other files are copied from the previous result.
+    """
+    previous_messages = previous_result.messages
+    current_messages = current_result.messages
+    current_messages.violations = _merge_messages(
+        previous_messages.violations, current_messages.violations, validated_files
+    )
+    current_messages.summary = _merge_messages(
+        previous_messages.summary, current_messages.summary, validated_files
+    )
+    return current_result
+
+
+async def find_previous_validation_result(
+    resource_id: str,
+    validation_report_service: ValidationReportService,
+    validation_override_service: ValidationOverrideService,
+) -> None | PolicySummaryResult:
+    """Find the latest validation result that can be updated incrementally."""
+    try:
+        reports = await validation_report_service.find_all(
+            resource_id=resource_id, offset=0, limit=1
+        )
+        if not reports:
+            return None
+        previous_result = (
+            await validation_report_service.load_validation_report_by_task_id(
+                resource_id=resource_id, task_id=reports[0].task_id
+            )
+        )
+        if not previous_result or not previous_result.input_hashes:
+            return None
+        overrides = await validation_override_service.get_validation_overrides(
+            resource_id=resource_id
+        )
+    except Exception as ex:
+        logger.warning(
+            "Previous validation result of %s is not loaded: %s", resource_id, ex
+        )
+        return None
+
+    overrides.validation_overrides.sort(key=lambda x: x.rule_id + x.source_file)
+    # overrides are applied on stored reports. Stored violations can not be reused
+    # if validation overrides are updated after the previous validation.
+    if previous_result.overrides.validation_overrides != overrides.validation_overrides:
+        logger.info(
+            "Validation overrides of %s are updated after the last validation.",
+            resource_id,
+        )
+        return None
+    return previous_result
@@ -0,0 +1,105 @@
+import asyncio
+import functools
+import hashlib
+import json
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable
+
+from mtbls.application.services.interfaces.repositories.file_object.file_object_write_repository import (  # noqa: E501
+    FileObjectWriteRepository,
+)
+
+logger = logging.getLogger(__name__)
+
+MHD_DIGEST_FILE_SUFFIX = ".mhd.digest.json"
+
+_process_pool: None | ProcessPoolExecutor = None
+_process_pool_lock = threading.Lock()
+
+
+def _get_process_pool(max_workers: int) -> ProcessPoolExecutor:
+    global _process_pool  # noqa: PLW0603
+    with _process_pool_lock:
+        if not _process_pool:
+            _process_pool = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _process_pool
+
+
+def _terminate_process_pool() -> None:
+    global _process_pool  # noqa: PLW0603
+    with _process_pool_lock:
+        pool = _process_pool
+        _process_pool = None
+    if not pool:
+        return
+    # running conversions are not cancelled by shutdown.
+    # worker processes are terminated to release CPU of timed out conversions.
+    for process in list((getattr(pool, "_processes", None) or {}).values()):
+        process.terminate()
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+async def run_in_process_pool(
+    func: Callable[..., Any],
+    *args: Any,
+    timeout_in_seconds: None | int = None,
+    max_workers: int = 2,
+    **kwargs: Any,
+) -> Any:
+    """Run a CPU bound function in a process pool without blocking event loop.
+
+    The pool is recreated if the function does not complete within timeout.
+    """
+    loop = asyncio.get_running_loop()
+    pool = _get_process_pool(max_workers)
+    future = loop.run_in_executor(pool, functools.partial(func, *args, **kwargs))
+    try:
+        return await asyncio.wait_for(future, timeout=timeout_in_seconds or None)
+    except TimeoutError as ex:
+        _terminate_process_pool()
+        raise TimeoutError(
+            f"{func.__name__} did not complete in {timeout_in_seconds} seconds."
+        ) from ex
+
+
+def create_mhd_conversion_digest(
+    input_hashes: dict[str, str], **conversion_inputs: Any
+) -> str:
+    """Create digest of study model hashes and MHD conversion configuration."""
+    digest = hashlib.sha256()
+    digest.update(json.dumps(input_hashes, sort_keys=True).encode())
+    digest.update(json.dumps(conversion_inputs, sort_keys=True, default=str).encode())
+    return digest.hexdigest()
+
+
+async def find_reusable_mhd_files(
+    resource_id: str,
+    digest: str,
+    internal_files_object_repository: FileObjectWriteRepository,
+    object_keys: list[str],
+    digest_object_key: str,
+) -> bool:
+    """Check the last successful MHD conversion has the same input digest.
+
+    Returns True if digest matches and all MHD files of the conversion exist.
+    """
+    repository = internal_files_object_repository
+    try:
+        if not await repository.exists(resource_id, digest_object_key):
+            return False
+        content = await repository.get_content(resource_id, digest_object_key)
+        if json.loads(content).get("digest") != digest:
+            return False
+        for object_key in object_keys:
+            if not await repository.exists(resource_id, object_key):
+                return False
+    except Exception as ex:
+        logger.warning("MHD conversion digest of %s is not loaded: %s", resource_id, ex)
+        return False
+    return True
@@ -0,0 +1,73 @@
+import contextlib
+import time
+from typing import Iterator
+
+from metabolights_utils.models.metabolights.model import MetabolightsStudyModel
+
+from mtbls.application.utils.metrics import Histogram
+from mtbls.domain.shared.validator.policy import ValidationPhaseTiming
+
+STUDY_SIZE_BUCKETS = ((1_000, "small"), (10_000, "medium"), (100_000, "large"))
+
+PAYLOAD_SIZE_BUCKETS = (10, 100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+
+validation_phase_duration = Histogram(
+    "validation_phase_duration_seconds", label_names=("phase", "study_size")
+)
+validation_phase_payload_size = Histogram(
+    "validation_phase_payload_size",
+    label_names=("phase", "study_size"),
+    buckets=PAYLOAD_SIZE_BUCKETS,
+)
+
+
+def get_study_row_count(model: MetabolightsStudyModel) -> int:
+    return sum(
+        x.table.row_count or 0
+        for tables in (model.samples, model.assays, model.metabolite_assignments)
+        for x in tables.values()
+    )
+
+
+def get_study_size_bucket(model: MetabolightsStudyModel) -> str:
+    """Return size label of study by total number of ISA table rows."""
+    row_count = get_study_row_count(model)
+    for max_rows, label in STUDY_SIZE_BUCKETS:
+        if row_count < max_rows:
+            return label
+    return "xlarge"
+
+
+class PhaseTimer:
+    """Collects durations and payload sizes of validation phases.
+
+    Payload size is the number of items processed in the phase
+    (ISA table rows, messages, bytes, etc.).
+    """
+
+    def __init__(self) -> None:
+        self.timings: list[ValidationPhaseTiming] = []
+
+    @contextlib.contextmanager
+    def measure(
+        self, phase: str, payload_size: None | int = None
+    ) -> Iterator[ValidationPhaseTiming]:
+        timing = ValidationPhaseTiming(phase=phase, payload_size=payload_size)
+        start = time.perf_counter()
+        try:
+            yield timing
+        finally:
+            timing.duration_in_seconds = round(time.perf_counter() - start, 6)
+            self.timings.append(timing)
+
+    def observe(self, study_size_bucket: str) -> None:
+        """Emit phase durations and payload sizes as histogram metrics."""
+        for timing in self.timings:
+            record_phase_timing(timing, study_size_bucket)
+
+
+def record_phase_timing(timing: ValidationPhaseTiming, study_size_bucket: str) -> None:
+    labels = {"phase": timing.phase, "study_size": study_size_bucket}
+    validation_phase_duration.observe(timing.duration_in_seconds, **labels)
+    if timing.payload_size is not None:
+        validation_phase_payload_size.observe(timing.payload_size, **labels)
@@ -1,16 +1,27 @@
+import contextlib
 import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from typing import Any, Dict
 
 from dependency_injector.wiring import Provide, inject
 from metabolights_utils.models.enums import GenericMessageType
+from metabolights_utils.models.metabolights.model import MetabolightsStudyModel
 from metabolights_utils.models.parser.enums import ParserMessageType
 
 from mtbls.application.decorators.async_task import async_task
+from mtbls.application.remote_tasks.common.phase_timer import (
+    PhaseTimer,
+    get_study_row_count,
+)
 from mtbls.application.remote_tasks.common.utils import run_coroutine
 from mtbls.application.services.interfaces.async_task.async_task_result import (
     AsyncTaskResult,
 )
 from mtbls.application.services.interfaces.policy_service import PolicyService
+from mtbls.application.services.interfaces.study_metadata_service import (
+    StudyMetadataService,
+)
 from mtbls.application.services.interfaces.study_metadata_service_factory import (
     StudyMetadataServiceFactory,
 )
@@ -63,55 +74,78 @@ async def run_isa_metadata_modifier_task(
     validation_run_configuration: None | ValidationRunConfiguration = None,
 ) -> Dict[str, Any]:
     metadata_service = await study_metadata_service_factory.create_service(resource_id)
-    load_maf_files = True
+    with metadata_service:
+        result, _, _ = await modify_study_model(
+            resource_id,
+            metadata_service=metadata_service,
+            policy_service=policy_service,
+            validation_run_configuration=validation_run_configuration,
+        )
+    if serialize_result:
+        return result.model_dump(by_alias=True)
+    return result
+
+
+async def modify_study_model(
+    resource_id: str,
+    metadata_service: StudyMetadataService,
+    policy_service: PolicyService,
+    validation_run_configuration: None | ValidationRunConfiguration = None,
+    phase_timer: None | PhaseTimer = None,
+) -> tuple[StudyMetadataModifierResult, None | MetabolightsStudyModel, list[str]]:
+    """Run modifiers and save the updated study metadata files.
+
+    Returns the modifier result, the in-memory study model if it reflects
+    the saved files (None otherwise) and the list of saved files with updates.
+    """
+    timer = phase_timer or PhaseTimer()
     if not validation_run_configuration:
         validation_run_configuration = ValidationRunConfiguration()
-    if validation_run_configuration.skip_result_file_modification:
-        load_maf_files = False
-    with metadata_service:
-        modifier_model = await metadata_service.load_study_model(
-            load_sample_file=True,
-            load_assay_files=True,
-            load_maf_files=load_maf_files,
-            load_folder_metadata=True,
-            load_db_metadata=True,
+    load_options = get_modifier_load_options(validation_run_configuration)
+    with timer.measure("modifier_load_study_model") as timing:
+        modifier_model = await metadata_service.load_study_model(**load_options)
+        timing.payload_size = get_study_row_count(modifier_model)
+    result = StudyMetadataModifierResult(resource_id=resource_id)
+    folder_errors = [
+        x
+        for x in modifier_model.folder_reader_messages
+        if x.type == GenericMessageType.ERROR
+    ]
+    if folder_errors:
+        result.error_message = (
+            "Study folder load error:  "
+            f"{folder_errors[0].short} {folder_errors[0].detail}"
         )
-        result = StudyMetadataModifierResult(resource_id=resource_id)
-        folder_errors = [
-            x
-            for x in modifier_model.folder_reader_messages
-            if x.type == GenericMessageType.ERROR
-        ]
-        if folder_errors:
-            result.error_message = (
-                "Study folder load error:  "
-                f"{folder_errors[0].short} {folder_errors[0].detail}"
-            )
-        parse_errors = []
-        for _, messages in modifier_model.parser_messages.items():
-            parse_errors.extend(
-                [x for x in messages if x.type in (ParserMessageType.CRITICAL,)]
-            )
-        if parse_errors:
-            result.error_message = f"Study file parse errors:  {parse_errors}"
-
-        control_lists: ValidationControls = await policy_service.get_control_lists()
-        templates: FileTemplates = await policy_service.get_templates()
-        config_load_failure = not control_lists or not templates
-        if config_load_failure:
-            result.error_message = "Control lists or templates are not fetched"
-
-        if parse_errors or folder_errors or config_load_failure:
-            result.has_error = True
-            if serialize_result:
-                return result.model_dump(by_alias=True)
-            return result
+    parse_errors = []
+    for _, messages in modifier_model.parser_messages.items():
+        parse_errors.extend(
+            [x for x in messages if x.type in (ParserMessageType.CRITICAL,)]
+        )
+    if parse_errors:
+        result.error_message = f"Study file parse errors:  {parse_errors}"
+
+    control_lists: ValidationControls = await policy_service.get_control_lists()
+    templates: FileTemplates = await policy_service.get_templates()
+    config_load_failure = not control_lists or not templates
+    if config_load_failure:
+        result.error_message = "Control lists or templates are not fetched"
 
+    if parse_errors or folder_errors or config_load_failure:
+        result.has_error = True
+        return result, modifier_model, []
+
+    with (
+        create_table_modifier_executor(
+            modifier_model, validation_run_configuration
+        ) as executor,
+        timer.measure("modifiers") as timing,
+    ):
         modifier = MetabolightsStudyModelModifier(
             model=modifier_model,
             templates=templates,
             control_lists=control_lists,
             config=validation_run_configuration,
+            executor=executor,
         )
         try:
             result.logs = modifier.modify()
@@ -119,30 +153,85 @@ async def run_isa_metadata_modifier_task(
             result.logs = modifier.update_logs
             result.has_error = True
             result.error_message = str(ex)
+        timing.payload_size = len(modifier.update_logs)
+
+    if result.has_error:
+        logger.info("Modification error for %s: %s", resource_id, result.error_message)
+        # model may be partially modified and it does not match the stored files.
+        return result, None, []
+
+    result.updated_files = modifier.get_updated_files()
+    if not result.updated_files:
+        logger.debug("There is no modification for %s.", resource_id)
+        return result, modifier_model, []
+
+    logger.info(
+        "%s modifier results: %d number of updates in %d files.",
+        resource_id,
+        len(modifier.update_logs),
+        len(result.updated_files),
+    )
+    logger.info("Create metadata snapshot for %s", resource_id)
+    with timer.measure("metadata_snapshot", len(result.updated_files)):
+        await metadata_service.create_metadata_snapshot(
+            suffix="VALIDATION", object_keys=result.updated_files
+        )
+    logger.info("Override %s metadata files", resource_id)
+    save_result_files = not validation_run_configuration.skip_result_file_modification
+    updated_row_count = sum(
+        x.table.row_count or 0
+        for files in (
+            modifier_model.samples,
+            modifier_model.assays,
+            modifier_model.metabolite_assignments,
+        )
+        for name, x in files.items()
+        if name in result.updated_files
+    )
+    with timer.measure("save_study_model", updated_row_count):
+        await metadata_service.save_study_model(
+            modifier_model,
+            save_result_files=save_result_files,
+            object_keys=result.updated_files,
+        )
+    return result, modifier_model, result.updated_files
+
+
+def get_modifier_load_options(
+    validation_run_configuration: ValidationRunConfiguration,
+) -> dict[str, bool]:
+    """Return load_study_model flags of the model that modifiers update."""
+    return {
+        "load_sample_file": True,
+        "load_assay_files": True,
+        "load_maf_files": not validation_run_configuration.skip_result_file_modification,
+        "load_folder_metadata": True,
+        "load_db_metadata": True,
+    }
+
+
+def create_table_modifier_executor(
+    model: MetabolightsStudyModel,
+    validation_run_configuration: ValidationRunConfiguration,
+) -> contextlib.AbstractContextManager[None | ProcessPoolExecutor]:
+    """Create a process pool for assay and MAF modifiers if it is enabled.
 
-        if not result.has_error:
-            if modifier.update_logs:
-                logger.info(
-                    "%s modifier results: %d number of updates.",
-                    resource_id,
-                    len(modifier.update_logs),
-                )
-                logger.info("Create metadata snapshot for %s", resource_id)
-                await metadata_service.create_metadata_snapshot(suffix="VALIDATION")
-                logger.info("Override %s metadata files", resource_id)
-                save_result_files = (
-                    not validation_run_configuration.skip_result_file_modification
-                )
-                await metadata_service.save_study_model(
-                    modifier_model, save_result_files=save_result_files
-                )
-            else:
-                logger.debug("There is no modification for %s.", resource_id)
-        else:
-            logger.info(
-                "Modification error for %s: %s", resource_id, result.error_message
-            )
-
-        if serialize_result:
-            return result.model_dump(by_alias=True)
-        return result
+    Pool is not created if there are not multiple tables to modify in parallel.
+    """
+    config = validation_run_configuration
+    table_count = max(
+        len(model.assays),
+        0
+        if config.skip_result_file_modification
+        else len(model.metabolite_assignments),
+    )
+    if (
+        not config.parallel_table_modifiers
+        or config.max_parallel_table_modifiers < 2
+        or table_count < 2
+    ):
+        return contextlib.nullcontext()
+    return ProcessPoolExecutor(
+        max_workers=min(config.max_parallel_table_modifiers, table_count),
+        mp_context=multiprocessing.get_context("spawn"),
+    )
@@ -2,12 +2,8 @@ import asyncio
 import datetime
 import json
 import logging
-import pathlib
 import re
-import shutil
-import subprocess
 import time
-import uuid
 from pathlib import Path
 from typing import Any, Dict, OrderedDict, Union
 
@@ -15,6 +11,8 @@ from cachetools import TTLCache
 from cachetools_async import cached
 from dependency_injector.wiring import Provide, inject
 from metabolights_utils.models.metabolights.model import MetabolightsStudyModel
+from metabolights_utils.models.parser.common import ParserMessage
+from metabolights_utils.models.parser.enums import ParserMessageType
 from mhd_model.convertors.announcement.convertor import create_announcement_file
 from mhd_model.model.v0_1.announcement.validation.validator import (
     MhdAnnouncementFileValidator,
@@ -24,8 +22,30 @@ from mtbls2mhd.config import Mtbls2MhdConfiguration
 from mtbls2mhd.convertor_factory import Mtbls2MhdConvertorFactory
 
 from mtbls.application.decorators.async_task import async_task
+from mtbls.application.remote_tasks.common.file_row_counter import (
+    get_file_row_count,
+)
+from mtbls.application.remote_tasks.common.incremental_validation import (
+    create_partial_study_model,
+    create_validation_input_hashes,
+    find_incremental_validation_files,
+    find_previous_validation_result,
+    merge_policy_results,
+)
+from mtbls.application.remote_tasks.common.mhd_conversion import (
+    MHD_DIGEST_FILE_SUFFIX,
+    create_mhd_conversion_digest,
+    find_reusable_mhd_files,
+    run_in_process_pool,
+)
+from mtbls.application.remote_tasks.common.phase_timer import (
+    PhaseTimer,
+    get_study_row_count,
+    get_study_size_bucket,
+)
 from mtbls.application.remote_tasks.common.run_modifier import (
-    run_isa_metadata_modifier_task,
+    get_modifier_load_options,
+    modify_study_model,
 )
 from mtbls.application.remote_tasks.common.utils import run_coroutine
 from mtbls.application.services.interfaces.async_task.async_task_result import (
@@ -44,6 +64,12 @@ from mtbls.application.services.interfaces.study_metadata_service import (
 from mtbls.application.services.interfaces.study_metadata_service_factory import (
     StudyMetadataServiceFactory,
 )
+from mtbls.application.services.interfaces.validation_override_service import (
+    ValidationOverrideService,
+)
+from mtbls.application.services.interfaces.validation_report_service import (
+    ValidationReportService,
+)
 from mtbls.domain.entities.study_file import StudyDataFileOutput
 from mtbls.domain.entities.validation.validation_configuration import (
     BaseOntologyValidation,
@@ -60,9 +86,11 @@ from mtbls.domain.shared.validator.policy import (
     PolicyMessage,
     PolicyResult,
     PolicyResultList,
+    PolicySummaryResult,
 )
 from mtbls.domain.shared.validator.run_configuration import (
     DbConfiguration,
+    ResultFileSizePolicy,
     ValidationRunConfiguration,
 )
 from mtbls.domain.shared.validator.types import PolicyMessageType, ValidationPhase
@@ -76,38 +104,15 @@ async def create_validation_run_configuration(
     mhd_config: MhdConfiguration,
     private_metadata_files_root_path: str,
     db_connection: dict,
-    temp_folder: Union[None, str] = None,
     apply_modifiers: bool = True,
     ignore_cv_term_validation: None | bool = None,
+    result_file_size_policy: None | ResultFileSizePolicy = None,
 ):
-    if not temp_folder:
-        temp_folder_path = pathlib.Path(f"/tmp/validation/{uuid.uuid4()}").resolve()
-    else:
-        temp_folder_path = pathlib.Path(temp_folder).resolve()
+    policy = result_file_size_policy or ResultFileSizePolicy()
     try:
         repo = metadata_files_object_repository
         files: list[StudyDataFileOutput] = await repo.list(resource_id)
         result_files = [f for f in files if re.match(r"m_.+\.tsv$", f.basename)]
-        local_result_files = []
-
-        for result_file in result_files:
-            local_result_file_path = (
-                temp_folder_path
-                / pathlib.Path(resource_id)
-                / pathlib.Path(result_file.object_key)
-            )
-            local_result_files.append(local_result_file_path)
-            local_result_file_path.parent.mkdir(parents=True, exist_ok=True)
-
-            await repo.download(
-                resource_id,
-                result_file.object_key,
-                target_path=str(local_result_file_path),
-            )
-        file_lines: dict[str, int] = calculate_file_lines(local_result_files)
-        total_result_file_lines = 0
-        if file_lines:
-            total_result_file_lines = sum([x for x in file_lines.values()])
         validation_run_configuration = ValidationRunConfiguration(
             apply_modifiers=apply_modifiers,
             mhd_configuration=mhd_config,
@@ -115,17 +120,44 @@ async def create_validation_run_configuration(
             db_connection=DbConfiguration.model_validate(db_connection),
             ignore_cv_term_validation=ignore_cv_term_validation,
         )
-        if total_result_file_lines > 4000:
+        total_size = sum(x.size_in_bytes or 0 for x in result_files)
+        large_result_files = False
+        if (
+            policy.max_total_size_in_bytes
+            and total_size > policy.max_total_size_in_bytes
+        ):
             logger.warning(
-                "Validation result MAF file lines exceed the limit: %d > 4000. "
-                "MAF file content validation PHASE3 will be skipped.",
-                total_result_file_lines,
+                "Validation result MAF file sizes exceed the limit: %d > %d.",
+                total_size,
+                policy.max_total_size_in_bytes,
+            )
+            large_result_files = True
+        else:
+            total_rows = 0
+            for result_file in result_files:
+                total_rows += await get_file_row_count(repo, resource_id, result_file)
+            if total_rows > policy.max_total_rows:
+                logger.warning(
+                    "Validation result MAF file rows exceed the limit: %d > %d.",
+                    total_rows,
+                    policy.max_total_rows,
+                )
+                large_result_files = True
+        if large_result_files:
+            logger.warning(
+                "MAF files will be validated in chunks of %d rows "
+                "and MAF file modification will be skipped.",
+                policy.chunk_size,
             )
             validation_run_configuration.skip_result_file_modification = True
             validation_run_configuration.validation_phases = [
                 x for x in ValidationPhase
             ]
-            validation_run_configuration.assignmet_sheet_limit = 100
+            validation_run_configuration.maf_chunk_size = policy.chunk_size
+            validation_run_configuration.max_parallel_maf_chunks = (
+                policy.max_parallel_chunks
+            )
+            validation_run_configuration.assignmet_sheet_limit = policy.chunk_size
         return validation_run_configuration
     except Exception as ex:
         logger.error(
@@ -138,28 +170,6 @@ async def create_validation_run_configuration(
             metadata_files_root_path=private_metadata_files_root_path,
             db_connection=DbConfiguration.model_validate(db_connection),
         )
-    finally:
-        if temp_folder_path and temp_folder_path.exists():
-            try:
-                shutil.rmtree(temp_folder_path)
-            except Exception as ex:
-                logger.error(
-                    "Temporary folder %s removal failed: %s",
-                    str(temp_folder_path),
-                    ex,
-                )
-
-
-def calculate_file_lines(file_paths: list[pathlib.Path]) -> dict[str, int]:
-    if not file_paths:
-        return {}
-    files = [f for f in file_paths if f.is_file()]
-    result = subprocess.check_output(["wc", "-l"] + files)
-    return {
-        line.split(maxsplit=1)[1]: int(line.split(maxsplit=1)[0])
-        for line in result.decode().strip().split("\n")
-        if line and line.strip() and line.split(maxsplit=1)[1] != "total"
-    }
 
 
 @async_task(queue="common")
@@ -170,6 +180,7 @@ def run_validation(  # noqa: PLR0913
     apply_modifiers: bool = True,
     serialize_result: bool = True,
     ignore_cv_term_validation: None | bool = None,
+    incremental: bool = False,
     study_metadata_service_factory: StudyMetadataServiceFactory = Provide[
         "services.study_metadata_service_factory"
     ],
@@ -177,7 +188,6 @@ def run_validation(  # noqa: PLR0913
     ontology_search_service: OntologySearchService = Provide[
         "services.ontology_search_service"
     ],
-    temp_folder: Union[None, str] = None,
     metadata_files_object_repository: FileObjectWriteRepository = Provide[
         "repositories.metadata_files_object_repository"
     ],
@@ -189,19 +199,39 @@ def run_validation(  # noqa: PLR0913
         "config.repositories.study_folders.mounted_paths.private_metadata_files_root_path"
     ],
     db_connection: dict = Provide["config.gateways.database.postgresql.connection"],
+    validation_report_service: ValidationReportService = Provide[
+        "services.validation_report_service"
+    ],
+    validation_override_service: ValidationOverrideService = Provide[
+        "services.validation_override_service"
+    ],
+    result_file_size_policy: None | dict = Provide[
+        "config.run.common_worker.validation.result_file_size_policy"
+    ],
     **kwargs,
 ) -> AsyncTaskResult:
     validation_run_configuration = asyncio.run(
         create_validation_run_configuration(
             resource_id=resource_id,
-            temp_folder=temp_folder,
             apply_modifiers=apply_modifiers,
             metadata_files_object_repository=metadata_files_object_repository,
             mhd_config=mhd_config,
             private_metadata_files_root_path=private_metadata_files_root_path,
             db_connection=db_connection,
+            result_file_size_policy=ResultFileSizePolicy.model_validate(
+                result_file_size_policy or {}
+            ),
         )
     )
+    previous_result = None
+    if incremental:
+        previous_result = asyncio.run(
+            find_previous_validation_result(
+                resource_id,
+                validation_report_service=validation_report_service,
+                validation_override_service=validation_override_service,
+            )
+        )
     try:
         modifier_result = None
         if apply_modifiers:
@@ -214,6 +244,7 @@ def run_validation(  # noqa: PLR0913
                 serialize_result=serialize_result,
                 ontology_search_service=ontology_search_service,
                 validation_run_configuration=validation_run_configuration,
+                previous_result=previous_result,
             )
         else:
             coroutine = run_validation_task(
@@ -225,6 +256,7 @@ def run_validation(  # noqa: PLR0913
                 serialize_result=serialize_result,
                 ontology_search_service=ontology_search_service,
                 validation_run_configuration=validation_run_configuration,
+                previous_result=previous_result,
             )
         return run_coroutine(coroutine)
 
@@ -244,19 +276,38 @@ async def run_validation_task_with_modifiers(
     serialize_result: bool = True,
     ontology_search_service: None | OntologySearchService = None,
     validation_run_configuration: None | ValidationRunConfiguration = None,
+    previous_result: None | PolicySummaryResult = None,
 ) -> Union[Dict[str, Any], PolicyResultList]:
-    try:
-        modifier_result = await run_isa_metadata_modifier_task(
-            resource_id,
-            study_metadata_service_factory=study_metadata_service_factory,
-            policy_service=policy_service,
-            serialize_result=False,
-            validation_run_configuration=validation_run_configuration,
-        )
-    except Exception as ex:
-        logger.error("Error to modify %s: %s", resource_id, ex)
-        logger.exception(ex)
-        modifier_result = None
+    if not validation_run_configuration:
+        validation_run_configuration = ValidationRunConfiguration()
+    model = None
+    phase_timer = PhaseTimer()
+    metadata_service = await study_metadata_service_factory.create_service(resource_id)
+    with metadata_service:
+        try:
+            modifier_result, model, updated_files = await modify_study_model(
+                resource_id,
+                metadata_service=metadata_service,
+                policy_service=policy_service,
+                validation_run_configuration=validation_run_configuration,
+                phase_timer=phase_timer,
+            )
+            if model and not is_modifier_model_reusable(validation_run_configuration):
+                logger.debug("Modified model of %s does not match phases.", resource_id)
+                model = None
+            if model:
+                with phase_timer.measure("reload_modified_files", len(updated_files)):
+                    model = await update_modified_input_data(
+                        metadata_service,
+                        model,
+                        updated_files,
+                        validation_run_configuration,
+                    )
+        except Exception as ex:
+            logger.error("Error to modify %s: %s", resource_id, ex)
+            logger.exception(ex)
+            modifier_result = None
+            model = None
 
     return await run_validation_task(
         resource_id,
@@ -267,9 +318,38 @@ async def run_validation_task_with_modifiers(
         serialize_result=serialize_result,
         ontology_search_service=ontology_search_service,
         validation_run_configuration=validation_run_configuration,
+        model=model,
+        previous_result=previous_result,
+        phase_timer=phase_timer,
     )
 
 
+async def update_modified_input_data(
+    metadata_service: StudyMetadataService,
+    model: MetabolightsStudyModel,
+    updated_files: list[str],
+    validation_run_configuration: ValidationRunConfiguration,
+) -> MetabolightsStudyModel:
+    reload_files = list(updated_files)
+    phases = validation_run_configuration.validation_phases
+    if (
+        ValidationPhase.PHASE_3 in phases
+        and validation_run_configuration.skip_result_file_modification
+    ):
+        # MAF files are not loaded by modifier if their modification is skipped.
+        reload_files.extend(
+            x for x in model.metabolite_assignments if x not in reload_files
+        )
+    if reload_files:
+        logger.debug("Reload %s files: %s", metadata_service.resource_id, reload_files)
+        await metadata_service.reload_study_model_files(
+            model,
+            reload_files,
+            assignment_sheet_limit=validation_run_configuration.assignmet_sheet_limit,
+        )
+    return model
+
+
 async def run_validation_task(  # noqa: PLR0913
     resource_id: str,
     study_metadata_service_factory: StudyMetadataServiceFactory,
@@ -279,9 +359,12 @@ async def run_validation_task(  # noqa: PLR0913
     serialize_result: bool = True,
     ontology_search_service: None | OntologySearchService = None,
     validation_run_configuration: None | ValidationRunConfiguration = None,
+    model: None | MetabolightsStudyModel = None,
+    previous_result: None | PolicySummaryResult = None,
+    phase_timer: None | PhaseTimer = None,
 ) -> Union[Dict[str, Any], PolicyResultList]:
     logger.info("Running validation for %s", resource_id)
-    metadata_service = await study_metadata_service_factory.create_service(resource_id)
+    timer = phase_timer or PhaseTimer()
     result_list: PolicyResultList = PolicyResultList()
     if modifier_result and isinstance(modifier_result, dict):
         modifier_result = StudyMetadataModifierResult.model_validate(modifier_result)
@@ -303,34 +386,97 @@ async def run_validation_task(  # noqa: PLR0913
         raise ValueError(message="Inputs are not valid")
 
     try:
-        logger.debug("Get MetaboLights validation input model.")
-        model = await get_input_data(
-            metadata_service,
-            phases,
-            assignment_sheet_limit=validation_run_configuration.assignmet_sheet_limit,
-        )
-        logger.debug("Validate using policy service.")
-        policy_result = await validate_by_policy_service(
-            resource_id,
+        if not model:
+            logger.debug("Get MetaboLights validation input model.")
+            metadata_service = await study_metadata_service_factory.create_service(
+                resource_id
+            )
+            config = validation_run_configuration
+            with metadata_service, timer.measure("load_study_model") as timing:
+                model = await get_input_data(
+                    metadata_service,
+                    phases,
+                    assignment_sheet_limit=config.assignmet_sheet_limit,
+                )
+                timing.payload_size = get_study_row_count(model)
+        else:
+            logger.debug("Use MetaboLights validation input model loaded before.")
+        rule_definitions = await policy_service.get_rule_definitions()
+        input_hashes = create_validation_input_hashes(
             model,
-            modifier_result,
-            policy_service,
-            ontology_search_service,
+            phases,
+            rule_definitions.validation_version if rule_definitions else None,
         )
+        incremental_files = None
+        validated_files = None
+        if previous_result:
+            incremental_files = find_incremental_validation_files(
+                model, previous_result.input_hashes, input_hashes
+            )
+        if incremental_files:
+            validated_files, input_files = incremental_files
+            logger.info(
+                "Validate only updated files of %s: %s",
+                resource_id,
+                sorted(validated_files),
+            )
+            policy_result = await validate_by_policy_service(
+                resource_id,
+                create_partial_study_model(model, input_files),
+                modifier_result,
+                policy_service,
+                ontology_search_service,
+                phase_timer=timer,
+            )
+            policy_result = merge_policy_results(
+                previous_result, policy_result, validated_files
+            )
+            update_file_techniques(policy_result, model)
+        else:
+            logger.debug("Validate using policy service.")
+            policy_result = await validate_by_policy_service(
+                resource_id,
+                model,
+                modifier_result,
+                policy_service,
+                ontology_search_service,
+                phase_timer=timer,
+            )
+        policy_result.input_hashes = input_hashes
+        if (
+            validation_run_configuration.maf_chunk_size
+            and ValidationPhase.PHASE_3 in phases
+        ):
+            metadata_service = await study_metadata_service_factory.create_service(
+                resource_id
+            )
+            with metadata_service, timer.measure("maf_chunk_validation"):
+                await validate_assignment_file_chunks(
+                    resource_id,
+                    model,
+                    policy_result,
+                    metadata_service=metadata_service,
+                    policy_service=policy_service,
+                    chunk_size=validation_run_configuration.maf_chunk_size,
+                    max_parallel_chunks=validation_run_configuration.max_parallel_maf_chunks,
+                    file_names=validated_files,
+                    ontology_search_service=ontology_search_service,
+                )
         errors = [
             x
             for x in policy_result.messages.violations
             if x.type == PolicyMessageType.ERROR
         ]
         try:
-            await process_mhd_study(
-                policy_result,
-                resource_id,
-                model,
-                policy_service,
-                internal_files_object_repository,
-                validation_run_configuration=validation_run_configuration,
-            )
+            with timer.measure("mhd_conversion"):
+                await process_mhd_study(
+                    policy_result,
+                    resource_id,
+                    model,
+                    policy_service,
+                    internal_files_object_repository,
+                    validation_run_configuration=validation_run_configuration,
+                )
         except Exception as ex:
             logger.exception(ex)
             logger.error("Failed to convert and validate MHD study.")
@@ -351,6 +497,9 @@ async def run_validation_task(  # noqa: PLR0913
                     )
                 )
         policy_result.phases = phases
+        policy_result.study_size_bucket = get_study_size_bucket(model)
+        policy_result.phase_timings = timer.timings
+        timer.observe(policy_result.study_size_bucket)
         result_list.results.append(policy_result)
 
     except Exception as ex:
@@ -376,7 +525,9 @@ async def validate_by_policy_service(
     modifier_result: None | StudyMetadataModifierResult,
     policy_service: PolicyService,
     ontology_search_service: None | OntologySearchService = None,
+    phase_timer: None | PhaseTimer = None,
 ) -> PolicyResult:
+    timer = phase_timer or PhaseTimer()
     policy_result: PolicyResult = PolicyResult()
     policy_result.resource_id = resource_id
     if modifier_result and modifier_result.resource_id:
@@ -393,17 +544,11 @@ async def validate_by_policy_service(
         elif modifier_result.logs:
             policy_result.metadata_updates = modifier_result.logs
     start_time = time.time()
-
-    for file in model.assays:
-        technique = model.assays[file].assay_technique.name
-        policy_result.assay_file_techniques[file] = technique
-
-    for file in model.metabolite_assignments:
-        technique = model.metabolite_assignments[file].assay_technique.name
-        policy_result.maf_file_techniques[file] = technique
+    update_file_techniques(policy_result, model)
 
     try:
-        messages = await policy_service.validate_study(resource_id, model)
+        with timer.measure("policy_validation", get_study_row_count(model)):
+            messages = await policy_service.validate_study(resource_id, model)
         policy_result.start_time = datetime.datetime.fromtimestamp(
             start_time
         ).isoformat()
@@ -415,12 +560,181 @@ async def validate_by_policy_service(
         logger.error("Invalid OPA response or parse error for %s", resource_id)
         logger.exception(ex)
         raise ex
-    await post_process_validation_messages(
-        model, policy_result, policy_service, ontology_search_service
-    )
+    with timer.measure("ontology_validation", len(messages.violations)):
+        await post_process_validation_messages(
+            model, policy_result, policy_service, ontology_search_service
+        )
     return policy_result
 
 
+async def validate_assignment_file_chunks(  # noqa: PLR0913
+    resource_id: str,
+    model: MetabolightsStudyModel,
+    policy_result: PolicyResult,
+    metadata_service: StudyMetadataService,
+    policy_service: PolicyService,
+    chunk_size: int,
+    max_parallel_chunks: int = 4,
+    file_names: None | set[str] = None,
+    ontology_search_service: None | OntologySearchService = None,
+) -> PolicyResult:
+    """Validate remaining rows of partially loaded MAF files in row windows.
+
+    The first window of each MAF file is validated with the study model.
+    The other windows are loaded and validated concurrently, at most
+    max_parallel_chunks windows are in memory at the same time.
+    Violations of each window are merged into the policy result.
+    """
+    semaphore = asyncio.Semaphore(max(1, max_parallel_chunks))
+
+    async def validate_chunk(file_name: str, offset: int) -> None:
+        async with semaphore:
+            maf_file = model.metabolite_assignments[file_name]
+            isa_table, parser_messages = await metadata_service.load_isa_table_sheet(
+                file_name, offset=offset, limit=chunk_size
+            )
+            parse_errors = [
+                x
+                for x in parser_messages
+                if x.type in (ParserMessageType.CRITICAL, ParserMessageType.ERROR)
+            ]
+            if parse_errors:
+                merge_policy_messages(
+                    policy_result.messages.violations,
+                    [create_chunk_parse_error_message(file_name, offset, parse_errors)],
+                )
+            if not isa_table.table.row_count:
+                logger.warning(
+                    "%s %s rows from %s are not loaded.", resource_id, file_name, offset
+                )
+                return
+            chunk_model = model.model_copy(
+                update={
+                    "assays": {
+                        k: v
+                        for k, v in model.assays.items()
+                        if file_name in v.referenced_assignment_files
+                    },
+                    "metabolite_assignments": {
+                        file_name: maf_file.model_copy(
+                            update={"table": isa_table.table}
+                        )
+                    },
+                }
+            )
+            chunk_result = PolicyResult(
+                resource_id=resource_id,
+                messages=await policy_service.validate_study(resource_id, chunk_model),
+            )
+            await post_process_validation_messages(
+                chunk_model, chunk_result, policy_service, ontology_search_service
+            )
+            messages = chunk_result.messages
+            merge_policy_messages(
+                policy_result.messages.violations,
+                [x for x in messages.violations if x.source_file == file_name],
+            )
+            merge_policy_messages(
+                policy_result.messages.summary,
+                [x for x in messages.summary if x.source_file == file_name],
+            )
+            logger.debug(
+                "%s %s rows %s-%s are validated.",
+                resource_id,
+                file_name,
+                offset,
+                offset + isa_table.table.row_count,
+            )
+
+    tasks = []
+    for file_name, maf_file in model.metabolite_assignments.items():
+        if file_names is not None and file_name not in file_names:
+            continue
+        table = maf_file.table
+        if table.total_row_count <= table.row_count:
+            continue
+        logger.info(
+            "Validate %s %s (%s rows) in chunks of %s rows.",
+            resource_id,
+            file_name,
+            table.total_row_count,
+            chunk_size,
+        )
+        for offset in range(table.row_count, table.total_row_count, chunk_size):
+            tasks.append(validate_chunk(file_name, offset))
+    if tasks:
+        await asyncio.gather(*tasks)
+    return policy_result
+
+
+def create_chunk_parse_error_message(
+    file_name: str, offset: int, parse_errors: list[ParserMessage]
+) -> PolicyMessage:
+    values = [f"Row {offset}+: {x.short} {x.detail}".strip() for x in parse_errors]
+    return PolicyMessage(
+        type=PolicyMessageType.ERROR,
+        section="metabolites",
+        source_file=file_name,
+        priority="CRITICAL",
+        identifier="rule___400_100_001_01",
+        title="MAF file parse error",
+        description="MAF file rows are not parsed and validated. "
+        "Please fix the file format or contact MetaboLights team for help.",
+        violation=f"{file_name} rows are not parsed. " + ", ".join(values),
+        values=values,
+        total_violations=len(values),
+    )
+
+
+def merge_policy_messages(
+    target: list[PolicyMessage], messages: list[PolicyMessage]
+) -> list[PolicyMessage]:
+    """Merge messages into the target list without duplicates.
+
+    Values and violation counts of the same rule and source are combined
+    and the most severe message type is selected.
+    """
+
+    def get_key(x: PolicyMessage):
+        return (
+            x.identifier,
+            x.source_file,
+            x.source_column_header,
+            str(x.source_column_index),
+        )
+
+    current = {get_key(x): x for x in target}
+    for message in messages:
+        key = get_key(message)
+        if key not in current:
+            current[key] = message
+            target.append(message)
+            continue
+        item = current[key]
+        values = set(item.values)
+        item.values.extend(x for x in message.values if x not in values)
+        item.total_violations += message.total_violations
+        item.has_more_violations = (
+            item.has_more_violations or message.has_more_violations
+        )
+        if message.type.get_level() > item.type.get_level():
+            item.type = message.type
+            item.violation = message.violation
+    return target
+
+
+def update_file_techniques(
+    policy_result: PolicyResult, model: MetabolightsStudyModel
+) -> None:
+    for file in model.assays:
+        technique = model.assays[file].assay_technique.name
+        policy_result.assay_file_techniques[file] = technique
+
+    for file in model.metabolite_assignments:
+        technique = model.metabolite_assignments[file].assay_technique.name
+        policy_result.maf_file_techniques[file] = technique
+
+
 async def process_mhd_study(
     policy_result: PolicyResult,
     resource_id: str,
@@ -436,10 +750,13 @@ async def process_mhd_study(
 
     category_str = StudyCategoryStr(category_label)
     version_settings = templates.configuration.versions.get(template_version)
+    mhd_digest_object_key = f"DATA_FILES/{resource_id}{MHD_DIGEST_FILE_SUFFIX}"
 
     if category_str in version_settings.active_mhd_profiles:
         mhd_file_path = None
         announcement_file_path = None
+        mhd_validation_file_path = None
+        mhd_digest = None
         mhd_model_version = model.study_db_metadata.mhd_model_version
         mhd_accession = model.study_db_metadata.reserved_mhd_accession
         profile_settings = version_settings.active_mhd_profiles.get(category_str)
@@ -466,12 +783,39 @@ async def process_mhd_study(
                     study_http_base_url=config.mhd_configuration.study_http_base_url,
                     default_dataset_licence_url=model.study_db_metadata.dataset_license_url,
                 )
+                mhd_digest = create_mhd_conversion_digest(
+                    policy_result.input_hashes
+                    or create_validation_input_hashes(model, []),
+                    mhd_accession=mhd_accession,
+                    mhd_model_version=mhd_model_version,
+                    schema_uri=schema_uri,
+                    profile_uri=profile_uri,
+                    config=mtbls2mhd_config.model_dump(mode="json"),
+                )
+                if await find_reusable_mhd_files(
+                    resource_id,
+                    mhd_digest,
+                    internal_files_object_repository,
+                    object_keys=[
+                        f"DATA_FILES/{resource_id}.mhd.json",
+                        f"DATA_FILES/{resource_id}.announcement.json",
+                        f"DATA_FILES/{resource_id}.mhd.validation.json",
+                    ],
+                    digest_object_key=mhd_digest_object_key,
+                ):
+                    logger.info(
+                        "MHD inputs of %s are not changed. "
+                        "MHD files of the last successful conversion are reused.",
+                        resource_id,
+                    )
+                    return True
                 (
                     mhd_file_path,
                     announcement_file_path,
                     mhd_validation_file_path,
-                ) = await validate_mhd_study(
-                    policy_result,
+                    mhd_messages,
+                ) = await run_in_process_pool(
+                    convert_and_validate_mhd_study,
                     resource_id,
                     mhd_accession,
                     schema_uri,
@@ -479,7 +823,13 @@ async def process_mhd_study(
                     mhd_filename=f"{resource_id}.mhd.json",
                     annoucement_filename=f"{resource_id}.announcement.json",
                     config=mtbls2mhd_config,
+                    has_errors=any(
+                        x.type == PolicyMessageType.ERROR
+                        for x in policy_result.messages.violations
+                    ),
+                    timeout_in_seconds=config.mhd_conversion_timeout_in_seconds,
                 )
+                policy_result.messages.violations.extend(mhd_messages)
             else:
                 logger.error(
                     "MHD version %s is not supported for %s",
@@ -496,6 +846,7 @@ async def process_mhd_study(
                 object_key.endswith(".mhd.json")
                 or object_key.endswith(".announcement.json")
                 or object_key.endswith(".mhd.validation.json")
+                or object_key.endswith(MHD_DIGEST_FILE_SUFFIX)
             ):
                 await internal_files_object_repository.delete_object(
                     resource_id, object_key
@@ -522,9 +873,57 @@ async def process_mhd_study(
                 f"file://{mhd_validation_file_path}",
                 override=True,
             )
+            mhd_validation = json.loads(Path(mhd_validation_file_path).read_text())
+            if mhd_digest and mhd_validation.get("status") == "success":
+                digest_file_path = Path(mhd_validation_file_path).with_name(
+                    f"{resource_id}{MHD_DIGEST_FILE_SUFFIX}"
+                )
+                digest_file_path.write_text(json.dumps({"digest": mhd_digest}))
+                await internal_files_object_repository.put_object(
+                    resource_id,
+                    mhd_digest_object_key,
+                    f"file://{digest_file_path}",
+                    override=True,
+                )
     return True
 
 
+def convert_and_validate_mhd_study(  # noqa: PLR0913
+    resource_id: str,
+    mhd_accession: None | str,
+    schema_uri: str,
+    profile_uri: str,
+    mhd_filename: None | str = None,
+    annoucement_filename: None | str = None,
+    config: None | Mtbls2MhdConfiguration = None,
+    has_errors: bool = False,
+) -> tuple[Path, Path, Path, list[PolicyMessage]]:
+    """Convert and validate MHD study in a worker process.
+
+    Returns MHD file paths and MHD validation messages.
+    """
+    policy_result = PolicyResult()
+    if has_errors:
+        # MHD validation messages are not added if study has errors.
+        policy_result.messages.violations.append(
+            PolicyMessage(type=PolicyMessageType.ERROR)
+        )
+    file_paths = asyncio.run(
+        validate_mhd_study(
+            policy_result,
+            resource_id,
+            mhd_accession,
+            schema_uri,
+            profile_uri,
+            mhd_filename=mhd_filename,
+            annoucement_filename=annoucement_filename,
+            config=config,
+        )
+    )
+    messages = [] if has_errors else policy_result.messages.violations
+    return *file_paths, messages
+
+
 async def validate_mhd_study(
     policy_result: PolicyResult,
     resource_id: str,
@@ -978,25 +1377,43 @@ async def get_input_data(
     assignment_sheet_limit: None | int = None,
 ) -> MetabolightsStudyModel:
     phases.sort(key=lambda x: x.value)
-    load_sample_file = False
-    load_assay_files = False
-    load_maf_files = False
-    load_folder_metadata = False
-    load_db_metadata = True
+    return await metadata_service.load_study_model(
+        **get_input_data_load_options(phases),
+        assignment_sheet_limit=assignment_sheet_limit,
+    )
+
+
+def get_input_data_load_options(phases: list[ValidationPhase]) -> dict[str, bool]:
+    """Return load_study_model flags of the validation input for the phases."""
+    load_options = {
+        "load_sample_file": False,
+        "load_assay_files": False,
+        "load_maf_files": False,
+        "load_folder_metadata": False,
+        "load_db_metadata": True,
+    }
     for phase in phases:
         if phase == ValidationPhase.PHASE_2:
-            load_sample_file = True
-            load_assay_files = True
+            load_options["load_sample_file"] = True
+            load_options["load_assay_files"] = True
         elif phase == ValidationPhase.PHASE_3:
-            load_sample_file = True
-            load_maf_files = True
+            load_options["load_sample_file"] = True
+            load_options["load_maf_files"] = True
         elif phase == ValidationPhase.PHASE_4:
-            load_folder_metadata = True
-    return await metadata_service.load_study_model(
-        load_sample_file=load_sample_file,
-        load_assay_files=load_assay_files,
-        load_maf_files=load_maf_files,
-        load_folder_metadata=load_folder_metadata,
-        load_db_metadata=load_db_metadata,
-        assignment_sheet_limit=assignment_sheet_limit,
-    )
+            load_options["load_folder_metadata"] = True
+    return load_options
+
+
+def is_modifier_model_reusable(
+    validation_run_configuration: ValidationRunConfiguration,
+) -> bool:
+    """Check the modified model has the same content as validation input.
+
+    Skipped MAF files are reloaded after modification for phase 3.
+    """
+    config = validation_run_configuration
+    phases = config.validation_phases or []
+    load_options = get_modifier_load_options(config)
+    if config.skip_result_file_modification and ValidationPhase.PHASE_3 in phases:
+        load_options["load_maf_files"] = True
+    return load_options == get_input_data_load_options(phases)
@@ -28,6 +28,18 @@ class CacheService(abc.ABC):
         expiration_time_in_seconds: Union[None, int] = None,
     ) -> bool: ...
 
+    @abc.abstractmethod
+    async def set_value_if_not_exists(
+        self,
+        key: str,
+        value: Any,
+        expiration_time_in_seconds: Union[None, int] = None,
+    ) -> bool:
+        """Set the value atomically if key does not exist.
+
+        Returns True if the value is set, False if key already exists.
+        """
+
     @abc.abstractmethod
     async def delete_key(self, key: str) -> bool: ...
 
@@ -0,0 +1,18 @@
+import abc
+from typing import Any
+
+
+class CacheValueCodec(abc.ABC):
+    @abc.abstractmethod
+    def encode(self, value: Any) -> Any: ...
+
+    @abc.abstractmethod
+    def decode(self, value: Any) -> Any: ...
+
+
+class PlainCacheValueCodec(CacheValueCodec):
+    def encode(self, value: Any) -> Any:
+        return value
+
+    def decode(self, value: Any) -> Any:
+        return value
@@ -7,6 +7,7 @@ from metabolights_utils.isatab import Writer
 from metabolights_utils.models.isa.common import IsaTableFile
 from metabolights_utils.models.isa.investigation_file import Investigation
 from metabolights_utils.models.metabolights.model import MetabolightsStudyModel
+from metabolights_utils.models.parser.common import ParserMessage
 from metabolights_utils.provider.study_provider import AbstractMetadataFileProvider
 
 from mtbls.application.services.study_metadata_service.models import (
@@ -58,6 +59,7 @@ class StudyMetadataService(AbstractMetadataFileProvider, abc.ABC):
         model: MetabolightsStudyModel,
         save_metadata_files: bool = True,
         save_result_files: bool = True,
+        object_keys: Union[None, list[str]] = None,
     ) -> bool: ...
 
     @abc.abstractmethod
@@ -135,6 +137,7 @@ class StudyMetadataService(AbstractMetadataFileProvider, abc.ABC):
         self,
         prefix: Union[None, str] = None,
         suffix: Union[None, str] = None,
+        object_keys: Union[None, list[str]] = None,
     ) -> tuple[str, str]: ...
 
     @abc.abstractmethod
@@ -142,6 +145,29 @@ class StudyMetadataService(AbstractMetadataFileProvider, abc.ABC):
         self, snapshot_name: str
     ) -> tuple[str, str]: ...
 
+    @abc.abstractmethod
+    async def reload_study_model_files(
+        self,
+        model: MetabolightsStudyModel,
+        object_keys: list[str],
+        assignment_sheet_limit: Union[int, None] = None,
+    ) -> MetabolightsStudyModel:
+        """Parse the selected files of a loaded model again.
+
+        It is used to refresh a loaded model after only some of its files
+        are saved, instead of loading the whole study again.
+        """
+
+    @abc.abstractmethod
+    async def load_isa_table_sheet(
+        self,
+        object_key: str,
+        expected_patterns: Union[None, list[list[str]]] = None,
+        offset: Union[int, None] = None,
+        limit: Union[int, None] = None,
+    ) -> tuple[IsaTableFile, list[ParserMessage]]:
+        """Parse selected rows of an ISA table file."""
+
     async def dump_investigation_as_json(
         self,
         investigation: Investigation,
@@ -183,14 +209,22 @@ class StudyMetadataService(AbstractMetadataFileProvider, abc.ABC):
         investigation_module_name: Union[None, str] = None,
         save_metadata_files: bool = True,
         save_result_files: bool = True,
+        object_keys: Union[None, list[str]] = None,
     ):
+        """Write study metadata files to the output directory.
+
+        If object_keys is defined, only files in the list are written.
+        """
+        selected_files = set(object_keys) if object_keys is not None else None
         Path(output_dir).mkdir(parents=True, exist_ok=True)
-        Writer.get_investigation_file_writer().write(
-            mtbls_model.investigation,
-            f"{output_dir}/{mtbls_model.investigation_file_path}",
-            values_in_quotation_mark=values_in_quotation_mark,
-            investigation_module_name=investigation_module_name,
-        )
+        investigation_file_path = mtbls_model.investigation_file_path
+        if selected_files is None or investigation_file_path in selected_files:
+            Writer.get_investigation_file_writer().write(
+                mtbls_model.investigation,
+                f"{output_dir}/{investigation_file_path}",
+                values_in_quotation_mark=values_in_quotation_mark,
+                investigation_module_name=investigation_module_name,
+            )
         study_groups = []
         if save_metadata_files:
             study_groups.append(mtbls_model.samples)
@@ -199,6 +233,11 @@ class StudyMetadataService(AbstractMetadataFileProvider, abc.ABC):
             study_groups.append(mtbls_model.metabolite_assignments)
         for isa_table_files in study_groups:
             for isa_table_file in isa_table_files.values():
+                if (
+                    selected_files is not None
+                    and isa_table_file.file_path not in selected_files
+                ):
+                    continue
                 await cls.dump_isa_table(
                     isa_table_file,
                     f"{output_dir}/{isa_table_file.file_path}",
@@ -240,12 +279,7 @@ class StudyMetadataService(AbstractMetadataFileProvider, abc.ABC):
         for column_model in isa_table_data.columns:
             column_order_map[column_model.column_index] = column_model.column_name
             column_header_map[column_model.column_index] = column_model.column_header
-        data: dict[str, list[str]] = {}
-        for row in isa_table_data.rows:
-            for col, val in row.data.items():
-                if col not in data:
-                    data[col] = []
-                data[col].append(val)
+        data = isa_table_data.get_column_values()
 
         cls.dump_isa_table_columns(
             file_path,
@@ -3,7 +3,8 @@ from typing import Union
 
 from mtbls.domain.entities.validation.validation_report import ValidationReport
 from mtbls.domain.shared.data_types import ZeroOrPositiveInt
-from mtbls.domain.shared.validator.policy import PolicySummaryResult
+from mtbls.domain.shared.validator.policy import PolicyMessage, PolicySummaryResult
+from mtbls.domain.shared.validator.report_query import ValidationReportIndex
 
 
 class ValidationReportService(abc.ABC):
@@ -39,3 +40,37 @@ class ValidationReportService(abc.ABC):
     async def load_validation_report_by_validation_time(
         self, resource_id: str, validation_time: str
     ) -> PolicySummaryResult: ...
+
+    async def save_validation_report_index(
+        self,
+        resource_id: str,
+        task_id: str,
+        report_index: ValidationReportIndex,
+        messages: Union[None, list[PolicyMessage]] = None,
+    ) -> bool:
+        """Store message index of a validation report.
+
+        If messages are given, they are also stored in blocks and offsets of
+        blocks are added to the index. Returns False if the service does not
+        store report indices.
+        """
+        return False
+
+    async def load_validation_report_messages(
+        self,
+        resource_id: str,
+        task_id: str,
+        report_index: ValidationReportIndex,
+        positions: list[int],
+    ) -> Union[None, list[PolicyMessage]]:
+        """Return violations at positions without loading the report.
+
+        None is returned if messages of the report are not stored in blocks.
+        """
+        return None
+
+    async def load_validation_report_index(
+        self, resource_id: str, task_id: str
+    ) -> Union[None, ValidationReportIndex]:
+        """Return stored message index of a validation report, if it exists."""
+        return None
@@ -0,0 +1,116 @@
+import hashlib
+import logging
+import re
+from typing import Any
+
+from mtbls.application.services.interfaces.policy_service import PolicyService
+from mtbls.application.services.interfaces.repositories.file_object.file_object_read_repository import (  # noqa: E501
+    FileObjectReadRepository,
+)
+from mtbls.application.services.interfaces.repositories.study.study_read_repository import (  # noqa: E501
+    StudyReadRepository,
+)
+from mtbls.application.services.interfaces.repositories.user.user_read_repository import (  # noqa: E501
+    UserReadRepository,
+)
+from mtbls.application.services.interfaces.validation_override_service import (
+    ValidationOverrideService,
+)
+from mtbls.application.services.study_metadata_service.db_metadata_collector import (
+    DefaultAsyncDbMetadataCollector,
+)
+from mtbls.domain.entities.study_file import StudyDataFileOutput
+
+logger = logging.getLogger(__name__)
+
+
+class ValidationInputDigestCalculator:
+    """Calculates a digest of all inputs that change a study validation result.
+
+    Digest inputs are ISA metadata file states, study database metadata,
+    data file index, validation overrides and policy service configuration.
+    File states are read from repository metadata (size, modification time
+    and stored hashes), file contents are not read.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        metadata_files_object_repository: FileObjectReadRepository,
+        internal_files_object_repository: FileObjectReadRepository,
+        study_read_repository: StudyReadRepository,
+        user_read_repository: UserReadRepository,
+        policy_service: PolicyService,
+        validation_override_service: ValidationOverrideService,
+        data_file_index_file_key: str = "DATA_FILES/data_file_index.json",
+    ):
+        self.metadata_files_object_repository = metadata_files_object_repository
+        self.internal_files_object_repository = internal_files_object_repository
+        self.policy_service = policy_service
+        self.validation_override_service = validation_override_service
+        self.data_file_index_file_key = data_file_index_file_key
+        self.db_metadata_collector = DefaultAsyncDbMetadataCollector(
+            study_read_repository=study_read_repository,
+            user_read_repository=user_read_repository,
+        )
+        self.policy_version: None | tuple[tuple[Any, ...], str] = None
+
+    async def calculate(self, resource_id: str, apply_modifiers: bool) -> str:
+        digest = hashlib.sha256()
+        digest.update(f"apply_modifiers:{apply_modifiers}\n".encode())
+
+        files = await self.metadata_files_object_repository.list(resource_id)
+        isa_files = [
+            x for x in files if x.basename and re.match(r"^[isam]_.+", x.basename)
+        ]
+        isa_files.sort(key=lambda x: x.object_key)
+        for file in isa_files:
+            file_state = self._get_file_state(file)
+            digest.update(f"metadata:{file.object_key}:{file_state}\n".encode())
+
+        data_file_index = await self.internal_files_object_repository.get_info(
+            resource_id, self.data_file_index_file_key
+        )
+        data_file_index_state = ""
+        if data_file_index:
+            data_file_index_state = self._get_file_state(data_file_index)
+        digest.update(f"data_file_index:{data_file_index_state}\n".encode())
+
+        db_metadata, _ = await self.db_metadata_collector.get_study_metadata_from_db(
+            resource_id, None
+        )
+        digest.update(db_metadata.model_dump_json().encode())
+
+        overrides = await self.validation_override_service.get_validation_overrides(
+            resource_id=resource_id
+        )
+        digest.update(overrides.model_dump_json().encode())
+
+        digest.update((await self.get_policy_version()).encode())
+        return digest.hexdigest()
+
+    async def get_policy_version(self) -> str:
+        """Return digest of policy service configuration.
+
+        Policy service returns the same configuration objects until it fetches
+        them again, so digest is calculated only when a new object is returned.
+        """
+        rule_definitions = await self.policy_service.get_rule_definitions()
+        templates = await self.policy_service.get_templates()
+        control_lists = await self.policy_service.get_control_lists()
+        if not rule_definitions or not templates or not control_lists:
+            raise ValueError("Policy service configuration is not fetched.")
+        sources = (rule_definitions, templates, control_lists)
+        if self.policy_version and all(
+            x is y for x, y in zip(self.policy_version[0], sources)
+        ):
+            return self.policy_version[1]
+        digest = hashlib.sha256()
+        digest.update(rule_definitions.validation_version.encode())
+        digest.update(templates.model_dump_json().encode())
+        digest.update(control_lists.model_dump_json().encode())
+        self.policy_version = (sources, digest.hexdigest())
+        return self.policy_version[1]
+
+    def _get_file_state(self, file: StudyDataFileOutput) -> str:
+        hashes = sorted(f"{k}={v}" for k, v in file.hashes.items())
+        return "|".join([str(file.size_in_bytes), str(file.updated_at), *hashes])
@@ -0,0 +1,218 @@
+import logging
+from typing import Union
+
+from cachetools import LRUCache
+
+from mtbls.application.services.interfaces.validation_report_service import (
+    ValidationReportService,
+)
+from mtbls.domain.shared.data_types import ZeroOrPositiveInt
+from mtbls.domain.shared.validator.policy import PolicyMessage, PolicySummaryResult
+from mtbls.domain.shared.validator.report_query import (
+    ValidationReportFacet,
+    ValidationReportIndex,
+    ValidationReportPage,
+)
+
+logger = logging.getLogger(__name__)
+
+# Reports are not updated after they are saved with a task id.
+# Only indices are cached and cache size is bounded by total number of violations.
+loaded_report_indices: LRUCache = LRUCache(
+    maxsize=1_000_000, getsizeof=lambda x: max(1, x.total)
+)
+
+
+def get_facet_value(message: PolicyMessage, facet: ValidationReportFacet) -> str:
+    if facet == ValidationReportFacet.TYPE:
+        return message.type.value
+    if facet == ValidationReportFacet.SOURCE_FILE:
+        return message.source_file
+    if facet == ValidationReportFacet.RULE_ID:
+        return message.identifier
+    return message.source_column_header
+
+
+def create_validation_report_index(
+    task_id: str, validation_result: PolicySummaryResult
+) -> ValidationReportIndex:
+    """Create posting lists of violation positions for each facet value."""
+    violations = validation_result.messages.violations
+    facets: dict[str, dict[str, list[int]]] = {
+        x.value: {} for x in ValidationReportFacet
+    }
+    for position, violation in enumerate(violations):
+        for facet in ValidationReportFacet:
+            value = get_facet_value(violation, facet)
+            facets[facet.value].setdefault(value, []).append(position)
+    return ValidationReportIndex(task_id=task_id, total=len(violations), facets=facets)
+
+
+async def save_validation_report_index(
+    resource_id: str,
+    task_id: str,
+    validation_result: PolicySummaryResult,
+    validation_report_service: ValidationReportService,
+) -> bool:
+    try:
+        report_index = create_validation_report_index(task_id, validation_result)
+        return await validation_report_service.save_validation_report_index(
+            resource_id=resource_id,
+            task_id=task_id,
+            report_index=report_index,
+            messages=validation_result.messages.violations,
+        )
+    except Exception as ex:
+        logger.warning(
+            "Validation report index of %s %s is not saved: %s",
+            resource_id,
+            task_id,
+            ex,
+        )
+        return False
+
+
+async def _load_report_index(
+    resource_id: str, task_id: str, validation_report_service: ValidationReportService
+) -> tuple[ValidationReportIndex, Union[None, PolicySummaryResult]]:
+    """Return report index and the report if it is loaded to create the index."""
+    key = (resource_id, task_id)
+    if key in loaded_report_indices:
+        return loaded_report_indices[key], None
+    report_index = None
+    try:
+        report_index = await validation_report_service.load_validation_report_index(
+            resource_id=resource_id, task_id=task_id
+        )
+    except Exception as ex:
+        logger.warning(
+            "Validation report index of %s %s is not loaded: %s",
+            resource_id,
+            task_id,
+            ex,
+        )
+    report = None
+    if not report_index or not report_index.message_block_offsets:
+        report = await validation_report_service.load_validation_report_by_task_id(
+            resource_id=resource_id, task_id=task_id
+        )
+        if not report_index or report_index.total != len(report.messages.violations):
+            report_index = create_validation_report_index(task_id, report)
+        # index of reports saved before message blocks is updated once.
+        try:
+            await validation_report_service.save_validation_report_index(
+                resource_id=resource_id,
+                task_id=task_id,
+                report_index=report_index,
+                messages=report.messages.violations,
+            )
+        except Exception as ex:
+            logger.warning(
+                "Validation report index of %s %s is not saved: %s",
+                resource_id,
+                task_id,
+                ex,
+            )
+    if report_index.message_block_offsets and (
+        loaded_report_indices.getsizeof(report_index) <= loaded_report_indices.maxsize
+    ):
+        loaded_report_indices[key] = report_index
+    return report_index, report
+
+
+async def _load_page_messages(
+    resource_id: str,
+    task_id: str,
+    report_index: ValidationReportIndex,
+    report: Union[None, PolicySummaryResult],
+    positions: list[int],
+    validation_report_service: ValidationReportService,
+) -> list[PolicyMessage]:
+    if report is None:
+        messages = await validation_report_service.load_validation_report_messages(
+            resource_id=resource_id,
+            task_id=task_id,
+            report_index=report_index,
+            positions=positions,
+        )
+        if messages is not None:
+            return messages
+        report = await validation_report_service.load_validation_report_by_task_id(
+            resource_id=resource_id, task_id=task_id
+        )
+    violations = report.messages.violations
+    return [violations[x] for x in positions]
+
+
+def _select_positions(
+    report_index: ValidationReportIndex,
+    filters: dict[ValidationReportFacet, list[str]],
+    excluded_facet: Union[None, ValidationReportFacet] = None,
+) -> set[int]:
+    # values of the same facet are joined with OR, facets are joined with AND.
+    selected = set(range(report_index.total))
+    for facet, values in filters.items():
+        if facet == excluded_facet or not values:
+            continue
+        postings = report_index.facets.get(facet.value, {})
+        facet_positions = set()
+        for value in values:
+            facet_positions.update(postings.get(value, []))
+        selected.intersection_update(facet_positions)
+    return selected
+
+
+async def query_validation_report(  # noqa: PLR0913
+    resource_id: str,
+    task_id: str,
+    validation_report_service: ValidationReportService,
+    message_types: Union[None, list[str]] = None,
+    source_files: Union[None, list[str]] = None,
+    rule_ids: Union[None, list[str]] = None,
+    columns: Union[None, list[str]] = None,
+    offset: ZeroOrPositiveInt = 0,
+    limit: ZeroOrPositiveInt = 100,
+) -> ValidationReportPage:
+    """Return a page of filtered violations and counts of each facet value.
+
+    Facet counts are calculated with the filters of the other facets, so
+    selectable values of a facet are not narrowed by its own filter.
+    Messages of the page are read from stored message blocks if they exist.
+    """
+    report_index, report = await _load_report_index(
+        resource_id, task_id, validation_report_service
+    )
+    filters = {
+        ValidationReportFacet.TYPE: message_types or [],
+        ValidationReportFacet.SOURCE_FILE: source_files or [],
+        ValidationReportFacet.RULE_ID: rule_ids or [],
+        ValidationReportFacet.COLUMN: columns or [],
+    }
+    positions = sorted(_select_positions(report_index, filters))
+    page_positions = positions[offset : offset + limit] if limit else positions[offset:]
+
+    facet_counts: dict[str, dict[str, int]] = {}
+    for facet in ValidationReportFacet:
+        candidates = _select_positions(report_index, filters, excluded_facet=facet)
+        counts = {}
+        for value, postings in report_index.facets.get(facet.value, {}).items():
+            count = len(candidates.intersection(postings))
+            if count:
+                counts[value] = count
+        facet_counts[facet.value] = counts
+
+    return ValidationReportPage(
+        task_id=task_id,
+        offset=offset,
+        limit=limit,
+        total=len(positions),
+        messages=await _load_page_messages(
+            resource_id,
+            task_id,
+            report_index,
+            report,
+            page_positions,
+            validation_report_service,
+        ),
+        facet_counts=facet_counts,
+    )
@@ -1,11 +1,15 @@
 from typing import Union
 
+from mtbls.application.remote_tasks.common.phase_timer import PhaseTimer
 from mtbls.application.services.interfaces.validation_override_service import (
     ValidationOverrideService,
 )
 from mtbls.application.services.interfaces.validation_report_service import (
     ValidationReportService,
 )
+from mtbls.application.use_cases.validation.validation_report_query import (
+    save_validation_report_index,
+)
 from mtbls.domain.shared.data_types import ZeroOrPositiveInt
 from mtbls.domain.shared.validation_result_file import ValidationResultFile
 from mtbls.domain.shared.validator.policy import PolicyMessage, PolicySummaryResult
@@ -46,12 +50,26 @@ async def override_and_save_validation_report(
     )
     overrides.validation_overrides.sort(key=lambda x: x.rule_id + x.source_file)
     validation_result.overrides = overrides
-    await apply_overrides_on_validations_result(
+    timer = PhaseTimer()
+    violations_count = len(validation_result.messages.violations)
+    with timer.measure("apply_overrides", violations_count):
+        await apply_overrides_on_validations_result(
+            validation_result=validation_result,
+            validation_override_service=validation_override_service,
+        )
+    validation_result.phase_timings.extend(timer.timings)
+    with timer.measure("save_report", violations_count):
+        await validation_report_service.save_validation_report(
+            resource_id=resource_id,
+            task_id=task_id,
+            validation_result=validation_result,
+        )
+    timer.observe(validation_result.study_size_bucket)
+    await save_validation_report_index(
+        resource_id=resource_id,
+        task_id=task_id,
         validation_result=validation_result,
-        validation_override_service=validation_override_service,
-    )
-    await validation_report_service.save_validation_report(
-        resource_id=resource_id, task_id=task_id, validation_result=validation_result
+        validation_report_service=validation_report_service,
     )
     return validation_result
 
@@ -72,12 +90,11 @@ async def apply_overrides_on_validations_result(
     summary_overrides: dict[str, set[PolicyMessageType]] = {}
     all_violations_map: dict[str, PolicyMessage] = {}
     if overrides_map:
+        override_index = ValidationOverrideIndex(overrides.validation_overrides)
         for violation in validation_result.messages.violations:
             all_violations_map[violation.identifier] = violation
             if violation.identifier in overrides_map:
-                override = match_override(
-                    overrides_map[violation.identifier], violation
-                )
+                override = override_index.match(violation)
                 if override:
                     violation.overridden = True
                     violation.override_comment = override.comment
@@ -164,6 +181,34 @@ def match_override(overrides: list[ValidationOverride], violation: PolicyMessage
     return override
 
 
+class ValidationOverrideIndex:
+    """Enabled validation overrides indexed by rule id.
+
+    match_override counts matched conditions of all overrides of a rule
+    together and selects the override where the count reaches four.
+    Each override matches at least its rule id, so only the first four
+    overrides of a rule can be selected. Only these are stored and
+    matching checks at most four overrides for each violation.
+    """
+
+    MAX_CANDIDATES = 4
+
+    def __init__(self, overrides: list[ValidationOverride]):
+        self.index: dict[str, list[ValidationOverride]] = {}
+        for override in overrides:
+            if not override.enabled:
+                continue
+            candidates = self.index.setdefault(override.rule_id, [])
+            if len(candidates) < self.MAX_CANDIDATES:
+                candidates.append(override)
+
+    def match(self, violation: PolicyMessage) -> None | ValidationOverride:
+        candidates = self.index.get(violation.identifier)
+        if not candidates:
+            return None
+        return match_override(candidates, violation)
+
+
 def select_message_type(violation_types: set[PolicyMessageType]):
     if PolicyMessageType.ERROR in violation_types:
         return PolicyMessageType.ERROR
@@ -1,6 +1,8 @@
+import asyncio
 import datetime
-import io
+import json
 import logging
+from collections.abc import Iterator
 from typing import Union
 
 from mtbls.application.remote_tasks.common.run_validation import run_validation
@@ -17,10 +19,14 @@ from mtbls.application.services.interfaces.validation_override_service import (
 from mtbls.application.services.interfaces.validation_report_service import (
     ValidationReportService,
 )
+from mtbls.application.services.study_metadata_service.validation_input_digest import (
+    ValidationInputDigestCalculator,
+)
 from mtbls.application.use_cases.validation.validation_reports import (
     load_validation_report_by_task_id,
     override_and_save_validation_report,
 )
+from mtbls.domain.enums.async_task_priority import AsyncTaskPriority
 from mtbls.domain.exceptions.async_task import (
     AsyncTaskAlreadyStartedError,
     AsyncTaskCheckStatusFailure,
@@ -45,6 +51,9 @@ from mtbls.domain.shared.validator.types import PolicyMessageType
 
 logger = logging.getLogger(__name__)
 
+# Placeholder value of current validation task key while a new task is starting.
+VALIDATION_TASK_CLAIM_VALUE = "__starting__"
+
 
 async def start_study_validation_task(  # noqa: PLR0913
     resource_id: str,
@@ -53,8 +62,16 @@ async def start_study_validation_task(  # noqa: PLR0913
     apply_modifiers: bool = False,
     override_ready_task_results: bool = False,
     cache_expiration_in_seconds: int = 10 * 60,
+    validation_input_digest_calculator: None | ValidationInputDigestCalculator = None,
+    validation_report_service: None | ValidationReportService = None,
+    input_digest_expiration_in_seconds: int = 7 * 24 * 60 * 60,
+    incremental: bool = False,
+    priority: AsyncTaskPriority = AsyncTaskPriority.INTERACTIVE,
+    claim_expiration_in_seconds: int = 60,
+    claim_wait_timeout_in_seconds: float = 5,
 ) -> AsyncTaskStatus:
     """Start a validation task for the study. Only one study validation task is allowed at the same time.
+    Duplicate requests are attached to the running task.
 
     Args:
         resource_id (str): a study accession number or submission id
@@ -63,18 +80,38 @@ async def start_study_validation_task(  # noqa: PLR0913
         apply_modifiers (bool, optional): runs modifiers and update metadata files before study validation. Defaults to False.
         override_ready_task_results (bool, optional): deletes the previous task result and starts new one. Defaults to False.
         cache_expiration_in_seconds (int, optional): duration to store the last task id in the cache. Defaults to 10*60 sec.
+        validation_input_digest_calculator (ValidationInputDigestCalculator, optional): calculates digest of validation inputs.
+            If it is defined with validation_report_service, the stored report of a previous task with the same digest is returned
+            and no new task is started.
+        validation_report_service (ValidationReportService, optional): service to check the stored validation reports.
+        input_digest_expiration_in_seconds (int, optional): duration to store the last validation input digest. Defaults to 7 days.
+        incremental (bool, optional): validates only updated ISA metadata files and merges their results into the last validation report.
+            Full validation runs if there is no suitable previous report. Defaults to False.
+        priority (AsyncTaskPriority, optional): message priority of the validation task.
+            Bulk validation requests should use BATCH priority. Defaults to INTERACTIVE.
+        claim_expiration_in_seconds (int, optional): maximum duration to hold the current task key while a new task is starting.
+        claim_wait_timeout_in_seconds (float, optional): duration to wait for the task id of a concurrent request.
 
     Raises:
-        AsyncTaskAlreadyStartedError: Raise if there is a task running.
+        AsyncTaskAlreadyStartedError: Raise if a concurrent request is starting a task and its task id is not available in time.
         AsyncTaskResultExistsError: Raise when there is a completed task and its result is not fetched yet.
             It is not thrown if override_ready_task_results is True
         AsyncTaskStartFailure: Raise if start task is failed.
 
     Returns:
         AsyncTaskStatus: Status of the started task.
+            If there is a task running or a concurrent request has started a task, status of that task.
     """  # noqa: E501
     key = f"validation_task:current:{resource_id}"
     task_id = await cache_service.get_value(key)
+    if task_id == VALIDATION_TASK_CLAIM_VALUE:
+        return await attach_to_claimed_validation_task(
+            resource_id,
+            key,
+            async_task_service=async_task_service,
+            cache_service=cache_service,
+            wait_timeout_in_seconds=claim_wait_timeout_in_seconds,
+        )
     if task_id:
         task = None
         try:
@@ -95,12 +132,13 @@ async def start_study_validation_task(  # noqa: PLR0913
                     "Validation result of the previous validation task exists. "
                     "Read the previous task result or delete it to start a new validation task.",  # noqa: E501
                 )
-            ttl = await cache_service.get_ttl_in_seconds(key)
-            if ttl > (cache_expiration_in_seconds - 10):
-                raise AsyncTaskAlreadyStartedError(
+            if not task.is_ready():
+                return await attach_to_claimed_validation_task(
                     resource_id,
-                    task_id,
-                    f"A validation task has been started for {resource_id}. Wait for its result.",  # noqa: E501
+                    key,
+                    async_task_service=async_task_service,
+                    cache_service=cache_service,
+                    wait_timeout_in_seconds=claim_wait_timeout_in_seconds,
                 )
             logger.debug(
                 "Validation task for %s is overriding the previous task result %s",
@@ -108,19 +146,67 @@ async def start_study_validation_task(  # noqa: PLR0913
                 task_id,
             )
             await cache_service.delete_key(key)
-            task.revoke(terminate=True)
 
-    executor = await async_task_service.get_async_task(
-        run_validation,
-        resource_id=resource_id,
-        apply_modifiers=apply_modifiers,
+    claimed = await cache_service.set_value_if_not_exists(
+        key=key,
+        value=VALIDATION_TASK_CLAIM_VALUE,
+        expiration_time_in_seconds=claim_expiration_in_seconds,
     )
-    result = await executor.start()
+    if not claimed:
+        logger.debug(
+            "Validation task of %s is started by another request.", resource_id
+        )
+        return await attach_to_claimed_validation_task(
+            resource_id,
+            key,
+            async_task_service=async_task_service,
+            cache_service=cache_service,
+            wait_timeout_in_seconds=claim_wait_timeout_in_seconds,
+        )
+
+    input_digest = None
+    digest_key = f"validation_task:input_digest:{resource_id}"
+    if validation_input_digest_calculator and validation_report_service:
+        try:
+            input_digest = await validation_input_digest_calculator.calculate(
+                resource_id, apply_modifiers=apply_modifiers
+            )
+        except Exception as ex:
+            logger.warning(
+                "Validation input digest calculation failed for %s: %s",
+                resource_id,
+                ex,
+            )
+        if input_digest:
+            cached_task_status = await find_cached_validation_task(
+                resource_id,
+                input_digest,
+                digest_key=digest_key,
+                cache_service=cache_service,
+                validation_report_service=validation_report_service,
+            )
+            if cached_task_status:
+                # Finished task of the cached result is not the current task.
+                await cache_service.delete_key(key)
+                return cached_task_status
+
+    try:
+        executor = await async_task_service.get_async_task(
+            run_validation,
+            resource_id=resource_id,
+            apply_modifiers=apply_modifiers,
+            incremental=incremental,
+        )
+        result = await executor.start(priority=priority)
+    except Exception:
+        await cache_service.delete_key(key)
+        raise
     task_id = result.get_id()
     logger.info(
-        "Validation task started for %s with task id %s",
+        "Validation task started for %s with task id %s and priority %s",
         resource_id,
         task_id,
+        priority.name,
     )
 
     try:
@@ -141,6 +227,14 @@ async def start_study_validation_task(  # noqa: PLR0913
         updated_task_result.get_id(),
         cache_expiration_in_seconds,
     )
+    if input_digest:
+        await cache_service.set_value(
+            key=digest_key,
+            value=json.dumps(
+                {"digest": input_digest, "task_id": updated_task_result.get_id()}
+            ),
+            expiration_time_in_seconds=input_digest_expiration_in_seconds,
+        )
     if updated_task_result.get_status().upper().startswith("FAIL"):
         logger.error(
             "Current task id:'%s' and its status: %s.",
@@ -161,6 +255,93 @@ async def start_study_validation_task(  # noqa: PLR0913
     )
 
 
+async def attach_to_claimed_validation_task(
+    resource_id: str,
+    key: str,
+    async_task_service: AsyncTaskService,
+    cache_service: CacheService,
+    wait_timeout_in_seconds: float = 5,
+    poll_interval_in_seconds: float = 0.2,
+) -> AsyncTaskStatus:
+    """Wait until the concurrent request starts its task and return its status."""
+    task_id = await cache_service.get_value(key)
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + wait_timeout_in_seconds
+    while task_id == VALIDATION_TASK_CLAIM_VALUE and loop.time() < deadline:
+        await asyncio.sleep(poll_interval_in_seconds)
+        task_id = await cache_service.get_value(key)
+
+    if not task_id or task_id == VALIDATION_TASK_CLAIM_VALUE:
+        raise AsyncTaskAlreadyStartedError(
+            resource_id,
+            "",
+            f"A validation task is being started for {resource_id}. Try again later.",
+        )
+    try:
+        task = await async_task_service.get_async_task_result(task_id)
+    except Exception as ex:
+        raise AsyncTaskAlreadyStartedError(
+            resource_id,
+            task_id,
+            f"A validation task has been started for {resource_id}. Wait for its result.",  # noqa: E501
+        ) from ex
+    logger.info(
+        "Validation request of %s is attached to the current task %s",
+        resource_id,
+        task_id,
+    )
+    return AsyncTaskStatus(
+        task_id=task_id,
+        task_status=task.get_status(),
+        ready=task.is_ready(),
+        is_successful=task.is_successful() if task.is_ready() else None,
+        message="Attached to the current validation task.",
+    )
+
+
+async def find_cached_validation_task(
+    resource_id: str,
+    input_digest: str,
+    digest_key: str,
+    cache_service: CacheService,
+    validation_report_service: ValidationReportService,
+) -> None | AsyncTaskStatus:
+    value = await cache_service.get_value(digest_key)
+    if not value:
+        return None
+    try:
+        cached_digest = json.loads(value)
+    except (TypeError, ValueError):
+        await cache_service.delete_key(digest_key)
+        return None
+    task_id = cached_digest.get("task_id")
+    if not task_id or cached_digest.get("digest") != input_digest:
+        return None
+    try:
+        await validation_report_service.find_by_task_id(
+            resource_id=resource_id, task_id=task_id
+        )
+    except StudyObjectNotFoundError:
+        logger.debug(
+            "Validation report of task %s is not stored yet for %s.",
+            task_id,
+            resource_id,
+        )
+        return None
+    logger.info(
+        "Validation inputs of %s are not changed. Validation report of %s is used.",
+        resource_id,
+        task_id,
+    )
+    return AsyncTaskStatus(
+        task_id=task_id,
+        task_status="SUCCESS",
+        ready=True,
+        is_successful=True,
+        message="Validation inputs are not changed. Read from history",
+    )
+
+
 async def get_study_validation_result(  # noqa: PLR0913
     resource_id: str,
     async_task_service: AsyncTaskService,
@@ -286,7 +467,7 @@ async def get_study_validation_report(  # noqa: PLR0913
     include_isa_metadata_updates: bool = True,
     include_overrides: bool = True,
     delimiter: str = "\t",
-) -> tuple[AsyncTaskSummary, str]:
+) -> tuple[AsyncTaskSummary, Iterator[str]]:
     task_summary: AsyncTaskSummary[
         PolicySummaryResult
     ] = await get_study_validation_result(
@@ -300,7 +481,7 @@ async def get_study_validation_report(  # noqa: PLR0913
 
     if task_summary.task.ready and task_summary.task.is_successful:
         summary_result: PolicySummaryResult = task_summary.task_result
-        summary_report = await get_report_content_from_summary_report(
+        summary_report = iterate_report_content(
             summary_result=summary_result,
             min_violation_level=min_violation_level,
             include_summary_messages=include_summary_messages,
@@ -322,7 +503,60 @@ async def get_report_content_from_summary_report(
     include_overrides: bool = True,
     delimiter: str = "\t",
 ) -> str:
-    f = io.StringIO()
+    return "".join(
+        iterate_report_content(
+            summary_result=summary_result,
+            min_violation_level=min_violation_level,
+            include_summary_messages=include_summary_messages,
+            include_isa_metadata_updates=include_isa_metadata_updates,
+            include_overrides=include_overrides,
+            delimiter=delimiter,
+        )
+    )
+
+
+def iterate_report_content(  # noqa: PLR0913
+    summary_result: PolicySummaryResult,
+    min_violation_level: Union[None, PolicyMessageType] = None,
+    include_summary_messages: bool = True,
+    include_isa_metadata_updates: bool = True,
+    include_overrides: bool = True,
+    delimiter: str = "\t",
+    chunk_size_in_bytes: int = 64 * 1024,
+) -> Iterator[str]:
+    """Yield TSV report content in chunks.
+
+    Rows are created while the content is consumed, so report content is not
+    stored in memory.
+    """
+    chunk: list[str] = []
+    chunk_size = 0
+    for row in iterate_report_rows(
+        summary_result=summary_result,
+        min_violation_level=min_violation_level,
+        include_summary_messages=include_summary_messages,
+        include_isa_metadata_updates=include_isa_metadata_updates,
+        include_overrides=include_overrides,
+        delimiter=delimiter,
+    ):
+        chunk.append(row)
+        chunk_size += len(row)
+        if chunk_size >= chunk_size_in_bytes:
+            yield "".join(chunk)
+            chunk = []
+            chunk_size = 0
+    if chunk:
+        yield "".join(chunk)
+
+
+def iterate_report_rows(
+    summary_result: PolicySummaryResult,
+    min_violation_level: Union[None, PolicyMessageType] = None,
+    include_summary_messages: bool = True,
+    include_isa_metadata_updates: bool = True,
+    include_overrides: bool = True,
+    delimiter: str = "\t",
+) -> Iterator[str]:
     row = [
         "MESSAGE",
         "SOURCE FILE",
@@ -342,7 +576,7 @@ async def get_report_content_from_summary_report(
         "OVERRIDE_COMMENT",
     ]
     row_str = delimiter.join(row)
-    f.write(f"{row_str}\n")
+    yield f"{row_str}\n"
     if summary_result.messages.violations:
         for messages in (
             summary_result.messages.summary,
@@ -365,17 +599,17 @@ async def get_report_content_from_summary_report(
             m: PolicyMessage = item
             if not min_violation_level or m.type.get_level() >= min_level:
                 row_str = get_row_string("SUMMARY", item, delimiter=delimiter)
-                f.write(f"{row_str}\n")
+                yield f"{row_str}\n"
 
     for item in summary_result.messages.violations:
         m: PolicyMessage = item
         if not min_violation_level or m.type.get_level() >= min_level:
             row_str = get_row_string("VIOLATION", item, delimiter=delimiter)
-            f.write(f"{row_str}\n")
+            yield f"{row_str}\n"
 
     if include_overrides and summary_result.overrides.validation_overrides:
-        f.write("\n\n")
-        f.write("OVERRIDDEN VALIDATION RULES\n")
+        yield "\n\n"
+        yield "OVERRIDDEN VALIDATION RULES\n"
         row = [
             "RULE ID",
             "TITLE",
@@ -388,7 +622,7 @@ async def get_report_content_from_summary_report(
             "COMMENT",
         ]
         row_str = delimiter.join(row)
-        f.write(f"{row_str}\n")
+        yield f"{row_str}\n"
         summary_result.overrides.validation_overrides.sort(
             key=lambda x: f"{x.rule_id}:{x.source_file}:{str(x.source_column_index)}"
         )
@@ -405,21 +639,25 @@ async def get_report_content_from_summary_report(
                 item.comment,
             ]
             row_str = delimiter.join(row)
-            f.write(f"{row_str}\n")
+            yield f"{row_str}\n"
 
     if include_isa_metadata_updates and summary_result.metadata_updates:
-        if summary_result.metadata_updates:
-            f.write("\n\n")
-            f.write("METADATA UPDATES\n")
-            row = ["SOURCE FILE", "OLD VALUE(s)", "NEW VALUE(s)", "ACTION"]
+        yield "\n\n"
+        yield "METADATA UPDATES\n"
+        row = ["SOURCE FILE", "OLD VALUE(s)", "NEW VALUE(s)", "ACTION", "UPDATED CELLS"]
+        row_str = delimiter.join(row)
+        yield f"{row_str}\n"
+        for item in summary_result.metadata_updates:
+            updated_cells = item.updated_cell_count
+            row = [
+                item.source,
+                item.old_value,
+                item.new_value,
+                item.action,
+                "" if updated_cells is None else str(updated_cells),
+            ]
             row_str = delimiter.join(row)
-            f.write(f"{row_str}\n")
-            for item in summary_result.metadata_updates:
-                row = [item.source, item.old_value, item.new_value, item.action]
-                row_str = delimiter.join(row)
-                f.write(f"{row_str}\n")
-    value = f.getvalue()
-    return value
+            yield f"{row_str}\n"
 
 
 def get_row_string(message_type: str, m: PolicyMessage, delimiter: str = "\t"):
@@ -575,6 +813,7 @@ async def convert_to_summary_result(resource_id: str, result_list: PolicyResultL
                 ...
         summary_result.messages.violations.extend(policy_result.messages.violations)
         summary_result.messages.summary.extend(policy_result.messages.summary)
+        summary_result.phase_timings.extend(policy_result.phase_timings)
 
     summary_result.messages.summary.sort(
         key=lambda x: x.source_file + x.identifier + x.source_column_header
@@ -585,4 +824,6 @@ async def convert_to_summary_result(resource_id: str, result_list: PolicyResultL
     summary_result.resource_id = resource_id
     summary_result.assay_file_techniques.update(policy_result.assay_file_techniques)
     summary_result.maf_file_techniques.update(policy_result.maf_file_techniques)
+    summary_result.input_hashes.update(policy_result.input_hashes)
+    summary_result.study_size_bucket = policy_result.study_size_bucket
     return summary_result
@@ -0,0 +1,81 @@
+import bisect
+import logging
+import threading
+from typing import Sequence
+
+logger = logging.getLogger("mtbls.metrics")
+
+DEFAULT_DURATION_BUCKETS = (
+    0.05,
+    0.1,
+    0.5,
+    1,
+    2.5,
+    5,
+    10,
+    30,
+    60,
+    120,
+    300,
+    600,
+    1800,
+    3600,
+)
+
+
+class HistogramSample:
+    def __init__(self, buckets: Sequence[float]):
+        self.bucket_counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+
+class Histogram:
+    """In-process histogram with bucket counts for each label set.
+
+    Each observation is also logged with the metric name and labels so that
+    log based metric collectors can aggregate them.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        label_names: Sequence[str],
+        buckets: Sequence[float] = DEFAULT_DURATION_BUCKETS,
+    ):
+        self.name = name
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(sorted(buckets))
+        self.samples: dict[tuple[str, ...], HistogramSample] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = tuple(str(labels.get(x, "")) for x in self.label_names)
+        with self._lock:
+            sample = self.samples.get(key)
+            if not sample:
+                sample = HistogramSample(self.buckets)
+                self.samples[key] = sample
+            sample.bucket_counts[bisect.bisect_left(self.buckets, value)] += 1
+            sample.count += 1
+            sample.sum += value
+        logger.info(
+            "metric=%s %s value=%s",
+            self.name,
+            " ".join(f"{k}={v}" for k, v in zip(self.label_names, key, strict=True)),
+            value,
+        )
+
+    def get_cumulative_counts(self, **labels: str) -> dict[str, int]:
+        """Return observation counts less than or equal to each bucket bound."""
+        key = tuple(str(labels.get(x, "")) for x in self.label_names)
+        sample = self.samples.get(key)
+        if not sample:
+            return {}
+        counts = {}
+        total = 0
+        bounds = [str(x) for x in self.buckets] + ["+Inf"]
+        for bound, count in zip(bounds, sample.bucket_counts, strict=True):
+            total += count
+            counts[bound] = total
+        return counts
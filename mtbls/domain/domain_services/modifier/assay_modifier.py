@@ -36,9 +36,15 @@ class AssayFileModifier(IsaTableModifier):
         templates: FileTemplates,
         control_lists: ValidationControls,
         max_row_number_limit: int = 10,
+        detailed_update_logs: bool = False,
     ):
         super().__init__(
-            model, isa_table_file, templates, control_lists, max_row_number_limit
+            model,
+            isa_table_file,
+            templates,
+            control_lists,
+            max_row_number_limit,
+            detailed_update_logs,
         )
 
     def modify(self) -> list[UpdateLog]:
@@ -64,29 +70,31 @@ class AssayFileModifier(IsaTableModifier):
             parameters = {x.term for x in protocol.parameters}
             protocols[protocol.name] = parameters
 
-        for file_name in self.model.assays:
-            protocol_ref_columns = self.get_isa_table_protocol_ref_columns(file_name)
-            protocol_ref_values = self.get_protocol_ref_values(
-                protocols, protocol_ref_columns
-            )
-            data = self.model.assays[file_name].table.data
+        file_name = self.file_path
+        if file_name not in self.model.assays:
+            return
+        protocol_ref_columns = self.get_isa_table_protocol_ref_columns(file_name)
+        protocol_ref_values = self.get_protocol_ref_values(
+            protocols, protocol_ref_columns
+        )
+        data = self.model.assays[file_name].table.data
 
-            for protocol_ref, new_val in protocol_ref_values.items():
-                old_values: set[str] = set()
-                for idx, val in enumerate(data[protocol_ref]):
-                    if val != new_val:
-                        old_values.add(f"'{val}'")
-                        data[protocol_ref][idx] = new_val
-                if old_values:
-                    limit = self.max_row_number_limit
+        for protocol_ref, new_val in protocol_ref_values.items():
+            old_values: set[str] = set()
+            for idx, val in enumerate(data[protocol_ref]):
+                if val != new_val:
+                    old_values.add(f"'{val}'")
+                    data[protocol_ref][idx] = new_val
+            if old_values:
+                limit = self.max_row_number_limit
 
-                    old_values_str = self.get_list_string(list(old_values), limit)
-                    self.modifier_update(
-                        source=file_name,
-                        action=f"Protocol REF [column index: {protocol_ref_columns[protocol_ref][0] + 1}] values are updated.",  # noqa: E501
-                        old_value=old_values_str,
-                        new_value=new_val,
-                    )
+                old_values_str = self.get_list_string(list(old_values), limit)
+                self.modifier_update(
+                    source=file_name,
+                    action=f"Protocol REF [column index: {protocol_ref_columns[protocol_ref][0] + 1}] values are updated.",  # noqa: E501
+                    old_value=old_values_str,
+                    new_value=new_val,
+                )
 
     def get_protocol_ref_values(self, protocols, protocol_ref_columns):
         protocol_ref_values: Dict[str, str] = {}
@@ -261,42 +269,43 @@ class AssayFileModifier(IsaTableModifier):
     #                 )
 
     def rule_a_200_090_004_01(self):
-        for file in self.model.assays:
-            assay_file: AssayFile = self.model.assays[file]
-            if assay_file.table.data:
-                names = [
-                    "Data Transformation Name",
-                    "Extract Name",
-                    "MS Assay Name",
-                    "NMR Assay Name",
-                    "Normalization Name",
-                ]
-                sample_name_column = "Sample Name"
-                valid_sample_name_column = False
-                sample_names = []
-                if sample_name_column in assay_file.table.data:
-                    sample_names = assay_file.table.data[sample_name_column]
-                    unique_names = {x.strip() for x in sample_names if x.strip()}
-                    if sample_names and len(unique_names) == len(sample_names):
-                        valid_sample_name_column = True
-                if not valid_sample_name_column or not sample_names:
-                    return
-                sample_name_str = self.get_list_string(
-                    sample_names, self.max_row_number_limit
-                )
-                for column_name in names:
-                    if column_name in assay_file.table.data:
-                        empty = True
-                        for cell in assay_file.table.data[column_name]:
-                            if cell and cell.strip():
-                                empty = False
-                                break
-                        if empty:
-                            new_values = copy.deepcopy(sample_names)
-                            assay_file.table.data[column_name] = new_values
-                            self.modifier_update(
-                                source=assay_file.file_path,
-                                action=f"{column_name} column values are filled from Sample Name column values.",  # noqa: E501
-                                old_value="",
-                                new_value=sample_name_str,
-                            )
+        if self.file_path not in self.model.assays:
+            return
+        assay_file: AssayFile = self.model.assays[self.file_path]
+        if assay_file.table.data:
+            names = [
+                "Data Transformation Name",
+                "Extract Name",
+                "MS Assay Name",
+                "NMR Assay Name",
+                "Normalization Name",
+            ]
+            sample_name_column = "Sample Name"
+            valid_sample_name_column = False
+            sample_names = []
+            if sample_name_column in assay_file.table.data:
+                sample_names = assay_file.table.data[sample_name_column]
+                unique_names = {x.strip() for x in sample_names if x.strip()}
+                if sample_names and len(unique_names) == len(sample_names):
+                    valid_sample_name_column = True
+            if not valid_sample_name_column or not sample_names:
+                return
+            sample_name_str = self.get_list_string(
+                sample_names, self.max_row_number_limit
+            )
+            for column_name in names:
+                if column_name in assay_file.table.data:
+                    empty = True
+                    for cell in assay_file.table.data[column_name]:
+                        if cell and cell.strip():
+                            empty = False
+                            break
+                    if empty:
+                        new_values = copy.deepcopy(sample_names)
+                        assay_file.table.data[column_name] = new_values
+                        self.modifier_update(
+                            source=assay_file.file_path,
+                            action=f"{column_name} column values are filled from Sample Name column values.",  # noqa: E501
+                            old_value="",
+                            new_value=sample_name_str,
+                        )
@@ -1,3 +1,4 @@
+import bisect
 from typing import Union
 
 from metabolights_utils.models.isa.common import (
@@ -17,12 +18,26 @@ from mtbls.domain.domain_services.modifier.base_modifier import OntologyItem
 from mtbls.domain.domain_services.modifier.column_update_handler import (
     IsaTableColumnUpdateHandler,
 )
+from mtbls.domain.domain_services.modifier.column_values import (
+    factorize_columns,
+    find_column_value_updates,
+    group_rows_by_code,
+)
 from mtbls.domain.entities.validation.validation_configuration import (
     FileTemplates,
     ValidationControls,
 )
 
 
+def create_ontology_item(row: tuple[str, str, str]) -> OntologyItem:
+    term, term_source_ref, term_accession_number = row
+    return OntologyItem(
+        term=term,
+        term_source_ref=term_source_ref,
+        term_accession_number=term_accession_number,
+    )
+
+
 class IsaTableModifier(BaseIsaModifier):
     def __init__(
         self,
@@ -31,6 +46,7 @@ class IsaTableModifier(BaseIsaModifier):
         templates: FileTemplates,
         control_lists: ValidationControls,
         max_row_number_limit: int = 10,
+        detailed_update_logs: bool = False,
     ):
         super().__init__(model, templates, control_lists, isa_table_file.file_path)
         self.isa_table_file = isa_table_file
@@ -39,6 +55,7 @@ class IsaTableModifier(BaseIsaModifier):
         ] = {}
         self.new_header_actions: Union[None, dict[str, list[TsvAddColumnsAction]]] = {}
         self.max_row_number_limit = max_row_number_limit
+        self.detailed_update_logs = detailed_update_logs
 
     def remove_trailing_and_prefix_spaces(self):
         action: TsvUpdateColumnHeaderAction = TsvUpdateColumnHeaderAction()
@@ -87,19 +104,13 @@ class IsaTableModifier(BaseIsaModifier):
         updater = IsaTableColumnUpdateHandler(isa_table_file=self.isa_table_file)
         for header in self.isa_table_file.table.headers:
             column = header.column_name
-            for row, val in enumerate(self.isa_table_file.table.data[column]):
-                stripped_value = val.strip().strip('"').strip("'")
-                if val != stripped_value:
-                    updater.update_isa_table_cell(header, val, stripped_value, row)
-        updates = updater.get_isa_table_update_logs()
-        if updates:
-            for update in updates:
-                self.modifier_update(
-                    source=update.source,
-                    action=update.action,
-                    new_value=update.new_value,
-                    old_value=update.old_value,
-                )
+            for old_value, new_value, rows in find_column_value_updates(
+                self.isa_table_file.table.data[column],
+                lambda x: x.strip().strip('"').strip("'"),
+            ):
+                updater.update_isa_table_cells(header, old_value, new_value, rows)
+        updates = updater.get_isa_table_update_logs(detailed=self.detailed_update_logs)
+        self.update_logs.extend(x for x in updates if x.new_value != x.old_value)
 
         return self.update_logs
 
@@ -130,137 +141,168 @@ class IsaTableModifier(BaseIsaModifier):
                     term_source_ref_column_index = header.column_index + 2
                     term_accession_number_column_index = header.column_index + 3
                 columns = self.isa_table_file.table.columns
-                data = self.isa_table_file.table.data
-                term_column_name = columns[term_column_index]
-                term_source_ref_column_name = columns[term_source_ref_column_index]
-                term_accession_number_column_name = columns[
-                    term_accession_number_column_index
-                ]
-                current_ontologies: dict[str, OntologyAnnotation] = {}
-                updated_rows: dict[
-                    str, dict[int, tuple[OntologyAnnotation, OntologyAnnotation]]
-                ] = {}
-                for idx, term in enumerate(data[term_column_name]):
-                    onto = None
-                    source_ref = data[term_source_ref_column_name][idx]
-                    accession = data[term_accession_number_column_name][idx]
-                    current_source_ref = source_ref
-                    current_accession = accession
-                    source_ref_lower = source_ref.lower()
-                    accession_lower = accession.lower()
-                    term_lower = term.lower()
+                self._update_ontology_column_values(
+                    header,
+                    columns[term_column_index],
+                    columns[term_source_ref_column_index],
+                    columns[term_accession_number_column_index],
+                    control_terms,
+                    control_source_refs,
+                    control_accessions,
+                )
 
-                    if source_ref and source_ref_lower in control_source_refs:
-                        current_source_ref = control_source_refs[source_ref_lower]
-                    if accession and accession_lower in control_accessions:
-                        current_accession = control_accessions[
-                            accession_lower
-                        ].term_accession_number
-                    if term in current_ontologies:
-                        onto = current_ontologies[term]
-                    elif term_lower in control_terms:
-                        key = term_lower
-                        if len(control_terms[key]) == 1:
-                            ontology = list(control_terms[key].values())
-                            onto = ontology[0] if ontology else None
-                        elif len(control_terms[key]) > 1:
-                            if source_ref_lower in control_terms[key]:
-                                onto = control_terms[key][source_ref_lower]
-                        if onto:
-                            current_ontologies[term] = onto
+    def _update_ontology_column_values(  # noqa: PLR0913
+        self,
+        header: IsaTableColumn,
+        term_column_name: str,
+        term_source_ref_column_name: str,
+        term_accession_number_column_name: str,
+        control_terms: dict[str, dict[str, OntologyAnnotation]],
+        control_source_refs: dict[str, str],
+        control_accessions: dict[str, OntologyAnnotation],
+    ):
+        data = self.isa_table_file.table.data
+        column_names = (
+            term_column_name,
+            term_source_ref_column_name,
+            term_accession_number_column_name,
+        )
+        codes, unique_rows, first_rows = factorize_columns(
+            *[data[x] for x in column_names]
+        )
+        if not unique_rows:
+            return
+        rows_by_code = group_rows_by_code(codes, len(unique_rows))
+        # The first ontology found for a term is reused in the next rows.
+        # Distinct rows are resolved in order of their first appearance.
+        current_ontologies: dict[str, OntologyAnnotation] = {}
+        cached_rows: dict[str, int] = {}
+        resolved: list[tuple[tuple[str, str, str], bool]] = []
+        for code, (term, source_ref, accession) in enumerate(unique_rows):
+            cached = term in current_ontologies
+            new_row, onto = self._resolve_ontology_row(
+                term,
+                source_ref,
+                accession,
+                current_ontologies.get(term),
+                control_terms,
+                control_source_refs,
+                control_accessions,
+            )
+            if not cached and onto:
+                current_ontologies[term] = onto
+                cached_rows[term] = first_rows[code]
+            resolved.append((new_row, cached or onto is not None))
 
-                    if term not in updated_rows:
-                        updated_rows[term] = {}
+        term_updates: dict[str, list[tuple[int, str, str, list[int]]]] = {}
+        for code, row in enumerate(unique_rows):
+            term = row[0]
+            term_updates.setdefault(term, [])
+            rows = rows_by_code[code]
+            new_row, resolved_by_term = resolved[code]
+            segments = [(rows, new_row)]
+            if not resolved_by_term and term in cached_rows:
+                # rows after the first ontology of the term use that ontology.
+                split = bisect.bisect_left(rows, cached_rows[term])
+                cached_row, _ = self._resolve_ontology_row(
+                    *row,
+                    current_ontologies[term],
+                    control_terms,
+                    control_source_refs,
+                    control_accessions,
+                )
+                segments = [(rows[:split], new_row), (rows[split:], cached_row)]
+            for segment_rows, segment_new_row in segments:
+                if not segment_rows or segment_new_row == row:
+                    continue
+                for column_name, old_value, new_value in zip(
+                    column_names, row, segment_new_row, strict=True
+                ):
+                    if old_value != new_value:
+                        cells = data[column_name]
+                        for idx in segment_rows:
+                            cells[idx] = new_value
+                old_str = str(create_ontology_item(row))
+                new_str = str(create_ontology_item(segment_new_row))
+                if old_str != new_str:
+                    term_updates[term].append(
+                        (segment_rows[0], old_str, new_str, segment_rows)
+                    )
 
-                    if idx not in updated_rows[term]:
-                        current = OntologyItem(
-                            term=term,
-                            term_source_ref=source_ref,
-                            term_accession_number=accession,
-                        )
-                        updated_rows[term][idx] = (current, current.model_copy())
+        for segments in term_updates.values():
+            updates: dict[str, dict[str, list[int]]] = {}
+            segments.sort(key=lambda x: x[0])
+            for _, old_str, new_str, segment_rows in segments:
+                rows = updates.setdefault(old_str, {}).setdefault(new_str, [])
+                rows.extend(x + 1 for x in segment_rows)
+            for old_str, old_str_updates in updates.items():
+                for new_str, rows in old_str_updates.items():
+                    rows_str = self.get_list_string(rows, self.max_row_number_limit)
+                    action = (
+                        f"Row update: Column [{header.column_index + 1}] "
+                        f"{header.column_header}, rows {rows_str}"
+                    )
+                    self.modifier_update(
+                        source=self.isa_table_file.file_path,
+                        action=action,
+                        old_value=old_str,
+                        new_value=new_str,
+                    )
 
-                    if not term_lower and accession_lower in control_accessions:
-                        item: OntologyAnnotation = control_accessions[accession_lower]
-                        if source_ref_lower in control_source_refs:
-                            if item.term_source_ref.lower() == source_ref_lower:
-                                onto = item
-                        else:
-                            onto = item
-                    if not term_lower and source_ref_lower and not accession_lower:
-                        current_source_ref = ""
+    def _resolve_ontology_row(  # noqa: PLR0913
+        self,
+        term: str,
+        source_ref: str,
+        accession: str,
+        cached_onto: Union[None, OntologyAnnotation],
+        control_terms: dict[str, dict[str, OntologyAnnotation]],
+        control_source_refs: dict[str, str],
+        control_accessions: dict[str, OntologyAnnotation],
+    ) -> tuple[tuple[str, str, str], Union[None, OntologyAnnotation]]:
+        """Return updated row values and the ontology found for the term."""
+        onto = None
+        term_onto = None
+        current_source_ref = source_ref
+        current_accession = accession
+        source_ref_lower = source_ref.lower()
+        accession_lower = accession.lower()
+        term_lower = term.lower()
+
+        if source_ref and source_ref_lower in control_source_refs:
+            current_source_ref = control_source_refs[source_ref_lower]
+        if accession and accession_lower in control_accessions:
+            current_accession = control_accessions[
+                accession_lower
+            ].term_accession_number
+        if cached_onto:
+            onto = cached_onto
+        elif term_lower in control_terms:
+            key = term_lower
+            if len(control_terms[key]) == 1:
+                ontology = list(control_terms[key].values())
+                onto = ontology[0] if ontology else None
+            elif len(control_terms[key]) > 1:
+                if source_ref_lower in control_terms[key]:
+                    onto = control_terms[key][source_ref_lower]
+            term_onto = onto
 
-                    if onto:
-                        if term != onto.term:
-                            cells = self.isa_table_file.table.data[term_column_name]
-                            cells[idx] = onto.term
-                            updated_rows[term][idx][0].term = term
-                            updated_rows[term][idx][1].term = onto.term
-                        if source_ref != onto.term_source_ref:
-                            cells = self.isa_table_file.table.data[
-                                term_source_ref_column_name
-                            ]
-                            cells[idx] = onto.term_source_ref
-                            updated_rows[term][idx][0].term_source_ref = source_ref
-                            updated_rows[term][idx][
-                                1
-                            ].term_source_ref = onto.term_source_ref
-                        if accession != onto.term_accession_number:
-                            cells = self.isa_table_file.table.data[
-                                term_accession_number_column_name
-                            ]
-                            cells[idx] = onto.term_accession_number
-                            updated_rows[term][idx][0].term_accession_number = accession
-                            new_onto = updated_rows[term][idx][1]
-                            new_onto.term_accession_number = onto.term_accession_number
-                    else:
-                        if current_source_ref != source_ref:
-                            cells = self.isa_table_file.table.data[
-                                term_source_ref_column_name
-                            ]
-                            cells[idx] = current_source_ref
-                            updated_rows[term][idx][0].term_source_ref = source_ref
-                            new_onto = updated_rows[term][idx][1]
-                            new_onto.term_source_ref = current_source_ref
-                        if current_accession != accession:
-                            cells = self.isa_table_file.table.data[
-                                term_accession_number_column_name
-                            ]
-                            cells[idx] = current_accession
-                            update = updated_rows[term][idx]
-                            update[0].term_accession_number = accession
-                            update[1].term_accession_number = current_accession
-                for term, updated_row_terms in updated_rows.items():
-                    updates: dict[str, dict[str, set[int]]] = {}
-                    if updated_row_terms:
-                        for idx, updated_row_term in updated_row_terms.items():
-                            old_str = str(updated_row_term[0])
-                            new_str = str(updated_row_term[1])
-                            if old_str == new_str:
-                                continue
-                            if old_str not in updates:
-                                updates[old_str] = {}
-                            if new_str not in updates[old_str]:
-                                updates[old_str][new_str] = set()
-                            updates[old_str][new_str].add(idx + 1)
-                        for old_str, old_str_updates in updates.items():
-                            for new_str, update_values in old_str_updates.items():
-                                rows = list(update_values)
-                                rows.sort()
-                                rows_str = self.get_list_string(
-                                    rows, self.max_row_number_limit
-                                )
-                                action = (
-                                    f"Row update: Column [{header.column_index + 1}] "
-                                    f"{header.column_header}, rows {rows_str}"
-                                )
+        if not term_lower and accession_lower in control_accessions:
+            item: OntologyAnnotation = control_accessions[accession_lower]
+            if source_ref_lower in control_source_refs:
+                if item.term_source_ref.lower() == source_ref_lower:
+                    onto = item
+            else:
+                onto = item
+        if not term_lower and source_ref_lower and not accession_lower:
+            current_source_ref = ""
 
-                                self.modifier_update(
-                                    source=self.isa_table_file.file_path,
-                                    action=action,
-                                    old_value=old_str,
-                                    new_value=new_str,
-                                )
+        if onto:
+            return (
+                onto.term,
+                onto.term_source_ref,
+                onto.term_accession_number,
+            ), term_onto
+        return (term, current_source_ref, current_accession), term_onto
 
     def _get_header_control_terms(
         self, header: IsaTableColumn, technique: str, file_type: str
@@ -359,23 +401,17 @@ class IsaTableModifier(BaseIsaModifier):
         if not control_lists:
             return
         term_column_name = header.column_name
-        current_ontologies: dict[str, OntologyAnnotation] = {}
         data = self.isa_table_file.table.data
         updater = IsaTableColumnUpdateHandler(isa_table_file=self.isa_table_file)
-        for idx, term in enumerate(data[term_column_name]):
-            onto = None
-            if term in current_ontologies:
-                onto = current_ontologies[term]
-            else:
-                key = term.lower()
-                controls = list(control_lists.get(key, {}).values())
-                if controls:
-                    onto: OntologyAnnotation = controls[0]
-                if onto:
-                    current_ontologies[key] = onto
-            if onto:
-                if onto.term != term:
-                    updater.update_isa_table_cell(header, term, onto.term, idx)
-        updates = updater.get_isa_table_update_logs()
+
+        def find_control_term(term: str) -> str:
+            controls = list(control_lists.get(term.lower(), {}).values())
+            return controls[0].term if controls else term
+
+        for old_value, new_value, rows in find_column_value_updates(
+            data[term_column_name], find_control_term
+        ):
+            updater.update_isa_table_cells(header, old_value, new_value, rows)
+        updates = updater.get_isa_table_update_logs(detailed=self.detailed_update_logs)
         if updates:
             self.update_logs.extend(updates)
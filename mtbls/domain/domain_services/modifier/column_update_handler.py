@@ -1,11 +1,11 @@
 import logging
-from typing import Dict, Tuple
+from typing import Dict
 
 from metabolights_utils.models.isa.common import IsaTableColumn, IsaTableFile
 from pydantic import BaseModel
 
 from mtbls.domain.domain_services.modifier.base_modifier import BaseModifier
-from mtbls.domain.shared.modifier import UpdateLog
+from mtbls.domain.shared.modifier import CellValueUpdate, UpdateLog
 
 logger = logging.getLogger(__name__)
 
@@ -14,7 +14,6 @@ class ColumnUpdateLog(BaseModel):
     header: str = ""
     index: int = -1
     cell_updates: Dict[str, Dict[str, list[int]]] = {}
-    updates: Dict[int, Tuple[str, str]] = {}
 
 
 class IsaTableColumnUpdateHandler(BaseModifier):
@@ -22,14 +21,17 @@ class IsaTableColumnUpdateHandler(BaseModifier):
         self.isa_table_file = isa_table_file
         self.column_updates: Dict[str, ColumnUpdateLog] = {}
 
-    def update_isa_table_cell(
-        self, column: IsaTableColumn, old_value: str, new_value: str, index: int
-    ):
+    def _get_column_log(self, column: IsaTableColumn) -> ColumnUpdateLog:
         if column.column_name not in self.column_updates:
             self.column_updates[column.column_name] = ColumnUpdateLog(
                 header=column.column_header, index=column.column_index
             )
-        column_log: ColumnUpdateLog = self.column_updates[column.column_name]
+        return self.column_updates[column.column_name]
+
+    def update_isa_table_cell(
+        self, column: IsaTableColumn, old_value: str, new_value: str, index: int
+    ):
+        column_log: ColumnUpdateLog = self._get_column_log(column)
         if old_value not in column_log.cell_updates:
             column_log.cell_updates[old_value] = {}
         if new_value not in column_log.cell_updates[old_value]:
@@ -37,9 +39,31 @@ class IsaTableColumnUpdateHandler(BaseModifier):
 
         column_log.cell_updates[old_value][new_value].append(index + 1)
         self.isa_table_file.table.data[column.column_name][index] = new_value
-        self.column_updates[column.column_name].updates[index] = (old_value, new_value)
 
-    def get_isa_table_update_logs(self, limit: int = 5) -> list[UpdateLog]:
+    def update_isa_table_cells(
+        self,
+        column: IsaTableColumn,
+        old_value: str,
+        new_value: str,
+        indices: list[int],
+    ):
+        """Update cells with the same value. Indices are in ascending order."""
+        column_log: ColumnUpdateLog = self._get_column_log(column)
+        new_values = column_log.cell_updates.setdefault(old_value, {})
+        new_values.setdefault(new_value, []).extend(x + 1 for x in indices)
+        cells = self.isa_table_file.table.data[column.column_name]
+        for index in indices:
+            cells[index] = new_value
+
+    def get_isa_table_update_logs(
+        self, limit: int = 5, detailed: bool = False
+    ) -> list[UpdateLog]:
+        """Return an update log for each updated column.
+
+        Cell updates are grouped by old and new values. Only the first groups
+        with cell counts are added unless detailed logs with row ranges of
+        all groups are requested.
+        """
         update_logs: list[UpdateLog] = []
         if not self.column_updates:
             return update_logs
@@ -56,12 +80,40 @@ class IsaTableColumnUpdateHandler(BaseModifier):
 
             new_values = [f"'{x[1]}'" for x in values]
             new_values_str = self.get_list_string(new_values, limit=limit)
+            value_updates = [
+                CellValueUpdate(
+                    old_value=old_value,
+                    new_value=new_value,
+                    count=len(rows),
+                    rows=get_row_ranges(rows) if detailed else "",
+                )
+                for old_value, new_values in column_log.cell_updates.items()
+                for new_value, rows in new_values.items()
+            ]
             update_logs.append(
                 UpdateLog(
                     source=file,
                     action=f"Update [column {column_index + 1}] {column_header}",
                     old_value=old_values_str,
                     new_value=new_values_str,
+                    updated_cell_count=sum(x.count for x in value_updates),
+                    value_updates=value_updates if detailed else value_updates[:limit],
                 )
             )
         return update_logs
+
+
+def get_row_ranges(rows: list[int]) -> str:
+    """Return row numbers as comma separated ranges (e.g. 1-3, 5, 8-9)."""
+    ranges: list[str] = []
+    start = previous = None
+    for row in sorted(set(rows)):
+        if previous is not None and row == previous + 1:
+            previous = row
+            continue
+        if start is not None:
+            ranges.append(str(start) if start == previous else f"{start}-{previous}")
+        start = previous = row
+    if start is not None:
+        ranges.append(str(start) if start == previous else f"{start}-{previous}")
+    return ", ".join(ranges)
@@ -0,0 +1,49 @@
+from typing import Callable, Sequence
+
+
+def factorize_columns(
+    *columns: Sequence[str],
+) -> tuple[list[int], list[tuple[str, ...]], list[int]]:
+    """Assign a code to each distinct row value of the columns.
+
+    Codes are numbered in order of first appearance. Returns row codes,
+    distinct row values and the first row index of each distinct value.
+    """
+    codes_map: dict[tuple[str, ...], int] = {}
+    row_codes: list[int] = []
+    first_rows: list[int] = []
+    for row_index, row in enumerate(zip(*columns, strict=True)):
+        code = codes_map.get(row)
+        if code is None:
+            code = len(codes_map)
+            codes_map[row] = code
+            first_rows.append(row_index)
+        row_codes.append(code)
+    return row_codes, list(codes_map), first_rows
+
+
+def group_rows_by_code(codes: list[int], code_count: int) -> list[list[int]]:
+    """Return ascending row indices of each code."""
+    rows_by_code: list[list[int]] = [[] for _ in range(code_count)]
+    for row_index, code in enumerate(codes):
+        rows_by_code[code].append(row_index)
+    return rows_by_code
+
+
+def find_column_value_updates(
+    values: Sequence[str], transform: Callable[[str], str]
+) -> list[tuple[str, str, list[int]]]:
+    """Apply transform on distinct values of a column.
+
+    Returns updated values with their row indices in order of first appearance.
+    """
+    codes, uniques, _ = factorize_columns(values)
+    updated = [(code, value, transform(value)) for code, (value,) in enumerate(uniques)]
+    updated = [x for x in updated if x[1] != x[2]]
+    if not updated:
+        return []
+    rows_by_code = group_rows_by_code(codes, len(uniques))
+    return [
+        (old_value, new_value, rows_by_code[code])
+        for code, old_value, new_value in updated
+    ]
@@ -1,3 +1,5 @@
+from concurrent.futures import Executor
+
 from metabolights_utils.isa_file_utils import IsaFileUtils
 from metabolights_utils.models.isa.common import IsaTableFile
 from metabolights_utils.models.isa.enums import ColumnsStructure
@@ -16,6 +18,9 @@ from mtbls.domain.domain_services.modifier.investigation_modifier import (
     InvestigationFileModifier,
 )
 from mtbls.domain.domain_services.modifier.maf_modifier import MafFileModifier
+from mtbls.domain.domain_services.modifier.parallel_table_modifier import (
+    run_table_modifiers,
+)
 from mtbls.domain.domain_services.modifier.sample_modifier import SampleFileModifier
 from mtbls.domain.entities.validation.validation_configuration import (
     FileTemplates,
@@ -28,12 +33,19 @@ from mtbls.domain.shared.validator.run_configuration import (
 
 
 class MetabolightsStudyModelModifier(BaseIsaModifier):
+    """Runs investigation, sample, assay and MAF file modifiers on a study model.
+
+    If an executor is defined, assay and MAF file modifiers run concurrently
+    on it and each of them modifies only its own table.
+    """
+
     def __init__(
         self,
         model: MetabolightsStudyModel,
         templates: FileTemplates,
         control_lists: ValidationControls,
         config: None | ValidationRunConfiguration = None,
+        executor: None | Executor = None,
     ):
         if not config:
             config = ValidationRunConfiguration()
@@ -46,29 +58,47 @@ class MetabolightsStudyModelModifier(BaseIsaModifier):
         self.modifiers_map: dict[str, BaseIsaModifier] = {}
         self.modifiers_map[model.investigation_file_path] = self.investigation_modifier
         self.config = config
+        self.executor = executor
 
     def modify(self) -> list[UpdateLog]:
         self.investigation_modifier.modify()
         sample_files: list[SampleFileModifier] = []
         for isa_table_file in self.model.samples.values():
             modifier = SampleFileModifier(
-                self.model, isa_table_file, self.templates, self.control_lists
+                self.model,
+                isa_table_file,
+                self.templates,
+                self.control_lists,
+                detailed_update_logs=self.config.detailed_update_logs,
             )
             file_name = isa_table_file.file_path
             self.modifiers_map[file_name] = modifier
             modifier.modify()
             sample_files.append(modifier)
 
-        assay_files: list[AssayFileModifier] = []
-        for isa_table_file in self.model.assays.values():
-            file_name = isa_table_file.file_path
-            modifier = AssayFileModifier(
-                self.model, isa_table_file, self.templates, self.control_lists
-            )
-            self.modifiers_map[file_name] = modifier
-            modifier.modify()
+        if self.executor and len(self.model.assays) > 1:
+            for modifier in run_table_modifiers(
+                self.executor,
+                self.model,
+                "assay",
+                self.templates,
+                self.control_lists,
+                detailed_update_logs=self.config.detailed_update_logs,
+            ):
+                self.modifiers_map[modifier.file_path] = modifier
+        else:
+            for isa_table_file in self.model.assays.values():
+                file_name = isa_table_file.file_path
+                modifier = AssayFileModifier(
+                    self.model,
+                    isa_table_file,
+                    self.templates,
+                    self.control_lists,
+                    detailed_update_logs=self.config.detailed_update_logs,
+                )
+                self.modifiers_map[file_name] = modifier
+                modifier.modify()
 
-            assay_files.append(modifier)
         if self.config.skip_result_file_modification:
             for isa_table_file in self.model.metabolite_assignments.values():
                 self.update_logs.append(
@@ -81,14 +111,30 @@ class MetabolightsStudyModelModifier(BaseIsaModifier):
                 )
         else:
             maf_files: list[MafFileModifier] = []
-            for isa_table_file in self.model.metabolite_assignments.values():
-                file_name = isa_table_file.file_path
-                modifier = MafFileModifier(
-                    self.model, isa_table_file, self.templates, self.control_lists
+            if self.executor and len(self.model.metabolite_assignments) > 1:
+                maf_files = run_table_modifiers(
+                    self.executor,
+                    self.model,
+                    "maf",
+                    self.templates,
+                    self.control_lists,
+                    detailed_update_logs=self.config.detailed_update_logs,
                 )
-                self.modifiers_map[file_name] = modifier
-                modifier.modify()
-                maf_files.append(modifier)
+                for modifier in maf_files:
+                    self.modifiers_map[modifier.file_path] = modifier
+            else:
+                for isa_table_file in self.model.metabolite_assignments.values():
+                    file_name = isa_table_file.file_path
+                    modifier = MafFileModifier(
+                        self.model,
+                        isa_table_file,
+                        self.templates,
+                        self.control_lists,
+                        detailed_update_logs=self.config.detailed_update_logs,
+                    )
+                    self.modifiers_map[file_name] = modifier
+                    modifier.modify()
+                    maf_files.append(modifier)
 
             for modifier in maf_files:
                 modifier.add_maf_sample_columns()
@@ -119,6 +165,31 @@ class MetabolightsStudyModelModifier(BaseIsaModifier):
         self.update_logs.sort(key=lambda x: x.source + x.action + x.old_value)
         return self.update_logs
 
+    def get_updated_files(self) -> list[str]:
+        """Return study files updated by modifiers.
+
+        All modifiable files are returned if source of an update log
+        is not a study file.
+        """
+        modifiable_files = {self.model.investigation_file_path}
+        modifiable_files.update(self.model.samples)
+        modifiable_files.update(self.model.assays)
+        skipped_files = set()
+        if self.config.skip_result_file_modification:
+            skipped_files.update(self.model.metabolite_assignments)
+        else:
+            modifiable_files.update(self.model.metabolite_assignments)
+
+        updated_files = set(self.new_header_actions)
+        updated_files.update(self.header_update_actions)
+        for log in self.update_logs:
+            if log.source in skipped_files:
+                continue
+            if log.source not in modifiable_files:
+                return sorted(modifiable_files)
+            updated_files.add(log.source)
+        return sorted(updated_files.intersection(modifiable_files))
+
     def update_column_headers(self, isa_table_files: dict[str, IsaTableFile]):
         remove_keys = []
         for file, actions in self.header_update_actions.items():
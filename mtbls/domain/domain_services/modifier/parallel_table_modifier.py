@@ -0,0 +1,137 @@
+from concurrent.futures import Executor
+from typing import Literal
+
+from metabolights_utils.models.isa.common import IsaTableFile
+from metabolights_utils.models.metabolights.model import (
+    MetabolightsStudyModel,
+    StudyFolderMetadata,
+)
+from metabolights_utils.tsv.model import (
+    TsvAddColumnsAction,
+    TsvUpdateColumnHeaderAction,
+)
+
+from mtbls.domain.domain_services.modifier.assay_modifier import AssayFileModifier
+from mtbls.domain.domain_services.modifier.base_isa_table_modifier import (
+    IsaTableModifier,
+)
+from mtbls.domain.domain_services.modifier.maf_modifier import MafFileModifier
+from mtbls.domain.entities.validation.validation_configuration import (
+    FileTemplates,
+    ValidationControls,
+)
+from mtbls.domain.shared.modifier import UpdateLog
+
+IsaTableType = Literal["assay", "maf"]
+
+TABLE_MODIFIERS: dict[IsaTableType, type[IsaTableModifier]] = {
+    "assay": AssayFileModifier,
+    "maf": MafFileModifier,
+}
+
+IsaTableModifierOutput = tuple[
+    IsaTableFile,
+    list[UpdateLog],
+    dict[str, list[TsvAddColumnsAction]],
+    dict[str, list[TsvUpdateColumnHeaderAction]],
+]
+
+
+def create_table_modifier_model(
+    model: MetabolightsStudyModel, table_type: IsaTableType, file_path: str
+) -> MetabolightsStudyModel:
+    """Create a study model with only the context needed to modify a table."""
+    worker_model = MetabolightsStudyModel(
+        investigation_file_path=model.investigation_file_path,
+        investigation=model.investigation,
+        study_db_metadata=model.study_db_metadata,
+    )
+    if file_path in model.parser_messages:
+        worker_model.parser_messages[file_path] = model.parser_messages[file_path]
+    if table_type == "assay":
+        worker_model.assays[file_path] = model.assays[file_path]
+        worker_model.study_folder_metadata = model.study_folder_metadata
+    else:
+        worker_model.metabolite_assignments[file_path] = model.metabolite_assignments[
+            file_path
+        ]
+        worker_model.study_folder_metadata = StudyFolderMetadata()
+    return worker_model
+
+
+def modify_isa_table(
+    model: MetabolightsStudyModel,
+    table_type: IsaTableType,
+    file_path: str,
+    templates: FileTemplates,
+    control_lists: ValidationControls,
+    detailed_update_logs: bool = False,
+) -> IsaTableModifierOutput:
+    """Run modifier of a table. It is executed in a worker process."""
+    if table_type == "assay":
+        isa_table_file = model.assays[file_path]
+    else:
+        isa_table_file = model.metabolite_assignments[file_path]
+    modifier = TABLE_MODIFIERS[table_type](
+        model,
+        isa_table_file,
+        templates,
+        control_lists,
+        detailed_update_logs=detailed_update_logs,
+    )
+    modifier.modify()
+    return (
+        modifier.isa_table_file,
+        modifier.update_logs,
+        modifier.new_header_actions,
+        modifier.header_update_actions,
+    )
+
+
+def run_table_modifiers(
+    executor: Executor,
+    model: MetabolightsStudyModel,
+    table_type: IsaTableType,
+    templates: FileTemplates,
+    control_lists: ValidationControls,
+    detailed_update_logs: bool = False,
+) -> list[IsaTableModifier]:
+    """Run modifiers of assay or MAF tables concurrently.
+
+    Each worker receives a study model that contains only its own table.
+    Modified tables replace the tables in the model and modifiers are returned
+    in table order to merge update logs deterministically.
+    """
+    isa_table_files = (
+        model.assays if table_type == "assay" else model.metabolite_assignments
+    )
+    futures = [
+        executor.submit(
+            modify_isa_table,
+            create_table_modifier_model(model, table_type, file_path),
+            table_type,
+            file_path,
+            templates,
+            control_lists,
+            detailed_update_logs,
+        )
+        for file_path in isa_table_files
+    ]
+    modifiers: list[IsaTableModifier] = []
+    for file_path, future in zip(list(isa_table_files), futures, strict=True):
+        isa_table_file, update_logs, new_header_actions, header_update_actions = (
+            future.result()
+        )
+        isa_table_files[file_path] = isa_table_file
+        modifier = TABLE_MODIFIERS[table_type](
+            model,
+            isa_table_file,
+            templates,
+            control_lists,
+            detailed_update_logs=detailed_update_logs,
+        )
+        modifier.update_logs = update_logs
+        modifier.new_header_actions = new_header_actions
+        modifier.header_update_actions = header_update_actions
+        modifiers.append(modifier)
+    return modifiers
@@ -30,9 +30,15 @@ class SampleFileModifier(IsaTableModifier):
         templates: FileTemplates,
         control_lists: ValidationControls,
         max_row_number_limit: int = 10,
+        detailed_update_logs: bool = False,
     ):
         super().__init__(
-            model, isa_table_file, templates, control_lists, max_row_number_limit
+            model,
+            isa_table_file,
+            templates,
+            control_lists,
+            max_row_number_limit,
+            detailed_update_logs,
         )
 
     def modify(self) -> list[UpdateLog]:
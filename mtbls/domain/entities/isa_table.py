@@ -1,10 +1,13 @@
 import logging
-from typing import Annotated, Literal, Union
+from typing import Annotated, Iterator, Literal, Union
 
 from metabolights_utils.common import CamelCaseModel
 from metabolights_utils.models.isa.enums import ColumnsStructure
 from pydantic import (
     Field,
+    SerializationInfo,
+    SerializerFunctionWrapHandler,
+    model_serializer,
 )
 
 from mtbls.domain.entities.base_entity import BaseEntity
@@ -122,5 +125,64 @@ class IsaTableData(CamelCaseModel):
     offset: int = 0
     limit: Union[None, int] = None
 
+    @property
+    def row_count(self) -> int:
+        return len(self.rows)
+
+    def iter_rows(self) -> Iterator[IsaTableRow]:
+        yield from self.rows
+
+    @model_serializer(mode="wrap")
+    def serialize_rows(
+        self, handler: SerializerFunctionWrapHandler, info: SerializationInfo
+    ):
+        data = handler(self)
+        # rows of columnar data are created while it is serialized.
+        if not self.rows and self.row_count and "rows" in data:
+            data["rows"] = [
+                x.model_dump(mode=info.mode, by_alias=info.by_alias)
+                for x in self.iter_rows()
+            ]
+        return data
+
+    def get_column_values(self) -> dict[str, list[str]]:
+        data: dict[str, list[str]] = {}
+        for row in self.iter_rows():
+            for col, val in row.data.items():
+                if col not in data:
+                    data[col] = []
+                data[col].append(val)
+        return data
+
+
+class ColumnarIsaTableData(IsaTableData):
+    """ISA table data that stores values of each column in a list.
+
+    Rows are not stored. They are created while they are iterated or
+    serialized. Row index of a row is its position plus offset.
+    """
+
+    column_values: Annotated[
+        dict[str, list[str]],
+        Field(description="Values of selected rows for each column", exclude=True),
+    ] = {}
+
+    @property
+    def row_count(self) -> int:
+        return len(next(iter(self.column_values.values()), []))
+
+    def iter_rows(self) -> Iterator[IsaTableRow]:
+        column_names = list(self.column_values)
+        for position, values in enumerate(
+            zip(*self.column_values.values(), strict=True)
+        ):
+            yield IsaTableRow(
+                row_index=position + self.offset,
+                data=dict(zip(column_names, values, strict=True)),
+            )
+
+    def get_column_values(self) -> dict[str, list[str]]:
+        return self.column_values
+
 
 class StudyAssayData(IsaTableData): ...
@@ -0,0 +1,12 @@
+import enum
+
+
+class AsyncTaskPriority(enum.IntEnum):
+    """Message priority of remote tasks. Lower value is consumed first.
+
+    Values are in the default priority steps of the redis broker (0, 3, 6, 9),
+    so no broker transport option is needed.
+    """
+
+    INTERACTIVE = 0
+    BATCH = 9
@@ -3,11 +3,20 @@ from typing import Union
 from metabolights_utils.common import CamelCaseModel
 
 
+class CellValueUpdate(CamelCaseModel):
+    old_value: str
+    new_value: str
+    count: int = 0
+    rows: str = ""
+
+
 class UpdateLog(CamelCaseModel):
     action: str
     source: str
     old_value: str
     new_value: str
+    updated_cell_count: None | int = None
+    value_updates: list[CellValueUpdate] = []
 
 
 class StudyMetadataModifierResult(CamelCaseModel):
@@ -16,3 +25,4 @@ class StudyMetadataModifierResult(CamelCaseModel):
     has_error: bool = False
     error_message: str = ""
     logs: list[UpdateLog] = []
+    updated_files: list[str] = []
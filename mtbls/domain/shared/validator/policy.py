@@ -61,6 +61,12 @@ class PolicyMessageList(CamelCaseModel):
     result: Annotated[PolicyMessage, Field()] = PolicyMessage()
 
 
+class ValidationPhaseTiming(CamelCaseModel):
+    phase: str = ""
+    duration_in_seconds: float = 0
+    payload_size: Union[None, int] = None
+
+
 class PolicyResult(CamelCaseModel):
     messages: ValidationResult = ValidationResult()
     resource_id: str = ""
@@ -73,6 +79,9 @@ class PolicyResult(CamelCaseModel):
     maf_file_techniques: Dict[str, str] = {}
     metadata_updates: List[UpdateLog] = []
     metadata_modifier_enabled: bool = False
+    input_hashes: Dict[str, str] = {}
+    study_size_bucket: str = ""
+    phase_timings: List[ValidationPhaseTiming] = []
 
     @field_validator("phases")
     @classmethod
@@ -104,6 +113,9 @@ class PolicySummaryResult(CamelCaseModel):
     assay_file_techniques: Dict[str, str] = {}
     maf_file_techniques: Dict[str, str] = {}
     overrides: ValidationOverrideList = ValidationOverrideList()
+    input_hashes: Dict[str, str] = {}
+    study_size_bucket: str = ""
+    phase_timings: List[ValidationPhaseTiming] = []
 
     @field_validator("status", mode="before")
     @classmethod
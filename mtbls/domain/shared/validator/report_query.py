@@ -0,0 +1,34 @@
+import enum
+from typing import Dict, List
+
+from metabolights_utils.common import CamelCaseModel
+
+from mtbls.domain.shared.validator.policy import PolicyMessage
+
+
+class ValidationReportFacet(enum.StrEnum):
+    TYPE = "type"
+    SOURCE_FILE = "sourceFile"
+    RULE_ID = "ruleId"
+    COLUMN = "column"
+
+
+class ValidationReportIndex(CamelCaseModel):
+    """Positions of violations in a validation report for each facet value."""
+
+    task_id: str = ""
+    total: int = 0
+    facets: Dict[str, Dict[str, List[int]]] = {}
+    # violations are stored in blocks to read a page without loading the report.
+    # Offsets of blocks and end of the stored file. Empty if they are not stored.
+    message_block_size: int = 0
+    message_block_offsets: List[int] = []
+
+
+class ValidationReportPage(CamelCaseModel):
+    task_id: str = ""
+    offset: int = 0
+    limit: int = 0
+    total: int = 0
+    messages: List[PolicyMessage] = []
+    facet_counts: Dict[str, Dict[str, int]] = {}
@@ -19,6 +19,13 @@ class DbConfiguration(BaseModel):
     port: int = 5432
 
 
+class ResultFileSizePolicy(BaseModel):
+    max_total_rows: int = 4000
+    max_total_size_in_bytes: None | int = None
+    chunk_size: int = 2000
+    max_parallel_chunks: int = 4
+
+
 class ValidationRunConfiguration(BaseModel):
     apply_modifiers: bool = True
     skip_result_file_modification: bool = False
@@ -27,4 +34,10 @@ class ValidationRunConfiguration(BaseModel):
     metadata_files_root_path: None | str = None
     db_connection: None | DbConfiguration = None
     assignmet_sheet_limit: None | int = None
+    maf_chunk_size: None | int = None
+    max_parallel_maf_chunks: int = 4
     ignore_cv_term_validation: None | bool = None
+    mhd_conversion_timeout_in_seconds: None | int = 600
+    parallel_table_modifiers: bool = False
+    max_parallel_table_modifiers: int = 4
+    detailed_update_logs: bool = False
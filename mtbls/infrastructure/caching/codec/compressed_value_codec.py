@@ -0,0 +1,93 @@
+import base64
+import enum
+import logging
+import zlib
+from typing import Any
+
+from pydantic import BaseModel
+
+from mtbls.application.services.interfaces.cache_value_codec import CacheValueCodec
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+COMPRESSED_VALUE_PREFIX = "mtbls:cz1:"
+
+
+class CompressionAlgorithm(enum.StrEnum):
+    ZLIB = "zlib"
+    ZSTD = "zstd"
+
+
+class CacheValueCodecConfiguration(BaseModel):
+    enabled: bool = False
+    algorithm: CompressionAlgorithm = CompressionAlgorithm.ZLIB
+    min_size_in_bytes: int = 1024
+    compression_level: int = 6
+
+
+class CompressedCacheValueCodec(CacheValueCodec):
+    """Compresses large string values and stores them as prefixed base64 text.
+
+    Values are stored as text because the redis clients use decode_responses.
+    Values without the prefix are returned as they are, so keys stored
+    before compression was enabled can still be read.
+    """
+
+    def __init__(
+        self, config: None | CacheValueCodecConfiguration | dict[str, Any] = None
+    ):
+        if not config:
+            self.config = CacheValueCodecConfiguration(enabled=True)
+        elif isinstance(config, dict):
+            self.config = CacheValueCodecConfiguration.model_validate(config)
+        else:
+            self.config = config
+        if self.config.algorithm == CompressionAlgorithm.ZSTD and not zstandard:
+            logger.warning(
+                "Cache value codec is configured to use %s but zstandard "
+                "is not installed. %s will be used.",
+                CompressionAlgorithm.ZSTD.value,
+                CompressionAlgorithm.ZLIB.value,
+            )
+            self.config = self.config.model_copy(
+                update={"algorithm": CompressionAlgorithm.ZLIB}
+            )
+
+    def encode(self, value: Any) -> Any:
+        if not self.config.enabled or not isinstance(value, str):
+            return value
+        data = value.encode("utf-8")
+        if len(data) < self.config.min_size_in_bytes:
+            return value
+        algorithm = self.config.algorithm
+        compressed = self._compress(algorithm, data)
+        encoded = base64.b64encode(compressed).decode("ascii")
+        result = f"{COMPRESSED_VALUE_PREFIX}{algorithm.value}:{encoded}"
+        if len(result) >= len(value):
+            return value
+        return result
+
+    def decode(self, value: Any) -> Any:
+        if not isinstance(value, str) or not value.startswith(COMPRESSED_VALUE_PREFIX):
+            return value
+        algorithm, _, encoded = value[len(COMPRESSED_VALUE_PREFIX) :].partition(":")
+        data = base64.b64decode(encoded)
+        return self._decompress(CompressionAlgorithm(algorithm), data).decode("utf-8")
+
+    def _compress(self, algorithm: CompressionAlgorithm, data: bytes) -> bytes:
+        if algorithm == CompressionAlgorithm.ZSTD:
+            compressor = zstandard.ZstdCompressor(level=self.config.compression_level)
+            return compressor.compress(data)
+        return zlib.compress(data, level=self.config.compression_level)
+
+    def _decompress(self, algorithm: CompressionAlgorithm, data: bytes) -> bytes:
+        if algorithm == CompressionAlgorithm.ZSTD:
+            if not zstandard:
+                raise ValueError("zstandard is required to decode the cache value.")
+            return zstandard.ZstdDecompressor().decompress(data)
+        return zlib.decompress(data)
@@ -57,6 +57,14 @@ class InMemoryCacheImpl(CacheService):
             self.expiration_times[key] = int(time.time()) + expiration_time_in_seconds
         return True
 
+    async def set_value_if_not_exists(
+        self, key: str, value: Any, expiration_time_in_seconds: Union[None, int] = None
+    ) -> bool:
+        # in-memory operations do not suspend, so check and set are not interleaved
+        if await self.does_key_exist(key):
+            return False
+        return await self.set_value(key, value, expiration_time_in_seconds)
+
     async def delete_key(self, key: str) -> bool:
         # Delete the key from both the store and expiration dictionary if it exists
         if key in self.store:
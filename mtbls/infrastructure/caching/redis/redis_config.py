@@ -1,5 +1,9 @@
 from pydantic import BaseModel
 
+from mtbls.infrastructure.caching.codec.compressed_value_codec import (
+    CacheValueCodecConfiguration,
+)
+
 
 class RedisService(BaseModel):
     host: str = ""
@@ -11,3 +15,4 @@ class RedisConnection(BaseModel):
     db: int = 10
     password: str = ""
     socket_timeout: float = 0.5
+    value_compression: CacheValueCodecConfiguration = CacheValueCodecConfiguration()
@@ -4,12 +4,21 @@ from dependency_injector import resources
 from redis.asyncio import Redis
 
 from mtbls.application.services.interfaces.cache_service import CacheService
+from mtbls.application.services.interfaces.cache_value_codec import CacheValueCodec
+from mtbls.infrastructure.caching.codec.compressed_value_codec import (
+    CompressedCacheValueCodec,
+)
 from mtbls.infrastructure.caching.redis.redis_config import RedisConnection
 
 
 class RedisCacheImpl(CacheService):
-    def __init__(self, config: dict[str, Any]):
+    def __init__(
+        self, config: dict[str, Any], value_codec: None | CacheValueCodec = None
+    ):
         self.connection = RedisConnection.model_validate(config, from_attributes=True)
+        self.value_codec = value_codec or CompressedCacheValueCodec(
+            self.connection.value_compression
+        )
 
         self.redis = Redis(
             host=self.connection.redis_service.host,
@@ -39,28 +48,40 @@ class RedisCacheImpl(CacheService):
     async def get_value(self, key: str) -> Any:
         value = await self.redis.get(key)
         if value is not None:
-            return value
+            return self.value_codec.decode(value)
         return None
 
     async def set_value_with_expiration_time(
         self, key: str, value: Any, expiration_timestamp: int
     ):
-        return await self.redis.setex(key, expiration_timestamp, value)
+        return await self.redis.setex(
+            key, expiration_timestamp, self.value_codec.encode(value)
+        )
 
     async def set_value(
         self, key: str, value: Any, expiration_time_in_seconds: Union[None, int] = None
     ) -> bool:
+        value = self.value_codec.encode(value)
         if expiration_time_in_seconds:
             return await self.redis.setex(key, expiration_time_in_seconds, value)
         return await self.redis.set(key, value)
 
+    async def set_value_if_not_exists(
+        self, key: str, value: Any, expiration_time_in_seconds: Union[None, int] = None
+    ) -> bool:
+        value = self.value_codec.encode(value)
+        result = await self.redis.set(
+            key, value, ex=expiration_time_in_seconds or None, nx=True
+        )
+        return bool(result)
+
     async def delete_key(self, key: str) -> bool:
         return await self.redis.delete(key) > 0
 
     async def get_ttl_in_seconds(self, key: str) -> int:
         return await self.redis.ttl(key)
 
-    async def close_connection(self, key: str) -> int:
+    async def close_connection(self) -> None:
         await self.redis.close()
 
 
@@ -2,6 +2,9 @@ from typing import List
 
 from pydantic import BaseModel
 
+from mtbls.infrastructure.caching.codec.compressed_value_codec import (
+    CacheValueCodecConfiguration,
+)
 from mtbls.infrastructure.caching.redis.redis_config import RedisService
 
 
@@ -11,3 +14,4 @@ class RedisSentinelConnection(BaseModel):
     db: int = 10
     sentinel_services: List[RedisService] = []
     socket_timeout: float = 0.5
+    value_compression: CacheValueCodecConfiguration = CacheValueCodecConfiguration()
@@ -4,14 +4,23 @@ import redis.asyncio as redis
 from redis.sentinel import Sentinel
 
 from mtbls.application.services.interfaces.cache_service import CacheService
+from mtbls.application.services.interfaces.cache_value_codec import CacheValueCodec
+from mtbls.infrastructure.caching.codec.compressed_value_codec import (
+    CompressedCacheValueCodec,
+)
 from mtbls.infrastructure.caching.redis_sentinel.redis_sentinel_config import (
     RedisSentinelConnection,
 )
 
 
 class RedisSentinelCacheImpl(CacheService):
-    def __init__(self, config: dict[str, Any]):
+    def __init__(
+        self, config: dict[str, Any], value_codec: None | CacheValueCodec = None
+    ):
         self.connection = RedisSentinelConnection.model_validate(config)
+        self.value_codec = value_codec or CompressedCacheValueCodec(
+            self.connection.value_compression
+        )
         connections = [(x.host, x.port) for x in self.connection.sentinel_services if x]
         self.sentinel = Sentinel(
             connections,
@@ -43,6 +52,7 @@ class RedisSentinelCacheImpl(CacheService):
             decode_responses=True,
             socket_connect_timeout=self.connection.socket_timeout,
         )
+        return self.redis_master
 
     async def _get_slave_connection(self) -> redis.Redis:
         self.redis_slave = self.sentinel.slave_for(
@@ -53,6 +63,7 @@ class RedisSentinelCacheImpl(CacheService):
             decode_responses=True,
             socket_connect_timeout=self.connection.socket_timeout,
         )
+        return self.redis_slave
 
     async def keys(self, key_pattern: str) -> list[str]:
         master = await self._get_master_connection()
@@ -64,22 +75,38 @@ class RedisSentinelCacheImpl(CacheService):
 
     async def get_value(self, key: str) -> Any:
         slave = await self._get_slave_connection()
-        return await slave.get(key)
+        value = await slave.get(key)
+        if value is not None:
+            return self.value_codec.decode(value)
+        return None
 
     async def set_value_with_expiration_time(
         self, key: str, value: Any, expiration_timestamp: int
     ):
         master = await self._get_master_connection()
-        return await master.setex(key, expiration_timestamp, value)
+        return await master.setex(
+            key, expiration_timestamp, self.value_codec.encode(value)
+        )
 
     async def set_value(
         self, key: str, value: Any, expiration_time_in_seconds: Union[None, int] = None
     ) -> bool:
         master = await self._get_master_connection()
+        value = self.value_codec.encode(value)
         if expiration_time_in_seconds:
             return await master.setex(key, expiration_time_in_seconds, value)
         return await master.set(key, value)
 
+    async def set_value_if_not_exists(
+        self, key: str, value: Any, expiration_time_in_seconds: Union[None, int] = None
+    ) -> bool:
+        master = await self._get_master_connection()
+        value = self.value_codec.encode(value)
+        result = await master.set(
+            key, value, ex=expiration_time_in_seconds or None, nx=True
+        )
+        return bool(result)
+
     async def delete_key(self, key: str) -> bool:
         master = await self._get_master_connection()
         return await master.delete(key) > 0
@@ -4,6 +4,8 @@ from mtbls.domain.component_configs.configuration import BaseConfiguration
 class OpaConfiguration(BaseConfiguration):
     validate_schema: bool = False
     timeout_in_seconds: int = 600
+    sharded_validation: bool = False
+    max_parallel_requests: int = 4
     version_url: str = "http://policy-engine:8181/v1/data/metabolights/validation/v2/configuration/version"
     validation_url: str = "http://policy-engine:8181/v1/data/metabolights/validation/v2/report/complete_report?pretty=true"
     templates_url: str = (
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from typing import Any, Union
 
@@ -18,6 +19,10 @@ from mtbls.domain.enums.http_request_type import HttpRequestType
 from mtbls.domain.shared.validator.policy import PolicyInput, ValidationResult
 from mtbls.domain.shared.validator.validation import Validation, VersionedValidationsMap
 from mtbls.infrastructure.policy_service.opa.opa_configuration import OpaConfiguration
+from mtbls.infrastructure.policy_service.opa.study_model_shards import (
+    create_study_model_shards,
+    merge_shard_results,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -129,24 +134,65 @@ class OpaPolicyService(PolicyService):
         validate_schema: None | bool = None,
         timeout_in_seconds: None | int = None,
     ) -> ValidationResult:
-        opa = PolicyInput()
-        opa.input = model
-        logger.debug("Loading study model schema to validate %s", resource_id)
         timeout_in_seconds = (
             timeout_in_seconds if timeout_in_seconds else self.config.timeout_in_seconds
         )
         validate_schema = (
             validate_schema if validate_schema else self.config.validate_schema
         )
-        #
+        table_files_count = (
+            len(model.samples) + len(model.assays) + len(model.metabolite_assignments)
+        )
+        if not self.config.sharded_validation or table_files_count < 2:
+            return await self.send_validation_request(
+                resource_id, model, validate_schema, timeout_in_seconds
+            )
+        if validate_schema:
+            self.validate_input_schema(resource_id, model)
+
+        shards = create_study_model_shards(model)
+        logger.debug(
+            "Sending %s validation request in %s shards to %s",
+            resource_id,
+            len(shards),
+            self.config.validation_url,
+        )
+        semaphore = asyncio.Semaphore(max(1, self.config.max_parallel_requests))
+
+        async def validate_shard(shard_model: MetabolightsStudyModel):
+            async with semaphore:
+                return await self.send_validation_request(
+                    resource_id, shard_model, False, timeout_in_seconds
+                )
+
+        results = await asyncio.gather(*[validate_shard(x.model) for x in shards])
+        return merge_shard_results(shards, results)
+
+    def validate_input_schema(
+        self, resource_id: str, model: MetabolightsStudyModel
+    ) -> None:
+        logger.debug("Loading study model schema to validate %s", resource_id)
+        opa = PolicyInput()
+        opa.input = model
         dict_value = opa.model_dump(by_alias=True)
+        logger.debug("Validating input model")
+        study_model_json_schema = get_study_model_schema()
+        jsonschema.validate(
+            instance=dict_value["input"], schema=study_model_json_schema
+        )
+
+    async def send_validation_request(
+        self,
+        resource_id: str,
+        model: MetabolightsStudyModel,
+        validate_schema: bool,
+        timeout_in_seconds: int,
+    ) -> ValidationResult:
         if validate_schema:
-            opa.model_json_schema(mode="serialization")
-            logger.debug("Validating input model")
-            study_model_json_schema = get_study_model_schema()
-            jsonschema.validate(
-                instance=dict_value["input"], schema=study_model_json_schema
-            )
+            self.validate_input_schema(resource_id, model)
+        opa = PolicyInput()
+        opa.input = model
+        dict_value = opa.model_dump(by_alias=True)
         logger.debug(
             "Sending %s validation request to %s",
             resource_id,
@@ -0,0 +1,119 @@
+from typing import TypeVar
+
+from metabolights_utils.models.isa.common import IsaTableFile
+from metabolights_utils.models.metabolights.model import MetabolightsStudyModel
+from pydantic import BaseModel
+
+from mtbls.domain.shared.validator.policy import PolicyMessage, ValidationResult
+
+T = TypeVar("T", bound=IsaTableFile)
+
+
+class StudyModelShard(BaseModel):
+    name: str
+    model: MetabolightsStudyModel
+    source_files: set[str] = set()
+    default_shard: bool = False
+
+
+def strip_table_data(isa_table_file: T) -> T:
+    """Return a copy of ISA table file without table rows.
+
+    Column headers and file level metadata (sample names, assay names,
+    referenced files, etc.) are kept for cross-file rules.
+    """
+    table = isa_table_file.table.model_copy(
+        update={"data": {}, "row_indices": [], "row_count": 0}
+    )
+    return isa_table_file.model_copy(update={"table": table})
+
+
+def _create_shard_model(
+    model: MetabolightsStudyModel, full_table_files: set[str]
+) -> MetabolightsStudyModel:
+    def select(tables: dict[str, T]) -> dict[str, T]:
+        return {
+            k: v if k in full_table_files else strip_table_data(v)
+            for k, v in tables.items()
+        }
+
+    return model.model_copy(
+        update={
+            "samples": select(model.samples),
+            "assays": select(model.assays),
+            "metabolite_assignments": select(model.metabolite_assignments),
+        }
+    )
+
+
+def create_study_model_shards(
+    model: MetabolightsStudyModel,
+) -> list[StudyModelShard]:
+    """Split study model into shards that can be validated independently.
+
+    Each ISA table file is validated in its own shard with the table data
+    of its cross-referenced files. Other table files are in the shard
+    without table rows. The default shard validates investigation file and
+    the other study level inputs.
+    """
+    shards = [
+        StudyModelShard(
+            name=model.investigation_file_path or "investigation",
+            model=_create_shard_model(model, set()),
+            default_shard=True,
+        )
+    ]
+    for file_name in model.samples:
+        shards.append(
+            StudyModelShard(
+                name=file_name,
+                model=_create_shard_model(model, {file_name}),
+                source_files={file_name},
+            )
+        )
+    for file_name in model.assays:
+        shards.append(
+            StudyModelShard(
+                name=file_name,
+                model=_create_shard_model(model, {file_name, *model.samples.keys()}),
+                source_files={file_name},
+            )
+        )
+    for file_name in model.metabolite_assignments:
+        assay_files = {
+            k
+            for k, v in model.assays.items()
+            if file_name in v.referenced_assignment_files
+        }
+        shards.append(
+            StudyModelShard(
+                name=file_name,
+                model=_create_shard_model(model, {file_name, *assay_files}),
+                source_files={file_name},
+            )
+        )
+    return shards
+
+
+def merge_shard_results(
+    shards: list[StudyModelShard], results: list[ValidationResult]
+) -> ValidationResult:
+    """Merge messages of shards.
+
+    A message is selected from the shard of its source file. Messages of
+    the other sources are selected from the default shard.
+    """
+    table_files: set[str] = set()
+    for shard in shards:
+        table_files.update(shard.source_files)
+
+    def is_selected(shard: StudyModelShard, message: PolicyMessage) -> bool:
+        if shard.default_shard:
+            return message.source_file not in table_files
+        return message.source_file in shard.source_files
+
+    merged = ValidationResult()
+    for shard, result in zip(shards, results):
+        merged.violations.extend(x for x in result.violations if is_selected(shard, x))
+        merged.summary.extend(x for x in result.summary if is_selected(shard, x))
+    return merged
@@ -80,19 +80,27 @@ class CeleryAsyncTaskExecutor(AsyncTaskExecutor):
         self.task_name = task_name
         self.id_generator = id_generator
 
-    async def start(self, expires: Union[None, int] = None) -> AsyncTaskResult:
+    async def start(
+        self, expires: Union[None, int] = None, priority: Union[None, int] = None
+    ) -> AsyncTaskResult:
         request_tracker = get_request_tracker().get_request_tracker_model().model_dump()
         self.kwargs["request_tracker"] = request_tracker
+        options = {}
+        if priority is not None:
+            options["priority"] = priority
         if self.id_generator:
             task_id = self.id_generator.generate_unique_id()
             task = self.task_method.apply_async(
                 expires=expires,
                 kwargs=self.kwargs,
                 task_id=task_id,
+                **options,
             )
         else:
-            task = self.task_method.apply_async(expires=expires, kwargs=self.kwargs)
-        logger.info("Task '%s' is created.", self.task_name)
+            task = self.task_method.apply_async(
+                expires=expires, kwargs=self.kwargs, **options
+            )
+        logger.info("Task '%s' is created with priority %s.", self.task_name, priority)
         return CeleryAsyncTaskResult(task)
 
 
@@ -103,7 +103,9 @@ class ThreadingAsyncTaskExecutor(AsyncTaskExecutor):
         self.task_name = task_name
         self.async_task_results_dict = async_task_results_dict
 
-    async def start(self, expires: Union[None, int] = None) -> AsyncTaskResult:
+    async def start(
+        self, expires: Union[None, int] = None, priority: Union[None, int] = None
+    ) -> AsyncTaskResult:
         task_id = self.id_generator.generate_unique_id()
         async_task = ThreadingAsyncTaskResult(self.async_task_results_dict, task_id)
         request_tracker = get_request_tracker().get_request_tracker_model().model_dump()
@@ -97,9 +97,7 @@ class FileSystemObjectReadRepository(FileObjectReadRepository):
         )
 
     async def get_uri(self, resource_id: str, object_key: str) -> str:
-        _, object_path = await self._get_object_path(
-            resource_id, self.study_bucket.value, object_key
-        )
+        _, object_path = await self._get_object_path(resource_id, object_key)
         return f"file://{str(object_path)}"
 
     async def download(
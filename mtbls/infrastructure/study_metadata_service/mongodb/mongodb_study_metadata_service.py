@@ -10,6 +10,7 @@ from metabolights_utils.common import CamelCaseModel
 from metabolights_utils.isatab import Writer
 from metabolights_utils.models.isa.common import IsaTableFile
 from metabolights_utils.models.metabolights.model import MetabolightsStudyModel
+from metabolights_utils.models.parser.common import ParserMessage
 from metabolights_utils.provider.async_provider.study_provider import (
     AsyncMetabolightsStudyProvider,
 )
@@ -559,11 +560,16 @@ class MongoDbStudyMetadataService(StudyMetadataService):
         model: MetabolightsStudyModel,
         save_metadata_files: bool = True,
         save_result_files: bool = True,
+        object_keys: Union[None, list[str]] = None,
     ) -> bool:
+        # only investigation file is stored. It is skipped if it is not selected.
+        object_key = model.investigation_file_path or "i_Investigation.txt"
+        if object_keys is not None and object_key not in object_keys:
+            return True
         investigation_item = InvestigationItem.get_from_investigation(
             model.investigation
         )
-        self.save_investigation_file(investigation_item)
+        await self.save_investigation_file(investigation_item, object_key=object_key)
         # TODO complete saving metadata and result files tables
 
     async def load_investigation_file(
@@ -632,8 +638,24 @@ class MongoDbStudyMetadataService(StudyMetadataService):
         prefix: Union[None, str] = None,
         suffix: Union[None, str] = None,
         timestamp_format: str = "%Y-%m-%d_%H-%M-%S",
+        object_keys: Union[None, list[str]] = None,
     ) -> tuple[str, str]: ...
 
+    async def reload_study_model_files(
+        self,
+        model: MetabolightsStudyModel,
+        object_keys: list[str],
+        assignment_sheet_limit: Union[int, None] = None,
+    ) -> MetabolightsStudyModel: ...
+
+    async def load_isa_table_sheet(
+        self,
+        object_key: str,
+        expected_patterns: Union[None, list[list[str]]] = None,
+        offset: Union[int, None] = None,
+        limit: Union[int, None] = None,
+    ) -> tuple[IsaTableFile, list[ParserMessage]]: ...
+
     async def get_isa_table_data_columns(
         self,
         object_key: str,
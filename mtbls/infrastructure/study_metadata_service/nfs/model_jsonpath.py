@@ -0,0 +1,114 @@
+import threading
+from typing import Any, Union, get_args, get_origin
+
+import jsonpath_ng.ext as jp
+from cachetools import LRUCache, cached
+from jsonpath_ng import JSONPath
+from jsonpath_ng.jsonpath import DatumInContext, Fields, Index, Root
+from pydantic import BaseModel, TypeAdapter
+
+ModelPath = list[Union[str, int]]
+
+
+@cached(cache=LRUCache(maxsize=512), lock=threading.Lock())
+def get_jsonpath_expression(jsonpath: str) -> JSONPath:
+    """Return compiled jsonpath expression. Compiled expressions are reused."""
+    return jp.parse(jsonpath)
+
+
+@cached(cache=LRUCache(maxsize=256), lock=threading.Lock())
+def get_type_adapter(annotation: Any) -> TypeAdapter:
+    return TypeAdapter(annotation)
+
+
+def get_datum_path(datum: DatumInContext) -> Union[None, ModelPath]:
+    """Return field names and list indices from root to a jsonpath match."""
+    path: ModelPath = []
+    while datum is not None:
+        if isinstance(datum.path, Fields) and len(datum.path.fields) == 1:
+            path.append(datum.path.fields[0])
+        elif isinstance(datum.path, Index) and len(datum.path.indices) == 1:
+            path.append(datum.path.indices[0])
+        elif not isinstance(datum.path, Root):
+            return None
+        datum = datum.context
+    path.reverse()
+    return path
+
+
+def get_field_name(model_class: type[BaseModel], key: str) -> Union[None, str]:
+    for name, field in model_class.model_fields.items():
+        if key == field.alias or key == name:
+            return name
+    return None
+
+
+def find_model_location(
+    model: BaseModel, path: ModelPath
+) -> Union[None, tuple[Union[BaseModel, list], Union[str, int], Any]]:
+    """Return parent, field name or list index and type of the item at path."""
+    parent: Any = model
+    annotation = None
+    for idx, key in enumerate(path):
+        if isinstance(key, str):
+            if not isinstance(parent, BaseModel):
+                return None
+            name = get_field_name(type(parent), key)
+            if not name:
+                return None
+            annotation = type(parent).model_fields[name].annotation
+            if idx == len(path) - 1:
+                return parent, name, annotation
+            parent = getattr(parent, name)
+        else:
+            if not isinstance(parent, list) or get_origin(annotation) is not list:
+                return None
+            if key < 0 or key >= len(parent):
+                return None
+            annotation = get_args(annotation)[0]
+            if idx == len(path) - 1:
+                return parent, key, annotation
+            parent = parent[key]
+    return None
+
+
+def update_model_item(model: BaseModel, path: ModelPath, value: Any) -> bool:
+    """Validate value with type of the item at path and replace the item."""
+    location = find_model_location(model, path) if path else None
+    if not location:
+        return False
+    parent, key, annotation = location
+    item = get_type_adapter(annotation).validate_python(value)
+    if isinstance(parent, list):
+        parent[key] = item
+    else:
+        setattr(parent, key, item)
+    return True
+
+
+def append_model_item(model: BaseModel, path: ModelPath, value: Any) -> bool:
+    """Validate value with item type of the list at path and append it."""
+    location = find_model_location(model, path) if path else None
+    if not location:
+        return False
+    parent, key, annotation = location
+    items = parent[key] if isinstance(parent, list) else getattr(parent, key)
+    if not isinstance(items, list) or get_origin(annotation) is not list:
+        return False
+    items.append(get_type_adapter(get_args(annotation)[0]).validate_python(value))
+    return True
+
+
+def delete_model_items(model: BaseModel, paths: list[ModelPath]) -> bool:
+    """Delete list items at paths. Nothing is deleted if a path is not a list item."""
+    selected: dict[int, tuple[list, set[int]]] = {}
+    for path in paths:
+        location = find_model_location(model, path) if path else None
+        if not location or not isinstance(location[0], list):
+            return False
+        items, index, _ = location
+        selected.setdefault(id(items), (items, set()))[1].add(index)
+    for items, indices in selected.values():
+        for index in sorted(indices, reverse=True):
+            del items[index]
+    return True
@@ -1,20 +1,29 @@
+import asyncio
 import datetime
+import io
 import logging
+import os
 import re
 import shutil
 import uuid
 from pathlib import Path
-from typing import Any, Union
+from typing import Any, Awaitable, Callable, Union
 
-import jsonpath_ng.ext as jp
 from metabolights_utils.common import CamelCaseModel
 from metabolights_utils.isatab import Reader, Writer
+from metabolights_utils.isatab.default.parser.isa_table_parser import (
+    assay_file_expected_patterns,
+    parse_isa_table_sheet_from_fs,
+    samples_file_expected_patterns,
+)
 from metabolights_utils.isatab.reader import (
     InvestigationFileReaderResult,
     IsaTableFileReaderResult,
 )
 from metabolights_utils.models.isa.common import IsaTableFile
 from metabolights_utils.models.metabolights.model import MetabolightsStudyModel
+from metabolights_utils.models.parser.common import ParserMessage
+from metabolights_utils.provider.study_provider import MetabolightsStudyProvider
 from pydantic.alias_generators import to_camel
 
 from mtbls.application.services.interfaces.repositories.file_object.file_object_write_repository import (  # noqa: E501
@@ -41,6 +50,7 @@ from mtbls.application.services.study_metadata_service.default_study_provider im
 from mtbls.application.services.study_metadata_service.models import IsaTableDataUpdates
 from mtbls.domain.entities.investigation import InvestigationItem
 from mtbls.domain.entities.isa_table import (
+    ColumnarIsaTableData,
     ColumnDefinition,
     IsaTableData,
     IsaTableFileObject,
@@ -53,9 +63,48 @@ from mtbls.domain.exceptions.repository import (
 )
 from mtbls.domain.shared.data_types import JsonPathOperation
 from mtbls.domain.shared.repository.study_bucket import StudyBucket
+from mtbls.infrastructure.study_metadata_service.nfs.model_jsonpath import (
+    ModelPath,
+    append_model_item,
+    delete_model_items,
+    get_datum_path,
+    get_jsonpath_expression,
+    update_model_item,
+)
+from mtbls.infrastructure.study_metadata_service.nfs.parsed_file_cache import (
+    parsed_metadata_files,
+)
+from mtbls.infrastructure.study_metadata_service.nfs.row_offset_index import (
+    RowOffsetIndex,
+    get_row_offset_index_key,
+)
 
 logger = logging.getLogger(__name__)
 
+# Snapshots of selected files have this file with their object keys.
+PARTIAL_SNAPSHOT_MANIFEST = "PARTIAL_SNAPSHOT_MANIFEST"
+
+
+class LazyFileStudyProvider(DataFileIndexMetabolightsStudyProvider):
+    """Study provider that requests each metadata file when it is first read."""
+
+    def __init__(
+        self,
+        *args: Any,
+        get_staged_file_path: Callable[[str], Awaitable[str]],
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.get_staged_file_path = get_staged_file_path
+
+    async def get_file_path(
+        self,
+        relative_file_path: str,
+        folder: Union[None, str],
+        study_id: Union[None, str],
+    ) -> str:
+        return await self.get_staged_file_path(relative_file_path)
+
 
 class FileObjectStudyMetadataService(StudyMetadataService):
     def __init__(
@@ -153,7 +202,7 @@ class FileObjectStudyMetadataService(StudyMetadataService):
             object_key=object_key
         )
         json_model = investigation.model_dump(by_alias=True)
-        expression, result, indices = await self._find_items_with_jsonpath(
+        expression, result, indices, paths = await self._find_items_with_jsonpath(
             json_model, target_jsonpath
         )
 
@@ -161,10 +210,12 @@ class FileObjectStudyMetadataService(StudyMetadataService):
             json_model, input_data, expression, result, indices, field_name=field_name
         )
         if updated:
-            updated_investigation = InvestigationItem.model_validate(json_model)
-            await self.save_investigation_file(
-                updated_investigation, object_key=object_key
-            )
+            # Only updated item is validated if its location is found in the model.
+            if not self._update_investigation_item(
+                investigation, operation, result, paths
+            ):
+                investigation = InvestigationItem.model_validate(json_model)
+            await self.save_investigation_file(investigation, object_key=object_key)
         elif operation != "get":
             return None, []
         data = []
@@ -280,11 +331,12 @@ class FileObjectStudyMetadataService(StudyMetadataService):
         json_model: dict[str, Any],
         target_jsonpath: str,
     ):
-        expression = jp.parse(target_jsonpath)
+        expression = get_jsonpath_expression(target_jsonpath)
         search_results = expression.find(json_model)
         result = [x.value for x in search_results]
         if not result:
-            return expression, [], []
+            return expression, [], [], []
+        paths = [get_datum_path(x) for x in search_results]
         indices = []
 
         if search_results and hasattr(search_results[0].path, "index"):
@@ -295,7 +347,24 @@ class FileObjectStudyMetadataService(StudyMetadataService):
             str(target_jsonpath),
             self.resource_id,
         )
-        return expression, result, indices
+        return expression, result, indices, paths
+
+    def _update_investigation_item(
+        self,
+        investigation: InvestigationItem,
+        operation: JsonPathOperation,
+        result: list[Any],
+        paths: list[Union[None, ModelPath]],
+    ) -> bool:
+        if not paths or any(x is None for x in paths):
+            return False
+        if operation == "delete":
+            return delete_model_items(investigation, paths)
+        if operation == "insert":
+            return append_model_item(investigation, paths[0], result[0][-1])
+        if operation in ("update-object", "patch", "update-string"):
+            return update_model_item(investigation, paths[0], result[0])
+        return False
 
     async def process_investigation_file(
         self,
@@ -348,13 +417,20 @@ class FileObjectStudyMetadataService(StudyMetadataService):
                     f"Resource not found: {not_exist_files}"
                 )
             selected_files = [x for x in resources if x.object_key in source_set]
-        for file in selected_files:
-            target_file_path = self.staging_path / Path(file.object_key)
-            await self.metadata_files_object_repository.download(
-                resource_id=self.resource_id,
-                object_key=file.object_key,
-                target_path=str(target_file_path),
+        self._remove_staged_links()
+        if source_object_keys:
+            await self._put_partial_snapshot_manifest(
+                parent_object_key, [x.object_key for x in selected_files]
             )
+        for file in selected_files:
+            target_file_path = await self._get_local_source_path(file.object_key)
+            if not target_file_path:
+                target_file_path = self.staging_path / Path(file.object_key)
+                await self.metadata_files_object_repository.download(
+                    resource_id=self.resource_id,
+                    object_key=file.object_key,
+                    target_path=str(target_file_path),
+                )
             target_object_key = f"{parent_object_key.strip('/')}/{file.object_key}"
             await self.audit_files_object_repository.put_object(
                 resource_id=self.resource_id,
@@ -363,6 +439,22 @@ class FileObjectStudyMetadataService(StudyMetadataService):
                 override=True,
             )
 
+    async def _put_partial_snapshot_manifest(
+        self, parent_object_key: str, object_keys: list[str]
+    ) -> None:
+        """Mark snapshot as partial. Its object keys are listed in the manifest."""
+        manifest_path = self.staging_path / Path(PARTIAL_SNAPSHOT_MANIFEST)
+        manifest_path.write_text("\n".join(object_keys))
+        try:
+            await self.audit_files_object_repository.put_object(
+                resource_id=self.resource_id,
+                object_key=f"{parent_object_key.strip('/')}/{PARTIAL_SNAPSHOT_MANIFEST}",
+                source_uri=f"file://{str(manifest_path)}",
+                override=True,
+            )
+        finally:
+            manifest_path.unlink(missing_ok=True)
+
     async def load_study_model(  # noqa: PLR0913
         self,
         load_sample_file: bool = False,
@@ -380,34 +472,62 @@ class FileObjectStudyMetadataService(StudyMetadataService):
         calculate_metadata_size: bool = False,
     ) -> MetabolightsStudyModel:
         object_key = "i_Investigation.txt"
-        object_path = Path(object_key)
-        target_file_path = self.staging_path / object_path
-        if not target_file_path.exists():
-            await self.metadata_files_object_repository.download(
-                resource_id=self.resource_id,
-                object_key=object_key,
-                target_path=str(target_file_path),
-            )
+        target_file_path = self.staging_path / Path(object_key)
         study_objects = await self.metadata_files_object_repository.list(
             resource_id=self.resource_id
         )
+        study_object_keys = {
+            x.object_key for x in study_objects if re.match(r"^[isam]_.+", x.basename)
+        }
+        staged_files: dict[str, asyncio.Task] = {}
 
-        for file in study_objects:
-            if re.match(r"^[isam]_.+", file.basename):
-                target_file_path = self.staging_path / Path(file.object_key)
-                await self.metadata_files_object_repository.download(
-                    resource_id=self.resource_id,
-                    object_key=file.object_key,
-                    target_path=str(target_file_path),
+        def stage_file(relative_file_path: str) -> asyncio.Task:
+            if relative_file_path not in staged_files:
+                staged_files[relative_file_path] = asyncio.create_task(
+                    self._stage_file(relative_file_path)
                 )
+            return staged_files[relative_file_path]
 
-        provider = DataFileIndexMetabolightsStudyProvider(
+        if not target_file_path.exists():
+            await stage_file(object_key)
+        # Requested sample, assay and MAF files are fetched concurrently.
+        # Other files are fetched when provider reads them.
+        prefetched_files: list[str] = []
+        if load_sample_file or load_assay_files:
+            try:
+                investigation = await self.load_investigation_file(object_key)
+                for study in investigation.studies:
+                    if load_sample_file:
+                        prefetched_files.append(study.file_name)
+                    if load_assay_files:
+                        prefetched_files.extend(x.file_name for x in study.assays)
+            except Exception as ex:
+                logger.warning(
+                    "%s investigation file is not parsed: %s", object_key, ex
+                )
+        if load_maf_files:
+            prefetched_files.extend(
+                x for x in study_object_keys if Path(x).name.startswith("m_")
+            )
+        await asyncio.gather(
+            *[stage_file(x) for x in prefetched_files if x in study_object_keys]
+        )
+
+        async def get_file_path(relative_file_path: str) -> str:
+            if relative_file_path != object_key and relative_file_path in (
+                study_object_keys
+            ):
+                await stage_file(relative_file_path)
+            return str(self.staging_path / Path(relative_file_path))
+
+        provider = LazyFileStudyProvider(
             resource_id=self.resource_id,
             study_read_repository=self.study_read_repository,
             user_read_repository=self.user_read_repository,
             internal_files_object_repository=self.internal_files_object_repository,
             metadata_files_object_repository=self.metadata_files_object_repository,
             data_file_index_file_key="DATA_FILES/data_file_index.json",
+            get_staged_file_path=get_file_path,
         )
 
         return await provider.load_study(
@@ -428,6 +548,140 @@ class FileObjectStudyMetadataService(StudyMetadataService):
             calculate_metadata_size=calculate_metadata_size,
         )
 
+    async def reload_study_model_files(
+        self,
+        model: MetabolightsStudyModel,
+        object_keys: list[str],
+        assignment_sheet_limit: Union[int, None] = None,
+    ) -> MetabolightsStudyModel:
+        """Parse the selected files of a loaded model again.
+
+        Saved files are read from staging folder and the others from the study
+        folder, because links to unmodified files are removed before saving.
+        """
+        provider = MetabolightsStudyProvider(metadata_file_provider=self)
+        for object_key in object_keys:
+            if object_key == model.investigation_file_path:
+                file_path = await self._get_readable_file_path(object_key)
+                provider.update_investigation_file(
+                    model, str(file_path.parent), file_name=file_path.name
+                )
+                model.investigation_file_path = object_key
+                model.parser_messages[object_key] = model.parser_messages.pop(
+                    file_path.name
+                )
+                continue
+            limit = None
+            patterns = None
+            if object_key in model.samples:
+                isa_table_file = model.samples[object_key]
+                patterns = samples_file_expected_patterns
+            elif object_key in model.assays:
+                isa_table_file = model.assays[object_key]
+                patterns = assay_file_expected_patterns
+            elif object_key in model.metabolite_assignments:
+                isa_table_file = model.metabolite_assignments[object_key]
+                limit = assignment_sheet_limit
+            else:
+                continue
+            isa_table, messages = await self.load_isa_table_sheet(
+                object_key, expected_patterns=patterns, limit=limit
+            )
+            isa_table_file.table = isa_table.table
+            isa_table_file.sha256_hash = isa_table.sha256_hash
+            table = isa_table_file.table
+            table.row_count = len(table.data[table.columns[0]]) if table.data else 0
+            model.parser_messages[object_key] = provider.filter_messages(messages)
+            if object_key in model.samples:
+                provider.set_organisms(isa_table_file, isa_table_file)
+            elif object_key in model.assays:
+                isa_table_file.number_of_assay_rows = table.row_count
+        if model.metabolite_assignments and any(
+            x in model.metabolite_assignments for x in object_keys
+        ):
+            model.has_assignment_table_data = True
+        return model
+
+    async def load_isa_table_sheet(
+        self,
+        object_key: str,
+        expected_patterns: Union[None, list[list[str]]] = None,
+        offset: Union[int, None] = None,
+        limit: Union[int, None] = None,
+    ) -> tuple[IsaTableFile, list[ParserMessage]]:
+        file_path = await self._get_readable_file_path(object_key)
+        return await asyncio.to_thread(
+            parse_isa_table_sheet_from_fs,
+            str(file_path),
+            expected_patterns,
+            offset=offset,
+            limit=limit,
+            fix_unicode_exceptions=True,
+            remove_empty_rows=True,
+            remove_new_lines_in_cells=True,
+        )
+
+    async def _get_local_source_path(self, object_key: str) -> Union[None, Path]:
+        """Return path of a metadata file if it is on local file system."""
+        uri = await self.metadata_files_object_repository.get_uri(
+            resource_id=self.resource_id, object_key=object_key
+        )
+        if not isinstance(uri, str) or not uri.startswith("file://"):
+            return None
+        source_path = Path(uri.removeprefix("file://"))
+        return source_path if source_path.is_file() else None
+
+    async def _get_readable_file_path(self, object_key: str) -> Path:
+        """Return path of a metadata file to parse.
+
+        File in staging folder is selected if it exists. Local files are read
+        in place and others are downloaded to staging folder.
+        """
+        target_file_path = self.staging_path / Path(object_key)
+        if target_file_path.exists():
+            return target_file_path
+        source_path = await self._get_local_source_path(object_key)
+        if source_path:
+            return source_path
+        await self.metadata_files_object_repository.download(
+            resource_id=self.resource_id,
+            object_key=object_key,
+            target_path=str(target_file_path),
+        )
+        return target_file_path
+
+    async def _stage_file(self, object_key: str) -> Path:
+        """Put a metadata file into staging folder.
+
+        A hard link (or a symbolic link) is created for local files instead
+        of a copy. Links are removed before any file is written in staging folder.
+        """
+        target_file_path = self.staging_path / Path(object_key)
+        source_path = await self._get_local_source_path(object_key)
+        if target_file_path.is_symlink() or target_file_path.exists():
+            target_file_path.unlink()
+        if not source_path:
+            await self.metadata_files_object_repository.download(
+                resource_id=self.resource_id,
+                object_key=object_key,
+                target_path=str(target_file_path),
+            )
+            return target_file_path
+        target_file_path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            os.link(source_path, target_file_path)
+        except OSError:
+            target_file_path.symlink_to(source_path)
+        return target_file_path
+
+    def _remove_staged_links(self) -> None:
+        """Remove links to source files to prevent writing on them."""
+        if not self.staging_path or not self.staging_path.exists():
+            return
+        for path in self.staging_path.rglob("*"):
+            if path.is_symlink() or (path.is_file() and path.stat().st_nlink > 1):
+                path.unlink()
+
     async def list_isa_files(self) -> list[StudyDataFileOutput]:
         return await self.metadata_files_object_repository.list(
             resource_id=self.resource_id
@@ -438,32 +692,40 @@ class FileObjectStudyMetadataService(StudyMetadataService):
         model: MetabolightsStudyModel,
         save_metadata_files: bool = True,
         save_result_files: bool = True,
+        object_keys: Union[None, list[str]] = None,
     ) -> bool:
         save_path_str = str(self.staging_path)
-
+        self._remove_staged_links()
         await self.save_metabolights_study_model(
             model,
             output_dir=save_path_str,
             values_in_quotation_mark=False,
             save_metadata_files=save_metadata_files,
             save_result_files=save_result_files,
+            object_keys=object_keys,
         )
+        selected_files = set(object_keys) if object_keys is not None else None
         isa_table_file_path = self.staging_path / Path(model.investigation_file_path)
         isa_table_file_path_str = str(isa_table_file_path)
         file_groups = []
-        if save_metadata_files:
+        if save_metadata_files and (
+            selected_files is None or model.investigation_file_path in selected_files
+        ):
             await self.metadata_files_object_repository.put_object(
                 resource_id=self.resource_id,
                 object_key=model.investigation_file_path,
                 source_uri=f"file://{isa_table_file_path_str}",
                 override=True,
             )
+        if save_metadata_files:
             file_groups = [model.samples, model.assays]
         if save_result_files:
             file_groups.append(model.metabolite_assignments)
 
         for isa_table_files in file_groups:
             for file_name in isa_table_files:
+                if selected_files is not None and file_name not in selected_files:
+                    continue
                 isa_table_file_path = self.staging_path / Path(file_name)
                 isa_table_file_path_str = str(isa_table_file_path)
                 await self.metadata_files_object_repository.put_object(
@@ -472,6 +734,8 @@ class FileObjectStudyMetadataService(StudyMetadataService):
                     source_uri=f"file://{isa_table_file_path_str}",
                     override=True,
                 )
+                await self._save_row_offset_index(file_name, isa_table_file_path)
+        parsed_metadata_files.invalidate(self.resource_id)
 
     async def load_investigation_file(
         self,
@@ -481,16 +745,90 @@ class FileObjectStudyMetadataService(StudyMetadataService):
             object_key = "i_Investigation.txt"
         object_path = Path(object_key)
         target_file_path = self.staging_path / object_path
+        cache_key = None
+        # file in staging folder may be updated in this transaction.
         if not target_file_path.exists():
-            await self.metadata_files_object_repository.download(
-                resource_id=self.resource_id,
-                object_key=object_key,
-                target_path=str(target_file_path),
-            )
+            cache_key = await self._get_parsed_file_cache_key(object_key)
+            cached_item = parsed_metadata_files.get(cache_key)
+            if cached_item is not None:
+                return cached_item
+        target_file_path = await self._get_readable_file_path(object_key)
         result: InvestigationFileReaderResult = (
             Reader.get_investigation_file_reader().read(target_file_path)
         )
-        return InvestigationItem.get_from_investigation(result.investigation)
+        investigation = InvestigationItem.get_from_investigation(result.investigation)
+        parsed_metadata_files.set(cache_key, investigation)
+        return investigation
+
+    async def _get_parsed_file_cache_key(
+        self, object_key: str, *args: Any
+    ) -> Union[None, tuple]:
+        file_info = await self._get_file_info(object_key)
+        return parsed_metadata_files.create_key(self.resource_id, file_info, *args)
+
+    async def _get_file_info(self, object_key: str) -> Union[None, StudyDataFileOutput]:
+        try:
+            return await self.metadata_files_object_repository.get_info(
+                resource_id=self.resource_id, object_key=object_key
+            )
+        except Exception as ex:
+            logger.debug("File info of %s is not fetched: %s", object_key, ex)
+            return None
+
+    async def _load_row_offset_index(
+        self, object_key: str, file_path: Path, file_info: StudyDataFileOutput
+    ) -> Union[None, RowOffsetIndex]:
+        """Load row offset index of an ISA table file or rebuild it if it is stale."""
+        index_key = get_row_offset_index_key(object_key)
+        index_path = self.staging_path / Path(".row_offsets") / Path(index_key)
+        try:
+            if await self.internal_files_object_repository.exists(
+                resource_id=self.resource_id, object_key=index_key
+            ):
+                index_path.parent.mkdir(parents=True, exist_ok=True)
+                await self.internal_files_object_repository.download(
+                    resource_id=self.resource_id,
+                    object_key=index_key,
+                    target_path=str(index_path),
+                )
+                index = RowOffsetIndex.model_validate_json(index_path.read_text())
+                if index.matches(file_info.size_in_bytes, str(file_info.updated_at)):
+                    return index
+        except Exception as ex:
+            logger.debug("Row offset index of %s is not loaded: %s", object_key, ex)
+        return await self._save_row_offset_index(object_key, file_path, file_info)
+
+    async def _save_row_offset_index(
+        self,
+        object_key: str,
+        file_path: Path,
+        file_info: Union[None, StudyDataFileOutput] = None,
+    ) -> Union[None, RowOffsetIndex]:
+        """Build row offset index of an ISA table file and store it in internal files."""
+        if not file_info:
+            file_info = await self._get_file_info(object_key)
+        if (
+            not file_info
+            or file_info.size_in_bytes is None
+            or file_info.updated_at is None
+            or file_info.size_in_bytes != file_path.stat().st_size
+        ):
+            return None
+        index_key = get_row_offset_index_key(object_key)
+        index_path = self.staging_path / Path(".row_offsets") / Path(index_key)
+        index = RowOffsetIndex.build(file_path, updated_at=str(file_info.updated_at))
+        try:
+            index_path.parent.mkdir(parents=True, exist_ok=True)
+            index_path.write_text(index.model_dump_json())
+            await self.internal_files_object_repository.put_object(
+                resource_id=self.resource_id,
+                object_key=index_key,
+                source_uri=f"file://{index_path}",
+                override=True,
+            )
+        except Exception as ex:
+            logger.warning("Row offset index of %s is not saved: %s", object_key, ex)
+        return index
 
     async def save_investigation_file(
         self,
@@ -505,6 +843,7 @@ class FileObjectStudyMetadataService(StudyMetadataService):
 
         save_path = Path(self.staging_path) / Path(object_key)
         save_path_str = str(save_path)
+        self._remove_staged_links()
         inv = investigation.to_investigation()
         Writer.get_investigation_file_writer().write(
             inv,
@@ -517,6 +856,7 @@ class FileObjectStudyMetadataService(StudyMetadataService):
             source_uri=f"file://{save_path_str}",
             override=True,
         )
+        parsed_metadata_files.invalidate(self.resource_id, object_key)
 
     async def restore_metadata_from_snapshot(
         self, snapshot_name: str
@@ -557,13 +897,22 @@ class FileObjectStudyMetadataService(StudyMetadataService):
             files_to_be_deleted = set(selected_files.keys()) - set(
                 snapshot_files.keys()
             )
+            # partial snapshot has only some files. Other files are not deleted.
+            if any(x.basename == PARTIAL_SNAPSHOT_MANIFEST for x in snapshot_resources):
+                files_to_be_deleted = set()
+            restore_path = self.staging_path / Path("restore")
+            restore_path.mkdir(parents=True, exist_ok=True)
             for file in snapshot_files.values():
-                await self.study_resource_write_repository.copy_object(
+                target_file_path = restore_path / Path(file.basename)
+                await self.audit_files_object_repository.download(
                     resource_id=self.resource_id,
-                    source_bucket_name=StudyBucket.AUDIT_FILES.value,
-                    source_object_key=file.object_key,
-                    target_bucket_name=StudyBucket.PRIVATE_METADATA_FILES.value,
-                    target_object_key=Path(file.object_key).name,
+                    object_key=file.object_key,
+                    target_path=str(target_file_path),
+                )
+                await self.metadata_files_object_repository.put_object(
+                    resource_id=self.resource_id,
+                    object_key=file.basename,
+                    source_uri=f"file://{str(target_file_path)}",
                     override=True,
                 )
             for file in files_to_be_deleted:
@@ -575,6 +924,9 @@ class FileObjectStudyMetadataService(StudyMetadataService):
             raise StudyResourceError(
                 self.resource_id, snapshot_name, "Restore failed"
             ) from exc
+        finally:
+            # restored files may have the same size and modification time.
+            parsed_metadata_files.invalidate(self.resource_id)
 
     def create_audit_folder_name(
         self,
@@ -594,6 +946,7 @@ class FileObjectStudyMetadataService(StudyMetadataService):
         prefix: Union[None, str] = None,
         suffix: Union[None, str] = None,
         timestamp_format: str = "%Y-%m-%d_%H-%M-%S",
+        object_keys: Union[None, list[str]] = None,
     ) -> tuple[str, str]:
         folder_name = self.create_audit_folder_name(
             folder_suffix=suffix,
@@ -602,7 +955,7 @@ class FileObjectStudyMetadataService(StudyMetadataService):
         )
         parent_object_key = f"audit/{folder_name}"
         await self._create_metadata_files_audit_folder(
-            parent_object_key=parent_object_key
+            parent_object_key=parent_object_key, source_object_keys=object_keys
         )
         return parent_object_key
 
@@ -615,7 +968,7 @@ class FileObjectStudyMetadataService(StudyMetadataService):
         result = await self.load_isa_table_file(
             object_key=object_key, offset=offset, limit=limit
         )
-        return result.rows if result else []
+        return list(result.iter_rows()) if result else []
 
     async def get_isa_table_data_columns(
         self,
@@ -647,12 +1000,17 @@ class FileObjectStudyMetadataService(StudyMetadataService):
     ) -> IsaTableData:
         object_path = Path(object_key)
         target_file_path = self.staging_path / object_path
+        cache_key = None
+        file_info = None
         if not target_file_path.exists():
-            await self.metadata_files_object_repository.download(
-                resource_id=self.resource_id,
-                object_key=object_key,
-                target_path=str(target_file_path),
+            file_info = await self._get_file_info(object_key)
+            cache_key = parsed_metadata_files.create_key(
+                self.resource_id, file_info, offset, limit
             )
+            cached_data = parsed_metadata_files.get(cache_key)
+            if cached_data is not None:
+                return cached_data
+        target_file_path = await self._get_readable_file_path(object_key)
         data_type = None
         if object_path.name.startswith("s_"):
             reader = Reader.get_sample_file_reader(results_per_page=100000)
@@ -666,21 +1024,23 @@ class FileObjectStudyMetadataService(StudyMetadataService):
         else:
             raise ValueError(f"Invalid isa table file {object_key}")
 
-        result: IsaTableFileReaderResult = reader.read(
-            target_file_path,
-            offset=offset,
-            limit=limit,
-        )
-        rows: list[IsaTableRow] = []
-        if result and result.isa_table_file and result.isa_table_file.table.data:
-            first_column = result.isa_table_file.table.columns[0]
-            for idx in range(len(result.isa_table_file.table.data[first_column])):
-                row = {
-                    col: result.isa_table_file.table.data[col][idx]
-                    for col in result.isa_table_file.table.data
-                }
-                row_index = idx if offset is None else idx + offset
-                rows.append(IsaTableRow(row_index=row_index, data=row))
+        selected_rows = None
+        if cache_key and (offset or limit is not None):
+            index = await self._load_row_offset_index(
+                object_key, target_file_path, file_info
+            )
+            if index:
+                selected_rows = index.read_rows(target_file_path, offset, limit)
+        if selected_rows is not None:
+            result: IsaTableFileReaderResult = reader.read(
+                io.StringIO(selected_rows), limit=limit, filename=object_path.name
+            )
+        else:
+            result: IsaTableFileReaderResult = reader.read(
+                target_file_path,
+                offset=offset,
+                limit=limit,
+            )
         columns = [
             ColumnDefinition(
                 column_index=x.column_index,
@@ -689,19 +1049,22 @@ class FileObjectStudyMetadataService(StudyMetadataService):
             )
             for x in result.isa_table_file.table.headers
         ]
-        return IsaTableData(
+        isa_table_data = ColumnarIsaTableData(
             data_type=data_type,
             columns=columns,
             offset=offset if offset else 0,
             limit=limit,
-            rows=rows,
+            column_values=result.isa_table_file.table.data or {},
         )
+        parsed_metadata_files.set(cache_key, isa_table_data)
+        return isa_table_data
 
     async def save_isa_table_file(
         self, resource_id: str, isa_table_file: IsaTableFile, object_key: str
     ):
         save_path = Path(self.staging_path) / Path(object_key)
         save_path_str = str(save_path)
+        self._remove_staged_links()
         await self.dump_isa_table(isa_table_file, save_path_str)
         await self.metadata_files_object_repository.put_object(
             resource_id=resource_id,
@@ -709,3 +1072,5 @@ class FileObjectStudyMetadataService(StudyMetadataService):
             source_uri=f"file://{save_path_str}",
             override=True,
         )
+        parsed_metadata_files.invalidate(resource_id, object_key)
+        await self._save_row_offset_index(object_key, save_path)
@@ -0,0 +1,77 @@
+import pickle
+import threading
+from typing import Any, Hashable, Union
+
+from cachetools import LRUCache
+
+from mtbls.domain.entities.study_file import StudyDataFileOutput
+
+DEFAULT_MAX_SIZE_IN_BYTES = 256 * 1024 * 1024
+
+
+class ParsedFileCache:
+    """Process level LRU cache of parsed metadata files.
+
+    Entries are keyed by resource id, object key, file size and modification
+    time, so a file updated by another process is parsed again. Values are
+    stored as pickled bytes and each read returns a new copy. Cache size is
+    bounded by total size of pickled values.
+    """
+
+    def __init__(self, max_size_in_bytes: int = DEFAULT_MAX_SIZE_IN_BYTES):
+        self.max_size_in_bytes = max_size_in_bytes
+        self.cache: LRUCache = LRUCache(maxsize=max_size_in_bytes, getsizeof=len)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def create_key(
+        resource_id: str, file_info: Union[None, StudyDataFileOutput], *args: Hashable
+    ) -> Union[None, tuple]:
+        """Return cache key of a file or None if file identity is not known."""
+        if (
+            not file_info
+            or file_info.size_in_bytes is None
+            or file_info.updated_at is None
+        ):
+            return None
+        return (
+            resource_id,
+            file_info.object_key,
+            file_info.size_in_bytes,
+            str(file_info.updated_at),
+            *args,
+        )
+
+    def get(self, key: Union[None, tuple]) -> Any:
+        if key is None:
+            return None
+        with self._lock:
+            content = self.cache.get(key)
+        return pickle.loads(content) if content is not None else None
+
+    def set(self, key: Union[None, tuple], value: Any) -> None:
+        if key is None:
+            return
+        content = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(content) > self.max_size_in_bytes:
+            return
+        with self._lock:
+            self.cache[key] = content
+
+    def invalidate(self, resource_id: str, object_key: Union[None, str] = None) -> None:
+        """Remove cached files of a study or a file of the study."""
+        with self._lock:
+            keys = [
+                x
+                for x in self.cache
+                if x[0] == resource_id and (object_key is None or x[1] == object_key)
+            ]
+            for key in keys:
+                self.cache.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.cache.clear()
+
+
+parsed_metadata_files = ParsedFileCache()
@@ -0,0 +1,111 @@
+import re
+from pathlib import Path
+from typing import Union
+
+from pydantic import BaseModel
+
+DEFAULT_ROW_BLOCK_SIZE = 1000
+ROW_OFFSET_INDEX_FOLDER = "METADATA_FILES_INDEX"
+
+EMPTY_LINES_PATTERN = re.compile(r"[\r\n][\r\n]+")
+QUOTED_CELL_PATTERN = re.compile(r'(")([^"]*)\1(\t|\r|\n|$)')
+
+
+def is_normalized_table_content(content: str) -> bool:
+    """Return True if ISA table parser reads each line as a row without any change.
+
+    Parser removes empty lines and new lines or whitespaces in quoted cells
+    before splitting content into lines.
+    """
+    if EMPTY_LINES_PATTERN.search(content):
+        return False
+    for match in QUOTED_CELL_PATTERN.finditer(content):
+        value = match.group(2)
+        if value != re.sub(r"\s", " ", value.strip()):
+            return False
+    return True
+
+
+def get_row_offset_index_key(object_key: str) -> str:
+    return f"{ROW_OFFSET_INDEX_FOLDER}/{object_key}.row_offsets.json"
+
+
+class RowOffsetIndex(BaseModel):
+    """Byte offsets of every N rows of an ISA table file.
+
+    It is used to parse a range of rows without reading whole file.
+    If indexed is False, file content is changed by parser while it is read
+    and rows can not be mapped to lines.
+    """
+
+    file_size: int = 0
+    updated_at: str = ""
+    indexed: bool = True
+    block_size: int = DEFAULT_ROW_BLOCK_SIZE
+    header_size: int = 0
+    total_row_count: int = 0
+    offsets: list[int] = []
+
+    @classmethod
+    def build(
+        cls,
+        file_path: Path,
+        updated_at: str = "",
+        block_size: int = DEFAULT_ROW_BLOCK_SIZE,
+    ) -> "RowOffsetIndex":
+        content = file_path.read_bytes()
+        index = cls(
+            file_size=len(content), updated_at=updated_at, block_size=block_size
+        )
+        try:
+            index.indexed = is_normalized_table_content(content.decode("utf-8"))
+        except UnicodeDecodeError:
+            index.indexed = False
+        if not index.indexed:
+            return index
+        position = content.find(b"\n")
+        index.header_size = len(content) if position < 0 else position + 1
+        position = index.header_size
+        while position < len(content):
+            if index.total_row_count % block_size == 0:
+                index.offsets.append(position)
+            index.total_row_count += 1
+            next_line = content.find(b"\n", position)
+            position = len(content) if next_line < 0 else next_line + 1
+        return index
+
+    def matches(self, file_size: Union[None, int], updated_at: str) -> bool:
+        return self.file_size == file_size and self.updated_at == updated_at
+
+    def read_rows(
+        self,
+        file_path: Path,
+        offset: Union[None, int] = None,
+        limit: Union[None, int] = None,
+    ) -> Union[None, str]:
+        """Return header and selected rows of file.
+
+        None is returned if file is not indexed or selected rows
+        are changed by parser.
+        """
+        if not self.indexed:
+            return None
+        offset = offset if offset and offset > 0 else 0
+        lines: list[bytes] = []
+        with file_path.open("rb") as f:
+            header = f.read(self.header_size)
+            if offset < self.total_row_count:
+                block = offset // self.block_size
+                f.seek(self.offsets[block])
+                for _ in range(offset - block * self.block_size):
+                    f.readline()
+                while limit is None or len(lines) < limit:
+                    line = f.readline()
+                    if not line:
+                        break
+                    lines.append(line)
+        try:
+            content = (header + b"".join(lines)).decode("utf-8")
+        except UnicodeDecodeError:
+            return None
+        return content if is_normalized_table_content(content) else None
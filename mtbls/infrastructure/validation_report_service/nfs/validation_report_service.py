@@ -1,34 +1,72 @@
-import json
+import asyncio
+import datetime
+import fcntl
+import gzip
 import logging
 import pathlib
 import re
 import uuid
 from typing import Union
 
+from cachetools import LRUCache
+from pydantic import BaseModel
+
 from mtbls.application.services.interfaces.validation_report_service import (
     ValidationReportService,
 )
-from mtbls.domain.entities.study_file import StudyDataFileOutput
 from mtbls.domain.exceptions.repository import StudyObjectNotFoundError
 from mtbls.domain.shared.data_types import ZeroOrPositiveInt
 from mtbls.domain.shared.validation_result_file import ValidationResultFile
-from mtbls.domain.shared.validator.policy import PolicySummaryResult
+from mtbls.domain.shared.validator.policy import PolicyMessage, PolicySummaryResult
+from mtbls.domain.shared.validator.report_query import ValidationReportIndex
 from mtbls.infrastructure.repositories.file_object.default.nfs.file_object_write_repository import (  # noqa: E501
     FileSystemObjectWriteRepository,
 )
 
 logger = logging.getLogger(__name__)
 
+VALIDATION_HISTORY_FILE_PATTERN = re.compile(
+    r"validation-history__(.+)__(.+?)\.json(?:\.gz)?$"
+)
+GZIP_MAGIC_NUMBER = b"\x1f\x8b"
+DEFAULT_MESSAGE_BLOCK_SIZE = 1000
+VALIDATION_HISTORY_TIME_FORMAT = "%Y-%m-%d_%H-%M-%S"
+
+
+class ValidationHistoryIndex(BaseModel):
+    """Validation reports of a study, ordered by validation time descending."""
+
+    reports: list[ValidationResultFile] = []
+
 
 class FileSystemValidationReportService(ValidationReportService):
-    def __init__(
+    """Stores validation reports in validation history folder of a study.
+
+    Retention policy is disabled by default. Reports are deleted only if
+    max_reports_per_study or max_report_age_in_days is set.
+    """
+
+    def __init__(  # noqa: PLR0913
         self,
         file_object_repository: FileSystemObjectWriteRepository,
         validation_history_object_key: str = "validation-history",
         temp_directory: str = "/tmp/validation-history-tmp",
+        index_file_name: str = "validation-history-index.json",
+        max_reports_per_study: None | int = None,
+        max_report_age_in_days: None | int = None,
+        max_cached_indices: int = 1000,
+        compress_reports: bool = True,
+        message_block_size: int = DEFAULT_MESSAGE_BLOCK_SIZE,
     ):
         self.file_object_repository = file_object_repository
         self.study_bucket = file_object_repository.get_bucket()
+        self.index_file_name = index_file_name
+        self.max_reports_per_study = max_reports_per_study
+        self.max_report_age_in_days = max_report_age_in_days
+        self.compress_reports = compress_reports
+        self.message_block_size = message_block_size
+        # parsed index files. Keys contain modification time and size of index file.
+        self.indices: LRUCache = LRUCache(maxsize=max_cached_indices)
 
         self.temp_directory = (
             pathlib.Path(temp_directory)
@@ -48,43 +86,20 @@ class FileSystemValidationReportService(ValidationReportService):
         offset: Union[None, ZeroOrPositiveInt],
         limit: Union[None, ZeroOrPositiveInt],
     ) -> list[ValidationResultFile]:
-        await self._initiate_validation_history_folder(resource_id=resource_id)
-        items: list[StudyDataFileOutput] = await self.file_object_repository.list(
-            resource_id=resource_id,
-            object_key=self.validation_history_object_key,
-        )
-        files: list[ValidationResultFile] = []
-        for item in items:
-            match = re.match(r"validation-history__(.+)__(.+).json$", item.basename)
-            if match:
-                groups = match.groups()
-                definition = ValidationResultFile(
-                    validation_time=groups[0], task_id=groups[1]
-                )
-                files.append(definition)
-        files.sort(key=lambda x: x.validation_time, reverse=True)
+        files = (await self._load_index(resource_id)).reports
         if offset:
             files = files[offset:]
         if limit:
             files = files[:limit]
-        return files
+        return list(files)
 
     async def find_by_task_id(
         self, resource_id: str, task_id: str
     ) -> ValidationResultFile:
-        await self._initiate_validation_history_folder(resource_id=resource_id)
-        items: list[StudyDataFileOutput] = await self.file_object_repository.list(
-            resource_id=resource_id,
-            object_key=self.validation_history_object_key,
-        )
-        for item in items:
-            match = re.match(r"validation-history__(.+)__(.+).json$", item.basename)
-            if match:
-                groups = match.groups()
-                if task_id == groups[1]:
-                    return ValidationResultFile(
-                        validation_time=groups[0], task_id=groups[1]
-                    )
+        index = await self._load_index(resource_id)
+        for item in index.reports:
+            if task_id == item.task_id:
+                return item
         raise StudyObjectNotFoundError(
             resource_id,
             self.study_bucket.value,
@@ -94,19 +109,10 @@ class FileSystemValidationReportService(ValidationReportService):
     async def find_by_validation_time(
         self, resource_id: str, validation_time: str
     ) -> ValidationResultFile:
-        await self._initiate_validation_history_folder(resource_id=resource_id)
-        items: list[StudyDataFileOutput] = await self.file_object_repository.list(
-            resource_id=resource_id,
-            object_key=self.validation_history_object_key,
-        )
-        for item in items:
-            match = re.match(r"validation-history__(.+)__(.+).json$", item.basename)
-            if match:
-                groups = match.groups()
-                if validation_time == groups[0]:
-                    return ValidationResultFile(
-                        validation_time=groups[0], task_id=groups[1]
-                    )
+        index = await self._load_index(resource_id)
+        for item in index.reports:
+            if validation_time == item.validation_time:
+                return item
         raise StudyObjectNotFoundError(
             resource_id,
             self.study_bucket.value,
@@ -119,11 +125,18 @@ class FileSystemValidationReportService(ValidationReportService):
         temp_filename = pathlib.Path(f"{str(uuid.uuid4())}.json")
         tmp_file_path = self.temp_directory / temp_filename
         source_uri = f"file://{str(tmp_file_path)}"
-        time_str = validation_result.start_time.strftime("%Y-%m-%d_%H-%M-%S")
-        object_key = f"{self.validation_history_object_key}/validation-history__{time_str}__{task_id}.json"  # noqa: E501
+        time_str = validation_result.start_time.strftime(VALIDATION_HISTORY_TIME_FORMAT)
+        report_file = ValidationResultFile(validation_time=time_str, task_id=task_id)
+        object_key = self._get_report_object_key(
+            report_file, compressed=self.compress_reports
+        )
         try:
-            with tmp_file_path.open("w") as f:
-                f.write(validation_result.model_dump_json(indent=4, by_alias=True))
+            if self.compress_reports:
+                with gzip.open(tmp_file_path, "wb", compresslevel=6) as f:
+                    f.write(validation_result.model_dump_json(by_alias=True).encode())
+            else:
+                with tmp_file_path.open("w") as f:
+                    f.write(validation_result.model_dump_json(indent=4, by_alias=True))
 
             await self._initiate_validation_history_folder(resource_id=resource_id)
             file_exists = await self.file_object_repository.exists(
@@ -145,9 +158,277 @@ class FileSystemValidationReportService(ValidationReportService):
                 await self.file_object_repository.object_created(
                     study_object=study_object
                 )
+            removed_reports = await asyncio.to_thread(
+                self._update_index_file, resource_id, report_file
+            )
+        finally:
+            tmp_file_path.unlink(missing_ok=True)
+        for item in removed_reports:
+            logger.info(
+                "Validation report %s of %s is deleted by retention policy.",
+                item.task_id,
+                resource_id,
+            )
+            for object_key in (
+                self._get_report_object_key(item, compressed=True),
+                self._get_report_object_key(item),
+                self._get_report_index_object_key(item),
+                self._get_report_messages_object_key(item),
+            ):
+                if await self.file_object_repository.exists(resource_id, object_key):
+                    await self.file_object_repository.delete_object(
+                        resource_id=resource_id, object_key=object_key
+                    )
+        return True
+
+    def _get_report_object_key(
+        self, item: ValidationResultFile, compressed: bool = False
+    ) -> str:
+        extension = ".json.gz" if compressed else ".json"
+        return f"{self.validation_history_object_key}/validation-history__{item.validation_time}__{item.task_id}{extension}"  # noqa: E501
+
+    def _get_report_index_object_key(self, item: ValidationResultFile) -> str:
+        return f"{self.validation_history_object_key}/validation-report-index__{item.validation_time}__{item.task_id}.json.gz"  # noqa: E501
 
+    def _get_report_messages_object_key(self, item: ValidationResultFile) -> str:
+        return f"{self.validation_history_object_key}/validation-report-messages__{item.validation_time}__{item.task_id}.jsonl.gz"  # noqa: E501
+
+    async def save_validation_report_index(
+        self,
+        resource_id: str,
+        task_id: str,
+        report_index: ValidationReportIndex,
+        messages: Union[None, list[PolicyMessage]] = None,
+    ) -> bool:
+        selected_object = await self.find_by_task_id(
+            resource_id=resource_id, task_id=task_id
+        )
+        if messages is not None:
+            await self._save_report_messages(
+                resource_id, selected_object, report_index, messages
+            )
+        object_key = self._get_report_index_object_key(selected_object)
+        tmp_file_path = self.temp_directory / pathlib.Path(f"{uuid.uuid4()}.json.gz")
+        try:
+            with gzip.open(tmp_file_path, "wb", compresslevel=6) as f:
+                f.write(report_index.model_dump_json(by_alias=True).encode())
+            await self.file_object_repository.put_object(
+                resource_id=resource_id,
+                object_key=object_key,
+                source_uri=f"file://{tmp_file_path}",
+            )
         finally:
             tmp_file_path.unlink(missing_ok=True)
+        return True
+
+    async def load_validation_report_index(
+        self, resource_id: str, task_id: str
+    ) -> Union[None, ValidationReportIndex]:
+        selected_object = await self.find_by_task_id(
+            resource_id=resource_id, task_id=task_id
+        )
+        object_key = self._get_report_index_object_key(selected_object)
+        if not await self.file_object_repository.exists(resource_id, object_key):
+            return None
+        content = await self.file_object_repository.get_content(
+            resource_id=resource_id, object_key=object_key
+        )
+        content = await asyncio.to_thread(gzip.decompress, content)
+        return ValidationReportIndex.model_validate_json(content)
+
+    async def _save_report_messages(
+        self,
+        resource_id: str,
+        selected_object: ValidationResultFile,
+        report_index: ValidationReportIndex,
+        messages: list[PolicyMessage],
+    ) -> None:
+        """Store messages as gzip members of message blocks, one message per line.
+
+        Each block can be decompressed alone after seeking to its offset.
+        """
+        tmp_file_path = self.temp_directory / pathlib.Path(f"{uuid.uuid4()}.jsonl.gz")
+        try:
+            offsets = await asyncio.to_thread(
+                self._write_message_blocks, tmp_file_path, messages
+            )
+            await self.file_object_repository.put_object(
+                resource_id=resource_id,
+                object_key=self._get_report_messages_object_key(selected_object),
+                source_uri=f"file://{tmp_file_path}",
+            )
+        finally:
+            tmp_file_path.unlink(missing_ok=True)
+        report_index.message_block_size = self.message_block_size
+        report_index.message_block_offsets = offsets
+
+    def _write_message_blocks(
+        self, file_path: pathlib.Path, messages: list[PolicyMessage]
+    ) -> list[int]:
+        offsets = []
+        with file_path.open("wb") as f:
+            for start in range(0, len(messages), self.message_block_size):
+                block = messages[start : start + self.message_block_size]
+                content = "\n".join(x.model_dump_json(by_alias=True) for x in block)
+                offsets.append(f.tell())
+                f.write(gzip.compress(content.encode(), compresslevel=6))
+            offsets.append(f.tell())
+        return offsets
+
+    async def load_validation_report_messages(
+        self,
+        resource_id: str,
+        task_id: str,
+        report_index: ValidationReportIndex,
+        positions: list[int],
+    ) -> Union[None, list[PolicyMessage]]:
+        if (
+            not report_index.message_block_size
+            or not report_index.message_block_offsets
+        ):
+            return None
+        selected_object = await self.find_by_task_id(
+            resource_id=resource_id, task_id=task_id
+        )
+        file_path = self.file_object_repository.folder_manager.get_study_folder_path(
+            resource_id,
+            self.study_bucket.value,
+            self._get_report_messages_object_key(selected_object),
+        )
+        if not file_path.exists():
+            return None
+        return await asyncio.to_thread(
+            self._read_message_blocks, file_path, report_index, positions
+        )
+
+    def _read_message_blocks(
+        self,
+        file_path: pathlib.Path,
+        report_index: ValidationReportIndex,
+        positions: list[int],
+    ) -> list[PolicyMessage]:
+        block_size = report_index.message_block_size
+        offsets = report_index.message_block_offsets
+        blocks: dict[int, list[bytes]] = {}
+        messages = []
+        with file_path.open("rb") as f:
+            for position in positions:
+                block = position // block_size
+                if block not in blocks:
+                    f.seek(offsets[block])
+                    content = gzip.decompress(
+                        f.read(offsets[block + 1] - offsets[block])
+                    )
+                    blocks[block] = content.split(b"\n")
+                line = blocks[block][position - block * block_size]
+                messages.append(PolicyMessage.model_validate_json(line))
+        return messages
+
+    def _get_history_path(self, resource_id: str) -> pathlib.Path:
+        return self.file_object_repository.folder_manager.get_study_folder_path(
+            resource_id,
+            self.study_bucket.value,
+            self.validation_history_object_key,
+        )
+
+    async def _load_index(self, resource_id: str) -> ValidationHistoryIndex:
+        index_path = self._get_history_path(resource_id) / self.index_file_name
+        if not index_path.exists():
+            # index is created from validation history folder if it does not exist.
+            await asyncio.to_thread(self._update_index_file, resource_id)
+            if not index_path.exists():
+                return ValidationHistoryIndex()
+        stat = index_path.stat()
+        key = (str(index_path), stat.st_mtime_ns, stat.st_size)
+        if key not in self.indices:
+            self.indices[key] = ValidationHistoryIndex.model_validate_json(
+                index_path.read_bytes()
+            )
+        return self.indices[key]
+
+    def _scan_history_folder(
+        self, history_path: pathlib.Path
+    ) -> list[ValidationResultFile]:
+        files = []
+        for path in history_path.iterdir():
+            match = VALIDATION_HISTORY_FILE_PATTERN.match(path.name)
+            if match:
+                groups = match.groups()
+                files.append(
+                    ValidationResultFile(validation_time=groups[0], task_id=groups[1])
+                )
+        return files
+
+    def _update_index_file(
+        self, resource_id: str, new_report: None | ValidationResultFile = None
+    ) -> list[ValidationResultFile]:
+        """Add new report to index file and apply retention policy.
+
+        Index file is created from validation history folder if it does not exist.
+        It is replaced atomically while a lock is held. Returns reports removed
+        from the index.
+        """
+        history_path = self._get_history_path(resource_id)
+        if not history_path.is_dir():
+            return []
+        index_path = history_path / self.index_file_name
+        lock_path = history_path / f"{self.index_file_name}.lock"
+        with lock_path.open("a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                if index_path.exists():
+                    index = ValidationHistoryIndex.model_validate_json(
+                        index_path.read_bytes()
+                    )
+                    if not new_report:
+                        return []
+                else:
+                    index = ValidationHistoryIndex(
+                        reports=self._scan_history_folder(history_path)
+                    )
+                if new_report:
+                    index.reports = [
+                        x for x in index.reports if x.task_id != new_report.task_id
+                    ]
+                    index.reports.append(new_report)
+                index.reports.sort(key=lambda x: x.validation_time, reverse=True)
+                index.reports, removed = self._apply_retention_policy(index.reports)
+
+                tmp_path = history_path / f".{self.index_file_name}.{uuid.uuid4()}"
+                tmp_path.write_text(index.model_dump_json(by_alias=True))
+                tmp_path.replace(index_path)
+                return removed
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _apply_retention_policy(
+        self, reports: list[ValidationResultFile]
+    ) -> tuple[list[ValidationResultFile], list[ValidationResultFile]]:
+        # the latest report is always kept.
+        kept = reports[:1]
+        removed = []
+        min_time = None
+        if self.max_report_age_in_days:
+            min_time = datetime.datetime.now() - datetime.timedelta(
+                days=self.max_report_age_in_days
+            )
+        for item in reports[1:]:
+            expired = False
+            if min_time:
+                try:
+                    validation_time = datetime.datetime.strptime(
+                        item.validation_time, VALIDATION_HISTORY_TIME_FORMAT
+                    )
+                    expired = validation_time < min_time
+                except ValueError:
+                    expired = False
+            if expired or (
+                self.max_reports_per_study and len(kept) >= self.max_reports_per_study
+            ):
+                removed.append(item)
+            else:
+                kept.append(item)
+        return kept, removed
 
     async def _initiate_validation_history_folder(self, resource_id: str):
         if not await self.file_object_repository.exists(
@@ -168,7 +449,6 @@ class FileSystemValidationReportService(ValidationReportService):
     async def load_validation_report_by_task_id(
         self, resource_id: str, task_id: str
     ) -> PolicySummaryResult:
-        await self._initiate_validation_history_folder(resource_id=resource_id)
         selected_object = await self.find_by_task_id(
             resource_id=resource_id, task_id=task_id
         )
@@ -179,36 +459,27 @@ class FileSystemValidationReportService(ValidationReportService):
     async def load_validation_report_by_validation_time(
         self, resource_id: str, validation_time: str
     ) -> PolicySummaryResult:
-        await self._initiate_validation_history_folder(resource_id=resource_id)
         selected_object = await self.find_by_validation_time(
             resource_id=resource_id, validation_time=validation_time
         )
-        return self._load_validation_report(
+        return await self._load_validation_report(
             resource_id=resource_id, selected_object=selected_object
         )
 
     async def _load_validation_report(
         self, resource_id: str, selected_object: ValidationResultFile
     ) -> PolicySummaryResult:
-        task_id = selected_object.task_id
-        time_str = selected_object.validation_time
-        object_key = f"{self.validation_history_object_key}/validation-history__{time_str}__{task_id}.json"  # noqa: E501
-        temp_filename = pathlib.Path(f"{str(uuid.uuid4())}.json")
-        tmp_file_path = self.temp_directory / temp_filename
-
+        # reports saved before compression was enabled are plain json files.
+        object_key = self._get_report_object_key(selected_object, compressed=True)
+        if not await self.file_object_repository.exists(resource_id, object_key):
+            object_key = self._get_report_object_key(selected_object)
         try:
-            await self.file_object_repository.download(
-                resource_id=resource_id,
-                object_key=object_key,
-                target_path=str(tmp_file_path),
+            content = await self.file_object_repository.get_content(
+                resource_id=resource_id, object_key=object_key
             )
-
-            with tmp_file_path.open() as f:
-                validations_obj = json.load(f)
-            result = PolicySummaryResult.model_validate(validations_obj)
-            return result
+            if content.startswith(GZIP_MAGIC_NUMBER):
+                content = await asyncio.to_thread(gzip.decompress, content)
+            return PolicySummaryResult.model_validate_json(content)
         except Exception as ex:
             logger.exception(ex)
             raise ex
-        finally:
-            tmp_file_path.unlink(missing_ok=True)
@@ -1,8 +1,10 @@
+import json
 from logging import getLogger
-from typing import Annotated, Union
+from typing import Annotated, Iterator, Union
 
 from dependency_injector.wiring import Provide, inject
 from fastapi import APIRouter, Body, Depends, Query
+from fastapi.responses import StreamingResponse
 
 from mtbls.application.services.interfaces.study_metadata_service_factory import (
     StudyMetadataServiceFactory,
@@ -33,6 +35,36 @@ logger = getLogger(__name__)
 
 router = APIRouter(prefix="/submissions/v1")
 
+ROWS_PER_CHUNK = 1000
+
+
+def iter_isa_table_data_response(
+    response: APIResponse[IsaTableData],
+) -> Iterator[str]:
+    """Serialize response as JSON and create ISA table rows while they are sent."""
+    isa_table_data = response.content
+    envelope = response.model_copy(update={"content": None}).model_dump(
+        mode="json", by_alias=True, exclude={"content"}
+    )
+    content = isa_table_data.model_dump(mode="json", by_alias=True, exclude={"rows"})
+    yield (
+        json.dumps(envelope)[:-1]
+        + ', "content": '
+        + json.dumps(content)[:-1]
+        + ', "rows": ['
+    )
+    chunk: list[str] = []
+    separator = ""
+    for row in isa_table_data.iter_rows():
+        chunk.append(row.model_dump_json(by_alias=True))
+        if len(chunk) == ROWS_PER_CHUNK:
+            yield separator + ", ".join(chunk)
+            chunk = []
+            separator = ", "
+    if chunk:
+        yield separator + ", ".join(chunk)
+    yield "]}}"
+
 
 def get_isa_file_items(data_type: str, filename_regex: str):
     file_name_description = f"{data_type} file name"
@@ -72,11 +104,13 @@ def get_isa_file_items(data_type: str, filename_regex: str):
         ]
         response = APIResponse[IsaTableData](content=isa_table_data)
 
-        if not isa_table_data or not isa_table_data.rows:
+        if not isa_table_data or not isa_table_data.row_count:
             response.success_message = "There is no data that matches the criteria."
         else:
-            response.success_message = f"{len(isa_table_data.rows)} rows."
-        return response
+            response.success_message = f"{isa_table_data.row_count} rows."
+        return StreamingResponse(
+            iter_isa_table_data_response(response), media_type="application/json"
+        )
 
     return get_isa_items
 
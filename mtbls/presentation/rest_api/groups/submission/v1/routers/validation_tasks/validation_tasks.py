@@ -22,6 +22,12 @@ from mtbls.application.services.interfaces.validation_override_service import (
 from mtbls.application.services.interfaces.validation_report_service import (
     ValidationReportService,
 )
+from mtbls.application.services.study_metadata_service.validation_input_digest import (
+    ValidationInputDigestCalculator,
+)
+from mtbls.application.use_cases.validation.validation_report_query import (
+    query_validation_report,
+)
 from mtbls.application.use_cases.validation.validation_reports import (
     get_validation_reports,
 )
@@ -31,17 +37,20 @@ from mtbls.application.use_cases.validation.validation_task import (
     get_study_validation_result,
     start_study_validation_task,
 )
+from mtbls.domain.enums.async_task_priority import AsyncTaskPriority
 from mtbls.domain.exceptions.async_task import (
     AsyncTaskCheckStatusFailure,
     AsyncTaskNotFoundError,
     AsyncTaskNotReadyError,
     AsyncTaskRemoteFailure,
 )
+from mtbls.domain.exceptions.repository import StudyObjectNotFoundError
 from mtbls.domain.shared.async_task.async_task_summary import AsyncTaskStatus
 from mtbls.domain.shared.data_types import ZeroOrPositiveInt
 from mtbls.domain.shared.permission import StudyPermissionContext
 from mtbls.domain.shared.repository.paginated_output import PaginatedOutput
 from mtbls.domain.shared.validation_result_file import ValidationResultFile
+from mtbls.domain.shared.validator.report_query import ValidationReportPage
 from mtbls.domain.shared.validator.types import PolicyMessageType
 from mtbls.presentation.rest_api.core.responses import (
     APIErrorResponse,
@@ -179,12 +188,45 @@ async def create_validation_task(
             description="Deletes previous task results even if it is not read.",
         ),
     ] = True,
+    reuse_previous_result: Annotated[
+        bool,
+        Field(
+            title="Reuse previous validation result.",
+            description="Returns the previous validation result "
+            "if metadata files, study metadata and validation rules are not changed.",
+        ),
+    ] = True,
+    incremental_validation: Annotated[
+        bool,
+        Field(
+            title="Validate only updated ISA metadata files.",
+            description="Validates only updated ISA metadata files and "
+            "merges their results into the last validation report.",
+        ),
+    ] = False,
+    batch_validation: Annotated[
+        bool,
+        Field(
+            title="Run as a batch validation task.",
+            description="Runs validation task with a lower priority. "
+            "Bulk validation requests should enable it "
+            "so that interactive requests are not queued behind them.",
+        ),
+    ] = False,
     async_task_service: AsyncTaskService = Depends(  # noqa: FAST002
         Provide["services.async_task_service"]
     ),
     cache_service: CacheService = Depends(Provide["services.cache_service"]),  # noqa: FAST002
+    validation_report_service: ValidationReportService = Depends(  # noqa: FAST002
+        Provide["services.validation_report_service"]
+    ),
+    validation_input_digest_calculator: ValidationInputDigestCalculator = Depends(  # noqa: FAST002
+        Provide["services.validation_input_digest_calculator"]
+    ),
 ):
     resource_id = context.study.accession_number
+    if not reuse_previous_result:
+        validation_input_digest_calculator = None
     if run_metadata_modifiers:
         logger.info("Run validation with modifiers...")
     else:
@@ -197,9 +239,30 @@ async def create_validation_task(
         async_task_service=async_task_service,
         cache_service=cache_service,
         cache_expiration_in_seconds=10 * 60,
+        validation_input_digest_calculator=validation_input_digest_calculator,
+        validation_report_service=validation_report_service,
+        incremental=incremental_validation,
+        priority=AsyncTaskPriority.BATCH
+        if batch_validation
+        else AsyncTaskPriority.INTERACTIVE,
     )
 
     response = APIResponse[StartValidationResponse]()
+    if task_status.ready and task_status.is_successful:
+        response.success_message = (
+            f"Result of validation task {task_status.task_id} is ready "
+            f"for {resource_id}. {task_status.message or ''}".strip()
+        )
+        response.content = StartValidationResponse(task=task_status)
+        return response
+    if task_status.message:
+        # request is attached to the running validation task of the study.
+        response.success_message = (
+            f"Validation task {task_status.task_id} is already running "
+            f"for {resource_id}. {task_status.message}"
+        )
+        response.content = StartValidationResponse(task=task_status)
+        return response
     response.success_message = (
         f"Validation task {task_status.task_id} is started for {resource_id}."
     )
@@ -347,13 +410,9 @@ async def get_validation_task_report(  # noqa: PLR0913
             "x-mtbls-file-type": media_type,
             "Content-Disposition": download_filename,
         }
-        report_chunk_size_in_bytes = 1024 * 1024 * 1
-
-        def iter_content(data: str):
-            for i in range(0, len(data), report_chunk_size_in_bytes):
-                yield data[i : (i + report_chunk_size_in_bytes)]
-
-        response = StreamingResponse(content=iter_content(result), headers=headers)
+        response = StreamingResponse(
+            content=result, media_type=media_type, headers=headers
+        )
         return response
     except (AsyncTaskNotFoundError, AsyncTaskNotReadyError) as ex:
         return JSONResponse(
@@ -374,6 +433,69 @@ async def get_validation_task_report(  # noqa: PLR0913
         )
 
 
+@router.get(
+    "/{resource_id}/{task_id}/messages",
+    summary="Get Filtered Study Validation Messages",
+    description="Returns a page of violations in a stored validation report. "
+    "Values of a filter are combined with OR, filters are combined with AND. "
+    "Facet counts show number of violations for each type, file, rule and column.",
+    response_model=APIResponse[ValidationReportPage],
+)
+@inject
+async def get_validation_report_messages(  # noqa: PLR0913
+    resource_id: Annotated[str, Depends(get_resource_id)],
+    task_id: Annotated[str, Depends(get_task_id)],
+    context: Annotated[StudyPermissionContext, Depends(check_read_permission)],
+    message_type: Annotated[
+        Union[None, list[str]],
+        Query(description="Violation types. ERROR, WARNING, INFO, SUCCESS"),
+    ] = None,
+    source_file: Annotated[
+        Union[None, list[str]], Query(description="Source file names")
+    ] = None,
+    rule_id: Annotated[
+        Union[None, list[str]], Query(description="Validation rule ids")
+    ] = None,
+    column: Annotated[
+        Union[None, list[str]], Query(description="Source column headers")
+    ] = None,
+    offset: Annotated[
+        ZeroOrPositiveInt, Query(description="initial violation index")
+    ] = 0,
+    limit: Annotated[
+        ZeroOrPositiveInt, Query(description="maximum number of violations")
+    ] = 100,
+    validation_report_service: ValidationReportService = Depends(  # noqa: FAST002
+        Provide["services.validation_report_service"]
+    ),
+):
+    resource_id = context.study.accession_number
+    try:
+        page = await query_validation_report(
+            resource_id=resource_id,
+            task_id=task_id,
+            validation_report_service=validation_report_service,
+            message_types=message_type,
+            source_files=source_file,
+            rule_ids=rule_id,
+            columns=column,
+            offset=offset,
+            limit=limit,
+        )
+    except StudyObjectNotFoundError as ex:
+        return JSONResponse(
+            status_code=status.HTTP_404_NOT_FOUND,
+            content=APIErrorResponse(
+                error_message=f"{type(ex).__name__}: {str(ex)}"
+            ).model_dump(),
+        )
+    response = APIResponse[ValidationReportPage](content=page)
+    response.success_message = (
+        f"{len(page.messages)} of {page.total} violation(s) in {task_id} report."
+    )
+    return response
+
+
 @router.delete(
     "/{resource_id}/tasks/{task_id}",
     summary="Delete running validation task.",
@@ -224,6 +224,8 @@ class ValidationServicesContainer(containers.DeclarativeContainer):
             FileSystemValidationReportService,
             file_object_repository=repositories.internal_files_object_repository,
             validation_history_object_key="validation-history",
+            max_reports_per_study=repository_config.validation_reports.max_reports_per_study,
+            max_report_age_in_days=repository_config.validation_reports.max_report_age_in_days,
         ),
     )
 
@@ -1,10 +1,16 @@
 import asyncio
 import logging
+import multiprocessing
+import time
 import uuid
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from multiprocessing.connection import Connection, wait
 from pathlib import Path
-from typing import Union
+from typing import Any, Union
 
 import click
+from pydantic import BaseModel
 
 from mtbls.application.remote_tasks.common.run_validation import (
     create_validation_run_configuration,
@@ -26,6 +32,37 @@ from mtbls.run.cli.validation.validation_app import ValidationApp
 
 logger = logging.getLogger(__name__)
 
+SUMMARY_FILE_HEADER = (
+    "STUDY_ID\tCREATED_AT\tRELEASE_DATE\tSTATUS\tRESULT\tERROR\tDURATION\n"
+)
+# studies with these results are not validated again when a sweep is resumed.
+COMPLETED_RESULTS = {"SUCCESS", "ERROR"}
+# events sent from validation worker processes
+WORKER_READY = "ready"
+VALIDATION_STARTED = "started"
+VALIDATION_COMPLETED = "completed"
+
+
+class StudyValidationSummary(BaseModel):
+    resource_id: str
+    created_at: str = ""
+    release_date: str = ""
+    status: str = ""
+    result: str = ""
+    error: str = ""
+    duration_in_seconds: float = 0
+
+    def to_summary_row(self) -> str:
+        return (
+            f"{self.resource_id}\t"
+            f"{self.created_at}\t"
+            f"{self.release_date}\t"
+            f"{self.status}\t"
+            f"{self.result}\t"
+            f"{self.error}\t"
+            f"{self.duration_in_seconds:.1f}\n"
+        )
+
 
 @click.command(no_args_is_help=True, name="validate")
 @click.option(
@@ -56,11 +93,37 @@ logger = logging.getLogger(__name__)
     "--summary-file",
     help="Validation results' summary file.",
 )
+@click.option(
+    "--workers",
+    default=0,
+    type=int,
+    help="Number of worker processes. 0 runs validations in the current process.",
+)
+@click.option(
+    "--concurrency",
+    default=1,
+    type=int,
+    help="Number of concurrent validations in each worker process "
+    "or in the current process if there is no worker.",
+)
+@click.option(
+    "--timeout",
+    default=3600,
+    type=int,
+    help="Validation timeout of a study in seconds. 0 disables timeout. "
+    "Worker process of a timed out study is replaced.",
+)
+@click.option(
+    "--checkpoint-file",
+    default="",
+    help="File to store completed studies. Interrupted runs resume from it. "
+    "Default is validation_checkpoint.jsonl in validation report root path.",
+)
 @click.option("--selected-studies", help="Comma seperated study ids.", default="")
 @click.option(
     "--input-file", help="Input file contains study ids in lines.", default=""
 )
-def run_validation_cli(
+def run_validation_cli(  # noqa: PLR0913
     selected_studies: str,
     input_file: str,
     apply_modifiers: bool = False,
@@ -68,11 +131,17 @@ def run_validation_cli(
     summary_file: Union[None, str] = None,
     config_file: Union[None, str] = None,
     secrets_file: Union[None, str] = None,
+    workers: int = 0,
+    concurrency: int = 1,
+    timeout: int = 3600,
+    checkpoint_file: Union[None, str] = None,
 ):
     if not selected_studies and not input_file:
         click.echo("Select --selected-studies or --input-file option.")
+        return
     if selected_studies and input_file:
         click.echo("Select only --selected-studies or --input-file option.")
+        return
     if selected_studies:
         resource_ids = [
             x.strip() for x in selected_studies.split(",") if x and x.strip()
@@ -89,143 +158,526 @@ def run_validation_cli(
     summary_file_path = Path(summary_file) if summary_file else None
     if summary_file_path:
         summary_file_path.parent.mkdir(parents=True, exist_ok=True)
+    checkpoint_file_path = (
+        Path(checkpoint_file)
+        if checkpoint_file
+        else reports_path / Path("validation_checkpoint.jsonl")
+    )
 
-    app = ValidationApp(config_file=config_file, secrets_file=secrets_file)
+    app = None
+    if workers < 1:
+        app = ValidationApp(config_file=config_file, secrets_file=secrets_file)
 
     asyncio.run(
         run_validation_and_save_report(
             validation_app=app,
             resource_ids=resource_ids,
             validation_reports_root_path=reports_path,
-            summary_file=Path(summary_file) if summary_file else None,
+            summary_file=summary_file_path,
             apply_modifiers=apply_modifiers,
+            workers=workers,
+            concurrency=concurrency,
+            timeout_in_seconds=timeout if timeout > 0 else None,
+            checkpoint_file=checkpoint_file_path,
+            config_file=config_file,
+            secrets_file=secrets_file,
         )
     )
 
 
-async def run_validation_and_save_report(
-    validation_app: ValidationApp,
+def get_report_path(validation_reports_root_path: Path, resource_id: str) -> Path:
+    return validation_reports_root_path / Path(f"{resource_id}_validation.tsv")
+
+
+def load_checkpoint(checkpoint_file: None | Path) -> set[str]:
+    """Return ids of studies that are completed in the previous runs."""
+    if not checkpoint_file or not checkpoint_file.exists():
+        return set()
+    completed = set()
+    with checkpoint_file.open() as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                summary = StudyValidationSummary.model_validate_json(line)
+            except ValueError:
+                logger.warning("Invalid checkpoint line is ignored: %s", line)
+                continue
+            if summary.result in COMPLETED_RESULTS:
+                completed.add(summary.resource_id)
+    return completed
+
+
+async def run_validation_and_save_report(  # noqa: PLR0913
+    validation_app: None | ValidationApp,
     resource_ids: list[str],
     validation_reports_root_path: Path,
     summary_file: None | Path,
     apply_modifiers: bool = False,
-) -> PolicySummaryResult:
-    fw = summary_file.open("w") if summary_file else None
+    workers: int = 0,
+    concurrency: int = 1,
+    timeout_in_seconds: None | int = None,
+    checkpoint_file: None | Path = None,
+    config_file: None | str = None,
+    secrets_file: None | str = None,
+) -> list[StudyValidationSummary]:
+    """Validate studies and save their reports.
+
+    If workers is greater than 0, studies are validated in worker processes
+    and each worker validates up to concurrency studies at the same time.
+    Timeouts are checked by the current process and the worker of a timed
+    out study is replaced. Otherwise studies are validated concurrently in
+    the current process and timeout can only interrupt a validation
+    while it is waiting for I/O.
+    Each completed study is appended to the checkpoint file and skipped
+    when the same sweep runs again.
+    """
+    resume = bool(
+        checkpoint_file
+        and checkpoint_file.exists()
+        and checkpoint_file.stat().st_size > 0
+    )
+    completed = load_checkpoint(checkpoint_file)
+    pending = [
+        x
+        for x in dict.fromkeys(resource_ids)
+        if x not in completed
+        and not get_report_path(validation_reports_root_path, x).exists()
+    ]
+    logger.info(
+        "%s studies will be validated. %s studies are skipped.",
+        len(pending),
+        len(resource_ids) - len(pending),
+    )
+    if not pending:
+        return []
+
+    if workers > 0:
+        worker_pool = ValidationWorkerPool(
+            workers=workers,
+            concurrency=concurrency,
+            timeout_in_seconds=timeout_in_seconds,
+            worker_args=(
+                config_file,
+                secrets_file,
+                validation_reports_root_path,
+                apply_modifiers,
+            ),
+        )
+        validation_results = iterate_in_thread(worker_pool.run(pending))
+    elif validation_app:
+        validation_results = validate_concurrently(
+            validation_app,
+            pending,
+            validation_reports_root_path,
+            apply_modifiers=apply_modifiers,
+            concurrency=concurrency,
+            timeout_in_seconds=timeout_in_seconds,
+        )
+    else:
+        raise ValueError("Validation app is required to validate in current process.")
+
+    summaries: list[StudyValidationSummary] = []
+    append_summary = resume and summary_file and summary_file.exists()
+    fw = summary_file.open("a" if append_summary else "w") if summary_file else None
+    checkpoint = checkpoint_file.open("a") if checkpoint_file else None
     try:
-        if fw:
-            fw.write("STUDY_ID\tCREATED_AT\tRELEASE_DATE\tSTATUS\tRESULT\tERROR\n")
-        for resource_id in resource_ids:
-            report_path = validation_reports_root_path / Path(
-                f"{resource_id}_validation.tsv"
-            )
-            if report_path.exists():
-                continue
+        if fw and not append_summary:
+            fw.write(SUMMARY_FILE_HEADER)
+        async for summary in validation_results:
+            summaries.append(summary)
+            if fw:
+                fw.write(summary.to_summary_row())
+                fw.flush()
+            if checkpoint:
+                checkpoint.write(f"{summary.model_dump_json()}\n")
+                checkpoint.flush()
             logger.info(
-                "Start validation for study: %s. Report will be saved to: %s",
+                "%s/%s %s: %s in %.1f seconds.",
+                len(summaries),
+                len(pending),
+                summary.resource_id,
+                summary.result,
+                summary.duration_in_seconds,
+            )
+    finally:
+        if fw:
+            fw.close()
+        if checkpoint:
+            checkpoint.close()
+        await validation_results.aclose()
+
+    total_duration = sum(x.duration_in_seconds for x in summaries)
+    logger.info(
+        "%s studies are validated. Total validation time: %.1f seconds.",
+        len(summaries),
+        total_duration,
+    )
+    return summaries
+
+
+async def validate_concurrently(  # noqa: PLR0913
+    validation_app: ValidationApp,
+    resource_ids: list[str],
+    validation_reports_root_path: Path,
+    apply_modifiers: bool = False,
+    concurrency: int = 1,
+    timeout_in_seconds: None | int = None,
+) -> AsyncIterator[StudyValidationSummary]:
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def validate(resource_id: str) -> StudyValidationSummary:
+        async with semaphore:
+            return await validate_study(
+                validation_app,
                 resource_id,
-                report_path,
+                validation_reports_root_path,
+                apply_modifiers=apply_modifiers,
+                timeout_in_seconds=timeout_in_seconds,
             )
-            try:
-                study = (
-                    await validation_app.study_read_repository.get_study_by_accession(
-                        resource_id
-                    )
-                )
-                release_date_str = study.release_date.strftime("%Y-%m-%d")
-                created_at_str = study.created_at.strftime("%Y-%m-%d")
-                config = await create_validation_run_configuration(
-                    resource_id=resource_id,
-                    temp_folder=None,
-                    apply_modifiers=apply_modifiers,
-                    metadata_files_object_repository=validation_app.metadata_files_object_repository,
-                    mhd_config=validation_app.mhd_config,
-                    private_metadata_files_root_path=validation_app.private_metadata_files_root_path,
-                    db_connection=validation_app.db_connection,
-                )
-                if apply_modifiers:
-                    result_list = await run_validation_task_with_modifiers(
-                        resource_id,
-                        study_metadata_service_factory=validation_app.study_metadata_service_factory,
-                        internal_files_object_repository=validation_app.internal_files_object_repository,
-                        policy_service=validation_app.policy_service,
-                        serialize_result=False,
-                        ontology_search_service=validation_app.ontology_search_service,
-                        validation_run_configuration=config,
-                    )
-                else:
-                    result_list = await run_validation_task(
-                        resource_id,
-                        modifier_result=None,
-                        study_metadata_service_factory=validation_app.study_metadata_service_factory,
-                        internal_files_object_repository=validation_app.internal_files_object_repository,
-                        policy_service=validation_app.policy_service,
-                        serialize_result=False,
-                        ontology_search_service=validation_app.ontology_search_service,
-                        validation_run_configuration=config,
-                    )
-                summary_result: PolicySummaryResult = await convert_to_summary_result(
-                    resource_id=resource_id, result_list=result_list
-                )
-                task_id = uuid.uuid4().hex
-                await override_and_save_validation_report(
-                    resource_id=resource_id,
-                    task_id=task_id,
-                    validation_result=summary_result,
-                    validation_report_service=validation_app.validation_report_service,
-                    validation_override_service=validation_app.validation_override_service,
-                )
 
-                summary_report = await get_report_content_from_summary_report(
-                    summary_result=summary_result,
-                    min_violation_level=None,
-                    include_summary_messages=False,
-                    include_isa_metadata_updates=True,
-                    include_overrides=True,
-                    delimiter="\t",
-                )
-                report_path.write_text(summary_report)
-                logger.info(
-                    "Validation report '%s' is created for study: %s.",
-                    report_path,
-                    resource_id,
+    for task in asyncio.as_completed([validate(x) for x in resource_ids]):
+        yield await task
+
+
+async def iterate_in_thread(iterator: Iterator[Any]) -> AsyncIterator[Any]:
+    try:
+        while (item := await asyncio.to_thread(next, iterator, None)) is not None:
+            yield item
+    finally:
+        iterator.close()
+
+
+class ValidationWorker:
+    def __init__(self, process: multiprocessing.Process, connection: Connection):
+        self.process = process
+        self.connection = connection
+        self.ready = False
+        self.closed = False
+        # study id -> start time. It is None until the worker starts the study.
+        self.running: dict[str, None | float] = {}
+
+
+class ValidationWorkerPool:
+    """Validates studies in worker processes.
+
+    Each worker validates up to concurrency studies at the same time in its
+    event loop. A blocked event loop can not handle a timeout, so timeouts are
+    checked here from the time the worker starts a study. Worker of a timed
+    out study is killed and replaced. Other studies of the same worker are
+    validated again.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        workers: int,
+        concurrency: int = 1,
+        timeout_in_seconds: None | float = None,
+        worker_args: tuple[Any, ...] = (),
+        worker_target: None | Callable[..., None] = None,
+        poll_interval_in_seconds: float = 1,
+    ):
+        self.workers = max(1, workers)
+        self.concurrency = max(1, concurrency)
+        self.timeout_in_seconds = timeout_in_seconds
+        self.worker_args = worker_args
+        self.worker_target = worker_target or run_validation_worker
+        self.poll_interval_in_seconds = poll_interval_in_seconds
+        self.context = multiprocessing.get_context("spawn")
+
+    def run(self, resource_ids: list[str]) -> Iterator[StudyValidationSummary]:
+        queue = deque(resource_ids)
+        workers = [self.start_worker() for _ in range(min(self.workers, len(queue)))]
+        try:
+            while queue or any(x.running for x in workers):
+                for worker in workers:
+                    while (
+                        worker.ready
+                        and not worker.closed
+                        and queue
+                        and len(worker.running) < self.concurrency
+                    ):
+                        try:
+                            worker.connection.send(queue[0])
+                        except OSError:
+                            worker.closed = True
+                            break
+                        worker.running[queue.popleft()] = None
+                ready = wait(
+                    [x.connection for x in workers],
+                    timeout=self.poll_interval_in_seconds,
                 )
-                error_count = sum(
-                    1
-                    for x in summary_result.messages.violations
-                    if x.type in {PolicyMessageType.ERROR}
+                for worker in workers:
+                    if worker.connection in ready:
+                        yield from self.receive_summaries(worker)
+                for idx, worker in enumerate(workers):
+                    summaries = self.check_worker(worker, queue)
+                    if summaries is not None:
+                        workers[idx] = self.start_worker()
+                        yield from summaries
+        finally:
+            for worker in workers:
+                self.stop_worker(worker)
+
+    def start_worker(self) -> ValidationWorker:
+        connection, worker_connection = self.context.Pipe()
+        process = self.context.Process(
+            target=self.worker_target,
+            args=(worker_connection, *self.worker_args),
+            daemon=True,
+        )
+        process.start()
+        worker_connection.close()
+        return ValidationWorker(process, connection)
+
+    def receive_summaries(
+        self, worker: ValidationWorker
+    ) -> Iterator[StudyValidationSummary]:
+        try:
+            event, value = worker.connection.recv()
+        except (EOFError, OSError):
+            worker.closed = True
+            return
+        if event == WORKER_READY:
+            worker.ready = True
+        elif event == VALIDATION_STARTED:
+            worker.running[value] = time.monotonic()
+        elif event == VALIDATION_COMPLETED:
+            summary = StudyValidationSummary.model_validate_json(value)
+            worker.running.pop(summary.resource_id, None)
+            yield summary
+
+    def check_worker(
+        self, worker: ValidationWorker, queue: deque[str]
+    ) -> None | list[StudyValidationSummary]:
+        """Return summaries of failed studies if worker should be replaced."""
+        now = time.monotonic()
+        timed_out = {
+            x
+            for x, start_time in worker.running.items()
+            if self.timeout_in_seconds
+            and start_time is not None
+            and now - start_time > self.timeout_in_seconds
+        }
+        alive = not worker.closed and worker.process.is_alive()
+        if alive and not timed_out:
+            return None
+        if not worker.ready:
+            raise RuntimeError(
+                f"Validation worker exited with code {worker.process.exitcode} "
+                "before it is ready."
+            )
+        self.stop_worker(worker)
+        summaries = []
+        for resource_id, start_time in worker.running.items():
+            summary = StudyValidationSummary(
+                resource_id=resource_id,
+                duration_in_seconds=now - start_time if start_time else 0,
+            )
+            if resource_id in timed_out:
+                logger.error("Validation of %s timed out.", resource_id)
+                summary.result = "TIMEOUT"
+                summary.error = (
+                    f"Validation timed out after {self.timeout_in_seconds} seconds"
                 )
-                validation_result = "SUCCESS" if error_count == 0 else "ERROR"
-                logger.info(
-                    "Validation status for study %s: %s. Error count: %s",
-                    resource_id,
-                    validation_result,
-                    error_count,
+            elif not alive:
+                logger.error("Validation worker failed for %s", resource_id)
+                summary.result = "Failed to validate"
+                summary.error = (
+                    f"Worker process exited with code {worker.process.exitcode}"
                 )
-                if fw:
-                    fw.write(
-                        f"{resource_id}\t"
-                        f"{created_at_str}\t"
-                        f"{release_date_str}\t"
-                        f"{study.status.name}\t"
-                        f"{validation_result}\t"
-                        f"{error_count}\n"
-                    )
-                    fw.flush()
-
-            except Exception as ex:
-                if fw:
-                    fw.write(
-                        f"{resource_id}\t"
-                        f"{created_at_str}\t"
-                        f"{release_date_str}\t"
-                        f"{study.status.name}\t"
-                        f"Failed to validate\t"
-                        f"{ex}\n"
-                    )
-                    fw.flush()
-    finally:
-        if fw:
-            fw.close()
+            else:
+                queue.appendleft(resource_id)
+                continue
+            summaries.append(summary)
+        return summaries
+
+    def stop_worker(self, worker: ValidationWorker) -> None:
+        if worker.process.is_alive():
+            if not worker.running and not worker.closed:
+                try:
+                    worker.connection.send(None)
+                    worker.process.join(timeout=10)
+                except OSError:
+                    pass
+            if worker.process.is_alive():
+                worker.process.kill()
+        worker.process.join()
+        worker.connection.close()
+        worker.closed = True
+
+
+def run_validation_worker(
+    connection: Connection,
+    config_file: None | str,
+    secrets_file: None | str,
+    validation_reports_root_path: Path,
+    apply_modifiers: bool,
+) -> None:
+    async def serve() -> None:
+        # Async clients of the app are bound to the event loop of the worker.
+        app = ValidationApp(config_file=config_file, secrets_file=secrets_file)
+        await serve_validation_requests(
+            connection,
+            lambda resource_id: validate_study(
+                app,
+                resource_id,
+                validation_reports_root_path,
+                apply_modifiers=apply_modifiers,
+            ),
+        )
+
+    asyncio.run(serve())
+
+
+async def serve_validation_requests(
+    connection: Connection,
+    validate: Callable[[str], Awaitable[StudyValidationSummary]],
+) -> None:
+    """Validate studies received from the parent process and send their summaries.
+
+    The parent sends None to stop the worker.
+    """
+    loop = asyncio.get_running_loop()
+    tasks: set[asyncio.Task] = set()
+
+    async def run(resource_id: str) -> None:
+        connection.send((VALIDATION_STARTED, resource_id))
+        summary = await validate(resource_id)
+        connection.send((VALIDATION_COMPLETED, summary.model_dump_json()))
+
+    connection.send((WORKER_READY, None))
+    while True:
+        try:
+            resource_id = await loop.run_in_executor(None, connection.recv)
+        except EOFError:
+            break
+        if resource_id is None:
+            break
+        task = asyncio.create_task(run(resource_id))
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+    if tasks:
+        await asyncio.gather(*tasks)
+
+
+async def validate_study(
+    validation_app: ValidationApp,
+    resource_id: str,
+    validation_reports_root_path: Path,
+    apply_modifiers: bool = False,
+    timeout_in_seconds: None | int = None,
+) -> StudyValidationSummary:
+    summary = StudyValidationSummary(resource_id=resource_id)
+    start_time = time.monotonic()
+    try:
+        await asyncio.wait_for(
+            validate_and_save_report(
+                validation_app,
+                summary,
+                get_report_path(validation_reports_root_path, resource_id),
+                apply_modifiers=apply_modifiers,
+            ),
+            timeout=timeout_in_seconds,
+        )
+    except TimeoutError:
+        logger.error("Validation of %s timed out.", resource_id)
+        summary.result = "TIMEOUT"
+        summary.error = f"Validation timed out after {timeout_in_seconds} seconds"
+    except Exception as ex:
+        logger.error("Validation of %s failed: %s", resource_id, ex)
+        summary.result = "Failed to validate"
+        summary.error = str(ex)
+    summary.duration_in_seconds = time.monotonic() - start_time
+    return summary
+
+
+async def validate_and_save_report(
+    validation_app: ValidationApp,
+    summary: StudyValidationSummary,
+    report_path: Path,
+    apply_modifiers: bool = False,
+) -> None:
+    resource_id = summary.resource_id
+    logger.info(
+        "Start validation for study: %s. Report will be saved to: %s",
+        resource_id,
+        report_path,
+    )
+    study = await validation_app.study_read_repository.get_study_by_accession(
+        resource_id
+    )
+    summary.release_date = study.release_date.strftime("%Y-%m-%d")
+    summary.created_at = study.created_at.strftime("%Y-%m-%d")
+    summary.status = study.status.name
+    config = await create_validation_run_configuration(
+        resource_id=resource_id,
+        apply_modifiers=apply_modifiers,
+        metadata_files_object_repository=validation_app.metadata_files_object_repository,
+        mhd_config=validation_app.mhd_config,
+        private_metadata_files_root_path=validation_app.private_metadata_files_root_path,
+        db_connection=validation_app.db_connection,
+    )
+    if apply_modifiers:
+        result_list = await run_validation_task_with_modifiers(
+            resource_id,
+            study_metadata_service_factory=validation_app.study_metadata_service_factory,
+            internal_files_object_repository=validation_app.internal_files_object_repository,
+            policy_service=validation_app.policy_service,
+            serialize_result=False,
+            ontology_search_service=validation_app.ontology_search_service,
+            validation_run_configuration=config,
+        )
+    else:
+        result_list = await run_validation_task(
+            resource_id,
+            modifier_result=None,
+            study_metadata_service_factory=validation_app.study_metadata_service_factory,
+            internal_files_object_repository=validation_app.internal_files_object_repository,
+            policy_service=validation_app.policy_service,
+            serialize_result=False,
+            ontology_search_service=validation_app.ontology_search_service,
+            validation_run_configuration=config,
+        )
+    summary_result: PolicySummaryResult = await convert_to_summary_result(
+        resource_id=resource_id, result_list=result_list
+    )
+    task_id = uuid.uuid4().hex
+    await override_and_save_validation_report(
+        resource_id=resource_id,
+        task_id=task_id,
+        validation_result=summary_result,
+        validation_report_service=validation_app.validation_report_service,
+        validation_override_service=validation_app.validation_override_service,
+    )
+
+    summary_report = await get_report_content_from_summary_report(
+        summary_result=summary_result,
+        min_violation_level=None,
+        include_summary_messages=False,
+        include_isa_metadata_updates=True,
+        include_overrides=True,
+        delimiter="\t",
+    )
+    report_path.write_text(summary_report)
+    logger.info(
+        "Validation report '%s' is created for study: %s.",
+        report_path,
+        resource_id,
+    )
+    error_count = sum(
+        1
+        for x in summary_result.messages.violations
+        if x.type in {PolicyMessageType.ERROR}
+    )
+    summary.result = "SUCCESS" if error_count == 0 else "ERROR"
+    summary.error = str(error_count)
+    logger.info(
+        "Validation status for study %s: %s. Error count: %s",
+        resource_id,
+        summary.result,
+        error_count,
+    )
 
 
 if __name__ == "__main__":
@@ -32,6 +32,9 @@ from mtbls.application.services.interfaces.validation_override_service import (
 from mtbls.application.services.interfaces.validation_report_service import (
     ValidationReportService,
 )
+from mtbls.application.services.study_metadata_service.validation_input_digest import (
+    ValidationInputDigestCalculator,
+)
 from mtbls.domain.domain_services.configuration_generator import create_config_from_dict
 from mtbls.domain.shared.mhd_configuration import MhdConfiguration
 from mtbls.infrastructure.auth.keycloak.keycloak_authentication import (
@@ -233,8 +236,19 @@ class Ws3ServicesContainer(containers.DeclarativeContainer):
             FileSystemValidationReportService,
             file_object_repository=repositories.internal_files_object_repository,
             validation_history_object_key="validation-history",
+            max_reports_per_study=repository_config.validation_reports.max_reports_per_study,
+            max_report_age_in_days=repository_config.validation_reports.max_report_age_in_days,
         ),
     )
+    validation_input_digest_calculator: ValidationInputDigestCalculator = providers.Singleton(
+        ValidationInputDigestCalculator,
+        metadata_files_object_repository=repositories.metadata_files_object_repository,
+        internal_files_object_repository=repositories.internal_files_object_repository,
+        study_read_repository=repositories.study_read_repository,
+        user_read_repository=repositories.user_read_repository,
+        policy_service=policy_service,
+        validation_override_service=validation_override_service,
+    )
 
 
 class Ws3ApplicationContainer(containers.DeclarativeContainer):
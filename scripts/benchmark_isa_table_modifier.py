@@ -0,0 +1,83 @@
+import random
+import time
+
+from metabolights_utils.models.isa.common import IsaTableColumn
+from metabolights_utils.models.isa.enums import ColumnsStructure
+from metabolights_utils.models.isa.samples_file import SamplesFile
+
+from mtbls.domain.domain_services.modifier.column_update_handler import (
+    IsaTableColumnUpdateHandler,
+)
+from mtbls.domain.domain_services.modifier.column_values import (
+    find_column_value_updates,
+)
+
+VALUES = ["source-1", " source-2", "'source-3'", "source-4 ", '"source-5"', "x"]
+
+
+def create_sample_file(row_count: int, column_count: int, seed: int) -> SamplesFile:
+    rnd = random.Random(seed)
+    sample_file = SamplesFile(file_path="s_MTBLS1.txt")
+    table = sample_file.table
+    for idx in range(column_count):
+        column_name = f"Characteristics[Column {idx}]"
+        table.columns.append(column_name)
+        table.headers.append(
+            IsaTableColumn(
+                column_index=idx,
+                column_name=column_name,
+                column_header=column_name,
+                column_structure=ColumnsStructure.SINGLE_COLUMN,
+            )
+        )
+        table.data[column_name] = [rnd.choice(VALUES) for _ in range(row_count)]
+    table.row_count = row_count
+    return sample_file
+
+
+def strip_value(value: str) -> str:
+    return value.strip().strip('"').strip("'")
+
+
+def update_cell_by_cell(sample_file: SamplesFile):
+    updater = IsaTableColumnUpdateHandler(isa_table_file=sample_file)
+    for header in sample_file.table.headers:
+        for row, value in enumerate(sample_file.table.data[header.column_name]):
+            stripped_value = strip_value(value)
+            if value != stripped_value:
+                updater.update_isa_table_cell(header, value, stripped_value, row)
+    return updater.get_isa_table_update_logs()
+
+
+def update_distinct_values(sample_file: SamplesFile):
+    updater = IsaTableColumnUpdateHandler(isa_table_file=sample_file)
+    for header in sample_file.table.headers:
+        for old_value, new_value, rows in find_column_value_updates(
+            sample_file.table.data[header.column_name], strip_value
+        ):
+            updater.update_isa_table_cells(header, old_value, new_value, rows)
+    return updater.get_isa_table_update_logs()
+
+
+if __name__ == "__main__":
+    row_count = 50000
+    sample_file = create_sample_file(row_count=row_count, column_count=20, seed=1)
+    expected_file = sample_file.model_copy(deep=True)
+
+    start = time.perf_counter()
+    expected_logs = update_cell_by_cell(expected_file)
+    cell_by_cell_duration = time.perf_counter() - start
+
+    start = time.perf_counter()
+    update_logs = update_distinct_values(sample_file)
+    column_duration = time.perf_counter() - start
+
+    if (
+        update_logs != expected_logs
+        or sample_file.table.data != expected_file.table.data
+    ):
+        raise AssertionError("Update logs are not same.")
+    print(f"Sample file rows: {row_count}, update logs: {len(update_logs)}")
+    print(f"Cell by cell: {cell_by_cell_duration:.3f} s")
+    print(f"Column distinct values: {column_duration:.3f} s")
+    print(f"Speedup: {cell_by_cell_duration / column_duration:.1f}x")
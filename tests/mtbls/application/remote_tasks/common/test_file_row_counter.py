@@ -0,0 +1,101 @@
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from mtbls.application.remote_tasks.common.file_row_counter import (
+    count_lines,
+    get_file_row_count,
+)
+from mtbls.application.remote_tasks.common.run_validation import (
+    create_validation_run_configuration,
+)
+from mtbls.application.services.interfaces.repositories.file_object.file_object_write_repository import (  # noqa: E501
+    FileObjectWriteRepository,
+)
+from mtbls.domain.entities.study_file import StudyDataFileOutput
+from mtbls.domain.shared.mhd_configuration import MhdConfiguration
+from mtbls.domain.shared.repository.study_bucket import StudyBucket
+from mtbls.domain.shared.validator.run_configuration import ResultFileSizePolicy
+
+DB_CONNECTION = {"database": "test", "user": "test", "password": "test", "host": "x"}
+
+
+def create_repository(files: list[StudyDataFileOutput], tmp_path: Path):
+    repository = AsyncMock(spec=FileObjectWriteRepository)
+    repository.get_bucket = Mock(return_value=StudyBucket.PRIVATE_METADATA_FILES)
+    repository.list.return_value = files
+    repository.get_uri.side_effect = lambda resource_id, object_key: (
+        f"file://{tmp_path / object_key}"
+    )
+    return repository
+
+
+def test_count_lines_01(tmp_path: Path):
+    file_path = tmp_path / "m_01.tsv"
+    file_path.write_text("header\nrow1\nrow2")
+    assert count_lines(file_path) == 3
+    file_path.write_text("header\nrow1\nrow2\n")
+    assert count_lines(file_path) == 3
+    file_path.write_text("")
+    assert count_lines(file_path) == 0
+
+
+@pytest.mark.asyncio
+async def test_get_file_row_count_01(tmp_path: Path):
+    """_summary_
+    Case:
+        Row count of an unchanged file is requested twice.
+    Expected result:
+        File is read in place once and the cached count is returned.
+    """
+    (tmp_path / "m_01.tsv").write_text("header\nrow1\nrow2\n")
+    file = StudyDataFileOutput(
+        object_key="m_01.tsv", basename="m_01.tsv", size_in_bytes=17
+    )
+    repository = create_repository([file], tmp_path)
+
+    assert await get_file_row_count(repository, "MTBLS1000001", file) == 2
+    assert await get_file_row_count(repository, "MTBLS1000001", file) == 2
+    repository.get_uri.assert_called_once()
+    repository.download.assert_not_called()
+    repository.get_content.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_create_validation_run_configuration_01(tmp_path: Path):
+    """_summary_
+    Case:
+        Total MAF file rows exceed row limit of the size policy.
+    Expected result:
+        MAF files are validated in chunks.
+    """
+    (tmp_path / "m_02.tsv").write_text("header\n" + "row\n" * 11)
+    file = StudyDataFileOutput(
+        object_key="m_02.tsv", basename="m_02.tsv", size_in_bytes=51
+    )
+    repository = create_repository([file], tmp_path)
+    policy = ResultFileSizePolicy(max_total_rows=10, chunk_size=5)
+    config = await create_validation_run_configuration(
+        "MTBLS1000002",
+        metadata_files_object_repository=repository,
+        mhd_config=MhdConfiguration(),
+        private_metadata_files_root_path=str(tmp_path),
+        db_connection=DB_CONNECTION,
+        result_file_size_policy=policy,
+    )
+    assert config.maf_chunk_size == 5
+    assert config.assignmet_sheet_limit == 5
+    assert config.skip_result_file_modification
+
+    policy = ResultFileSizePolicy(max_total_rows=11)
+    config = await create_validation_run_configuration(
+        "MTBLS1000002",
+        metadata_files_object_repository=repository,
+        mhd_config=MhdConfiguration(),
+        private_metadata_files_root_path=str(tmp_path),
+        db_connection=DB_CONNECTION,
+        result_file_size_policy=policy,
+    )
+    assert not config.maf_chunk_size
+    assert not config.skip_result_file_modification
@@ -0,0 +1,157 @@
+from metabolights_utils.models.isa.assay_file import AssayFile
+from metabolights_utils.models.isa.assignment_file import AssignmentFile
+from metabolights_utils.models.isa.samples_file import SamplesFile
+from metabolights_utils.models.metabolights.model import MetabolightsStudyModel
+
+from mtbls.application.remote_tasks.common.incremental_validation import (
+    create_partial_study_model,
+    create_validation_input_hashes,
+    find_incremental_validation_files,
+    merge_policy_results,
+)
+from mtbls.domain.shared.validator.policy import (
+    PolicyMessage,
+    PolicyResult,
+    PolicySummaryResult,
+    ValidationResult,
+)
+from mtbls.domain.shared.validator.types import ValidationPhase
+
+PHASES = [ValidationPhase.PHASE_1, ValidationPhase.PHASE_2]
+
+
+def create_model() -> MetabolightsStudyModel:
+    model = MetabolightsStudyModel()
+    model.investigation_file_path = "i_Investigation.txt"
+    model.samples["s_01.txt"] = SamplesFile(sha256_hash="s1")
+    model.assays["a_01.txt"] = AssayFile(
+        sha256_hash="a1", referenced_assignment_files=["m_01.tsv"]
+    )
+    model.assays["a_02.txt"] = AssayFile(sha256_hash="a2")
+    model.metabolite_assignments["m_01.tsv"] = AssignmentFile(sha256_hash="m1")
+    return model
+
+
+def test_find_incremental_validation_files_01():
+    """_summary_
+    Case:
+        Only an assay file is updated.
+    Expected result:
+        Assay file, its MAF file and sample file are validated.
+        Other assay files are loaded to validate sample file.
+    """
+    model = create_model()
+    previous_hashes = create_validation_input_hashes(model, PHASES, "v1")
+    model.assays["a_01.txt"].sha256_hash = "a1-updated"
+    current_hashes = create_validation_input_hashes(model, PHASES, "v1")
+
+    validated_files, input_files = find_incremental_validation_files(
+        model, previous_hashes, current_hashes
+    )
+    assert validated_files == {"a_01.txt", "m_01.tsv", "s_01.txt"}
+    assert input_files == {"a_01.txt", "a_02.txt", "m_01.tsv", "s_01.txt"}
+
+    partial_model = create_partial_study_model(model, input_files)
+    assert set(partial_model.assays) == {"a_01.txt", "a_02.txt"}
+    assert set(partial_model.metabolite_assignments) == {"m_01.tsv"}
+
+
+def test_find_incremental_validation_files_02():
+    """_summary_
+    Case:
+        Sample file is updated.
+    Expected result:
+        Sample file and all assay files are validated.
+    """
+    model = create_model()
+    previous_hashes = create_validation_input_hashes(model, PHASES, "v1")
+    model.samples["s_01.txt"].sha256_hash = "s1-updated"
+    current_hashes = create_validation_input_hashes(model, PHASES, "v1")
+
+    validated_files, _ = find_incremental_validation_files(
+        model, previous_hashes, current_hashes
+    )
+    assert validated_files == {"s_01.txt", "a_01.txt", "a_02.txt"}
+
+
+def test_find_incremental_validation_files_03():
+    """_summary_
+    Case:
+        Investigation file, validation version or file list is updated.
+    Expected result:
+        Full validation is required.
+    """
+    model = create_model()
+    previous_hashes = create_validation_input_hashes(model, PHASES, "v1")
+    model.investigation.identifier = "MTBLS1"
+    current_hashes = create_validation_input_hashes(model, PHASES, "v1")
+    assert not find_incremental_validation_files(model, previous_hashes, current_hashes)
+
+    model = create_model()
+    current_hashes = create_validation_input_hashes(model, PHASES, "v2")
+    assert not find_incremental_validation_files(model, previous_hashes, current_hashes)
+
+    model.assays["a_03.txt"] = AssayFile(sha256_hash="a3")
+    current_hashes = create_validation_input_hashes(model, PHASES, "v1")
+    assert not find_incremental_validation_files(model, previous_hashes, current_hashes)
+
+
+def test_find_incremental_validation_files_04():
+    """_summary_
+    Case:
+        Assay file update fixes a sample file violation.
+    Expected result:
+        Stale sample file violation is removed from the merged result.
+    """
+    model = create_model()
+    previous_hashes = create_validation_input_hashes(model, PHASES, "v1")
+    model.assays["a_02.txt"].sha256_hash = "a2-updated"
+    current_hashes = create_validation_input_hashes(model, PHASES, "v1")
+    validated_files, _ = find_incremental_validation_files(
+        model, previous_hashes, current_hashes
+    )
+    previous_result = PolicySummaryResult(
+        messages=ValidationResult(
+            violations=[
+                PolicyMessage(identifier="rule_s_01", source_file="s_01.txt"),
+                PolicyMessage(identifier="rule_a_01", source_file="a_01.txt"),
+            ]
+        )
+    )
+    result = merge_policy_results(previous_result, PolicyResult(), validated_files)
+    violations = {(x.identifier, x.source_file) for x in result.messages.violations}
+    assert violations == {("rule_a_01", "a_01.txt")}
+
+
+def test_merge_policy_results_01():
+    """_summary_
+    Case:
+        Previous result has violations of updated and not updated files.
+    Expected result:
+        Violations of updated files are replaced, the others are kept.
+    """
+    previous_result = PolicySummaryResult(
+        messages=ValidationResult(
+            violations=[
+                PolicyMessage(identifier="rule_a_01", source_file="a_01.txt"),
+                PolicyMessage(identifier="rule_a_02", source_file="a_02.txt"),
+                PolicyMessage(identifier="rule___500_100_001_01", source_file="input"),
+            ],
+            summary=[PolicyMessage(identifier="rule_a", source_file="a_01.txt")],
+        )
+    )
+    current_result = PolicyResult(
+        messages=ValidationResult(
+            violations=[
+                PolicyMessage(identifier="rule_a_03", source_file="a_01.txt"),
+                PolicyMessage(
+                    identifier="rule_i_01", source_file="i_Investigation.txt"
+                ),
+            ],
+            summary=[PolicyMessage(identifier="rule_a", source_file="a_01.txt")],
+        )
+    )
+    result = merge_policy_results(previous_result, current_result, {"a_01.txt"})
+    violations = {(x.identifier, x.source_file) for x in result.messages.violations}
+    assert violations == {("rule_a_02", "a_02.txt"), ("rule_a_03", "a_01.txt")}
+    assert len(result.messages.summary) == 1
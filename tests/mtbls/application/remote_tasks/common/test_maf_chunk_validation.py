@@ -0,0 +1,243 @@
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from metabolights_utils.models.isa.assay_file import AssayFile
+from metabolights_utils.models.isa.assignment_file import AssignmentFile
+from metabolights_utils.models.isa.common import IsaTable
+from metabolights_utils.models.metabolights.model import MetabolightsStudyModel
+
+from mtbls.application.remote_tasks.common.run_validation import (
+    merge_policy_messages,
+    validate_assignment_file_chunks,
+)
+from mtbls.application.services.interfaces.policy_service import PolicyService
+from mtbls.application.services.interfaces.repositories.file_object.file_object_write_repository import (  # noqa: E501
+    FileObjectWriteRepository,
+)
+from mtbls.application.services.interfaces.repositories.study.study_read_repository import (  # noqa: E501
+    StudyReadRepository,
+)
+from mtbls.application.services.interfaces.repositories.study_data_file.study_data_file_write_repository import (  # noqa: E501
+    StudyDataFileRepository,
+)
+from mtbls.application.services.interfaces.repositories.user.user_read_repository import (  # noqa: E501
+    UserReadRepository,
+)
+from mtbls.application.services.interfaces.study_metadata_service import (
+    StudyMetadataService,
+)
+from mtbls.domain.shared.validator.policy import (
+    PolicyMessage,
+    PolicyResult,
+    ValidationResult,
+)
+from mtbls.domain.shared.validator.types import PolicyMessageType
+from mtbls.infrastructure.study_metadata_service.nfs.nfs_study_metadata_service import (  # noqa: E501
+    FileObjectStudyMetadataService,
+)
+
+
+def create_metadata_service(
+    tmp_path: Path, study_path: Path
+) -> FileObjectStudyMetadataService:
+    repository = AsyncMock(spec=FileObjectWriteRepository)
+
+    async def get_uri(resource_id: str, object_key: str):
+        return f"file://{study_path / object_key}"
+
+    repository.get_uri.side_effect = get_uri
+    return FileObjectStudyMetadataService(
+        resource_id="MTBLS1",
+        study_data_file_repository=Mock(spec=StudyDataFileRepository),
+        metadata_files_object_repository=repository,
+        audit_files_object_repository=AsyncMock(spec=FileObjectWriteRepository),
+        internal_files_object_repository=AsyncMock(spec=FileObjectWriteRepository),
+        study_read_repository=Mock(spec=StudyReadRepository),
+        user_read_repository=Mock(spec=UserReadRepository),
+        temp_path=str(tmp_path / "staging"),
+    )
+
+
+def create_policy_service() -> PolicyService:
+    """Policy service reports each empty metabolite identification value."""
+
+    async def validate_study(resource_id: str, model: MetabolightsStudyModel):
+        table = model.metabolite_assignments["m_01.tsv"].table
+        values = [
+            table.data["database_identifier"][idx]
+            for idx, value in enumerate(table.data["metabolite_identification"])
+            if not value
+        ]
+        violations = []
+        if values:
+            violations.append(
+                PolicyMessage(
+                    identifier="rule_m_01",
+                    source_file="m_01.tsv",
+                    values=values,
+                    total_violations=len(values),
+                )
+            )
+        return ValidationResult(violations=violations)
+
+    policy_service = Mock(spec=PolicyService)
+    policy_service.validate_study.side_effect = validate_study
+    return policy_service
+
+
+def test_merge_policy_messages_01():
+    """_summary_
+    Case:
+        Same rule is violated in different MAF file chunks.
+    Expected result:
+        One message with combined values and the most severe type.
+    """
+    target = [
+        PolicyMessage(
+            identifier="rule_m_01",
+            source_file="m_01.tsv",
+            type=PolicyMessageType.WARNING,
+            values=["1", "2"],
+            total_violations=2,
+        )
+    ]
+    merge_policy_messages(
+        target,
+        [
+            PolicyMessage(
+                identifier="rule_m_01",
+                source_file="m_01.tsv",
+                type=PolicyMessageType.ERROR,
+                values=["2", "3"],
+                total_violations=2,
+                has_more_violations=True,
+            ),
+            PolicyMessage(identifier="rule_m_02", source_file="m_01.tsv"),
+        ],
+    )
+    assert len(target) == 2
+    assert target[0].values == ["1", "2", "3"]
+    assert target[0].total_violations == 4
+    assert target[0].has_more_violations
+    assert target[0].type == PolicyMessageType.ERROR
+
+
+@pytest.mark.asyncio
+async def test_validate_assignment_file_chunks_01():
+    """_summary_
+    Case:
+        First 2 rows of a MAF file with 5 rows are validated before.
+    Expected result:
+        Remaining rows are validated in 2 chunks and violations are merged.
+    """
+    model = MetabolightsStudyModel()
+    model.assays["a_01.txt"] = AssayFile(referenced_assignment_files=["m_01.tsv"])
+    model.assays["a_02.txt"] = AssayFile()
+    model.metabolite_assignments["m_01.tsv"] = AssignmentFile(
+        table=IsaTable(row_count=2, total_row_count=5)
+    )
+    metadata_service = Mock(spec=StudyMetadataService)
+    metadata_service.load_isa_table_sheet.return_value = (
+        AssignmentFile(table=IsaTable(row_count=2)),
+        [],
+    )
+    policy_service = Mock(spec=PolicyService)
+    policy_service.validate_study.return_value = ValidationResult(
+        violations=[
+            PolicyMessage(identifier="rule_m_01", source_file="m_01.tsv"),
+            PolicyMessage(identifier="rule_a_01", source_file="a_01.txt"),
+        ]
+    )
+    policy_result = PolicyResult(
+        messages=ValidationResult(
+            violations=[PolicyMessage(identifier="rule_m_01", source_file="m_01.tsv")]
+        )
+    )
+    await validate_assignment_file_chunks(
+        "MTBLS1",
+        model,
+        policy_result,
+        metadata_service=metadata_service,
+        policy_service=policy_service,
+        chunk_size=2,
+    )
+    offsets = sorted(
+        x.kwargs["offset"] for x in metadata_service.load_isa_table_sheet.call_args_list
+    )
+    assert offsets == [2, 4]
+    chunk_model: MetabolightsStudyModel = policy_service.validate_study.call_args[0][1]
+    assert set(chunk_model.assays) == {"a_01.txt"}
+    assert [x.identifier for x in policy_result.messages.violations] == ["rule_m_01"]
+
+
+@pytest.mark.asyncio
+async def test_validate_assignment_file_chunks_02(tmp_path: Path):
+    """_summary_
+    Case:
+        First 2 rows of a MAF file with 5 rows are validated before.
+        Rows 4 and 5 have violations and MAF file is not in staging folder.
+    Expected result:
+        Remaining rows are read from study folder and their violations
+        are reported.
+    """
+    study_path = tmp_path / "MTBLS1"
+    study_path.mkdir()
+    rows = ["database_identifier\tmetabolite_identification"]
+    rows.extend(f"CHEBI:{idx}\t{'' if idx > 3 else 'x'}" for idx in range(1, 6))
+    (study_path / "m_01.tsv").write_text("\n".join(rows) + "\n")
+    model = MetabolightsStudyModel()
+    model.metabolite_assignments["m_01.tsv"] = AssignmentFile(
+        table=IsaTable(row_count=2, total_row_count=5)
+    )
+    policy_result = PolicyResult(messages=ValidationResult())
+    policy_service = create_policy_service()
+
+    with create_metadata_service(tmp_path, study_path) as metadata_service:
+        await validate_assignment_file_chunks(
+            "MTBLS1",
+            model,
+            policy_result,
+            metadata_service=metadata_service,
+            policy_service=policy_service,
+            chunk_size=2,
+        )
+
+    violations = policy_result.messages.violations
+    assert [x.identifier for x in violations] == ["rule_m_01"]
+    assert sorted(violations[0].values) == ["CHEBI:4", "CHEBI:5"]
+    assert violations[0].total_violations == 2
+
+
+@pytest.mark.asyncio
+async def test_validate_assignment_file_chunks_03(tmp_path: Path):
+    """_summary_
+    Case:
+        MAF file is deleted after its first 2 rows are validated.
+    Expected result:
+        Parse error of remaining rows is reported as an error.
+    """
+    study_path = tmp_path / "MTBLS1"
+    study_path.mkdir()
+    model = MetabolightsStudyModel()
+    model.metabolite_assignments["m_01.tsv"] = AssignmentFile(
+        table=IsaTable(row_count=2, total_row_count=5)
+    )
+    policy_result = PolicyResult(messages=ValidationResult())
+    policy_service = create_policy_service()
+
+    with create_metadata_service(tmp_path, study_path) as metadata_service:
+        await validate_assignment_file_chunks(
+            "MTBLS1",
+            model,
+            policy_result,
+            metadata_service=metadata_service,
+            policy_service=policy_service,
+            chunk_size=2,
+        )
+
+    violations = policy_result.messages.violations
+    assert len(violations) == 1
+    assert violations[0].source_file == "m_01.tsv"
+    assert violations[0].type == PolicyMessageType.ERROR
+    policy_service.validate_study.assert_not_called()
@@ -0,0 +1,88 @@
+import json
+import time
+from unittest.mock import AsyncMock
+
+import pytest
+
+from mtbls.application.remote_tasks.common.mhd_conversion import (
+    create_mhd_conversion_digest,
+    find_reusable_mhd_files,
+    run_in_process_pool,
+)
+from mtbls.application.services.interfaces.repositories.file_object.file_object_write_repository import (  # noqa: E501
+    FileObjectWriteRepository,
+)
+
+DIGEST_KEY = "DATA_FILES/MTBLS1.mhd.digest.json"
+MHD_KEYS = ["DATA_FILES/MTBLS1.mhd.json", "DATA_FILES/MTBLS1.announcement.json"]
+
+
+def create_repository(objects: dict[str, bytes]):
+    repository = AsyncMock(spec=FileObjectWriteRepository)
+    repository.exists.side_effect = lambda resource_id, key: key in objects
+    repository.get_content.side_effect = lambda resource_id, key: objects[key]
+    return repository
+
+
+def test_create_mhd_conversion_digest_01():
+    """_summary_
+    Case:
+        Digest is created with same and updated inputs.
+    Expected result:
+        Digest does not depend on input order and changes if an input changes.
+    """
+    digest = create_mhd_conversion_digest(
+        {"a.txt": "1", "s.txt": "2"}, mhd_model_version="0.1", schema_uri="x"
+    )
+    assert digest == create_mhd_conversion_digest(
+        {"s.txt": "2", "a.txt": "1"}, schema_uri="x", mhd_model_version="0.1"
+    )
+    assert digest != create_mhd_conversion_digest(
+        {"a.txt": "1", "s.txt": "3"}, mhd_model_version="0.1", schema_uri="x"
+    )
+    assert digest != create_mhd_conversion_digest(
+        {"a.txt": "1", "s.txt": "2"}, mhd_model_version="0.2", schema_uri="x"
+    )
+
+
+@pytest.mark.asyncio
+async def test_find_reusable_mhd_files_01():
+    """_summary_
+    Case:
+        Stored digest matches or not, and an MHD file is missing.
+    Expected result:
+        MHD files are reused only if digest matches and all files exist.
+    """
+    objects = {x: b"{}" for x in MHD_KEYS}
+    objects[DIGEST_KEY] = json.dumps({"digest": "abc"}).encode()
+    repository = create_repository(objects)
+
+    assert await find_reusable_mhd_files(
+        "MTBLS1", "abc", repository, MHD_KEYS, DIGEST_KEY
+    )
+    assert not await find_reusable_mhd_files(
+        "MTBLS1", "xyz", repository, MHD_KEYS, DIGEST_KEY
+    )
+    del objects[MHD_KEYS[1]]
+    assert not await find_reusable_mhd_files(
+        "MTBLS1", "abc", repository, MHD_KEYS, DIGEST_KEY
+    )
+    del objects[DIGEST_KEY]
+    assert not await find_reusable_mhd_files(
+        "MTBLS1", "abc", repository, MHD_KEYS, DIGEST_KEY
+    )
+
+
+@pytest.mark.asyncio
+async def test_run_in_process_pool_01():
+    """_summary_
+    Case:
+        A function completes and another one exceeds the timeout.
+    Expected result:
+        Result is returned and TimeoutError is raised for the slow function.
+        Pool is usable after the timeout.
+    """
+    assert await run_in_process_pool(sum, [1, 2, 3], timeout_in_seconds=60) == 6
+    with pytest.raises(TimeoutError):
+        await run_in_process_pool(time.sleep, 30, timeout_in_seconds=1)
+    assert await run_in_process_pool(max, [1, 2, 3], timeout_in_seconds=60) == 3
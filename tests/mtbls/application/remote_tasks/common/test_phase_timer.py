@@ -0,0 +1,60 @@
+import pytest
+from metabolights_utils.models.isa.samples_file import SamplesFile
+from metabolights_utils.models.metabolights.model import MetabolightsStudyModel
+
+from mtbls.application.remote_tasks.common.phase_timer import (
+    PhaseTimer,
+    get_study_size_bucket,
+)
+from mtbls.application.utils.metrics import Histogram
+
+
+def test_phase_timer_01():
+    """_summary_
+    Case:
+        Two phases are measured and the second one raises an exception.
+    Expected result:
+        Both phases are recorded in order with their payload sizes.
+    """
+    timer = PhaseTimer()
+    with timer.measure("load_study_model") as timing:
+        timing.payload_size = 10
+    with pytest.raises(ValueError), timer.measure("policy_validation", 5):
+        raise ValueError()
+
+    assert [x.phase for x in timer.timings] == ["load_study_model", "policy_validation"]
+    assert [x.payload_size for x in timer.timings] == [10, 5]
+    assert all(x.duration_in_seconds >= 0 for x in timer.timings)
+
+
+def test_get_study_size_bucket_01():
+    """_summary_
+    Case:
+        Study with no table rows and study with 20000 sample rows.
+    Expected result:
+        Studies are labelled as small and large.
+    """
+    model = MetabolightsStudyModel()
+    assert get_study_size_bucket(model) == "small"
+    samples_file = SamplesFile()
+    samples_file.table.row_count = 20000
+    model.samples["s_MTBLS1.txt"] = samples_file
+    assert get_study_size_bucket(model) == "large"
+
+
+def test_histogram_01():
+    """_summary_
+    Case:
+        Values are observed with two label sets.
+    Expected result:
+        Cumulative bucket counts are calculated for each label set.
+    """
+    histogram = Histogram("test_duration", ("phase",), buckets=(1, 10))
+    for value in (0.5, 1, 5, 20):
+        histogram.observe(value, phase="a")
+    histogram.observe(2, phase="b")
+
+    assert histogram.get_cumulative_counts(phase="a") == {"1": 2, "10": 3, "+Inf": 4}
+    assert histogram.get_cumulative_counts(phase="b") == {"1": 0, "10": 1, "+Inf": 1}
+    assert histogram.samples[("a",)].sum == 26.5
+    assert histogram.get_cumulative_counts(phase="c") == {}
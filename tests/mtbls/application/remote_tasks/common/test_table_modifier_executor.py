@@ -0,0 +1,61 @@
+from unittest.mock import Mock
+
+import pytest
+from metabolights_utils.models.isa.assay_file import AssayFile
+from metabolights_utils.models.metabolights.model import MetabolightsStudyModel
+
+from mtbls.application.remote_tasks.common import run_modifier
+from mtbls.application.remote_tasks.common.run_modifier import (
+    create_table_modifier_executor,
+)
+from mtbls.domain.shared.validator.run_configuration import (
+    ValidationRunConfiguration,
+)
+
+
+def create_model(assay_count: int) -> MetabolightsStudyModel:
+    model = MetabolightsStudyModel()
+    for idx in range(assay_count):
+        model.assays[f"a_{idx}.txt"] = AssayFile(file_path=f"a_{idx}.txt")
+    return model
+
+
+def test_create_table_modifier_executor_01():
+    """_summary_
+    Case:
+        Parallel table modifiers are not enabled.
+    Expected result:
+        No executor is created.
+    """
+    config = ValidationRunConfiguration()
+    with create_table_modifier_executor(create_model(4), config) as executor:
+        assert executor is None
+
+
+def test_create_table_modifier_executor_02():
+    """_summary_
+    Case:
+        Parallel table modifiers are enabled and study has only one assay file.
+    Expected result:
+        No executor is created.
+    """
+    config = ValidationRunConfiguration(parallel_table_modifiers=True)
+    with create_table_modifier_executor(create_model(1), config) as executor:
+        assert executor is None
+
+
+def test_create_table_modifier_executor_03(monkeypatch: pytest.MonkeyPatch):
+    """_summary_
+    Case:
+        Parallel table modifiers are enabled and study has three assay files.
+    Expected result:
+        Process pool is created with number of tables as max workers.
+    """
+    executor_class = Mock()
+    monkeypatch.setattr(run_modifier, "ProcessPoolExecutor", executor_class)
+    config = ValidationRunConfiguration(
+        parallel_table_modifiers=True, max_parallel_table_modifiers=8
+    )
+    executor = create_table_modifier_executor(create_model(3), config)
+    assert executor is executor_class.return_value
+    assert executor_class.call_args.kwargs["max_workers"] == 3
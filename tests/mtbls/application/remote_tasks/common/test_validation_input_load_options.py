@@ -0,0 +1,49 @@
+from mtbls.application.remote_tasks.common.run_validation import (
+    get_input_data_load_options,
+    is_modifier_model_reusable,
+)
+from mtbls.domain.shared.validator.run_configuration import (
+    ValidationRunConfiguration,
+)
+from mtbls.domain.shared.validator.types import ValidationPhase
+
+
+def test_get_input_data_load_options_01():
+    """_summary_
+    Case:
+        Only phase 1 and phase 4 are selected.
+    Expected result:
+        Only folder and database metadata are loaded.
+    """
+    load_options = get_input_data_load_options(
+        [ValidationPhase.PHASE_1, ValidationPhase.PHASE_4]
+    )
+    assert load_options == {
+        "load_sample_file": False,
+        "load_assay_files": False,
+        "load_maf_files": False,
+        "load_folder_metadata": True,
+        "load_db_metadata": True,
+    }
+
+
+def test_is_modifier_model_reusable_01():
+    """_summary_
+    Case:
+        All phases are selected and MAF file modification is skipped.
+    Expected result:
+        Modified model is reused because MAF files are reloaded.
+    """
+    config = ValidationRunConfiguration(skip_result_file_modification=True)
+    assert is_modifier_model_reusable(config)
+
+
+def test_is_modifier_model_reusable_02():
+    """_summary_
+    Case:
+        Only phase 1 is selected.
+    Expected result:
+        Modified model is not reused because it has ISA tables and folder metadata.
+    """
+    config = ValidationRunConfiguration(validation_phases=[ValidationPhase.PHASE_1])
+    assert not is_modifier_model_reusable(config)
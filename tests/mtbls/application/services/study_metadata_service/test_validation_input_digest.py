@@ -0,0 +1,108 @@
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from mtbls.application.services.interfaces.policy_service import PolicyService
+from mtbls.application.services.study_metadata_service.validation_input_digest import (
+    ValidationInputDigestCalculator,
+)
+from mtbls.domain.entities.study_file import StudyDataFileOutput
+
+
+def create_policy_object(content: str) -> Mock:
+    item = Mock()
+    item.validation_version = "1.0"
+    item.model_dump_json.return_value = content
+    return item
+
+
+@pytest.fixture
+def policy_service() -> PolicyService:
+    service = Mock(spec=PolicyService)
+    service.get_rule_definitions = AsyncMock(return_value=create_policy_object(""))
+    service.get_templates = AsyncMock(return_value=create_policy_object("{}"))
+    service.get_control_lists = AsyncMock(return_value=create_policy_object("{}"))
+    return service
+
+
+def create_calculator(policy_service: PolicyService) -> ValidationInputDigestCalculator:
+    return ValidationInputDigestCalculator(
+        metadata_files_object_repository=Mock(),
+        internal_files_object_repository=Mock(),
+        study_read_repository=Mock(),
+        user_read_repository=Mock(),
+        policy_service=policy_service,
+        validation_override_service=Mock(),
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_policy_version_01(policy_service: PolicyService):
+    """_summary_
+    Case:
+        Policy service returns the same configuration objects twice.
+    Expected result:
+        Configuration is serialized once and the same digest is returned.
+    """
+    calculator = create_calculator(policy_service)
+    templates = await policy_service.get_templates()
+
+    first = await calculator.get_policy_version()
+    second = await calculator.get_policy_version()
+
+    assert first == second
+    assert templates.model_dump_json.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_get_policy_version_02(policy_service: PolicyService):
+    """_summary_
+    Case:
+        Policy service fetches new control lists.
+    Expected result:
+        Digest is calculated again and it is changed.
+    """
+    calculator = create_calculator(policy_service)
+    first = await calculator.get_policy_version()
+    policy_service.get_control_lists.return_value = create_policy_object('{"a": 1}')
+
+    second = await calculator.get_policy_version()
+
+    assert first != second
+
+
+@pytest.mark.asyncio
+async def test_calculate_01(policy_service: PolicyService):
+    """_summary_
+    Case:
+        Modification time of an investigation file is changed.
+    Expected result:
+        Digest is changed and file contents are not read.
+    """
+    calculator = create_calculator(policy_service)
+    file = StudyDataFileOutput(
+        basename="i_Investigation.txt",
+        object_key="i_Investigation.txt",
+        size_in_bytes=10,
+        updated_at="2025-01-01T00:00:00",
+    )
+    metadata_repository = calculator.metadata_files_object_repository
+    metadata_repository.list = AsyncMock(return_value=[file])
+    calculator.internal_files_object_repository.get_info = AsyncMock(return_value=None)
+    db_metadata = Mock()
+    db_metadata.model_dump_json.return_value = "{}"
+    calculator.db_metadata_collector.get_study_metadata_from_db = AsyncMock(
+        return_value=(db_metadata, [])
+    )
+    overrides = Mock()
+    overrides.model_dump_json.return_value = "[]"
+    calculator.validation_override_service.get_validation_overrides = AsyncMock(
+        return_value=overrides
+    )
+
+    first = await calculator.calculate("MTBLS1", apply_modifiers=True)
+    file.updated_at = "2025-01-02T00:00:00"
+    second = await calculator.calculate("MTBLS1", apply_modifiers=True)
+
+    assert first != second
+    metadata_repository.get_content.assert_not_called()
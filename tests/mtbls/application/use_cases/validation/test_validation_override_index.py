@@ -0,0 +1,112 @@
+import random
+
+import pytest
+
+from mtbls.application.use_cases.validation.validation_reports import (
+    ValidationOverrideIndex,
+    match_override,
+)
+from mtbls.domain.shared.validator.policy import PolicyMessage
+from mtbls.domain.shared.validator.validation import ValidationOverride
+
+RULE_IDS = ["rule_a_100_001_001_01", "rule_a_100_001_001_02"]
+FILES = ["", "s_MTBLS1.txt", "a_MTBLS1.txt"]
+HEADERS = ["", "Source Name", "Sample Name"]
+COLUMN_INDICES = ["", 0, 1, "1"]
+
+
+def create_override(rnd: random.Random, position: int) -> ValidationOverride:
+    return ValidationOverride(
+        override_id=str(position),
+        rule_id=rnd.choice(RULE_IDS),
+        source_file=rnd.choice(FILES),
+        source_column_header=rnd.choice(HEADERS),
+        source_column_index=rnd.choice(COLUMN_INDICES),
+        enabled=rnd.random() > 0.2,
+    )
+
+
+def create_violation(rnd: random.Random) -> PolicyMessage:
+    return PolicyMessage(
+        identifier=rnd.choice(RULE_IDS),
+        source_file=rnd.choice(FILES),
+        source_column_header=rnd.choice(HEADERS),
+        source_column_index=rnd.choice(COLUMN_INDICES),
+    )
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_validation_override_index_property_01(seed: int):
+    """_summary_
+    Case:
+        Random overrides and violations.
+    Expected result:
+        Index returns same override as match_override.
+    """
+    rnd = random.Random(seed)
+    overrides = [create_override(rnd, i) for i in range(rnd.randint(0, 12))]
+    # overrides are matched with enabled overrides of the violation's rule.
+    overrides_map: dict[str, list[ValidationOverride]] = {}
+    for override in overrides:
+        if override.enabled:
+            overrides_map.setdefault(override.rule_id, []).append(override)
+    index = ValidationOverrideIndex(overrides)
+    for _ in range(50):
+        violation = create_violation(rnd)
+        expected = match_override(
+            overrides_map.get(violation.identifier, []), violation
+        )
+        actual = index.match(violation)
+        assert (expected.override_id if expected else None) == (
+            actual.override_id if actual else None
+        )
+
+
+def test_validation_override_index_01():
+    """_summary_
+    Case:
+        First override matches three conditions and the second override
+        matches only rule id.
+    Expected result:
+        Matched conditions are counted for all overrides of the rule,
+        so the second override is selected.
+    """
+    violation = PolicyMessage(
+        identifier=RULE_IDS[0],
+        source_file="s_MTBLS1.txt",
+        source_column_header="Source Name",
+        source_column_index=1,
+    )
+    overrides = [
+        ValidationOverride(
+            override_id="1",
+            rule_id=RULE_IDS[0],
+            source_file="s_MTBLS1.txt",
+            source_column_header="Sample Name",
+            source_column_index=1,
+        ),
+        ValidationOverride(
+            override_id="2",
+            rule_id=RULE_IDS[0],
+            source_file="a_MTBLS1.txt",
+            source_column_header="Sample Name",
+            source_column_index=2,
+        ),
+    ]
+    assert match_override(overrides, violation).override_id == "2"
+    assert ValidationOverrideIndex(overrides).match(violation).override_id == "2"
+
+
+def test_validation_override_index_02():
+    """_summary_
+    Case:
+        A rule has more than four enabled overrides.
+    Expected result:
+        Only the first four overrides are stored.
+    """
+    overrides = [
+        ValidationOverride(override_id=str(i), rule_id=RULE_IDS[0]) for i in range(6)
+    ]
+    overrides[0].enabled = False
+    index = ValidationOverrideIndex(overrides)
+    assert [x.override_id for x in index.index[RULE_IDS[0]]] == ["1", "2", "3", "4"]
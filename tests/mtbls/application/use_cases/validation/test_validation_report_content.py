@@ -0,0 +1,48 @@
+import pytest
+
+from mtbls.application.use_cases.validation.validation_task import (
+    get_report_content_from_summary_report,
+    iterate_report_content,
+)
+from mtbls.domain.shared.validator.policy import PolicyMessage, PolicySummaryResult
+from mtbls.domain.shared.validator.types import PolicyMessageType
+
+
+def create_summary_result(violation_count: int) -> PolicySummaryResult:
+    result = PolicySummaryResult(resource_id="MTBLS1")
+    for i in range(violation_count):
+        result.messages.violations.append(
+            PolicyMessage(
+                identifier=f"rule_{i % 10}",
+                type=PolicyMessageType.ERROR if i % 2 else PolicyMessageType.WARNING,
+                source_file="s_MTBLS1.txt",
+                violation=f"violation {i}",
+            )
+        )
+    return result
+
+
+@pytest.mark.asyncio
+async def test_iterate_report_content_01():
+    """_summary_
+    Case:
+        A report with many violations is iterated in chunks.
+    Expected result:
+        Chunks are not larger than chunk size plus one row and
+        joined chunks are same as report content.
+    """
+    summary_result = create_summary_result(5000)
+    content = await get_report_content_from_summary_report(
+        summary_result, min_violation_level=PolicyMessageType.ERROR
+    )
+    chunks = list(
+        iterate_report_content(
+            summary_result,
+            min_violation_level=PolicyMessageType.ERROR,
+            chunk_size_in_bytes=4096,
+        )
+    )
+    assert len(chunks) > 1
+    assert all(len(x) < 4096 + 1024 for x in chunks)
+    assert "".join(chunks) == content
+    assert content.count("\n") == 2501
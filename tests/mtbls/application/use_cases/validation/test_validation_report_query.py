@@ -0,0 +1,122 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from mtbls.application.services.interfaces.validation_report_service import (
+    ValidationReportService,
+)
+from mtbls.application.use_cases.validation import validation_report_query
+from mtbls.application.use_cases.validation.validation_report_query import (
+    create_validation_report_index,
+    query_validation_report,
+)
+from mtbls.domain.shared.validator.policy import (
+    PolicyMessage,
+    PolicySummaryResult,
+    ValidationResult,
+)
+from mtbls.domain.shared.validator.types import PolicyMessageType
+
+
+def create_report() -> PolicySummaryResult:
+    violations = []
+    for i in range(10):
+        violations.append(
+            PolicyMessage(
+                identifier=f"rule_{i % 3}",
+                type=PolicyMessageType.ERROR if i % 2 else PolicyMessageType.WARNING,
+                source_file="s_MTBLS1.txt" if i < 6 else "a_MTBLS1.txt",
+                source_column_header="Sample Name" if i % 4 else "",
+                violation=str(i),
+            )
+        )
+    return PolicySummaryResult(
+        resource_id="MTBLS1", messages=ValidationResult(violations=violations)
+    )
+
+
+def create_service(report: PolicySummaryResult, stored_index=None):
+    validation_report_query.loaded_report_indices.clear()
+    service = AsyncMock(spec=ValidationReportService)
+    service.load_validation_report_by_task_id.return_value = report
+    service.load_validation_report_index.return_value = stored_index
+    service.save_validation_report_index.return_value = False
+    service.load_validation_report_messages.return_value = None
+    return service
+
+
+@pytest.mark.asyncio
+async def test_query_validation_report_01():
+    """_summary_
+    Case:
+        Filters of two facets with multiple values and pagination.
+    Expected result:
+        Values of a facet are joined with OR and facets with AND.
+        Facet counts ignore the filter of the same facet.
+    """
+    report = create_report()
+    service = create_service(report)
+    page = await query_validation_report(
+        "MTBLS1",
+        "task-1",
+        service,
+        message_types=["ERROR"],
+        rule_ids=["rule_0", "rule_1"],
+        offset=1,
+        limit=2,
+    )
+    # ERROR: 1, 3, 5, 7, 9 - rule_0 or rule_1: 0, 1, 3, 4, 6, 7, 9
+    assert page.total == 4
+    assert [x.violation for x in page.messages] == ["3", "7"]
+    assert page.facet_counts["type"] == {"ERROR": 4, "WARNING": 3}
+    assert page.facet_counts["ruleId"] == {"rule_0": 2, "rule_1": 2, "rule_2": 1}
+    assert page.facet_counts["sourceFile"] == {"s_MTBLS1.txt": 2, "a_MTBLS1.txt": 2}
+
+
+@pytest.mark.asyncio
+async def test_query_validation_report_02():
+    """_summary_
+    Case:
+        Stored report index has message blocks and report is queried twice.
+    Expected result:
+        Index is loaded once, page messages are read from message blocks
+        and the report is not loaded.
+    """
+    report = create_report()
+    violations = report.messages.violations
+    stored_index = create_validation_report_index("task-1", report)
+    stored_index.message_block_size = 1000
+    stored_index.message_block_offsets = [0, 100]
+    service = create_service(report, stored_index)
+    service.load_validation_report_messages.side_effect = (
+        lambda resource_id, task_id, report_index, positions: [
+            violations[x] for x in positions
+        ]
+    )
+    page = await query_validation_report(
+        "MTBLS1", "task-1", service, source_files=["a_MTBLS1.txt"], columns=[""]
+    )
+    assert [x.violation for x in page.messages] == ["8"]
+    page = await query_validation_report("MTBLS1", "task-1", service, limit=0)
+    assert page.total == 10
+    assert len(page.messages) == 10
+    service.load_validation_report_index.assert_awaited_once()
+    service.load_validation_report_by_task_id.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_query_validation_report_03():
+    """_summary_
+    Case:
+        Stored report index has no message blocks.
+    Expected result:
+        Report is loaded and index is saved with messages of the report.
+    """
+    report = create_report()
+    stored_index = create_validation_report_index("task-1", report)
+    service = create_service(report, stored_index)
+    page = await query_validation_report("MTBLS1", "task-1", service, limit=3)
+    assert [x.violation for x in page.messages] == ["0", "1", "2"]
+    service.load_validation_report_by_task_id.assert_awaited_once()
+    kwargs = service.save_validation_report_index.await_args.kwargs
+    assert kwargs["messages"] == report.messages.violations
@@ -17,7 +17,6 @@ from mtbls.application.use_cases.validation.validation_task import (
     start_study_validation_task,
 )
 from mtbls.domain.exceptions.async_task import (
-    AsyncTaskAlreadyStartedError,
     AsyncTaskResultExistsError,
     AsyncTaskStartFailure,
 )
@@ -79,7 +78,7 @@ async def test_start_study_validation_task_02(
     Case:
         There is a task that is still running
     Expected result:
-        Task will not start.  AsyncTaskAlreadyStartedError
+        Task will not start. Request is attached to the running task.
     """
 
     task_id = "initial-task-id"
@@ -94,19 +93,20 @@ async def test_start_study_validation_task_02(
     async_task_service.get_async_task_result.return_value = result
 
     resource_id = ms_metabolights_model.investigation.studies[0].identifier
-    with pytest.raises(AsyncTaskAlreadyStartedError) as x:
-        await start_study_validation_task(
-            resource_id=resource_id,
-            cache_service=cache_service,
-            apply_modifiers=False,
-            async_task_service=async_task_service,
-            override_ready_task_results=False,
-            cache_expiration_in_seconds=60,
-        )
-        assert x.value.args[0] == resource_id
-        assert x.value.args[1] == task_id
-        async_task_service.get_async_task.assert_not_called()
-        async_task_service.get_async_task_result.assert_called()
+    status = await start_study_validation_task(
+        resource_id=resource_id,
+        cache_service=cache_service,
+        apply_modifiers=False,
+        async_task_service=async_task_service,
+        override_ready_task_results=False,
+        cache_expiration_in_seconds=60,
+    )
+    assert status.task_id == task_id
+    assert status.task_status == "running"
+    assert not status.ready
+    async_task_service.get_async_task.assert_not_called()
+    cache_service.delete_key.assert_not_called()
+    result.revoke.assert_not_called()
 
 
 @pytest.mark.asyncio
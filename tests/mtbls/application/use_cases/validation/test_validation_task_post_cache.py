@@ -0,0 +1,175 @@
+import json
+from unittest.mock import Mock
+
+import pytest
+
+from mtbls.application.services.interfaces.async_task.async_task_executor import (
+    AsyncTaskExecutor,
+)
+from mtbls.application.services.interfaces.async_task.async_task_result import (
+    AsyncTaskResult,
+)
+from mtbls.application.services.interfaces.async_task.async_task_service import (
+    AsyncTaskService,
+)
+from mtbls.application.services.interfaces.cache_service import CacheService
+from mtbls.application.services.interfaces.validation_report_service import (
+    ValidationReportService,
+)
+from mtbls.application.services.study_metadata_service.validation_input_digest import (
+    ValidationInputDigestCalculator,
+)
+from mtbls.application.use_cases.validation.validation_task import (
+    start_study_validation_task,
+)
+from mtbls.domain.exceptions.repository import StudyObjectNotFoundError
+from mtbls.domain.shared.async_task.async_task_summary import AsyncTaskStatus
+from mtbls.domain.shared.validation_result_file import ValidationResultFile
+
+
+@pytest.fixture(scope="function")
+def validation_input_digest_calculator() -> ValidationInputDigestCalculator:
+    calculator = Mock(spec=ValidationInputDigestCalculator)
+    calculator.calculate.return_value = "digest-01"
+    return calculator
+
+
+def create_executor(async_task_service: AsyncTaskService, task_id: str):
+    result: AsyncTaskResult = Mock(spec=AsyncTaskResult)
+    result.get_id.return_value = task_id
+    result.is_successful.return_value = False
+    result.get_status.return_value = "PENDING"
+    result.is_ready.return_value = False
+    executor: AsyncTaskExecutor = Mock(spec=AsyncTaskExecutor)
+    executor.start.return_value = result
+    async_task_service.get_async_task.return_value = executor
+    async_task_service.get_async_task_result.return_value = result
+    return executor
+
+
+@pytest.mark.asyncio
+async def test_start_study_validation_task_cache_01(
+    cache_service: CacheService,
+    async_task_service: AsyncTaskService,
+    validation_report_service: ValidationReportService,
+    validation_input_digest_calculator: ValidationInputDigestCalculator,
+):
+    """_summary_
+    Case:
+        Validation inputs are not changed and report of the previous task exists.
+    Expected result:
+        Previous task status is returned, new task is not started and
+        previous task is not stored as current task.
+    """
+    cached_value = json.dumps({"digest": "digest-01", "task_id": "task-01"})
+    cache_service.get_value.side_effect = ["", cached_value]
+    validation_report_service.find_by_task_id.return_value = ValidationResultFile(
+        task_id="task-01", validation_time="2025-01-01_00-00-00"
+    )
+    executor = create_executor(async_task_service, "task-02")
+
+    status: AsyncTaskStatus = await start_study_validation_task(
+        resource_id="MTBLS1",
+        cache_service=cache_service,
+        async_task_service=async_task_service,
+        validation_input_digest_calculator=validation_input_digest_calculator,
+        validation_report_service=validation_report_service,
+    )
+    executor.start.assert_not_called()
+    assert status.task_id == "task-01"
+    assert status.ready
+    assert status.is_successful
+    cache_service.set_value.assert_not_called()
+    cache_service.delete_key.assert_called_once_with("validation_task:current:MTBLS1")
+
+
+@pytest.mark.asyncio
+async def test_start_study_validation_task_cache_02(
+    cache_service: CacheService,
+    async_task_service: AsyncTaskService,
+    validation_report_service: ValidationReportService,
+    validation_input_digest_calculator: ValidationInputDigestCalculator,
+):
+    """_summary_
+    Case:
+        Validation inputs are changed.
+    Expected result:
+        New task is started and its input digest is stored.
+    """
+    cached_value = json.dumps({"digest": "digest-00", "task_id": "task-01"})
+    cache_service.get_value.side_effect = ["", cached_value]
+    executor = create_executor(async_task_service, "task-02")
+
+    status: AsyncTaskStatus = await start_study_validation_task(
+        resource_id="MTBLS1",
+        cache_service=cache_service,
+        async_task_service=async_task_service,
+        validation_input_digest_calculator=validation_input_digest_calculator,
+        validation_report_service=validation_report_service,
+    )
+    executor.start.assert_called_once()
+    validation_report_service.find_by_task_id.assert_not_called()
+    assert status.task_id == "task-02"
+    stored_value = cache_service.set_value.call_args_list[-1].kwargs["value"]
+    assert json.loads(stored_value) == {"digest": "digest-01", "task_id": "task-02"}
+
+
+@pytest.mark.asyncio
+async def test_start_study_validation_task_cache_03(
+    cache_service: CacheService,
+    async_task_service: AsyncTaskService,
+    validation_report_service: ValidationReportService,
+    validation_input_digest_calculator: ValidationInputDigestCalculator,
+):
+    """_summary_
+    Case:
+        Validation inputs are not changed but report of the previous task
+        is not stored.
+    Expected result:
+        New task is started.
+    """
+    cached_value = json.dumps({"digest": "digest-01", "task_id": "task-01"})
+    cache_service.get_value.side_effect = ["", cached_value]
+    validation_report_service.find_by_task_id.side_effect = StudyObjectNotFoundError(
+        "MTBLS1", "internal", "validation-history__*__task-01.json"
+    )
+    executor = create_executor(async_task_service, "task-02")
+
+    status: AsyncTaskStatus = await start_study_validation_task(
+        resource_id="MTBLS1",
+        cache_service=cache_service,
+        async_task_service=async_task_service,
+        validation_input_digest_calculator=validation_input_digest_calculator,
+        validation_report_service=validation_report_service,
+    )
+    executor.start.assert_called_once()
+    assert status.task_id == "task-02"
+
+
+@pytest.mark.asyncio
+async def test_start_study_validation_task_cache_04(
+    cache_service: CacheService,
+    async_task_service: AsyncTaskService,
+    validation_report_service: ValidationReportService,
+    validation_input_digest_calculator: ValidationInputDigestCalculator,
+):
+    """_summary_
+    Case:
+        Validation input digest calculation fails.
+    Expected result:
+        New task is started and no digest is stored.
+    """
+    cache_service.get_value.return_value = ""
+    validation_input_digest_calculator.calculate.side_effect = ValueError()
+    executor = create_executor(async_task_service, "task-02")
+
+    status: AsyncTaskStatus = await start_study_validation_task(
+        resource_id="MTBLS1",
+        cache_service=cache_service,
+        async_task_service=async_task_service,
+        validation_input_digest_calculator=validation_input_digest_calculator,
+        validation_report_service=validation_report_service,
+    )
+    executor.start.assert_called_once()
+    cache_service.set_value.assert_called_once()
+    assert status.task_id == "task-02"
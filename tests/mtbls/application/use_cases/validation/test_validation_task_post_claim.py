@@ -0,0 +1,184 @@
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+
+from mtbls.application.services.interfaces.async_task.async_task_executor import (
+    AsyncTaskExecutor,
+)
+from mtbls.application.services.interfaces.async_task.async_task_result import (
+    AsyncTaskResult,
+)
+from mtbls.application.services.interfaces.async_task.async_task_service import (
+    AsyncTaskService,
+)
+from mtbls.application.services.interfaces.cache_service import CacheService
+from mtbls.application.use_cases.validation.validation_task import (
+    VALIDATION_TASK_CLAIM_VALUE,
+    start_study_validation_task,
+)
+from mtbls.domain.enums.async_task_priority import AsyncTaskPriority
+from mtbls.domain.exceptions.async_task import AsyncTaskAlreadyStartedError
+from mtbls.infrastructure.caching.in_memory.in_memory_cache import InMemoryCacheImpl
+
+
+def create_executor(async_task_service: AsyncTaskService, task_id: str):
+    result: AsyncTaskResult = Mock(spec=AsyncTaskResult)
+    result.get_id.return_value = task_id
+    result.is_successful.return_value = False
+    result.get_status.return_value = "PENDING"
+    result.is_ready.return_value = False
+    executor: AsyncTaskExecutor = Mock(spec=AsyncTaskExecutor)
+
+    async def start(*args, **kwargs):
+        await asyncio.sleep(0.05)
+        return result
+
+    executor.start.side_effect = start
+    async_task_service.get_async_task.return_value = executor
+    async_task_service.get_async_task_result.return_value = result
+    return executor
+
+
+@pytest.mark.asyncio
+async def test_start_study_validation_task_claim_01(
+    async_task_service: AsyncTaskService,
+):
+    """_summary_
+    Case:
+        Two requests start validation of the same study at the same time.
+    Expected result:
+        Only one task is started and the second request attaches to it.
+    """
+    cache_service = InMemoryCacheImpl()
+    create_executor(async_task_service, "task-01")
+
+    statuses = await asyncio.gather(
+        *[
+            start_study_validation_task(
+                resource_id="MTBLS1",
+                async_task_service=async_task_service,
+                cache_service=cache_service,
+                claim_wait_timeout_in_seconds=1,
+            )
+            for _ in range(2)
+        ]
+    )
+    async_task_service.get_async_task.assert_called_once()
+    assert [x.task_id for x in statuses] == ["task-01", "task-01"]
+    assert await cache_service.get_value("validation_task:current:MTBLS1") == "task-01"
+
+
+@pytest.mark.asyncio
+async def test_start_study_validation_task_claim_02(
+    async_task_service: AsyncTaskService,
+):
+    """_summary_
+    Case:
+        Another request claimed the study but it does not publish its task id.
+    Expected result:
+        AsyncTaskAlreadyStartedError and no new task is started.
+    """
+    cache_service = InMemoryCacheImpl()
+    await cache_service.set_value(
+        "validation_task:current:MTBLS1", VALIDATION_TASK_CLAIM_VALUE, 60
+    )
+    create_executor(async_task_service, "task-01")
+
+    with pytest.raises(AsyncTaskAlreadyStartedError):
+        await start_study_validation_task(
+            resource_id="MTBLS1",
+            async_task_service=async_task_service,
+            cache_service=cache_service,
+            claim_wait_timeout_in_seconds=0.1,
+        )
+    async_task_service.get_async_task.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_start_study_validation_task_claim_03(
+    cache_service: CacheService,
+    async_task_service: AsyncTaskService,
+):
+    """_summary_
+    Case:
+        Task fails to start after the study is claimed.
+    Expected result:
+        Claim is released.
+    """
+    cache_service.get_value.return_value = ""
+    cache_service.set_value_if_not_exists.return_value = True
+    executor = create_executor(async_task_service, "task-01")
+    executor.start.side_effect = Exception("broker is not available")
+
+    with pytest.raises(Exception, match="broker is not available"):
+        await start_study_validation_task(
+            resource_id="MTBLS1",
+            async_task_service=async_task_service,
+            cache_service=cache_service,
+        )
+    cache_service.delete_key.assert_called_once_with("validation_task:current:MTBLS1")
+    cache_service.set_value.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_start_study_validation_task_claim_04(
+    cache_service: CacheService,
+    async_task_service: AsyncTaskService,
+):
+    """_summary_
+    Case:
+        Validation task is started with batch priority.
+    Expected result:
+        Task is started with the batch priority.
+    """
+    cache_service.get_value.return_value = ""
+    cache_service.set_value_if_not_exists.return_value = True
+    executor = create_executor(async_task_service, "task-01")
+
+    status = await start_study_validation_task(
+        resource_id="MTBLS1",
+        async_task_service=async_task_service,
+        cache_service=cache_service,
+        priority=AsyncTaskPriority.BATCH,
+    )
+    assert status.task_id == "task-01"
+    executor.start.assert_called_once_with(priority=AsyncTaskPriority.BATCH)
+    assert AsyncTaskPriority.BATCH > AsyncTaskPriority.INTERACTIVE
+
+
+@pytest.mark.asyncio
+async def test_start_study_validation_task_claim_05(
+    async_task_service: AsyncTaskService,
+):
+    """_summary_
+    Case:
+        A validation task was started and it is still running.
+        The same study is requested again later with override_ready_task_results.
+    Expected result:
+        Running task is not revoked and no new task is started.
+        Second request returns the running task.
+    """
+    cache_service = InMemoryCacheImpl()
+    create_executor(async_task_service, "task-01")
+    first = await start_study_validation_task(
+        resource_id="MTBLS1",
+        async_task_service=async_task_service,
+        cache_service=cache_service,
+        cache_expiration_in_seconds=600,
+    )
+    key = "validation_task:current:MTBLS1"
+    await cache_service.set_value(key, first.task_id, 30)
+
+    second = await start_study_validation_task(
+        resource_id="MTBLS1",
+        async_task_service=async_task_service,
+        cache_service=cache_service,
+        override_ready_task_results=True,
+        cache_expiration_in_seconds=600,
+    )
+    async_task_service.get_async_task.assert_called_once()
+    running_task = async_task_service.get_async_task_result.return_value
+    running_task.revoke.assert_not_called()
+    assert second.task_id == "task-01"
+    assert second.message == "Attached to the current validation task."
@@ -0,0 +1,93 @@
+import pytest
+
+from mtbls.domain.domain_services.modifier.column_update_handler import (
+    IsaTableColumnUpdateHandler,
+    get_row_ranges,
+)
+from tests.mtbls.mocks.modifier.sample_table_modifier import (
+    SampleTableModifier,
+    create_sample_file,
+)
+
+
+@pytest.mark.parametrize(
+    ("rows", "expected"),
+    [
+        ([], ""),
+        ([3], "3"),
+        ([1, 2, 3, 5, 8, 9], "1-3, 5, 8-9"),
+        ([9, 8, 2, 1, 2], "1-2, 8-9"),
+    ],
+)
+def test_get_row_ranges_01(rows: list[int], expected: str):
+    """_summary_
+    Case:
+        Row numbers are unordered, duplicated or consecutive.
+    Expected result:
+        Consecutive row numbers are merged into ranges.
+    """
+    assert get_row_ranges(rows) == expected
+
+
+def test_get_isa_table_update_logs_01():
+    """_summary_
+    Case:
+        Cells of a column are updated with two old and new value pairs.
+    Expected result:
+        Compact log has cell counts of each pair without row ranges.
+        Detailed log has row ranges of each pair.
+    """
+    sample_file = create_sample_file(row_count=10, seed=1)
+    header = sample_file.table.headers[0]
+    handler = IsaTableColumnUpdateHandler(isa_table_file=sample_file)
+    handler.update_isa_table_cells(header, " a", "a", [0, 1, 2, 7])
+    handler.update_isa_table_cells(header, "b ", "b", [4])
+
+    compact_logs = handler.get_isa_table_update_logs(limit=1)
+    detailed_logs = handler.get_isa_table_update_logs(limit=1, detailed=True)
+
+    assert len(compact_logs) == 1
+    assert compact_logs[0].updated_cell_count == 5
+    assert [(x.old_value, x.count, x.rows) for x in compact_logs[0].value_updates] == [
+        (" a", 4, "")
+    ]
+    assert detailed_logs[0].updated_cell_count == 5
+    assert [(x.new_value, x.rows) for x in detailed_logs[0].value_updates] == [
+        ("a", "1-3, 8"),
+        ("b", "5"),
+    ]
+    assert sample_file.table.data[header.column_name][7] == "a"
+
+
+def test_get_isa_table_update_logs_02():
+    """_summary_
+    Case:
+        Whitespace cleanup on a large sample table with compact logs.
+    Expected result:
+        There is one log for each updated column and counts match updated cells.
+    """
+    sample_file = create_sample_file(row_count=20000, seed=3)
+    original = sample_file.model_copy(deep=True)
+    update_logs = SampleTableModifier(sample_file).remove_trailing_and_prefix_spaces()
+
+    cell_logs = [x for x in update_logs if x.updated_cell_count]
+    assert cell_logs
+    assert len({x.action for x in cell_logs}) == len(cell_logs)
+    for update_log in cell_logs:
+        assert len(update_log.value_updates) <= 5
+        assert all(not x.rows for x in update_log.value_updates)
+        header = update_log.action.split("] ", 1)[1]
+        column = next(
+            x.column_name
+            for x in sample_file.table.headers
+            if x.column_header == header
+            and f"[column {x.column_index + 1}]" in update_log.action
+        )
+        changed = sum(
+            1
+            for x, y in zip(
+                original.table.data[column], sample_file.table.data[column], strict=True
+            )
+            if x != y
+        )
+        assert update_log.updated_cell_count == changed
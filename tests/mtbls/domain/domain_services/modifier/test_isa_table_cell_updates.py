@@ -0,0 +1,55 @@
+import pytest
+
+from mtbls.domain.domain_services.modifier.column_values import (
+    factorize_columns,
+    find_column_value_updates,
+)
+from tests.mtbls.mocks.modifier.sample_table_modifier import (
+    CellByCellSampleTableModifier,
+    SampleTableModifier,
+    create_sample_file,
+)
+
+
+def test_factorize_columns_01():
+    """_summary_
+    Case:
+        Two columns with repeated row values.
+    Expected result:
+        Codes are numbered by first appearance of each distinct row value.
+    """
+    codes, values, first_rows = factorize_columns(
+        ["a", "b", "a", "a", "b"], ["x", "x", "x", "y", "x"]
+    )
+    assert codes == [0, 1, 0, 2, 1]
+    assert values == [("a", "x"), ("b", "x"), ("a", "y")]
+    assert first_rows == [0, 1, 3]
+
+
+def test_find_column_value_updates_01():
+    """_summary_
+    Case:
+        Column values with leading and trailing spaces.
+    Expected result:
+        Each distinct value is updated once with all of its rows.
+    """
+    updates = find_column_value_updates([" a", "b", " a", "c ", "b"], str.strip)
+    assert updates == [(" a", "a", [0, 2]), ("c ", "c", [3])]
+    assert find_column_value_updates([], str.strip) == []
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_isa_table_cell_updates_01(seed: int):
+    """_summary_
+    Case:
+        Random sample table with spaces, quotes and ontology terms to update.
+    Expected result:
+        Update logs and table data are same as cell by cell implementation.
+    """
+    sample_file = create_sample_file(row_count=300, seed=seed)
+    expected_file = sample_file.model_copy(deep=True)
+    update_logs = SampleTableModifier(sample_file).modify()
+    expected_update_logs = CellByCellSampleTableModifier(expected_file).modify()
+
+    assert update_logs == expected_update_logs
+    assert sample_file.table.data == expected_file.table.data
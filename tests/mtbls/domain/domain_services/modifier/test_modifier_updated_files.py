@@ -0,0 +1,116 @@
+from unittest.mock import Mock
+
+from metabolights_utils.models.isa.assay_file import AssayFile
+from metabolights_utils.models.isa.assignment_file import AssignmentFile
+from metabolights_utils.models.isa.samples_file import SamplesFile
+from metabolights_utils.models.metabolights.model import MetabolightsStudyModel
+from metabolights_utils.tsv.model import TsvUpdateColumnHeaderAction
+
+from mtbls.domain.domain_services.modifier.metabolights_study_model_modifier import (
+    MetabolightsStudyModelModifier,
+)
+from mtbls.domain.entities.validation.validation_configuration import (
+    FileTemplates,
+    ValidationControls,
+)
+from mtbls.domain.shared.modifier import UpdateLog
+from mtbls.domain.shared.validator.run_configuration import (
+    ValidationRunConfiguration,
+)
+
+
+def create_modifier(
+    skip_result_file_modification: bool = False,
+) -> MetabolightsStudyModelModifier:
+    model = MetabolightsStudyModel()
+    model.investigation_file_path = "i_Investigation.txt"
+    model.samples["s_MTBLS1.txt"] = SamplesFile(file_path="s_MTBLS1.txt")
+    for name in ("a_MTBLS1_01.txt", "a_MTBLS1_02.txt"):
+        model.assays[name] = AssayFile(file_path=name)
+    model.metabolite_assignments["m_MTBLS1.tsv"] = AssignmentFile(
+        file_path="m_MTBLS1.tsv"
+    )
+    return MetabolightsStudyModelModifier(
+        model=model,
+        templates=Mock(spec=FileTemplates),
+        control_lists=Mock(spec=ValidationControls),
+        config=ValidationRunConfiguration(
+            skip_result_file_modification=skip_result_file_modification
+        ),
+    )
+
+
+def create_log(source: str, action: str = "Update") -> UpdateLog:
+    return UpdateLog(source=source, action=action, old_value="x", new_value="y")
+
+
+def test_get_updated_files_01():
+    """_summary_
+    Case:
+        Update logs refer to sample and one of assay files.
+    Expected result:
+        Only sample and assay files with updates are returned.
+    """
+    modifier = create_modifier()
+    modifier.update_logs = [
+        create_log("s_MTBLS1.txt"),
+        create_log("a_MTBLS1_02.txt"),
+        create_log("s_MTBLS1.txt", action="Strip"),
+    ]
+    assert modifier.get_updated_files() == ["a_MTBLS1_02.txt", "s_MTBLS1.txt"]
+
+
+def test_get_updated_files_02():
+    """_summary_
+    Case:
+        There is no update log.
+    Expected result:
+        Empty list.
+    """
+    modifier = create_modifier()
+    assert modifier.get_updated_files() == []
+
+
+def test_get_updated_files_03():
+    """_summary_
+    Case:
+        Result file modification is skipped and MAF files have skip logs.
+    Expected result:
+        MAF files are not returned.
+    """
+    modifier = create_modifier(skip_result_file_modification=True)
+    modifier.update_logs = [
+        create_log("m_MTBLS1.tsv", action="Modifier skipped this file."),
+        create_log("i_Investigation.txt"),
+    ]
+    assert modifier.get_updated_files() == ["i_Investigation.txt"]
+
+
+def test_get_updated_files_04():
+    """_summary_
+    Case:
+        Source of an update log is not a study file.
+    Expected result:
+        All modifiable files are returned.
+    """
+    modifier = create_modifier()
+    modifier.update_logs = [create_log("s_MTBLS1.txt"), create_log("unknown")]
+    assert modifier.get_updated_files() == [
+        "a_MTBLS1_01.txt",
+        "a_MTBLS1_02.txt",
+        "i_Investigation.txt",
+        "m_MTBLS1.tsv",
+        "s_MTBLS1.txt",
+    ]
+
+
+def test_get_updated_files_05():
+    """_summary_
+    Case:
+        Column header of an assay file is updated without an update log.
+    Expected result:
+        Assay file is returned.
+    """
+    modifier = create_modifier()
+    modifier.header_update_actions["a_MTBLS1_01.txt"] = [TsvUpdateColumnHeaderAction()]
+    assert modifier.get_updated_files() == ["a_MTBLS1_01.txt"]
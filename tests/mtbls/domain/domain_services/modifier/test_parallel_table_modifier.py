@@ -0,0 +1,170 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from metabolights_utils.models.isa.assay_file import AssayFile
+from metabolights_utils.models.isa.assignment_file import AssignmentFile
+from metabolights_utils.models.isa.common import IsaTableColumn
+from metabolights_utils.models.isa.enums import ColumnsStructure
+from metabolights_utils.models.metabolights.model import MetabolightsStudyModel
+from metabolights_utils.models.parser.common import ParserMessage
+
+from mtbls.domain.domain_services.modifier.metabolights_study_model_modifier import (
+    MetabolightsStudyModelModifier,
+)
+from mtbls.domain.domain_services.modifier.parallel_table_modifier import (
+    create_table_modifier_model,
+    run_table_modifiers,
+)
+from mtbls.domain.entities.validation.validation_configuration import (
+    FileTemplates,
+    ValidationControls,
+)
+
+COLUMNS = ["Sample Name", "Protocol REF", "Extract Name", "Raw Spectral Data File"]
+
+
+def create_assay_file(file_path: str, row_count: int = 5) -> AssayFile:
+    assay_file = AssayFile(file_path=file_path)
+    table = assay_file.table
+    for idx, column_name in enumerate(COLUMNS):
+        table.columns.append(column_name)
+        table.headers.append(
+            IsaTableColumn(
+                column_index=idx,
+                column_name=column_name,
+                column_header=column_name,
+                column_structure=ColumnsStructure.SINGLE_COLUMN,
+            )
+        )
+    prefix = file_path.split(".")[0]
+    table.data["Sample Name"] = [f" {prefix}-{x}" for x in range(row_count)]
+    table.data["Protocol REF"] = ["Extraction"] * row_count
+    table.data["Extract Name"] = [f"{prefix}-{x}" for x in range(row_count)]
+    table.data["Raw Spectral Data File"] = [
+        f"raw/{prefix}-{x}.raw" for x in range(row_count)
+    ]
+    table.row_count = row_count
+    return assay_file
+
+
+def create_model(assay_count: int = 3) -> MetabolightsStudyModel:
+    model = MetabolightsStudyModel(investigation_file_path="i_Investigation.txt")
+    for idx in range(assay_count):
+        file_path = f"a_MTBLS1_{idx:02}.txt"
+        model.assays[file_path] = create_assay_file(file_path)
+    model.metabolite_assignments["m_MTBLS1.tsv"] = AssignmentFile(
+        file_path="m_MTBLS1.tsv"
+    )
+    return model
+
+
+def test_create_table_modifier_model_01():
+    """_summary_
+    Case:
+        Create worker model of an assay file with parser messages.
+    Expected result:
+        Worker model contains only the assay table and its parser messages.
+    """
+    model = create_model()
+    model.parser_messages["a_MTBLS1_01.txt"] = [ParserMessage(short="Warning")]
+    model.parser_messages["a_MTBLS1_02.txt"] = [ParserMessage(short="Warning")]
+
+    worker_model = create_table_modifier_model(model, "assay", "a_MTBLS1_01.txt")
+
+    assert list(worker_model.assays) == ["a_MTBLS1_01.txt"]
+    assert worker_model.assays["a_MTBLS1_01.txt"] is model.assays["a_MTBLS1_01.txt"]
+    assert not worker_model.metabolite_assignments
+    assert list(worker_model.parser_messages) == ["a_MTBLS1_01.txt"]
+    assert worker_model.investigation_file_path == "i_Investigation.txt"
+
+
+def test_run_table_modifiers_01():
+    """_summary_
+    Case:
+        Run assay modifiers in a process pool.
+    Expected result:
+        Modified tables replace model tables and update logs are in table order.
+    """
+    model = create_model()
+    with ProcessPoolExecutor(
+        max_workers=2, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        modifiers = run_table_modifiers(
+            executor, model, "assay", FileTemplates(), ValidationControls()
+        )
+
+    assert [x.file_path for x in modifiers] == list(model.assays)
+    for modifier in modifiers:
+        assert modifier.isa_table_file is model.assays[modifier.file_path]
+        assert modifier.update_logs
+        assert {x.source for x in modifier.update_logs} == {modifier.file_path}
+    data = model.assays["a_MTBLS1_01.txt"].table.data
+    assert data["Sample Name"][0] == "a_MTBLS1_01-0"
+    assert data["Raw Spectral Data File"][0] == "FILES/raw/a_MTBLS1_01-0.raw"
+
+
+def test_modify_with_executor_01():
+    """_summary_
+    Case:
+        Study model is modified sequentially and with an executor.
+    Expected result:
+        Modified tables, update logs and updated files are same.
+    """
+    sequential_model = create_model()
+    sequential_modifier = MetabolightsStudyModelModifier(
+        sequential_model, FileTemplates(), ValidationControls()
+    )
+    sequential_logs = sequential_modifier.modify()
+
+    model = create_model()
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        modifier = MetabolightsStudyModelModifier(
+            model, FileTemplates(), ValidationControls(), executor=executor
+        )
+        logs = modifier.modify()
+
+    assert logs == sequential_logs
+    assert modifier.get_updated_files() == sequential_modifier.get_updated_files()
+    for file_path, assay_file in model.assays.items():
+        expected = sequential_model.assays[file_path].table.data
+        assert assay_file.table.data == expected
+
+
+def create_heterogeneous_model() -> MetabolightsStudyModel:
+    model = create_model()
+    row_count = model.assays["a_MTBLS1_00.txt"].table.row_count
+    model.assays["a_MTBLS1_00.txt"].table.data["Sample Name"] = ["s1"] * row_count
+    model.assays["a_MTBLS1_01.txt"].table.data["Extract Name"] = [""] * row_count
+    return model
+
+
+def test_modify_with_executor_02():
+    """_summary_
+    Case:
+        First assay file has duplicate sample names and second assay file
+        has an empty Extract Name column. Study model is modified
+        sequentially and with an executor.
+    Expected result:
+        Modified tables, update logs and updated files are same and
+        Extract Name column of the second assay file is filled.
+    """
+    sequential_model = create_heterogeneous_model()
+    sequential_modifier = MetabolightsStudyModelModifier(
+        sequential_model, FileTemplates(), ValidationControls()
+    )
+    sequential_logs = sequential_modifier.modify()
+
+    model = create_heterogeneous_model()
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        modifier = MetabolightsStudyModelModifier(
+            model, FileTemplates(), ValidationControls(), executor=executor
+        )
+        logs = modifier.modify()
+
+    assert logs == sequential_logs
+    assert modifier.get_updated_files() == sequential_modifier.get_updated_files()
+    for file_path, assay_file in model.assays.items():
+        expected = sequential_model.assays[file_path].table.data
+        assert assay_file.table.data == expected
+    data = model.assays["a_MTBLS1_01.txt"].table.data
+    assert data["Extract Name"] == data["Sample Name"]
@@ -0,0 +1,44 @@
+from mtbls.domain.entities.isa_table import (
+    ColumnarIsaTableData,
+    IsaTableData,
+    IsaTableRow,
+)
+
+
+def test_columnar_isa_table_data_01():
+    """_summary_
+    Case:
+        Columnar ISA table data with offset is serialized.
+    Expected result:
+        Serialized rows are same as ISA table data with row objects.
+    """
+    columnar_data = ColumnarIsaTableData(
+        data_type="maf",
+        offset=10,
+        column_values={"database_identifier": ["CHEBI:1", ""], "name": ["a", "b"]},
+    )
+    rows = [
+        IsaTableRow(row_index=10, data={"database_identifier": "CHEBI:1", "name": "a"}),
+        IsaTableRow(row_index=11, data={"database_identifier": "", "name": "b"}),
+    ]
+    isa_table_data = IsaTableData(data_type="maf", offset=10, rows=rows)
+
+    assert columnar_data.row_count == 2
+    assert list(columnar_data.iter_rows()) == rows
+    assert columnar_data.model_dump(by_alias=True) == isa_table_data.model_dump(
+        by_alias=True
+    )
+    assert columnar_data.get_column_values() == isa_table_data.get_column_values()
+
+
+def test_columnar_isa_table_data_02():
+    """_summary_
+    Case:
+        Columnar ISA table data is serialized without rows.
+    Expected result:
+        Rows are not created.
+    """
+    columnar_data = ColumnarIsaTableData(
+        data_type="sample", column_values={"Source Name": ["s1"]}
+    )
+    assert "rows" not in columnar_data.model_dump(exclude={"rows"})
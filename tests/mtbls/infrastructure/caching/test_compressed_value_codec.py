@@ -0,0 +1,79 @@
+import json
+import logging
+
+import pytest
+
+from mtbls.infrastructure.caching.codec import compressed_value_codec
+from mtbls.infrastructure.caching.codec.compressed_value_codec import (
+    COMPRESSED_VALUE_PREFIX,
+    CacheValueCodecConfiguration,
+    CompressedCacheValueCodec,
+    CompressionAlgorithm,
+)
+
+
+@pytest.fixture
+def large_value() -> str:
+    docs = [{"iri": f"http://purl.obolibrary.org/obo/CHEBI_{x}"} for x in range(200)]
+    return json.dumps({"response": {"docs": docs}})
+
+
+def test_encode_decode_01(large_value: str):
+    codec = CompressedCacheValueCodec(
+        CacheValueCodecConfiguration(enabled=True, algorithm=CompressionAlgorithm.ZLIB)
+    )
+    encoded = codec.encode(large_value)
+    assert encoded.startswith(f"{COMPRESSED_VALUE_PREFIX}zlib:")
+    assert len(encoded) < len(large_value)
+    assert codec.decode(encoded) == large_value
+
+
+def test_encode_decode_02(large_value: str):
+    pytest.importorskip("zstandard")
+    codec = CompressedCacheValueCodec(
+        CacheValueCodecConfiguration(enabled=True, algorithm=CompressionAlgorithm.ZSTD)
+    )
+    encoded = codec.encode(large_value)
+    assert encoded.startswith(f"{COMPRESSED_VALUE_PREFIX}zstd:")
+    assert len(encoded) < len(large_value)
+    assert codec.decode(encoded) == large_value
+
+
+def test_zstd_fallback_01(
+    large_value: str, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+):
+    """_summary_
+    Case:
+        zstd is configured but zstandard is not installed.
+    Expected result:
+        A warning is logged and values are compressed with zlib.
+        Configuration object is not changed.
+    """
+    monkeypatch.setattr(compressed_value_codec, "zstandard", None)
+    config = CacheValueCodecConfiguration(
+        enabled=True, algorithm=CompressionAlgorithm.ZSTD
+    )
+    with caplog.at_level(logging.WARNING, logger=compressed_value_codec.__name__):
+        codec = CompressedCacheValueCodec(config)
+    assert "zstandard is not installed" in caplog.text
+    assert config.algorithm == CompressionAlgorithm.ZSTD
+    encoded = codec.encode(large_value)
+    assert encoded.startswith(f"{COMPRESSED_VALUE_PREFIX}zlib:")
+    assert codec.decode(encoded) == large_value
+
+
+def test_encode_small_value_01():
+    codec = CompressedCacheValueCodec({"enabled": True, "min_size_in_bytes": 1024})
+    assert codec.encode("task-id") == "task-id"
+    assert codec.encode(10) == 10
+
+
+def test_encode_disabled_01(large_value: str):
+    codec = CompressedCacheValueCodec({"enabled": False})
+    assert codec.encode(large_value) == large_value
+
+
+def test_decode_plain_value_01(large_value: str):
+    codec = CompressedCacheValueCodec()
+    assert codec.decode(large_value) == large_value
+    assert codec.decode(None) is None
@@ -0,0 +1,32 @@
+import pytest
+
+from mtbls.infrastructure.caching.in_memory.in_memory_cache import InMemoryCacheImpl
+
+
+@pytest.mark.asyncio
+async def test_set_value_if_not_exists_01():
+    """_summary_
+    Case:
+        Key does not exist.
+    Expected result:
+        Value is set and the second call does not override it.
+    """
+    cache = InMemoryCacheImpl()
+    assert await cache.set_value_if_not_exists("key", "value-01", 60)
+    assert not await cache.set_value_if_not_exists("key", "value-02", 60)
+    assert await cache.get_value("key") == "value-01"
+
+
+@pytest.mark.asyncio
+async def test_set_value_if_not_exists_02():
+    """_summary_
+    Case:
+        Key exists but it is expired.
+    Expected result:
+        New value is set.
+    """
+    cache = InMemoryCacheImpl()
+    await cache.set_value_with_expiration_time("key", "value-01", 0)
+    assert await cache.set_value_if_not_exists("key", "value-02")
+    assert await cache.get_value("key") == "value-02"
+    assert await cache.get_ttl_in_seconds("key") == -1
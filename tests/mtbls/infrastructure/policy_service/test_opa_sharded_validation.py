@@ -0,0 +1,102 @@
+from unittest.mock import AsyncMock
+
+import pytest
+from metabolights_utils.models.isa.assay_file import AssayFile
+from metabolights_utils.models.isa.assignment_file import AssignmentFile
+from metabolights_utils.models.isa.common import IsaTable
+from metabolights_utils.models.isa.samples_file import SamplesFile
+from metabolights_utils.models.metabolights.model import MetabolightsStudyModel
+
+from mtbls.application.services.interfaces.http_client import HttpClient
+from mtbls.domain.entities.http_response import HttpResponse
+from mtbls.infrastructure.policy_service.opa.opa_configuration import OpaConfiguration
+from mtbls.infrastructure.policy_service.opa.opa_service import OpaPolicyService
+
+
+def create_table() -> IsaTable:
+    return IsaTable(columns=["Sample Name"], data={"Sample Name": ["s1"]}, row_count=1)
+
+
+@pytest.fixture
+def study_model() -> MetabolightsStudyModel:
+    model = MetabolightsStudyModel()
+    model.investigation_file_path = "i_Investigation.txt"
+    model.samples["s_01.txt"] = SamplesFile(table=create_table())
+    model.assays["a_01.txt"] = AssayFile(
+        table=create_table(), referenced_assignment_files=["m_01.tsv"]
+    )
+    model.assays["a_02.txt"] = AssayFile(table=create_table())
+    model.metabolite_assignments["m_01.tsv"] = AssignmentFile(table=create_table())
+    return model
+
+
+def create_response(json: dict) -> HttpResponse:
+    model = json["input"]
+    loaded_files = [
+        file_name
+        for key in ("samples", "assays", "metaboliteAssignments")
+        for file_name, file in model[key].items()
+        if file["table"]["data"]
+    ]
+    violations = [
+        {"identifier": "rule_01", "sourceFile": "i_Investigation.txt"},
+        {"identifier": "rule_02", "sourceFile": "input"},
+    ]
+    violations.extend(
+        {"identifier": "rule_03", "sourceFile": x, "violation": ",".join(loaded_files)}
+        for x in model["assays"]
+    )
+    return HttpResponse(json_data={"result": {"violations": violations}})
+
+
+@pytest.mark.asyncio
+async def test_validate_study_sharded_01(study_model: MetabolightsStudyModel):
+    """_summary_
+    Case:
+        Sharded validation is enabled for a study with sample, assay and MAF files.
+    Expected result:
+        Each ISA table file is validated in its own request with its references.
+        Messages are selected from shard of their source files without duplicates.
+    """
+    http_client: HttpClient = AsyncMock(spec=HttpClient)
+    http_client.send_request.side_effect = lambda *args, **kwargs: create_response(
+        kwargs["json"]
+    )
+    config = OpaConfiguration(sharded_validation=True, max_parallel_requests=2)
+    service = OpaPolicyService(http_client=http_client, config=config)
+
+    result = await service.validate_study("MTBLS1", study_model)
+
+    assert http_client.send_request.call_count == 5
+    violations = {(x.identifier, x.source_file) for x in result.violations}
+    assert len(violations) == len(result.violations) == 4
+    assay_violations = {
+        x.source_file: x.violation
+        for x in result.violations
+        if x.identifier == "rule_03"
+    }
+    assert assay_violations == {
+        "a_01.txt": "s_01.txt,a_01.txt",
+        "a_02.txt": "s_01.txt,a_02.txt",
+    }
+    assert study_model.assays["a_02.txt"].table.data
+
+
+@pytest.mark.asyncio
+async def test_validate_study_sharded_02(study_model: MetabolightsStudyModel):
+    """_summary_
+    Case:
+        Sharded validation is disabled.
+    Expected result:
+        Study is validated with one request.
+    """
+    http_client: HttpClient = AsyncMock(spec=HttpClient)
+    http_client.send_request.side_effect = lambda *args, **kwargs: create_response(
+        kwargs["json"]
+    )
+    service = OpaPolicyService(http_client=http_client, config=OpaConfiguration())
+
+    result = await service.validate_study("MTBLS1", study_model)
+
+    assert http_client.send_request.call_count == 1
+    assert len(result.violations) == 4
@@ -0,0 +1,193 @@
+import shutil
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from mtbls.application.services.interfaces.repositories.file_object.file_object_write_repository import (  # noqa: E501
+    FileObjectWriteRepository,
+)
+from mtbls.application.services.interfaces.repositories.study.study_read_repository import (  # noqa: E501
+    StudyReadRepository,
+)
+from mtbls.application.services.interfaces.repositories.study_data_file.study_data_file_write_repository import (  # noqa: E501
+    StudyDataFileRepository,
+)
+from mtbls.application.services.interfaces.repositories.user.user_read_repository import (  # noqa: E501
+    UserReadRepository,
+)
+from mtbls.domain.entities.investigation import (
+    CommentedPersonItem,
+    CommentItem,
+    InvestigationItem,
+    PersonItem,
+)
+from mtbls.infrastructure.study_metadata_service.nfs.model_jsonpath import (
+    delete_model_items,
+    get_jsonpath_expression,
+    update_model_item,
+)
+from mtbls.infrastructure.study_metadata_service.nfs.nfs_study_metadata_service import (  # noqa: E501
+    FileObjectStudyMetadataService,
+)
+from mtbls.infrastructure.study_metadata_service.nfs.parsed_file_cache import (
+    parsed_metadata_files,
+)
+
+
+def create_service(tmp_path: Path) -> FileObjectStudyMetadataService:
+    study_path = tmp_path / "MTBLS1"
+    study_path.mkdir(parents=True)
+    shutil.copy(
+        "tests/data/studies/MTBLS1/i_Investigation.txt",
+        study_path / "i_Investigation.txt",
+    )
+    repository = AsyncMock(spec=FileObjectWriteRepository)
+    repository.get_uri.return_value = f"file://{study_path / 'i_Investigation.txt'}"
+    repository.get_info.return_value = None
+    service = FileObjectStudyMetadataService(
+        resource_id="MTBLS1",
+        study_data_file_repository=Mock(spec=StudyDataFileRepository),
+        metadata_files_object_repository=repository,
+        audit_files_object_repository=AsyncMock(spec=FileObjectWriteRepository),
+        internal_files_object_repository=AsyncMock(spec=FileObjectWriteRepository),
+        study_read_repository=Mock(spec=StudyReadRepository),
+        user_read_repository=Mock(spec=UserReadRepository),
+        temp_path=str(tmp_path / "staging"),
+    )
+    service.save_investigation_file = AsyncMock()
+    return service
+
+
+def get_contacts(investigation: InvestigationItem):
+    return investigation.studies[0].contacts
+
+
+@pytest.mark.parametrize(
+    "operation,jsonpath,input_data,field_name,get_value,expected",
+    [
+        (
+            "update-object",
+            "$.studies[0].contacts[0]",
+            PersonItem(first_name="Jane", last_name="Doe"),
+            None,
+            lambda x: [(y.first_name, y.last_name, y.email) for y in get_contacts(x)],
+            [
+                ("Jane", "Doe", ""),
+                ("Jules", "Griffin", "jlg40@cam.ac.uk"),
+            ],
+        ),
+        (
+            "patch",
+            "$.studies[0].contacts[1]",
+            PersonItem(email="jane@example.com"),
+            None,
+            lambda x: [(y.first_name, y.email) for y in get_contacts(x)],
+            [("Reza", "rms72@cam.ac.uk"), ("Jules", "jane@example.com")],
+        ),
+        (
+            "update-string",
+            "$.studies[0]",
+            "New title",
+            "title",
+            lambda x: x.studies[0].title,
+            "New title",
+        ),
+        (
+            "insert",
+            "$.studies[0].contacts",
+            CommentedPersonItem(
+                first_name="Jane", comments=[CommentItem(name="ORCID", value="1")]
+            ),
+            None,
+            lambda x: [
+                (y.first_name, [(z.name, z.value) for z in y.comments])
+                for y in get_contacts(x)[2:]
+            ],
+            [("Jane", [("ORCID", "1")])],
+        ),
+        (
+            "delete",
+            "$.studies[0].contacts[0]",
+            None,
+            None,
+            lambda x: [y.first_name for y in get_contacts(x)],
+            ["Jules"],
+        ),
+        (
+            "delete",
+            "$.studies[0].protocols[?(@.name=='Extraction')]",
+            None,
+            None,
+            lambda x: [y.name for y in x.studies[0].protocols],
+            [
+                "Sample collection",
+                "NMR sample",
+                "NMR spectroscopy",
+                "NMR assay",
+                "Data transformation",
+                "Metabolite identification",
+            ],
+        ),
+    ],
+)
+@pytest.mark.asyncio
+async def test_modify_investigation_file_in_place_01(  # noqa: PLR0913
+    tmp_path: Path, operation, jsonpath, input_data, field_name, get_value, expected
+):
+    """_summary_
+    Case:
+        Investigation file is modified with a jsonpath and only updated item
+        is validated.
+    Expected result:
+        Saved investigation has the updated items and other items are not
+        changed. Saved items are model instances.
+    """
+    parsed_metadata_files.clear()
+    output_class = str if operation == "update-string" else CommentedPersonItem
+    with create_service(tmp_path) as service:
+        data, indices = await service.modify_investigation_file(
+            target_jsonpath=jsonpath,
+            operation=operation,
+            output_model_class=output_class,
+            input_data=input_data,
+            field_name=field_name,
+        )
+        service.save_investigation_file.assert_awaited_once()
+        saved: InvestigationItem = service.save_investigation_file.await_args.args[0]
+    assert data
+    if operation == "insert":
+        assert indices == [2]
+    assert get_value(saved) == expected
+    assert all(isinstance(x, PersonItem) for x in get_contacts(saved))
+    assert InvestigationItem.model_validate(saved.model_dump()) == saved
+
+
+def test_get_jsonpath_expression_01():
+    """_summary_
+    Case:
+        Same jsonpath is compiled twice.
+    Expected result:
+        Compiled expression is reused.
+    """
+    jsonpath = "$.studies[0].contacts"
+    assert get_jsonpath_expression(jsonpath) is get_jsonpath_expression(jsonpath)
+
+
+def test_update_model_item_01():
+    """_summary_
+    Case:
+        Items are updated or deleted with paths of a model.
+    Expected result:
+        Only list items and fields defined in the model are updated.
+    """
+    investigation = InvestigationItem(contacts=[PersonItem(first_name="Jane")])
+    assert update_model_item(investigation, ["contacts", 0], {"firstName": "John"})
+    assert investigation.contacts[0].first_name == "John"
+    assert update_model_item(investigation, ["title"], "Title")
+    assert investigation.title == "Title"
+    assert not update_model_item(investigation, ["contacts", 1], {})
+    assert not update_model_item(investigation, ["unknownField"], "")
+    assert not delete_model_items(investigation, [["title"]])
+    assert delete_model_items(investigation, [["contacts", 0]])
+    assert not investigation.contacts
@@ -0,0 +1,159 @@
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from metabolights_utils.models.isa.assay_file import AssayFile
+from metabolights_utils.models.isa.samples_file import SamplesFile
+from metabolights_utils.models.metabolights.model import MetabolightsStudyModel
+
+from mtbls.application.services.interfaces.repositories.file_object.file_object_write_repository import (  # noqa: E501
+    FileObjectWriteRepository,
+)
+from mtbls.application.services.interfaces.repositories.study.study_read_repository import (  # noqa: E501
+    StudyReadRepository,
+)
+from mtbls.application.services.interfaces.repositories.study_data_file.study_data_file_write_repository import (  # noqa: E501
+    StudyDataFileRepository,
+)
+from mtbls.application.services.interfaces.repositories.user.user_read_repository import (  # noqa: E501
+    UserReadRepository,
+)
+from mtbls.infrastructure.study_metadata_service.nfs.nfs_study_metadata_service import (  # noqa: E501
+    PARTIAL_SNAPSHOT_MANIFEST,
+    FileObjectStudyMetadataService,
+)
+
+
+def create_service(tmp_path: Path) -> FileObjectStudyMetadataService:
+    return FileObjectStudyMetadataService(
+        resource_id="MTBLS1",
+        study_data_file_repository=Mock(spec=StudyDataFileRepository),
+        metadata_files_object_repository=AsyncMock(spec=FileObjectWriteRepository),
+        audit_files_object_repository=AsyncMock(spec=FileObjectWriteRepository),
+        internal_files_object_repository=AsyncMock(spec=FileObjectWriteRepository),
+        study_read_repository=Mock(spec=StudyReadRepository),
+        user_read_repository=Mock(spec=UserReadRepository),
+        temp_path=str(tmp_path),
+    )
+
+
+def create_model() -> MetabolightsStudyModel:
+    model = MetabolightsStudyModel()
+    model.investigation_file_path = "i_Investigation.txt"
+    model.samples["s_MTBLS1.txt"] = SamplesFile(file_path="s_MTBLS1.txt")
+    model.assays["a_MTBLS1.txt"] = AssayFile(file_path="a_MTBLS1.txt")
+    return model
+
+
+def get_saved_object_keys(repository: AsyncMock) -> list[str]:
+    return sorted(x.kwargs["object_key"] for x in repository.put_object.call_args_list)
+
+
+@pytest.mark.asyncio
+async def test_save_study_model_01(tmp_path: Path):
+    """_summary_
+    Case:
+        Object keys are not defined.
+    Expected result:
+        All metadata files are written and uploaded.
+    """
+    service = create_service(tmp_path)
+    with service:
+        await service.save_study_model(create_model())
+        written_files = sorted(x.name for x in service.staging_path.iterdir())
+    uploaded_files = get_saved_object_keys(service.metadata_files_object_repository)
+    expected = ["a_MTBLS1.txt", "i_Investigation.txt", "s_MTBLS1.txt"]
+    assert written_files == expected
+    assert uploaded_files == expected
+
+
+@pytest.mark.asyncio
+async def test_save_study_model_02(tmp_path: Path):
+    """_summary_
+    Case:
+        Only sample file is in object keys.
+    Expected result:
+        Investigation and assay files are not written and not uploaded.
+    """
+    service = create_service(tmp_path)
+    with service:
+        await service.save_study_model(create_model(), object_keys=["s_MTBLS1.txt"])
+        written_files = sorted(x.name for x in service.staging_path.iterdir())
+    uploaded_files = get_saved_object_keys(service.metadata_files_object_repository)
+    assert written_files == ["s_MTBLS1.txt"]
+    assert uploaded_files == ["s_MTBLS1.txt"]
+
+
+@pytest.mark.asyncio
+async def test_create_metadata_snapshot_01(tmp_path: Path):
+    """_summary_
+    Case:
+        Snapshot is created for an updated sample file.
+    Expected result:
+        Only sample file and partial snapshot manifest are copied to audit folder.
+    """
+    service = create_service(tmp_path)
+    service.metadata_files_object_repository.list.return_value = [
+        Mock(object_key=x, basename=x)
+        for x in ("a_MTBLS1.txt", "i_Investigation.txt", "s_MTBLS1.txt")
+    ]
+    with service:
+        folder = await service.create_metadata_snapshot(
+            suffix="VALIDATION", object_keys=["s_MTBLS1.txt"]
+        )
+    uploaded_files = get_saved_object_keys(service.audit_files_object_repository)
+    assert uploaded_files == [
+        f"{folder}/{PARTIAL_SNAPSHOT_MANIFEST}",
+        f"{folder}/s_MTBLS1.txt",
+    ]
+
+
+def create_snapshot_service(
+    tmp_path: Path, snapshot_files: list[str]
+) -> FileObjectStudyMetadataService:
+    service = create_service(tmp_path)
+    service.metadata_files_object_repository.list.return_value = [
+        Mock(object_key=x, basename=x)
+        for x in ("a_MTBLS1.txt", "i_Investigation.txt", "s_MTBLS1.txt")
+    ]
+    snapshot = "audit/2025-01-01_10-00-00_VALIDATION"
+    service.audit_files_object_repository.list.side_effect = [
+        [Mock(object_key=snapshot)],
+        [Mock(object_key=f"{snapshot}/{x}", basename=x) for x in snapshot_files],
+    ]
+    return service
+
+
+@pytest.mark.asyncio
+async def test_restore_metadata_from_snapshot_01(tmp_path: Path):
+    """_summary_
+    Case:
+        Partial snapshot has only sample file and its manifest.
+    Expected result:
+        Sample file is restored and other metadata files are not deleted.
+    """
+    service = create_snapshot_service(
+        tmp_path, ["s_MTBLS1.txt", PARTIAL_SNAPSHOT_MANIFEST]
+    )
+    with service:
+        await service.restore_metadata_from_snapshot("2025-01-01_10-00-00_VALIDATION")
+    restored_files = get_saved_object_keys(service.metadata_files_object_repository)
+    assert restored_files == ["s_MTBLS1.txt"]
+    service.metadata_files_object_repository.delete_object.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_restore_metadata_from_snapshot_02(tmp_path: Path):
+    """_summary_
+    Case:
+        Snapshot of all files has investigation and sample files.
+    Expected result:
+        Files are restored and assay file that is not in snapshot is deleted.
+    """
+    service = create_snapshot_service(tmp_path, ["i_Investigation.txt", "s_MTBLS1.txt"])
+    with service:
+        await service.restore_metadata_from_snapshot("2025-01-01_10-00-00_VALIDATION")
+    restored_files = get_saved_object_keys(service.metadata_files_object_repository)
+    assert restored_files == ["i_Investigation.txt", "s_MTBLS1.txt"]
+    deleted = service.metadata_files_object_repository.delete_object.await_args_list
+    assert [x.kwargs["object_key"] for x in deleted] == ["a_MTBLS1.txt"]
@@ -0,0 +1,198 @@
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from metabolights_utils.isatab import Writer
+from metabolights_utils.models.isa.investigation_file import (
+    Assay,
+    Investigation,
+    Study,
+)
+
+from mtbls.application.services.interfaces.repositories.file_object.file_object_write_repository import (  # noqa: E501
+    FileObjectWriteRepository,
+)
+from mtbls.application.services.interfaces.repositories.study.study_read_repository import (  # noqa: E501
+    StudyReadRepository,
+)
+from mtbls.application.services.interfaces.repositories.study_data_file.study_data_file_write_repository import (  # noqa: E501
+    StudyDataFileRepository,
+)
+from mtbls.application.services.interfaces.repositories.user.user_read_repository import (  # noqa: E501
+    UserReadRepository,
+)
+from mtbls.domain.entities.investigation import InvestigationItem
+from mtbls.domain.entities.study_file import StudyDataFileOutput
+from mtbls.infrastructure.study_metadata_service.nfs.nfs_study_metadata_service import (  # noqa: E501
+    FileObjectStudyMetadataService,
+)
+from mtbls.infrastructure.study_metadata_service.nfs.parsed_file_cache import (
+    parsed_metadata_files,
+)
+
+
+def create_service(tmp_path: Path, study_path: Path) -> FileObjectStudyMetadataService:
+    repository = AsyncMock(spec=FileObjectWriteRepository)
+
+    async def get_uri(resource_id: str, object_key: str):
+        return f"file://{study_path / object_key}"
+
+    repository.get_uri.side_effect = get_uri
+    repository.get_info.return_value = None
+    return FileObjectStudyMetadataService(
+        resource_id="MTBLS1",
+        study_data_file_repository=Mock(spec=StudyDataFileRepository),
+        metadata_files_object_repository=repository,
+        audit_files_object_repository=AsyncMock(spec=FileObjectWriteRepository),
+        internal_files_object_repository=AsyncMock(spec=FileObjectWriteRepository),
+        study_read_repository=Mock(spec=StudyReadRepository),
+        user_read_repository=Mock(spec=UserReadRepository),
+        temp_path=str(tmp_path / "staging"),
+    )
+
+
+def create_study_folder(tmp_path: Path) -> Path:
+    study_path = tmp_path / "MTBLS1"
+    study_path.mkdir()
+    investigation = Investigation()
+    investigation.studies.append(Study(identifier="MTBLS1", title="Title 1"))
+    Writer.get_investigation_file_writer().write(
+        investigation, str(study_path / "i_Investigation.txt")
+    )
+    return study_path
+
+
+@pytest.mark.asyncio
+async def test_load_investigation_file_read_path_01(tmp_path: Path):
+    """_summary_
+    Case:
+        Investigation file is on local file system.
+    Expected result:
+        File is parsed in place without a copy in staging folder.
+    """
+    parsed_metadata_files.clear()
+    study_path = create_study_folder(tmp_path)
+    with create_service(tmp_path, study_path) as service:
+        investigation: InvestigationItem = await service.load_investigation_file()
+        assert investigation.studies[0].title == "Title 1"
+        service.metadata_files_object_repository.download.assert_not_called()
+        assert not list(service.staging_path.iterdir())
+
+
+@pytest.mark.asyncio
+async def test_load_study_model_read_path_01(tmp_path: Path):
+    """_summary_
+    Case:
+        Study model is loaded, so investigation file is staged as a link,
+        and then investigation file is saved.
+    Expected result:
+        Link is replaced by a new file and the source file is not changed.
+    """
+    parsed_metadata_files.clear()
+    study_path = create_study_folder(tmp_path)
+    source_path = study_path / "i_Investigation.txt"
+    source_content = source_path.read_text()
+    with create_service(tmp_path, study_path) as service:
+        service.metadata_files_object_repository.list.return_value = []
+        model = await service.load_study_model()
+        assert model.investigation.studies[0].title == "Title 1"
+        staged_path = service.staging_path / "i_Investigation.txt"
+        assert staged_path.samefile(source_path)
+        service.metadata_files_object_repository.download.assert_not_called()
+
+        investigation = await service.load_investigation_file()
+        investigation.studies[0].title = "Title 2"
+        await service.save_investigation_file(investigation)
+
+        assert not staged_path.samefile(source_path)
+        assert source_path.read_text() == source_content
+        assert "Title 2" in staged_path.read_text()
+
+
+def create_isa_study_folder(tmp_path: Path) -> Path:
+    study_path = tmp_path / "MTBLS1"
+    study_path.mkdir()
+    investigation = Investigation()
+    study = Study(identifier="MTBLS1", title="Title 1", file_name="s_MTBLS1.txt")
+    study.study_assays.assays.append(Assay(file_name="a_MTBLS1.txt"))
+    investigation.studies.append(study)
+    Writer.get_investigation_file_writer().write(
+        investigation, str(study_path / "i_Investigation.txt")
+    )
+    (study_path / "s_MTBLS1.txt").write_text(
+        "Source Name\tSample Name\nsource1\tsample1\nsource2\tsample2\n"
+    )
+    (study_path / "a_MTBLS1.txt").write_text(
+        "Sample Name\tMetabolite Assignment File\n"
+        "sample1\tm_MTBLS1.tsv\nsample2\tm_MTBLS1.tsv\n"
+    )
+    (study_path / "m_MTBLS1.tsv").write_text(
+        "database_identifier\tmetabolite_identification\n"
+        "CHEBI:1\tx\nCHEBI:2\ty\nCHEBI:3\tz\n"
+    )
+    return study_path
+
+
+def create_isa_study_service(
+    tmp_path: Path, study_path: Path
+) -> FileObjectStudyMetadataService:
+    service = create_service(tmp_path, study_path)
+    service.metadata_files_object_repository.list.return_value = [
+        StudyDataFileOutput(object_key=x.name, basename=x.name)
+        for x in study_path.iterdir()
+    ]
+    return service
+
+
+@pytest.mark.asyncio
+async def test_reload_study_model_files_read_path_01(tmp_path: Path):
+    """_summary_
+    Case:
+        Study model is loaded, only assay file is saved and then assay
+        and MAF files are reloaded.
+    Expected result:
+        Saved assay file is read from staging folder and MAF file is read
+        from study folder without parser errors.
+    """
+    parsed_metadata_files.clear()
+    study_path = create_isa_study_folder(tmp_path)
+    with create_isa_study_service(tmp_path, study_path) as service:
+        model = await service.load_study_model(
+            load_sample_file=True, load_assay_files=True, load_maf_files=True
+        )
+        assert model.metabolite_assignments["m_MTBLS1.tsv"].table.row_count == 3
+        assay_data = model.assays["a_MTBLS1.txt"].table.data
+        assay_data["Sample Name"][0] = "sample3"
+
+        await service.save_study_model(model, object_keys=["a_MTBLS1.txt"])
+        assert not (service.staging_path / "m_MTBLS1.tsv").exists()
+        model.metabolite_assignments["m_MTBLS1.tsv"].table.data.clear()
+        await service.reload_study_model_files(model, ["a_MTBLS1.txt", "m_MTBLS1.tsv"])
+
+    maf_table = model.metabolite_assignments["m_MTBLS1.tsv"].table
+    assert maf_table.row_count == 3
+    assert maf_table.data["database_identifier"] == ["CHEBI:1", "CHEBI:2", "CHEBI:3"]
+    assert not model.parser_messages["m_MTBLS1.tsv"]
+    assert model.assays["a_MTBLS1.txt"].table.data["Sample Name"][0] == "sample3"
+    assert "sample3" not in (study_path / "a_MTBLS1.txt").read_text()
+
+
+@pytest.mark.asyncio
+async def test_load_study_model_read_path_02(tmp_path: Path):
+    """_summary_
+    Case:
+        Study model is loaded without sample and assay files.
+    Expected result:
+        Investigation file is not parsed to prefetch sample and assay files.
+    """
+    parsed_metadata_files.clear()
+    study_path = create_isa_study_folder(tmp_path)
+    with create_isa_study_service(tmp_path, study_path) as service:
+        load_investigation_file = AsyncMock(wraps=service.load_investigation_file)
+        service.load_investigation_file = load_investigation_file
+        model = await service.load_study_model()
+        assert model.investigation.studies[0].title == "Title 1"
+        load_investigation_file.assert_not_awaited()
+
+        await service.load_study_model(load_assay_files=True)
+        load_investigation_file.assert_awaited_once()
@@ -0,0 +1,101 @@
+import shutil
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from mtbls.application.services.interfaces.repositories.file_object.file_object_write_repository import (  # noqa: E501
+    FileObjectWriteRepository,
+)
+from mtbls.application.services.interfaces.repositories.study.study_read_repository import (  # noqa: E501
+    StudyReadRepository,
+)
+from mtbls.application.services.interfaces.repositories.study_data_file.study_data_file_write_repository import (  # noqa: E501
+    StudyDataFileRepository,
+)
+from mtbls.application.services.interfaces.repositories.user.user_read_repository import (  # noqa: E501
+    UserReadRepository,
+)
+from mtbls.domain.entities.study_file import StudyDataFileOutput
+from mtbls.infrastructure.study_metadata_service.nfs.nfs_study_metadata_service import (  # noqa: E501
+    FileObjectStudyMetadataService,
+)
+
+MAF_FILE = "m_MTBLS1_metabolite_profiling_NMR_spectroscopy_v2_maf.tsv"
+
+
+def create_study_folder(tmp_path: Path) -> Path:
+    study_path = tmp_path / "MTBLS1"
+    shutil.copytree(
+        "tests/data/studies/MTBLS1", study_path, ignore=shutil.ignore_patterns("FILES")
+    )
+    shutil.copy(study_path / "s_MTBLS1.txt", study_path / "a_MTBLS1_unused.txt")
+    shutil.copy(study_path / MAF_FILE, study_path / "m_MTBLS1_unused.tsv")
+    return study_path
+
+
+def create_service(tmp_path: Path, study_path: Path) -> FileObjectStudyMetadataService:
+    repository = AsyncMock(spec=FileObjectWriteRepository)
+
+    async def get_uri(resource_id: str, object_key: str):
+        return f"file://{study_path / object_key}"
+
+    repository.get_uri.side_effect = get_uri
+    repository.get_info.return_value = None
+    repository.list.return_value = [
+        StudyDataFileOutput(object_key=x.name, basename=x.name)
+        for x in study_path.iterdir()
+    ]
+    return FileObjectStudyMetadataService(
+        resource_id="MTBLS1",
+        study_data_file_repository=Mock(spec=StudyDataFileRepository),
+        metadata_files_object_repository=repository,
+        audit_files_object_repository=AsyncMock(spec=FileObjectWriteRepository),
+        internal_files_object_repository=AsyncMock(spec=FileObjectWriteRepository),
+        study_read_repository=Mock(spec=StudyReadRepository),
+        user_read_repository=Mock(spec=UserReadRepository),
+        temp_path=str(tmp_path / "staging"),
+    )
+
+
+@pytest.mark.asyncio
+async def test_load_study_model_selective_01(tmp_path: Path):
+    """_summary_
+    Case:
+        Only investigation file is requested.
+    Expected result:
+        Only files referenced by investigation and assay files are staged.
+    """
+    study_path = create_study_folder(tmp_path)
+    with create_service(tmp_path, study_path) as service:
+        model = await service.load_study_model()
+        assert model.investigation.studies
+        assert list(model.metabolite_assignments) == [MAF_FILE]
+        staged_files = {x.name for x in service.staging_path.iterdir()}
+        assert staged_files == {
+            "i_Investigation.txt",
+            "s_MTBLS1.txt",
+            "a_MTBLS1_metabolite_profiling_NMR_spectroscopy.txt",
+            MAF_FILE,
+        }
+        service.metadata_files_object_repository.download.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_load_study_model_selective_02(tmp_path: Path):
+    """_summary_
+    Case:
+        All ISA table files are requested.
+    Expected result:
+        Tables are loaded and MAF files are staged.
+    """
+    study_path = create_study_folder(tmp_path)
+    with create_service(tmp_path, study_path) as service:
+        model = await service.load_study_model(
+            load_sample_file=True, load_assay_files=True, load_maf_files=True
+        )
+        assert model.samples["s_MTBLS1.txt"].table.row_count > 0
+        assert model.metabolite_assignments[MAF_FILE].table.row_count > 0
+        staged_files = {x.name for x in service.staging_path.iterdir()}
+        assert "m_MTBLS1_unused.tsv" in staged_files
+        assert "a_MTBLS1_unused.txt" not in staged_files
@@ -0,0 +1,162 @@
+import datetime
+import shutil
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from metabolights_utils.isatab import Writer
+from metabolights_utils.models.isa.investigation_file import Investigation, Study
+
+from mtbls.application.services.interfaces.repositories.file_object.file_object_write_repository import (  # noqa: E501
+    FileObjectWriteRepository,
+)
+from mtbls.application.services.interfaces.repositories.study.study_read_repository import (  # noqa: E501
+    StudyReadRepository,
+)
+from mtbls.application.services.interfaces.repositories.study_data_file.study_data_file_write_repository import (  # noqa: E501
+    StudyDataFileRepository,
+)
+from mtbls.application.services.interfaces.repositories.user.user_read_repository import (  # noqa: E501
+    UserReadRepository,
+)
+from mtbls.domain.entities.investigation import InvestigationItem
+from mtbls.domain.entities.study_file import StudyDataFileOutput
+from mtbls.infrastructure.study_metadata_service.nfs.nfs_study_metadata_service import (  # noqa: E501
+    FileObjectStudyMetadataService,
+)
+from mtbls.infrastructure.study_metadata_service.nfs.parsed_file_cache import (
+    ParsedFileCache,
+    parsed_metadata_files,
+)
+
+
+def create_file_info(
+    object_key: str = "i_Investigation.txt", size_in_bytes: int = 100, second: int = 0
+) -> StudyDataFileOutput:
+    return StudyDataFileOutput(
+        object_key=object_key,
+        size_in_bytes=size_in_bytes,
+        updated_at=datetime.datetime(2025, 1, 1, 0, 0, second),
+    )
+
+
+def test_parsed_file_cache_01():
+    """_summary_
+    Case:
+        Cached value is modified by caller.
+    Expected result:
+        Cached entry is not changed and each read returns a new copy.
+    """
+    cache = ParsedFileCache()
+    key = cache.create_key("MTBLS1", create_file_info())
+    cache.set(key, {"rows": [1, 2, 3]})
+
+    value = cache.get(key)
+    value["rows"].append(4)
+
+    assert cache.get(key) == {"rows": [1, 2, 3]}
+    assert cache.get(key) is not cache.get(key)
+
+
+def test_parsed_file_cache_02():
+    """_summary_
+    Case:
+        File size or modification time changes and file info is not known.
+    Expected result:
+        Different keys are created and there is no key without file info.
+    """
+    cache = ParsedFileCache()
+    key = cache.create_key("MTBLS1", create_file_info())
+    cache.set(key, "value")
+
+    updated_file_info = create_file_info(size_in_bytes=101)
+    assert cache.get(cache.create_key("MTBLS1", updated_file_info)) is None
+    assert cache.get(cache.create_key("MTBLS1", create_file_info(second=1))) is None
+    assert cache.create_key("MTBLS1", None) is None
+    assert cache.create_key("MTBLS1", StudyDataFileOutput(object_key="x")) is None
+
+
+def test_parsed_file_cache_03():
+    """_summary_
+    Case:
+        Files of two studies are cached and one study is invalidated.
+        Cache size is less than a value.
+    Expected result:
+        Only files of invalidated study are removed.
+        Values larger than cache size are not cached.
+    """
+    cache = ParsedFileCache(max_size_in_bytes=1000)
+    key_1 = cache.create_key("MTBLS1", create_file_info())
+    key_2 = cache.create_key("MTBLS2", create_file_info())
+    cache.set(key_1, "value 1")
+    cache.set(key_2, "value 2")
+    cache.invalidate("MTBLS1")
+    assert cache.get(key_1) is None
+    assert cache.get(key_2) == "value 2"
+
+    cache.set(key_1, "x" * 2000)
+    assert cache.get(key_1) is None
+
+
+def create_investigation_file(file_path: Path, title: str) -> None:
+    investigation = Investigation()
+    investigation.studies.append(Study(identifier="MTBLS1", title=title))
+    Writer.get_investigation_file_writer().write(investigation, str(file_path))
+
+
+def create_service(tmp_path: Path, source_path: Path) -> FileObjectStudyMetadataService:
+    repository = AsyncMock(spec=FileObjectWriteRepository)
+
+    async def download(resource_id: str, object_key: str, target_path: str):
+        shutil.copy(source_path, target_path)
+
+    repository.download.side_effect = download
+    return FileObjectStudyMetadataService(
+        resource_id="MTBLS1",
+        study_data_file_repository=Mock(spec=StudyDataFileRepository),
+        metadata_files_object_repository=repository,
+        audit_files_object_repository=AsyncMock(spec=FileObjectWriteRepository),
+        internal_files_object_repository=AsyncMock(spec=FileObjectWriteRepository),
+        study_read_repository=Mock(spec=StudyReadRepository),
+        user_read_repository=Mock(spec=UserReadRepository),
+        temp_path=str(tmp_path / "staging"),
+    )
+
+
+@pytest.mark.asyncio
+async def test_load_investigation_file_cache_01(tmp_path: Path):
+    """_summary_
+    Case:
+        Investigation file is loaded by two requests, then file is updated.
+    Expected result:
+        Second request uses cached file and its changes do not affect cache.
+        Updated file is parsed again.
+    """
+    parsed_metadata_files.clear()
+    source_path = tmp_path / "i_Investigation.txt"
+    create_investigation_file(source_path, "Title 1")
+
+    with create_service(tmp_path, source_path) as service:
+        service.metadata_files_object_repository.get_info.return_value = (
+            create_file_info()
+        )
+        first: InvestigationItem = await service.load_investigation_file()
+        first.studies[0].title = "Changed"
+
+    with create_service(tmp_path, source_path) as service:
+        service.metadata_files_object_repository.get_info.return_value = (
+            create_file_info()
+        )
+        second: InvestigationItem = await service.load_investigation_file()
+        service.metadata_files_object_repository.download.assert_not_called()
+        assert second.studies[0].title == "Title 1"
+
+        create_investigation_file(source_path, "Title 2")
+        service.metadata_files_object_repository.get_info.return_value = (
+            create_file_info(second=1)
+        )
+        service.staging_path.joinpath("i_Investigation.txt").unlink(missing_ok=True)
+        third: InvestigationItem = await service.load_investigation_file()
+        service.metadata_files_object_repository.download.assert_called_once()
+        assert third.studies[0].title == "Title 2"
+    parsed_metadata_files.clear()
@@ -0,0 +1,131 @@
+import io
+import shutil
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from metabolights_utils.isatab import Reader
+
+from mtbls.application.services.interfaces.repositories.file_object.file_object_write_repository import (  # noqa: E501
+    FileObjectWriteRepository,
+)
+from mtbls.application.services.interfaces.repositories.study.study_read_repository import (  # noqa: E501
+    StudyReadRepository,
+)
+from mtbls.application.services.interfaces.repositories.study_data_file.study_data_file_write_repository import (  # noqa: E501
+    StudyDataFileRepository,
+)
+from mtbls.application.services.interfaces.repositories.user.user_read_repository import (  # noqa: E501
+    UserReadRepository,
+)
+from mtbls.domain.entities.study_file import StudyDataFileOutput
+from mtbls.infrastructure.study_metadata_service.nfs.nfs_study_metadata_service import (  # noqa: E501
+    FileObjectStudyMetadataService,
+)
+from mtbls.infrastructure.study_metadata_service.nfs.parsed_file_cache import (
+    parsed_metadata_files,
+)
+from mtbls.infrastructure.study_metadata_service.nfs.row_offset_index import (
+    RowOffsetIndex,
+)
+
+MAF_FILE = "m_MTBLS1_metabolite_profiling_NMR_spectroscopy_v2_maf.tsv"
+MAF_FILE_PATH = Path("tests/data/studies/MTBLS1") / Path(MAF_FILE)
+
+
+def read_rows(file_path_or_buffer, offset=None, limit=None) -> dict[str, list[str]]:
+    reader = Reader.get_assignment_file_reader(results_per_page=100000)
+    result = reader.read(
+        file_path_or_buffer, offset=offset, limit=limit, filename=MAF_FILE
+    )
+    return result.isa_table_file.table.data
+
+
+@pytest.mark.parametrize(
+    "offset,limit", [(0, 0), (0, 5), (3, 7), (5, None), (9, 100), (1000, 10)]
+)
+def test_row_offset_index_read_rows_01(offset, limit):
+    """_summary_
+    Case:
+        Rows of a MAF file are selected with row offset index.
+    Expected result:
+        Selected rows are same as rows parsed from whole file.
+    """
+    index = RowOffsetIndex.build(MAF_FILE_PATH, block_size=4)
+    assert index.indexed
+    selected_rows = index.read_rows(MAF_FILE_PATH, offset, limit)
+    assert selected_rows is not None
+    actual = read_rows(io.StringIO(selected_rows), limit=limit)
+    expected = read_rows(MAF_FILE_PATH, offset=offset, limit=limit)
+    assert actual == expected
+
+
+def test_row_offset_index_read_rows_02(tmp_path: Path):
+    """_summary_
+    Case:
+        A cell in the file contains new line character.
+    Expected result:
+        File is not indexed and rows are not selected with index.
+    """
+    file_path = tmp_path / MAF_FILE
+    file_path.write_text('database_identifier\tname\nCHEBI:1\t"a\nb"\n')
+    index = RowOffsetIndex.build(file_path)
+    assert not index.indexed
+    assert index.read_rows(file_path, 1, 1) is None
+
+
+@pytest.mark.asyncio
+async def test_load_isa_table_file_row_offset_index_01(tmp_path: Path):
+    """_summary_
+    Case:
+        A page of MAF file is loaded twice.
+    Expected result:
+        Row offset index is built once and rows are same as full file rows.
+    """
+    parsed_metadata_files.clear()
+    study_path = tmp_path / "MTBLS1"
+    study_path.mkdir()
+    shutil.copy(MAF_FILE_PATH, study_path / MAF_FILE)
+    repository = AsyncMock(spec=FileObjectWriteRepository)
+    repository.get_uri.return_value = f"file://{study_path / MAF_FILE}"
+    repository.get_info.return_value = StudyDataFileOutput(
+        object_key=MAF_FILE,
+        size_in_bytes=(study_path / MAF_FILE).stat().st_size,
+        updated_at="2024-01-01T00:00:00",
+    )
+    internal_files = AsyncMock(spec=FileObjectWriteRepository)
+    stored_files = {}
+
+    async def put_object(resource_id, object_key, source_uri, override=True):
+        stored_files[object_key] = Path(source_uri.removeprefix("file://")).read_text()
+
+    async def exists(resource_id, object_key):
+        return object_key in stored_files
+
+    async def download(resource_id, object_key, target_path):
+        Path(target_path).write_text(stored_files[object_key])
+
+    internal_files.put_object.side_effect = put_object
+    internal_files.exists.side_effect = exists
+    internal_files.download.side_effect = download
+
+    with FileObjectStudyMetadataService(
+        resource_id="MTBLS1",
+        study_data_file_repository=Mock(spec=StudyDataFileRepository),
+        metadata_files_object_repository=repository,
+        audit_files_object_repository=AsyncMock(spec=FileObjectWriteRepository),
+        internal_files_object_repository=internal_files,
+        study_read_repository=Mock(spec=StudyReadRepository),
+        user_read_repository=Mock(spec=UserReadRepository),
+        temp_path=str(tmp_path / "staging"),
+    ) as service:
+        result = await service.load_isa_table_file(MAF_FILE, offset=4, limit=3)
+        parsed_metadata_files.clear()
+        result_2 = await service.load_isa_table_file(MAF_FILE, offset=4, limit=3)
+        assert internal_files.put_object.call_count == 1
+        assert result == result_2
+        assert [x.row_index for x in result.iter_rows()] == [4, 5, 6]
+        expected = read_rows(MAF_FILE_PATH, offset=4, limit=3)
+        assert [x.data["database_identifier"] for x in result.iter_rows()] == expected[
+            "database_identifier"
+        ]
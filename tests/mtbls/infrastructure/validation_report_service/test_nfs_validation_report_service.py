@@ -0,0 +1,201 @@
+import datetime
+import pathlib
+from unittest.mock import Mock
+
+import pytest
+
+from mtbls.application.services.interfaces.http_client import HttpClient
+from mtbls.domain.exceptions.repository import StudyObjectNotFoundError
+from mtbls.domain.shared.repository.study_bucket import StudyBucket
+from mtbls.domain.shared.validator.policy import PolicyMessage, PolicySummaryResult
+from mtbls.domain.shared.validator.report_query import ValidationReportIndex
+from mtbls.infrastructure.repositories.file_object.default.nfs.file_object_write_repository import (  # noqa: E501
+    FileSystemObjectWriteRepository,
+)
+from mtbls.infrastructure.repositories.file_object.default.nfs.study_folder_manager import (  # noqa: E501
+    StudyFolderManager,
+)
+from mtbls.infrastructure.validation_report_service.nfs.validation_report_service import (  # noqa: E501
+    FileSystemValidationReportService,
+)
+
+
+def create_service(
+    root_path: pathlib.Path, max_reports_per_study: None | int = None
+) -> FileSystemValidationReportService:
+    (root_path / "MTBLS1").mkdir(parents=True, exist_ok=True)
+    folder_manager = StudyFolderManager(
+        {"mounted_paths": {"internal_files_root_path": str(root_path)}}
+    )
+    repository = FileSystemObjectWriteRepository(
+        folder_manager=folder_manager,
+        study_bucket=StudyBucket.INTERNAL_FILES,
+        http_client=Mock(spec=HttpClient),
+    )
+    return FileSystemValidationReportService(
+        file_object_repository=repository,
+        temp_directory=str(root_path / "tmp"),
+        max_reports_per_study=max_reports_per_study,
+    )
+
+
+def create_result(day: int) -> PolicySummaryResult:
+    return PolicySummaryResult(
+        resource_id="MTBLS1", start_time=datetime.datetime(2025, 1, day, 10, 0, 0)
+    )
+
+
+@pytest.mark.asyncio
+async def test_validation_history_index_01(tmp_path: pathlib.Path):
+    """_summary_
+    Case:
+        Validation reports are saved.
+    Expected result:
+        Reports are found by task id and time, and listed newest first
+        without listing validation history folder.
+    """
+    service = create_service(tmp_path)
+    for day in (1, 3, 2):
+        await service.save_validation_report(
+            "MTBLS1", f"task-{day}", create_result(day)
+        )
+
+    service.file_object_repository.list = Mock(side_effect=AssertionError())
+    reports = await service.find_all("MTBLS1", offset=0, limit=None)
+    assert [x.task_id for x in reports] == ["task-3", "task-2", "task-1"]
+    item = await service.find_by_task_id("MTBLS1", "task-2")
+    assert item.validation_time == "2025-01-02_10-00-00"
+    item = await service.find_by_validation_time("MTBLS1", "2025-01-01_10-00-00")
+    assert item.task_id == "task-1"
+    result = await service.load_validation_report_by_validation_time(
+        "MTBLS1", "2025-01-03_10-00-00"
+    )
+    assert result.resource_id == "MTBLS1"
+    with pytest.raises(StudyObjectNotFoundError):
+        await service.find_by_task_id("MTBLS1", "task-x")
+
+
+@pytest.mark.asyncio
+async def test_validation_history_index_02(tmp_path: pathlib.Path):
+    """_summary_
+    Case:
+        Validation history folder has reports but there is no index file.
+    Expected result:
+        Index is created from validation history folder.
+    """
+    service = create_service(tmp_path)
+    await service.save_validation_report("MTBLS1", "task-1", create_result(1))
+    history_path = tmp_path / "MTBLS1" / "validation-history"
+    (history_path / service.index_file_name).unlink()
+
+    reports = await service.find_all("MTBLS1", offset=None, limit=None)
+    assert [x.task_id for x in reports] == ["task-1"]
+    assert (history_path / service.index_file_name).exists()
+
+
+@pytest.mark.asyncio
+async def test_validation_history_index_03(tmp_path: pathlib.Path):
+    """_summary_
+    Case:
+        Number of reports exceeds max_reports_per_study.
+    Expected result:
+        The oldest reports are deleted.
+    """
+    service = create_service(tmp_path, max_reports_per_study=2)
+    for day in (1, 2, 3):
+        await service.save_validation_report(
+            "MTBLS1", f"task-{day}", create_result(day)
+        )
+
+    reports = await service.find_all("MTBLS1", offset=None, limit=None)
+    assert [x.task_id for x in reports] == ["task-3", "task-2"]
+    history_path = tmp_path / "MTBLS1" / "validation-history"
+    assert not list(history_path.glob("validation-history__*__task-1.json"))
+    assert await service.find_all("MTBLS2", offset=None, limit=None) == []
+
+
+@pytest.mark.asyncio
+async def test_validation_report_compression_01(tmp_path: pathlib.Path):
+    """_summary_
+    Case:
+        A report is saved with compression and a legacy report is saved as json.
+    Expected result:
+        Both reports are loaded.
+    """
+    service = create_service(tmp_path)
+    await service.save_validation_report("MTBLS1", "task-2", create_result(2))
+    history_path = tmp_path / "MTBLS1" / "validation-history"
+    compressed_file = (
+        history_path / "validation-history__2025-01-02_10-00-00__task-2.json.gz"
+    )
+    assert compressed_file.read_bytes().startswith(b"\x1f\x8b")
+
+    service.compress_reports = False
+    await service.save_validation_report("MTBLS1", "task-1", create_result(1))
+    assert (
+        history_path / "validation-history__2025-01-01_10-00-00__task-1.json"
+    ).exists()
+
+    for task_id in ("task-1", "task-2"):
+        result = await service.load_validation_report_by_task_id("MTBLS1", task_id)
+        assert result.resource_id == "MTBLS1"
+
+
+@pytest.mark.asyncio
+async def test_validation_report_index_01(tmp_path: pathlib.Path):
+    """_summary_
+    Case:
+        Report index is saved and the report is deleted by retention policy.
+    Expected result:
+        Index is loaded by task id before retention and deleted with report.
+    """
+    service = create_service(tmp_path, max_reports_per_study=1)
+    await service.save_validation_report("MTBLS1", "task-1", create_result(1))
+    assert await service.load_validation_report_index("MTBLS1", "task-1") is None
+    report_index = ValidationReportIndex(
+        task_id="task-1", total=1, facets={"type": {"ERROR": [0]}}
+    )
+    assert await service.save_validation_report_index("MTBLS1", "task-1", report_index)
+    loaded = await service.load_validation_report_index("MTBLS1", "task-1")
+    assert loaded == report_index
+
+    await service.save_validation_report("MTBLS1", "task-2", create_result(2))
+    history_path = tmp_path / "MTBLS1" / service.validation_history_object_key
+    assert not list(history_path.glob("validation-report-index__*"))
+
+
+@pytest.mark.asyncio
+async def test_validation_report_index_02(tmp_path: pathlib.Path):
+    """_summary_
+    Case:
+        Report index is saved with messages stored in blocks.
+    Expected result:
+        Messages at selected positions are loaded in the given order
+        and message blocks are deleted with the report.
+    """
+    service = create_service(tmp_path, max_reports_per_study=1)
+    service.message_block_size = 3
+    await service.save_validation_report("MTBLS1", "task-1", create_result(1))
+    messages = [PolicyMessage(identifier=f"rule_{i}") for i in range(10)]
+    report_index = ValidationReportIndex(task_id="task-1", total=10)
+    assert await service.save_validation_report_index(
+        "MTBLS1", "task-1", report_index, messages=messages
+    )
+    loaded = await service.load_validation_report_index("MTBLS1", "task-1")
+    assert loaded.message_block_size == 3
+    assert len(loaded.message_block_offsets) == 5
+
+    selected = await service.load_validation_report_messages(
+        "MTBLS1", "task-1", loaded, [9, 0, 4, 5]
+    )
+    assert [x.identifier for x in selected] == ["rule_9", "rule_0", "rule_4", "rule_5"]
+    assert (
+        await service.load_validation_report_messages(
+            "MTBLS1", "task-1", ValidationReportIndex(task_id="task-1"), [0]
+        )
+        is None
+    )
+
+    await service.save_validation_report("MTBLS1", "task-2", create_result(2))
+    history_path = tmp_path / "MTBLS1" / service.validation_history_object_key
+    assert not list(history_path.glob("validation-report-messages__*"))
@@ -0,0 +1,228 @@
+import random
+
+from metabolights_utils.models.isa.common import IsaTableColumn, IsaTableFile
+from metabolights_utils.models.isa.enums import ColumnsStructure
+from metabolights_utils.models.isa.investigation_file import OntologyAnnotation
+from metabolights_utils.models.isa.samples_file import SamplesFile
+from metabolights_utils.models.metabolights.model import MetabolightsStudyModel
+
+from mtbls.domain.domain_services.modifier.base_isa_table_modifier import (
+    IsaTableModifier,
+    create_ontology_item,
+)
+from mtbls.domain.domain_services.modifier.column_update_handler import (
+    IsaTableColumnUpdateHandler,
+)
+from mtbls.domain.shared.modifier import UpdateLog
+
+ORGANISMS = [
+    OntologyAnnotation(
+        term="Homo sapiens", term_source_ref="NCBITAXON", term_accession_number="9606"
+    ),
+    OntologyAnnotation(
+        term="Mus musculus", term_source_ref="NCBITAXON", term_accession_number="10090"
+    ),
+    OntologyAnnotation(
+        term="blood", term_source_ref="UBERON", term_accession_number="0000178"
+    ),
+    OntologyAnnotation(
+        term="blood", term_source_ref="BTO", term_accession_number="0000089"
+    ),
+]
+UNITS = [
+    OntologyAnnotation(
+        term="microliter", term_source_ref="UO", term_accession_number="0000101"
+    ),
+    OntologyAnnotation(
+        term="milliliter", term_source_ref="UO", term_accession_number="0000098"
+    ),
+]
+SOURCE_NAMES = ["source-1", " source-2", "'source-3'", "source-4 ", '"source-5"']
+TERMS = ["Homo sapiens", "homo sapiens", "Mus Musculus", "blood", "Blood", "", "x"]
+SOURCE_REFS = ["NCBITAXON", "ncbitaxon", "UBERON", "bto", "", "EFO"]
+ACCESSIONS = ["9606", "", "0000178", "0000089", "123"]
+UNIT_TERMS = ["microliter", "Microliter", "milliliter", "", "ul"]
+UNIT_SOURCE_REFS = ["UO", "uo", ""]
+UNIT_ACCESSIONS = ["0000101", "0000098", ""]
+
+COLUMNS = [
+    ("Source Name", ColumnsStructure.SINGLE_COLUMN),
+    ("Characteristics[Organism]", ColumnsStructure.ONTOLOGY_COLUMN),
+    ("Term Source REF", ColumnsStructure.SINGLE_COLUMN),
+    ("Term Accession Number", ColumnsStructure.SINGLE_COLUMN),
+    ("Characteristics[Volume]", ColumnsStructure.SINGLE_COLUMN_AND_UNIT_ONTOLOGY),
+    ("Unit", ColumnsStructure.SINGLE_COLUMN),
+    ("Term Source REF", ColumnsStructure.SINGLE_COLUMN),
+    ("Term Accession Number", ColumnsStructure.SINGLE_COLUMN),
+]
+
+
+def create_control_terms(
+    items: list[OntologyAnnotation],
+) -> dict[str, dict[str, OntologyAnnotation]]:
+    control_terms: dict[str, dict[str, OntologyAnnotation]] = {}
+    for item in items:
+        key = item.term.lower()
+        control_terms.setdefault(key, {})[item.term_source_ref.lower()] = item
+    return control_terms
+
+
+def create_sample_file(row_count: int, seed: int) -> SamplesFile:
+    rnd = random.Random(seed)
+    pools = [
+        SOURCE_NAMES,
+        TERMS,
+        SOURCE_REFS,
+        ACCESSIONS,
+        ["1", " 2", "3 "],
+        UNIT_TERMS,
+        UNIT_SOURCE_REFS,
+        UNIT_ACCESSIONS,
+    ]
+    sample_file = SamplesFile(file_path="s_MTBLS1.txt")
+    table = sample_file.table
+    for idx, (header, structure) in enumerate(COLUMNS):
+        column_name = header if idx < 2 else f"{header}.{idx}"
+        table.columns.append(column_name)
+        table.headers.append(
+            IsaTableColumn(
+                column_index=idx,
+                column_name=column_name,
+                column_header=header,
+                column_structure=structure,
+            )
+        )
+        table.data[column_name] = [rnd.choice(pools[idx]) for _ in range(row_count)]
+    table.row_count = row_count
+    return sample_file
+
+
+class SampleTableModifier(IsaTableModifier):
+    """ISA table modifier with fixed control lists."""
+
+    def __init__(self, isa_table_file: IsaTableFile, max_row_number_limit: int = 10):
+        model = MetabolightsStudyModel()
+        model.samples[isa_table_file.file_path] = isa_table_file
+        super().__init__(
+            model,
+            isa_table_file,
+            templates=None,
+            control_lists=None,
+            max_row_number_limit=max_row_number_limit,
+        )
+
+    def modify(self) -> list[UpdateLog]:
+        self.remove_trailing_and_prefix_spaces()
+        self.update_ontology_columns()
+        return self.update_logs
+
+    def _identify_template_type(self):
+        return "minimum"
+
+    def get_related_rule(self, file_type, file_template_name, rule_key):
+        if rule_key == "Source Name":
+            return None, {
+                f"source-{x}": {
+                    "": OntologyAnnotation(term=f"Source-{x}", term_source_ref="")
+                }
+                for x in (1, 2)
+            }
+        return None, None
+
+    def _get_header_control_terms(self, header, technique, file_type):
+        items = (
+            UNITS if header.column_header == "Characteristics[Volume]" else ORGANISMS
+        )
+        control_terms = create_control_terms(items)
+        control_source_refs = {
+            x.term_source_ref.lower(): x.term_source_ref for x in items
+        }
+        control_accessions = {x.term_accession_number.lower(): x for x in items}
+        return control_terms, control_source_refs, control_accessions
+
+
+class CellByCellSampleTableModifier(SampleTableModifier):
+    """Cell by cell updates to compare with updates of distinct values.
+
+    Headers of sample files are clean, so only cell updates are compared.
+    """
+
+    def remove_trailing_and_prefix_spaces(self):
+        updater = IsaTableColumnUpdateHandler(isa_table_file=self.isa_table_file)
+        for header in self.isa_table_file.table.headers:
+            for row, val in enumerate(
+                self.isa_table_file.table.data[header.column_name]
+            ):
+                stripped_value = val.strip().strip('"').strip("'")
+                if val != stripped_value:
+                    updater.update_isa_table_cell(header, val, stripped_value, row)
+        updates = updater.get_isa_table_update_logs()
+        self.update_logs.extend(x for x in updates if x.new_value != x.old_value)
+        return self.update_logs
+
+    def _update_ontology_column_values(  # noqa: PLR0913
+        self,
+        header: IsaTableColumn,
+        term_column_name: str,
+        term_source_ref_column_name: str,
+        term_accession_number_column_name: str,
+        control_terms: dict[str, dict[str, OntologyAnnotation]],
+        control_source_refs: dict[str, str],
+        control_accessions: dict[str, OntologyAnnotation],
+    ):
+        data = self.isa_table_file.table.data
+        column_names = (
+            term_column_name,
+            term_source_ref_column_name,
+            term_accession_number_column_name,
+        )
+        current_ontologies: dict[str, OntologyAnnotation] = {}
+        updates: dict[str, dict[str, dict[str, list[int]]]] = {}
+        for idx, row in enumerate(zip(*[data[x] for x in column_names], strict=True)):
+            term = row[0]
+            new_row, onto = self._resolve_ontology_row(
+                *row,
+                current_ontologies.get(term),
+                control_terms,
+                control_source_refs,
+                control_accessions,
+            )
+            if onto:
+                current_ontologies[term] = onto
+            for column_name, new_value in zip(column_names, new_row, strict=True):
+                data[column_name][idx] = new_value
+            old_str = str(create_ontology_item(row))
+            new_str = str(create_ontology_item(new_row))
+            term_updates = updates.setdefault(term, {})
+            if old_str != new_str:
+                rows = term_updates.setdefault(old_str, {}).setdefault(new_str, [])
+                rows.append(idx + 1)
+        for term_updates in updates.values():
+            for old_str, old_str_updates in term_updates.items():
+                for new_str, rows in old_str_updates.items():
+                    rows_str = self.get_list_string(rows, self.max_row_number_limit)
+                    self.modifier_update(
+                        source=self.isa_table_file.file_path,
+                        action=f"Row update: Column [{header.column_index + 1}] "
+                        f"{header.column_header}, rows {rows_str}",
+                        old_value=old_str,
+                        new_value=new_str,
+                    )
+
+    def update_single_column(
+        self,
+        template_type: str,
+        file_type: str,
+        header: IsaTableColumn,
+    ):
+        _, control_lists = self.get_related_rule(
+            file_type, template_type, header.column_header
+        )
+        if not control_lists:
+            return
+        updater = IsaTableColumnUpdateHandler(isa_table_file=self.isa_table_file)
+        for idx, term in enumerate(self.isa_table_file.table.data[header.column_name]):
+            controls = list(control_lists.get(term.lower(), {}).values())
+            if controls and controls[0].term != term:
+                updater.update_isa_table_cell(header, term, controls[0].term, idx)
+        self.update_logs.extend(updater.get_isa_table_update_logs())
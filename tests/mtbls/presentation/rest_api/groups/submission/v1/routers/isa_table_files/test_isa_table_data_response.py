@@ -0,0 +1,31 @@
+import json
+
+import pytest
+
+from mtbls.domain.entities.isa_table import ColumnarIsaTableData, IsaTableData
+from mtbls.presentation.rest_api.core.responses import APIResponse
+from mtbls.presentation.rest_api.groups.submission.v1.routers.isa_table_files import (
+    isa_table_files,
+)
+
+
+@pytest.mark.parametrize("row_count", [0, 1, 2, 5])
+def test_iter_isa_table_data_response_01(monkeypatch, row_count: int):
+    """_summary_
+    Case:
+        Response of columnar ISA table data is streamed with 2 rows per chunk.
+    Expected result:
+        Streamed JSON is same as serialized response.
+    """
+    monkeypatch.setattr(isa_table_files, "ROWS_PER_CHUNK", 2)
+    isa_table_data = ColumnarIsaTableData(
+        data_type="assay",
+        offset=3,
+        column_values={"Sample Name": [f"sample_{x}" for x in range(row_count)]},
+    )
+    response = APIResponse[IsaTableData](content=isa_table_data)
+    response.success_message = f"{row_count} rows."
+
+    streamed = "".join(isa_table_files.iter_isa_table_data_response(response))
+
+    assert json.loads(streamed) == json.loads(response.model_dump_json(by_alias=True))
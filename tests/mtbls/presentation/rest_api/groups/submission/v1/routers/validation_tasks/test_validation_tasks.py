@@ -1,5 +1,6 @@
 import datetime
 import json
+import shutil
 from pathlib import Path
 from typing import Any, Callable, Generator, Union
 from unittest.mock import AsyncMock, Mock
@@ -28,6 +29,7 @@ from mtbls.domain.enums.token_type import TokenType
 from mtbls.domain.enums.user_role import UserRole
 from mtbls.domain.enums.user_status import UserStatus
 from mtbls.domain.shared.permission import ResourcePermission
+from mtbls.domain.shared.repository.study_bucket import StudyBucket
 from mtbls.domain.shared.validator.policy import (
     PolicyMessage,
     PolicyResult,
@@ -38,8 +40,16 @@ from mtbls.domain.shared.validator.types import PolicyMessageType
 from mtbls.infrastructure.pub_sub.threading.thread_manager_impl import (
     ThreadingAsyncTaskService,
 )
+from mtbls.infrastructure.repositories.file_object.default.nfs.file_object_write_repository import (  # noqa: E501
+    FileSystemObjectWriteRepository,
+)
+from mtbls.infrastructure.repositories.file_object.default.nfs.study_folder_manager import (  # noqa: E501
+    StudyFolderManager,
+)
+from mtbls.infrastructure.validation_report_service.nfs.validation_report_service import (  # noqa: E501
+    FileSystemValidationReportService,
+)
 from mtbls.presentation.rest_api.core.responses import (
-    APIErrorResponse,
     APIResponse,
     Status,
 )
@@ -70,9 +80,29 @@ class MockApiClientContext:
         self.study = study
 
 
+VALIDATION_HISTORY_PATH = (
+    "tests/data/storages/rw/studies/internal-files/MTBLS800001/validation-history"
+)
+
+
+@pytest.fixture(scope="module")
+def internal_files_root_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Copy of internal files. Validation reports and indices are saved here."""
+    root_path = tmp_path_factory.mktemp("internal-files")
+    shutil.copytree(
+        VALIDATION_HISTORY_PATH,
+        root_path / "MTBLS800001" / "validation-history",
+        ignore=shutil.ignore_patterns("validation-history-index.json*"),
+    )
+    return root_path
+
+
 @pytest.fixture(scope="module")
 def mock_submission_api_client(
-    submission_api_client, submission_api_container, validation_result_01
+    submission_api_client,
+    submission_api_container,
+    validation_result_01,
+    internal_files_root_path: Path,
 ) -> Generator[Any, Any, MockApiClient]:
     container = submission_api_container
     policy_service: PolicyService = container.services.policy_service()
@@ -82,7 +112,22 @@ def mock_submission_api_client(
         return validation_result_01
 
     policy_service.validate_study = mock_validate
+    folder_manager = StudyFolderManager(
+        {"mounted_paths": {"internal_files_root_path": str(internal_files_root_path)}}
+    )
+    container.services.validation_report_service.override(
+        FileSystemValidationReportService(
+            file_object_repository=FileSystemObjectWriteRepository(
+                folder_manager=folder_manager,
+                study_bucket=StudyBucket.INTERNAL_FILES,
+                http_client=container.gateways.http_client(),
+            ),
+            validation_history_object_key="validation-history",
+            temp_directory=str(internal_files_root_path / "tmp"),
+        )
+    )
     yield MockApiClient(client=submission_api_client, container=container)
+    container.services.validation_report_service.reset_override()
     policy_service.validate_study = validate_study
 
 
@@ -426,12 +471,13 @@ class TestGetValidationsV1:
         mock_submission_api_client: MockApiClient,
         jwt_token: str,
         policy_result_list_01: PolicyResultList,
+        internal_files_root_path: Path,
     ):
         """There is no task id input and there is a task completed.
         expected: task status and content
         """
         task_id = "123456-987650-54321-success-01"
-        target = "tests/data/storages/rw/studies/internal-files/MTBLS800001/validation-history"  # noqa: E501
+        target = internal_files_root_path / "MTBLS800001" / "validation-history"
         self.remove_task_results(task_id, target)
         try:
             resource_id = "MTBLS800001"
@@ -517,6 +563,7 @@ class TestGetValidationsV1:
         mock_submission_api_client: MockApiClient,
         jwt_token: str,
         policy_result_list_01: PolicyResultList,
+        internal_files_root_path: Path,
     ):
         """
         There is a task id input.
@@ -527,7 +574,7 @@ class TestGetValidationsV1:
         key = f"validation_task:current:{resource_id}"
 
         task_id = "83599aa5-7130-48ad-95e9-36e4ac51405c-234"
-        target = "tests/data/storages/rw/studies/internal-files/MTBLS800001/validation-history"  # noqa: E501
+        target = internal_files_root_path / "MTBLS800001" / "validation-history"
         services = mock_submission_api_client.container.services
         cache_service: CacheService = services.cache_service()
         await cache_service.set_value(key, value=task_id, expiration_time_in_seconds=60)
@@ -570,6 +617,7 @@ class TestGetValidationsV1:
         mock_submission_api_client: MockApiClient,
         jwt_token: str,
         policy_result_list_01: PolicyResultList,
+        internal_files_root_path: Path,
     ):
         """
         There is a task id input.
@@ -580,7 +628,7 @@ class TestGetValidationsV1:
         key = f"validation_task:current:{resource_id}"
 
         task_id = "83599aa5-7130-48ad-95e9-36e4ac51405c-234"
-        target = "tests/data/storages/rw/studies/internal-files/MTBLS800001/validation-history"  # noqa: E501
+        target = internal_files_root_path / "MTBLS800001" / "validation-history"
         services = mock_submission_api_client.container.services
         cache_service: CacheService = services.cache_service()
         await cache_service.set_value(key, value=task_id, expiration_time_in_seconds=60)
@@ -680,15 +728,15 @@ class TestPostValidationsV1:
         assert result.content.task.task_id
 
     @pytest.mark.asyncio
-    async def test_start_task_failed_01(
+    async def test_start_task_attached_01(
         self,
         mock_submission_api_client: MockApiClient,
         jwt_token: str,
     ):
         """
-        There is a task in cache but it is created 5 seconds before.
+        There is a task in cache and it is still running.
 
-        Expected: Raise exception AsyncTaskAlreadyStartedError
+        Expected: No new task is started. Status of the running task is returned.
         """
         resource_id = "MTBLS800001"
         key = f"validation_task:current:{resource_id}"
@@ -717,7 +765,9 @@ class TestPostValidationsV1:
         )
         await cache_service.delete_key(key)
         del async_task_service.async_task_results_dict[task_id]
-        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.status_code == status.HTTP_200_OK
         json_response = response.json()
-        result = APIErrorResponse.model_validate(json_response)
-        assert "AsyncTaskAlreadyStartedError" in result.error_message
+        result = APIResponse[StartValidationResponse].model_validate(json_response)
+        assert result.content.task.task_id == task_id
+        assert result.content.task.task_status == "RUNNING"
+        assert "already running" in result.success_message
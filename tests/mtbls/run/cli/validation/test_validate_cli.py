@@ -0,0 +1,175 @@
+import asyncio
+import time
+from multiprocessing.connection import Connection
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from mtbls.run.cli.validation import validate
+from mtbls.run.cli.validation.validate import (
+    StudyValidationSummary,
+    ValidationWorkerPool,
+    load_checkpoint,
+    run_validation_and_save_report,
+    serve_validation_requests,
+)
+from mtbls.run.cli.validation.validation_app import ValidationApp
+
+
+@pytest.fixture
+def running_validations(monkeypatch: pytest.MonkeyPatch) -> list[int]:
+    running = [0, 0]
+
+    async def validate_and_save_report(
+        validation_app, summary: StudyValidationSummary, report_path: Path, **kwargs
+    ):
+        running[0] += 1
+        running[1] = max(running)
+        try:
+            if summary.resource_id == "MTBLS3":
+                await asyncio.sleep(10)
+            if summary.resource_id == "MTBLS4":
+                raise ValueError("invalid study")
+            await asyncio.sleep(0.05)
+            report_path.write_text("report")
+            summary.result = "SUCCESS"
+            summary.error = "0"
+        finally:
+            running[0] -= 1
+
+    monkeypatch.setattr(validate, "validate_and_save_report", validate_and_save_report)
+    return running
+
+
+@pytest.mark.asyncio
+async def test_run_validation_and_save_report_01(
+    tmp_path: Path, running_validations: list[int]
+):
+    """_summary_
+    Case:
+        Studies are validated concurrently with a timeout.
+    Expected result:
+        Summary contains durations and results. Failed and timed out studies
+        are not in completed studies of checkpoint file.
+    """
+    summary_file = tmp_path / "summary.tsv"
+    checkpoint_file = tmp_path / "checkpoint.jsonl"
+    summaries = await run_validation_and_save_report(
+        validation_app=Mock(spec=ValidationApp),
+        resource_ids=["MTBLS1", "MTBLS2", "MTBLS3", "MTBLS4"],
+        validation_reports_root_path=tmp_path,
+        summary_file=summary_file,
+        concurrency=2,
+        timeout_in_seconds=0.5,
+        checkpoint_file=checkpoint_file,
+    )
+    results = {x.resource_id: x.result for x in summaries}
+    assert results == {
+        "MTBLS1": "SUCCESS",
+        "MTBLS2": "SUCCESS",
+        "MTBLS3": "TIMEOUT",
+        "MTBLS4": "Failed to validate",
+    }
+    assert running_validations[1] == 2
+    assert load_checkpoint(checkpoint_file) == {"MTBLS1", "MTBLS2"}
+    lines = summary_file.read_text().splitlines()
+    assert lines[0].endswith("DURATION")
+    assert len(lines) == 5
+
+
+@pytest.mark.asyncio
+async def test_run_validation_and_save_report_02(
+    tmp_path: Path, running_validations: list[int]
+):
+    """_summary_
+    Case:
+        Sweep is resumed with a checkpoint file.
+    Expected result:
+        Only studies that are not completed are validated and summary file is appended.
+    """
+    summary_file = tmp_path / "summary.tsv"
+    checkpoint_file = tmp_path / "checkpoint.jsonl"
+    summary_file.write_text(validate.SUMMARY_FILE_HEADER)
+    checkpoint_file.write_text(
+        StudyValidationSummary(resource_id="MTBLS1", result="ERROR").model_dump_json()
+        + "\n"
+        + StudyValidationSummary(
+            resource_id="MTBLS2", result="TIMEOUT"
+        ).model_dump_json()
+        + "\n"
+    )
+    summaries = await run_validation_and_save_report(
+        validation_app=Mock(spec=ValidationApp),
+        resource_ids=["MTBLS1", "MTBLS2"],
+        validation_reports_root_path=tmp_path,
+        summary_file=summary_file,
+        checkpoint_file=checkpoint_file,
+    )
+    assert [x.resource_id for x in summaries] == ["MTBLS2"]
+    assert load_checkpoint(checkpoint_file) == {"MTBLS1", "MTBLS2"}
+    assert len(summary_file.read_text().splitlines()) == 2
+
+
+def run_test_validation_worker(connection: Connection) -> None:
+    running = [0, 0]
+
+    async def validate_study(resource_id: str) -> StudyValidationSummary:
+        if resource_id == "MTBLS3":
+            # CPU bound validation blocks event loop of the worker.
+            time.sleep(60)
+        running[0] += 1
+        running[1] = max(running)
+        await asyncio.sleep(0.3)
+        running[0] -= 1
+        return StudyValidationSummary(
+            resource_id=resource_id, result="SUCCESS", error=str(running[1])
+        )
+
+    asyncio.run(serve_validation_requests(connection, validate_study))
+
+
+def test_validation_worker_pool_01():
+    """_summary_
+    Case:
+        One worker process validates studies with concurrency 2.
+    Expected result:
+        Two studies are validated at the same time in the worker.
+    """
+    pool = ValidationWorkerPool(
+        workers=1,
+        concurrency=2,
+        worker_target=run_test_validation_worker,
+        poll_interval_in_seconds=0.1,
+    )
+    summaries = list(pool.run(["MTBLS1", "MTBLS2"]))
+    assert {x.resource_id: x.result for x in summaries} == {
+        "MTBLS1": "SUCCESS",
+        "MTBLS2": "SUCCESS",
+    }
+    assert max(int(x.error) for x in summaries) == 2
+
+
+def test_validation_worker_pool_02():
+    """_summary_
+    Case:
+        A study blocks event loop of its worker and another study is sent
+        to the same worker.
+    Expected result:
+        Blocked study times out and its worker is replaced.
+        Other study is validated by the new worker.
+    """
+    pool = ValidationWorkerPool(
+        workers=1,
+        concurrency=2,
+        timeout_in_seconds=1,
+        worker_target=run_test_validation_worker,
+        poll_interval_in_seconds=0.1,
+    )
+    start_time = time.monotonic()
+    summaries = list(pool.run(["MTBLS3", "MTBLS1"]))
+    assert [(x.resource_id, x.result) for x in summaries] == [
+        ("MTBLS3", "TIMEOUT"),
+        ("MTBLS1", "SUCCESS"),
+    ]
+    assert time.monotonic() - start_time < 30